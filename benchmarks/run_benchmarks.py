@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""Benchmark suite for Rxiv-Maker.
+
+Generates synthetic manuscripts of configurable size and times the main
+pipeline stages on them:
+
+- ``convert_markdown_to_latex`` on the full main manuscript
+- ``extract_content_sections`` on 01_MAIN.md
+- ``generate_supplementary_tex`` on 02_SUPPLEMENTARY_INFO.md
+- every content validator
+- arXiv packaging (``prepare_arxiv_package`` and ``create_zip_package``)
+
+Results are written as JSON so that runs from different commits can be
+compared with ``--compare``.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--scales 1,2,4] [--repeat 3]
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/OLD.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from benchmarks.synthetic_manuscript import (  # noqa: E402
+    ManuscriptSpec,
+    write_synthetic_manuscript,
+)
+
+DEFAULT_RESULTS_DIR = REPO_ROOT / "benchmarks" / "results"
+
+
+def _git_commit():
+    """Return the current git commit hash, or ``"unknown"``."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=REPO_ROOT,
+            check=True,
+        )  # nosec B603 B607
+        return result.stdout.strip()
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return "unknown"
+
+
+def _time_call(func, repeat, setup=None):
+    """Call ``func`` ``repeat`` times and return timing statistics in seconds.
+
+    ``setup`` is called before each run, outside the timed section.
+    """
+    runs = []
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            func()
+            runs.append(time.perf_counter() - start)
+    return {
+        "min": min(runs),
+        "median": statistics.median(runs),
+        "runs": runs,
+    }
+
+
+def _prepare_output_dir(manuscript_dir, output_dir, yaml_metadata):
+    """Generate the LaTeX output tree needed by the arXiv packaging stage."""
+    from src.py.processors.template_processor import (
+        generate_supplementary_tex,
+        get_template_path,
+        process_template_replacements,
+    )
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    template_content = get_template_path().read_text(encoding="utf-8")
+    main_tex = process_template_replacements(
+        template_content, yaml_metadata, str(manuscript_dir / "01_MAIN.md")
+    )
+    (output_dir / f"{manuscript_dir.name}.tex").write_text(main_tex, encoding="utf-8")
+    generate_supplementary_tex(str(output_dir), yaml_metadata)
+
+    shutil.copy2(manuscript_dir / "03_REFERENCES.bib", output_dir)
+    for style_file in (REPO_ROOT / "src" / "tex" / "style").glob("*.bst"):
+        shutil.copy2(style_file, output_dir)
+    shutil.copytree(manuscript_dir / "FIGURES", output_dir / "Figures")
+
+
+def benchmark_manuscript(manuscript_dir, work_dir, repeat):
+    """Time every pipeline stage on one manuscript directory.
+
+    Args:
+        manuscript_dir: Synthetic manuscript directory
+        work_dir: Scratch directory for generated output
+        repeat: Number of timed runs per stage
+
+    Returns:
+        Dictionary mapping stage names to timing statistics
+    """
+    import prepare_arxiv
+    from src.py.converters.md2tex import (
+        convert_markdown_to_latex,
+        extract_content_sections,
+    )
+    from src.py.processors.template_processor import (
+        SUPPLEMENTARY_CACHE_DIR,
+        generate_supplementary_tex,
+    )
+    from src.py.processors.yaml_processor import extract_yaml_metadata
+    from src.py.validators import (
+        CitationValidator,
+        FigureValidator,
+        MathValidator,
+        ReferenceValidator,
+        SyntaxValidator,
+    )
+
+    main_md = manuscript_dir / "01_MAIN.md"
+    main_content = main_md.read_text(encoding="utf-8")
+    with contextlib.redirect_stdout(io.StringIO()):
+        yaml_metadata = extract_yaml_metadata(str(main_md))
+
+    results = {}
+    results["convert_markdown_to_latex"] = _time_call(
+        lambda: convert_markdown_to_latex(main_content), repeat
+    )
+    results["extract_content_sections"] = _time_call(
+        lambda: extract_content_sections(str(main_md)), repeat
+    )
+
+    supplementary_out = work_dir / "supplementary"
+    supplementary_out.mkdir(parents=True, exist_ok=True)
+    # Converted parts are cached under the output directory; time conversions
+    results["generate_supplementary_tex"] = _time_call(
+        lambda: generate_supplementary_tex(str(supplementary_out), yaml_metadata),
+        repeat,
+        setup=lambda: shutil.rmtree(
+            supplementary_out / SUPPLEMENTARY_CACHE_DIR, ignore_errors=True
+        ),
+    )
+
+    for validator_class in (
+        CitationValidator,
+        FigureValidator,
+        MathValidator,
+        ReferenceValidator,
+        SyntaxValidator,
+    ):
+        results[f"validator.{validator_class.__name__}"] = _time_call(
+            lambda cls=validator_class: cls(str(manuscript_dir)).validate(), repeat
+        )
+
+    # arXiv packaging: LaTeX test compilation is not part of the benchmark
+    output_dir = work_dir / "output"
+    with contextlib.redirect_stdout(io.StringIO()):
+        _prepare_output_dir(manuscript_dir, output_dir, yaml_metadata)
+    arxiv_dir = output_dir / "arxiv_submission"
+    original_compile = prepare_arxiv.test_arxiv_compilation
+    prepare_arxiv.test_arxiv_compilation = lambda *args: True
+    try:
+        results["arxiv.prepare_arxiv_package"] = _time_call(
+            lambda: prepare_arxiv.prepare_arxiv_package(str(output_dir), arxiv_dir),
+            repeat,
+        )
+    finally:
+        prepare_arxiv.test_arxiv_compilation = original_compile
+    results["arxiv.create_zip_package"] = _time_call(
+        lambda: prepare_arxiv.create_zip_package(
+            arxiv_dir, str(work_dir / "for_arxiv.zip")
+        ),
+        repeat,
+    )
+
+    return results
+
+
+def run_benchmarks(base_spec, scales, repeat):
+    """Run the benchmark suite for each scale factor.
+
+    Args:
+        base_spec: Manuscript size at scale 1
+        scales: Scale factors applied to ``base_spec``
+        repeat: Number of timed runs per stage
+
+    Returns:
+        JSON-serialisable benchmark report
+    """
+    report = {
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "base_spec": base_spec.to_dict(),
+        "scales": {},
+    }
+
+    original_cwd = os.getcwd()
+    original_manuscript_path = os.environ.get("MANUSCRIPT_PATH")
+    # prepare_arxiv resolves the style file relative to the repository root
+    os.chdir(REPO_ROOT)
+    try:
+        for scale in scales:
+            spec = base_spec.scaled(scale)
+            with tempfile.TemporaryDirectory(prefix="rxiv_bench_") as tmp:
+                tmp_path = Path(tmp)
+                manuscript_dir = write_synthetic_manuscript(
+                    tmp_path / "BENCH_MANUSCRIPT", spec
+                )
+                os.environ["MANUSCRIPT_PATH"] = str(manuscript_dir)
+                print(f"⏱  Scale {scale}: {spec.to_dict()}")
+                stages = benchmark_manuscript(manuscript_dir, tmp_path, repeat)
+                for stage, timing in stages.items():
+                    print(f"   {stage:<40} {timing['median'] * 1000:>10.1f} ms")
+                report["scales"][str(scale)] = {
+                    "spec": spec.to_dict(),
+                    "input_bytes": sum(
+                        (manuscript_dir / name).stat().st_size
+                        for name in ("01_MAIN.md", "02_SUPPLEMENTARY_INFO.md")
+                    ),
+                    "stages": stages,
+                }
+    finally:
+        os.chdir(original_cwd)
+        if original_manuscript_path is None:
+            os.environ.pop("MANUSCRIPT_PATH", None)
+        else:
+            os.environ["MANUSCRIPT_PATH"] = original_manuscript_path
+
+    return report
+
+
+def compare_reports(baseline, current, threshold=1.25):
+    """Compare two benchmark reports stage by stage.
+
+    Args:
+        baseline: Earlier benchmark report
+        current: Newer benchmark report
+        threshold: Slowdown ratio above which a stage is flagged
+
+    Returns:
+        List of (scale, stage, baseline_s, current_s, ratio) for flagged stages
+    """
+    regressions = []
+    print(f"\n📊 Comparing {baseline['commit']} → {current['commit']}")
+    for scale, scale_data in current["scales"].items():
+        baseline_scale = baseline["scales"].get(scale)
+        if not baseline_scale:
+            continue
+        for stage, timing in scale_data["stages"].items():
+            old = baseline_scale["stages"].get(stage)
+            if not old:
+                continue
+            ratio = timing["median"] / old["median"] if old["median"] else 1.0
+            marker = "⚠️" if ratio > threshold else "✓"
+            print(
+                f"{marker} x{scale:<3} {stage:<40} "
+                f"{old['median'] * 1000:>9.1f} → {timing['median'] * 1000:>9.1f} ms "
+                f"({ratio:.2f}x)"
+            )
+            if ratio > threshold:
+                regressions.append(
+                    (scale, stage, old["median"], timing["median"], ratio)
+                )
+    return regressions
+
+
+def main():
+    """Main entry point for the benchmark suite."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark Rxiv-Maker on synthetic manuscripts"
+    )
+    parser.add_argument("--sections", type=int, default=ManuscriptSpec.sections)
+    parser.add_argument("--tables", type=int, default=ManuscriptSpec.tables)
+    parser.add_argument("--table-rows", type=int, default=ManuscriptSpec.table_rows)
+    parser.add_argument("--figures", type=int, default=ManuscriptSpec.figures)
+    parser.add_argument("--citations", type=int, default=ManuscriptSpec.citations)
+    parser.add_argument("--math-spans", type=int, default=ManuscriptSpec.math_spans)
+    parser.add_argument(
+        "--scales",
+        default="1,2,4",
+        help="Comma-separated scale factors applied to all sizes (default: 1,2,4)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Timed runs per stage (default: 3)"
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        help="JSON results file (default: benchmarks/results/<commit>.json)",
+    )
+    parser.add_argument(
+        "--compare", help="Earlier JSON results file to compare against"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="Slowdown ratio flagged as a regression (default: 1.25)",
+    )
+
+    args = parser.parse_args()
+
+    spec = ManuscriptSpec(
+        sections=args.sections,
+        tables=args.tables,
+        table_rows=args.table_rows,
+        figures=args.figures,
+        citations=args.citations,
+        math_spans=args.math_spans,
+    )
+    scales = [int(s) for s in args.scales.split(",") if s.strip()]
+
+    report = run_benchmarks(spec, scales, args.repeat)
+
+    output_path = (
+        Path(args.output)
+        if args.output
+        else DEFAULT_RESULTS_DIR / f"{report['commit']}.json"
+    )
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✅ Benchmark results written to {output_path}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_reports(baseline, report, args.threshold)
+        if regressions:
+            print(f"\n⚠️  {len(regressions)} stage(s) slower than {args.threshold}x")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
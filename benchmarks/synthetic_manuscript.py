@@ -0,0 +1,305 @@
+"""Synthetic manuscript generator for Rxiv-Maker benchmarks.
+
+This module writes complete manuscript directories (config, main text,
+supplementary information, bibliography and figure files) whose size is
+controlled by a handful of parameters, so that the conversion, validation
+and packaging stages can be timed on inputs far larger than
+EXAMPLE_MANUSCRIPT.
+"""
+
+import random
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+
+@dataclass
+class ManuscriptSpec:
+    """Size parameters of a synthetic manuscript."""
+
+    sections: int = 8
+    paragraphs_per_section: int = 6
+    tables: int = 10
+    table_rows: int = 20
+    figures: int = 10
+    citations: int = 1000
+    math_spans: int = 1000
+    supplementary_notes: int = 5
+    seed: int = 0
+
+    def scaled(self, factor: int) -> "ManuscriptSpec":
+        """Return a copy of this spec with every size multiplied by ``factor``."""
+        return ManuscriptSpec(
+            sections=self.sections * factor,
+            paragraphs_per_section=self.paragraphs_per_section,
+            tables=self.tables * factor,
+            table_rows=self.table_rows,
+            figures=self.figures * factor,
+            citations=self.citations * factor,
+            math_spans=self.math_spans * factor,
+            supplementary_notes=self.supplementary_notes * factor,
+            seed=self.seed,
+        )
+
+    def to_dict(self) -> dict:
+        """Return the spec as a JSON-serialisable dictionary."""
+        return asdict(self)
+
+
+_WORDS = [
+    "preprint",
+    "manuscript",
+    "analysis",
+    "sample",
+    "data",
+    "model",
+    "result",
+    "method",
+    "signal",
+    "protein",
+    "cell",
+    "image",
+    "figure",
+    "table",
+    "measurement",
+    "protocol",
+    "experiment",
+    "pipeline",
+    "reproducible",
+    "automated",
+    "workflow",
+]
+
+_SECTION_TITLES = [
+    "Abstract",
+    "Main",
+    "Methods",
+    "Results",
+    "Discussion",
+    "Conclusion",
+    "Data availability",
+    "Code availability",
+]
+
+_CONFIG_TEMPLATE = """title:
+  - long: "Synthetic Benchmark Manuscript"
+  - short: "Synthetic Benchmark"
+  - lead_author: "Bench"
+
+date: "2025-01-01"
+use_line_numbers: false
+acknowledge_rxiv_maker: false
+
+keywords:
+  - "benchmark"
+  - "synthetic"
+
+authors:
+  - name: "Ada Bench"
+    affiliations:
+      - "Bench Lab"
+    corresponding_author: true
+    email: "ada@example.org"
+    orcid: 0000-0000-0000-0000
+
+affiliations:
+  - shortname: "Bench Lab"
+    full_name: "Benchmark Laboratory"
+    location: "Nowhere"
+
+bibliography: 03_REFERENCES.bib
+"""
+
+
+class _ContentFactory:
+    """Distributes citations, math spans and floats evenly over paragraphs."""
+
+    def __init__(self, spec: ManuscriptSpec):
+        self.spec = spec
+        self.rng = random.Random(spec.seed)
+        self.citation_keys = [f"ref{i:05d}" for i in range(max(spec.citations, 1))]
+        self._citation_index = 0
+
+    def sentence(self, n_words: int = 14) -> str:
+        words = [self.rng.choice(_WORDS) for _ in range(n_words)]
+        return " ".join(words).capitalize() + "."
+
+    def citation(self) -> str:
+        key = self.citation_keys[self._citation_index % len(self.citation_keys)]
+        self._citation_index += 1
+        # Alternate single and bracketed multiple citations
+        if self._citation_index % 3 == 0:
+            other = self.citation_keys[
+                (self._citation_index * 7) % len(self.citation_keys)
+            ]
+            return f"[@{key};@{other}]"
+        return f"@{key}"
+
+    def math(self, index: int) -> str:
+        if index % 5 == 0:
+            return f"$$x_{{{index}}} = \\frac{{a_{index}}}{{b}}$$ {{#eq:eq{index}}}"
+        return f"$\\alpha_{{{index}}} + \\beta^2$"
+
+    def paragraphs(self, count: int, citations: int, maths: int, offset: int) -> str:
+        """Build ``count`` paragraphs containing the given citations and maths."""
+        blocks = []
+        for p in range(count):
+            parts = [self.sentence(), f"See `code_{p}` for details."]
+            n_cite = citations // count + (1 if p < citations % count else 0)
+            n_math = maths // count + (1 if p < maths % count else 0)
+            for _ in range(n_cite):
+                parts.append(f"As shown previously {self.citation()}.")
+            for m in range(n_math):
+                parts.append(f"We use {self.math(offset + p * 1000 + m)} here.")
+            parts.append(f"**Bold claim {p}** and *italic remark*.")
+            blocks.append(" ".join(parts))
+        return "\n\n".join(blocks)
+
+    def table(self, index: int, prefix: str) -> str:
+        header = "| **Name** | **Value** | **Reference** | **Notes** |"
+        separator = "|----------|-----------|---------------|-----------|"
+        rows = [
+            f"| item_{index}_{r} | `{r * 3}` | {self.citation()} | {self.sentence(4)} |"
+            for r in range(self.spec.table_rows)
+        ]
+        caption = (
+            f"{{#{prefix}:table{index}}} **Synthetic table {index}.** "
+            f"{self.sentence(10)}"
+        )
+        return "\n".join([header, separator, *rows, "", caption])
+
+    def figure(self, name: str, label: str) -> str:
+        return (
+            f"![](FIGURES/{name}/{name}.png)\n"
+            f'{{#{label} width="0.8"}} **Synthetic figure {name}.** '
+            f"{self.sentence(10)}"
+        )
+
+
+def _distribute(total: int, buckets: int) -> list[int]:
+    """Split ``total`` into ``buckets`` near-equal non-negative integers."""
+    buckets = max(buckets, 1)
+    return [
+        total // buckets + (1 if i < total % buckets else 0) for i in range(buckets)
+    ]
+
+
+def build_main_markdown(spec: ManuscriptSpec, factory: _ContentFactory) -> str:
+    """Build the 01_MAIN.md content for ``spec``."""
+    lines = ["# Synthetic Benchmark Manuscript", ""]
+    n_sections = max(spec.sections, 1)
+    citations = _distribute(spec.citations, n_sections)
+    maths = _distribute(spec.math_spans, n_sections)
+    tables = _distribute(spec.tables, n_sections)
+    figures = _distribute(spec.figures, n_sections)
+
+    table_index = 0
+    figure_index = 0
+    for s in range(n_sections):
+        title = _SECTION_TITLES[s] if s < len(_SECTION_TITLES) else f"Results part {s}"
+        lines.append(f"## {title}")
+        lines.append("")
+        lines.append(
+            factory.paragraphs(
+                spec.paragraphs_per_section, citations[s], maths[s], s * 100000
+            )
+        )
+        lines.append("")
+        for _ in range(tables[s]):
+            table_index += 1
+            lines.append(factory.table(table_index, "table"))
+            lines.append("")
+        for _ in range(figures[s]):
+            figure_index += 1
+            name = f"Figure_{figure_index}"
+            lines.append(factory.figure(name, f"fig:f{figure_index}"))
+            lines.append("")
+            lines.append(f"As illustrated in @fig:f{figure_index}.")
+            lines.append("")
+    return "\n".join(lines)
+
+
+def build_supplementary_markdown(spec: ManuscriptSpec, factory: _ContentFactory) -> str:
+    """Build the 02_SUPPLEMENTARY_INFO.md content for ``spec``."""
+    n_tables = max(spec.tables // 2, 1)
+    n_figures = max(spec.figures // 2, 1)
+    lines = ["## Supplementary Tables", ""]
+    for t in range(1, n_tables + 1):
+        lines.append(factory.table(t, "stable"))
+        lines.append("")
+
+    lines.extend(["## Supplementary Notes", ""])
+    for n in range(1, max(spec.supplementary_notes, 1) + 1):
+        lines.append(f"{{#snote:note{n}}} **Supplementary topic {n}**")
+        lines.append("")
+        lines.append(
+            factory.paragraphs(2, spec.citations // 20, spec.math_spans // 20, n)
+        )
+        lines.append("")
+
+    lines.extend(["## Supplementary Figures", ""])
+    for f in range(1, n_figures + 1):
+        name = f"SFigure_{f}"
+        lines.append(factory.figure(name, f"sfig:s{f}"))
+        lines.append("")
+    return "\n".join(lines)
+
+
+def build_bibliography(spec: ManuscriptSpec, factory: _ContentFactory) -> str:
+    """Build a BibTeX file defining every citation key used."""
+    entries = []
+    for key in factory.citation_keys:
+        entries.append(
+            f"@article{{{key},\n"
+            f"  title        = {{{factory.sentence(6)}}},\n"
+            f"  author       = {{Bench, Ada}},\n"
+            f"  journal      = {{Journal of Benchmarks}},\n"
+            f"  year         = 2025\n"
+            f"}}"
+        )
+    return "\n".join(entries) + "\n"
+
+
+def write_synthetic_manuscript(directory, spec: ManuscriptSpec) -> Path:
+    """Write a synthetic manuscript described by ``spec`` into ``directory``.
+
+    Args:
+        directory: Target manuscript directory (created if missing)
+        spec: Size parameters of the manuscript
+
+    Returns:
+        Path to the manuscript directory
+    """
+    manuscript_dir = Path(directory)
+    manuscript_dir.mkdir(parents=True, exist_ok=True)
+    factory = _ContentFactory(spec)
+
+    (manuscript_dir / "00_CONFIG.yml").write_text(_CONFIG_TEMPLATE, encoding="utf-8")
+    (manuscript_dir / "01_MAIN.md").write_text(
+        build_main_markdown(spec, factory), encoding="utf-8"
+    )
+    (manuscript_dir / "02_SUPPLEMENTARY_INFO.md").write_text(
+        build_supplementary_markdown(spec, factory), encoding="utf-8"
+    )
+    (manuscript_dir / "03_REFERENCES.bib").write_text(
+        build_bibliography(spec, factory), encoding="utf-8"
+    )
+
+    # Figure payloads are random bytes: packaging and validation only care
+    # about file names and sizes, not about image content.
+    figures_dir = manuscript_dir / "FIGURES"
+    names = [f"Figure_{i}" for i in range(1, max(spec.figures, 1) + 1)]
+    names += [f"SFigure_{i}" for i in range(1, max(spec.figures // 2, 1) + 1)]
+    for name in names:
+        figure_dir = figures_dir / name
+        figure_dir.mkdir(parents=True, exist_ok=True)
+        (figure_dir / f"{name}.png").write_bytes(factory.rng.randbytes(64 * 1024))
+        (figure_dir / f"{name}.pdf").write_bytes(factory.rng.randbytes(32 * 1024))
+
+    data_dir = figures_dir / "DATA" / "SFigure_1"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    (data_dir / "values.csv").write_text(
+        "x,y\n" + "\n".join(f"{i},{i * i}" for i in range(1000)) + "\n",
+        encoding="utf-8",
+    )
+
+    return manuscript_dir
@@ -1,25 +1,258 @@
 #!/usr/bin/env python3
 """Prepare arXiv submission package from Rxiv-Maker output.
 
-This script creates a clean, self-contained package suitable for arXiv submission
-by copying and modifying the necessary files to remove dependencies on minted
-and other shell-escape requiring packages.
+This script creates a clean, self-contained package suitable for arXiv submission.
+The generated LaTeX is scanned for the files it references (figures, inputs,
+bibliography and style files), and only those are synchronised into the
+submission directory, which is updated in place between runs.
 
 Usage:
     python prepare_arxiv.py [--output-dir DIR]
 """
 
 import argparse
+import filecmp
 import os
+import re
 import shutil
+import struct
 import subprocess
+import tempfile
 import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Style files shipped with Rxiv-Maker, used when the output directory lacks them
+STYLE_DIR = Path(__file__).resolve().parent / "src" / "tex" / "style"
+
+# LaTeX commands whose arguments name files the submission depends on
+TEX_DEPENDENCY_PATTERN = re.compile(
+    r"\\(includegraphics|input|include|bibliography|bibliographystyle"
+    r"|documentclass|usepackage|RequirePackage)\*?\s*(?:\[[^\]]*\]\s*)?\{([^}]*)\}"
+)
+
+# Unescaped LaTeX comments, up to the end of the line
+TEX_COMMENT_PATTERN = re.compile(r"(?<!\\)%.*")
+
+# Extensions tried by pdflatex for \includegraphics without an extension, in
+# order of preference; the first existing file is the one that gets shipped
+GRAPHICS_EXTENSIONS = (".pdf", ".png", ".jpg", ".jpeg")
+
+# Extensions tried for a reference without one, per LaTeX command
+DEPENDENCY_EXTENSIONS = {
+    "includegraphics": GRAPHICS_EXTENSIONS,
+    "input": (".tex",),
+    "include": (".tex",),
+    "bibliography": (".bib",),
+    "bibliographystyle": (".bst",),
+    "documentclass": (".cls",),
+    "usepackage": (".sty",),
+    "RequirePackage": (".sty",),
+}
+
+# Files that are scanned for further dependencies once they are included
+SCANNED_EXTENSIONS = (".tex", ".cls", ".sty")
+
+# Formats that are already compressed and are stored in the ZIP without deflate
+STORED_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".pdf", ".gz", ".zip"}
+
+# Fixed entry metadata so that identical files give byte-identical archives
+ZIP_TIMESTAMP = (1980, 1, 1, 0, 0, 0)
+ZIP_FILE_ATTRIBUTES = 0o100644 << 16
+ZIP_UNIX_SYSTEM = 3
+ZIP_VERSION = 20
+ZIP_UTF8_FLAG = 0x800
+ZIP_COMPRESSION_LEVEL = zlib.Z_DEFAULT_COMPRESSION
+ZIP_CHUNK_SIZE = 1024 * 1024
+ZIP64_LIMIT = zipfile.ZIP64_LIMIT
+
+# Sources that must match the main build before its .aux files are reused
+COMPILATION_SOURCE_EXTENSIONS = {".tex", ".bbl", ".bib", ".cls", ".sty", ".bst"}
+
+# Auxiliary files copied from the main build into the compilation sandbox
+SEEDED_EXTENSIONS = (".aux", ".out", ".toc", ".lof", ".lot")
+
+# Inputs pdflatex and bibtex only read, which the sandbox may hard-link.
+# Everything else is copied, since the tools rewrite files such as the .bbl
+# in place and would modify the package through a link.
+LINKABLE_EXTENSIONS = {
+    ".pdf",
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".eps",
+    ".svg",
+    ".sty",
+    ".cls",
+    ".bst",
+}
+
+
+def find_main_tex(directory):
+    r"""Find the main manuscript file in a directory.
+
+    The main file is the first ``.tex`` file (in name order) that declares a
+    ``\documentclass``; Supplementary.tex is only ever input from it.
+
+    Args:
+        directory: Directory containing the generated LaTeX files
+
+    Returns:
+        Path to the main LaTeX file, or None if there is none
+    """
+    candidates = sorted(
+        tex_file
+        for tex_file in Path(directory).glob("*.tex")
+        if tex_file.name != "Supplementary.tex"
+    )
+    for tex_file in candidates:
+        content = TEX_COMMENT_PATTERN.sub("", tex_file.read_text(encoding="utf-8"))
+        if "\\documentclass" in content:
+            return tex_file
+    return candidates[0] if candidates else None
+
+
+def _resolve_dependency(name, source_dirs, extensions=("",)):
+    """Return ``(archive name, source path)`` of the first matching file."""
+    for extension in extensions:
+        archive_name = f"{name}{extension}"
+        for source_dir in source_dirs:
+            candidate = source_dir / archive_name
+            if candidate.is_file():
+                # Style fallbacks are shipped next to the main file
+                if source_dir != source_dirs[0]:
+                    archive_name = candidate.name
+                return archive_name, candidate
+    return None
+
+
+def find_tex_dependencies(main_tex, source_dirs=None):
+    r"""Collect the files a LaTeX document needs to compile.
+
+    Starting from ``main_tex``, every ``\input``/``\include``-ed file and
+    every local class or package is scanned recursively for
+    ``\includegraphics``, ``\bibliography`` and ``\bibliographystyle``
+    references. Graphics without an extension resolve to a single file, using
+    pdflatex's order of preference.
+
+    Args:
+        main_tex: Path to the main LaTeX file
+        source_dirs: Directories searched for referenced files, in order; paths
+            are relative to the first one. Defaults to the directory of
+            ``main_tex`` followed by the Rxiv-Maker style directory.
+
+    Returns:
+        Tuple of a dict mapping archive-relative names to source paths, and a
+        sorted list of references that could not be resolved
+    """
+    main_tex = Path(main_tex)
+    if source_dirs is None:
+        source_dirs = [main_tex.parent, STYLE_DIR]
+    source_dirs = [Path(source_dir) for source_dir in source_dirs]
+    main_name = main_tex.stem
+
+    dependencies = {main_tex.name: main_tex}
+    missing = set()
+
+    # The compiled bibliography lets arXiv skip BibTeX
+    bbl = _resolve_dependency(main_name, source_dirs[:1], (".bbl",))
+    if bbl:
+        dependencies[bbl[0]] = bbl[1]
+
+    queue = deque([main_tex])
+    while queue:
+        content = TEX_COMMENT_PATTERN.sub("", queue.popleft().read_text("utf-8"))
+        for match in TEX_DEPENDENCY_PATTERN.finditer(content):
+            command = match.group(1)
+            names = [name.strip() for name in match.group(2).split(",")]
+            for name in filter(None, names):
+                if "\\jobname" in name:
+                    # Files named after the job are written during compilation
+                    continue
+
+                if Path(name).suffix and command in ("includegraphics", "input"):
+                    extensions = ("",)
+                else:
+                    extensions = DEPENDENCY_EXTENSIONS[command]
+
+                resolved = _resolve_dependency(name, source_dirs, extensions)
+                if resolved is None:
+                    # Classes and packages not found locally come from TeX Live
+                    if command not in ("documentclass", "usepackage", "RequirePackage"):
+                        missing.add(name)
+                    continue
+
+                archive_name, source = resolved
+                if archive_name in dependencies:
+                    continue
+                dependencies[archive_name] = source
+                if source.suffix in SCANNED_EXTENSIONS:
+                    queue.append(source)
+
+    return dependencies, sorted(missing)
+
+
+def _is_up_to_date(source, destination):
+    """Check whether ``destination`` is an unchanged copy of ``source``."""
+    if not destination.is_file():
+        return False
+    source_stat = source.stat()
+    destination_stat = destination.stat()
+    return (
+        source_stat.st_size == destination_stat.st_size
+        and source_stat.st_mtime_ns == destination_stat.st_mtime_ns
+    )
+
+
+def sync_package(dependencies, arxiv_path):
+    """Synchronise the submission directory with a set of dependencies.
+
+    Files are copied only when they are new or have changed since the last
+    run, and anything in ``arxiv_path`` that is no longer a dependency
+    (including compilation artefacts) is removed.
+
+    Args:
+        dependencies: Dict mapping archive-relative names to source paths
+        arxiv_path: Submission directory to update in place
+
+    Returns:
+        Dict with the lists of ``copied``, ``unchanged`` and ``removed`` names
+    """
+    arxiv_path = Path(arxiv_path)
+    arxiv_path.mkdir(parents=True, exist_ok=True)
+    stats = {"copied": [], "unchanged": [], "removed": []}
+
+    for archive_name, source in sorted(dependencies.items()):
+        destination = arxiv_path / archive_name
+        if _is_up_to_date(source, destination):
+            stats["unchanged"].append(archive_name)
+            continue
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(source, destination)
+        stats["copied"].append(archive_name)
+
+    wanted = {Path(archive_name) for archive_name in dependencies}
+    # Deepest paths first so that directories are emptied before they are checked
+    for path in sorted(arxiv_path.rglob("*"), reverse=True):
+        relative = path.relative_to(arxiv_path)
+        if path.is_dir():
+            if not any(path.iterdir()):
+                path.rmdir()
+        elif relative not in wanted:
+            path.unlink()
+            stats["removed"].append(relative.as_posix())
+
+    return stats
+
 
 def prepare_arxiv_package(output_dir="./output", arxiv_dir=None):
     """Prepare arXiv submission package.
 
+    Only the files referenced from the generated manuscript are shipped, and
+    an existing submission directory is updated incrementally.
+
     Args:
         output_dir (str): Path to the Rxiv-Maker output directory
         arxiv_dir (str): Path where arXiv submission files will be created
@@ -33,109 +266,42 @@ def prepare_arxiv_package(output_dir="./output", arxiv_dir=None):
 
     arxiv_path = Path(arxiv_dir)
 
-    # Create clean arxiv directory
-    if arxiv_path.exists():
-        shutil.rmtree(arxiv_path)
-    arxiv_path.mkdir(parents=True)
-
     print(f"Preparing arXiv submission package in {arxiv_path}")
 
-    # Copy the unified style file (already arXiv-compatible)
-    style_source = Path("src/tex/style/rxiv_maker_style.cls")
+    main_tex = find_main_tex(output_path)
+    if main_tex is None:
+        raise FileNotFoundError("No main LaTeX file found in output directory")
+
+    # The unified style file is already arXiv-compatible
+    style_source = STYLE_DIR / "rxiv_maker_style.cls"
     if not style_source.exists():
         raise FileNotFoundError(f"Style file not found: {style_source}")
 
-    shutil.copy2(style_source, arxiv_path / "rxiv_maker_style.cls")
-    print("✓ Copied unified arXiv-compatible style file")
-
-    # Determine the main manuscript file name by looking for .tex files
-    tex_files = list(output_path.glob("*.tex"))
-    main_tex_file = None
-
-    # Find the main manuscript file (not Supplementary.tex)
-    for tex_file in tex_files:
-        if tex_file.name != "Supplementary.tex":
-            main_tex_file = tex_file.name
-            break
-
-    if not main_tex_file:
-        raise FileNotFoundError("No main LaTeX file found in output directory")
-
-    # Base name without extension for .bbl file
-    main_name = main_tex_file.replace(".tex", "")
-
-    # Copy main LaTeX files
-    main_files = [
-        main_tex_file,
-        "Supplementary.tex",
-        "03_REFERENCES.bib",
-        f"{main_name}.bbl",  # Include compiled bibliography if it exists
-        "rxiv_maker_style.bst",  # Bibliography style file
-    ]
-
-    for filename in main_files:
-        source_file = output_path / filename
-        if source_file.exists():
-            # Copy and modify the main tex file to use arxiv style
-            if filename == main_tex_file:
-                with open(source_file) as f:
-                    content = f.read()
-                # No need to replace documentclass - unified style is arXiv-compatible
-                # Keep the original style file name since it's unified
-                # Write the modified content
-                with open(arxiv_path / filename, "w") as f:
-                    f.write(content)
-                print(f"✓ Copied and modified {filename} for arXiv compatibility")
-            else:
-                shutil.copy2(source_file, arxiv_path / filename)
-                print(f"✓ Copied {filename}")
-        else:
-            if filename.endswith(".bbl") or filename.endswith(".bst"):
-                print(f"⚠ Optional file not found: {filename}")
-            else:
-                print(f"✗ Required file not found: {filename}")
-
-    # Copy all figure files
-    figures_source = output_path / "Figures"
-    if figures_source.exists():
-        figures_dest = arxiv_path / "Figures"
-
-        # Copy figure directories with PNG files (arXiv preferred format)
-        for figure_dir in figures_source.iterdir():
-            if figure_dir.is_dir() and not figure_dir.name.startswith("."):
-                dest_dir = figures_dest / figure_dir.name
-                dest_dir.mkdir(parents=True, exist_ok=True)
-
-                # Copy PNG files
-                for png_file in figure_dir.glob("*.png"):
-                    shutil.copy2(png_file, dest_dir / png_file.name)
-                    print(f"✓ Copied {png_file.relative_to(output_path)}")
-
-                # Also copy PDF files as backup
-                for pdf_file in figure_dir.glob("*.pdf"):
-                    shutil.copy2(pdf_file, dest_dir / pdf_file.name)
-                    print(f"✓ Copied {pdf_file.relative_to(output_path)}")
-
-        # Copy data files if they exist
-        data_dir = figures_source / "DATA"
-        if data_dir.exists():
-            data_dest = figures_dest / "DATA"
-            if data_dest.exists():
-                shutil.rmtree(data_dest)
-            shutil.copytree(data_dir, data_dest)
-            print("✓ Copied DATA directory")
+    dependencies, missing = find_tex_dependencies(main_tex)
+    for name in missing:
+        print(f"✗ Referenced file not found: {name}")
+
+    stats = sync_package(dependencies, arxiv_path)
+    for name in stats["copied"]:
+        print(f"✓ Copied {name}")
+    for name in stats["removed"]:
+        print(f"✓ Removed stale {name}")
+    print(
+        f"✓ {len(dependencies)} referenced files "
+        f"({len(stats['copied'])} updated, {len(stats['unchanged'])} unchanged)"
+    )
 
     print(f"\n📦 arXiv package prepared in {arxiv_path}")
 
     # Verify all required files are present
-    package_valid = verify_package(arxiv_path)
+    package_valid = verify_package(arxiv_path) and not missing
 
     if not package_valid:
         print("⚠️  Package verification failed - some files are missing")
         return arxiv_path
 
     # Test compilation to ensure the package builds correctly
-    compilation_success = test_arxiv_compilation(arxiv_path)
+    compilation_success = test_arxiv_compilation(arxiv_path, output_path)
 
     if not compilation_success:
         print("❌ arXiv package compilation test failed!")
@@ -152,55 +318,25 @@ def prepare_arxiv_package(output_dir="./output", arxiv_dir=None):
 
 
 def verify_package(arxiv_path):
-    """Verify that the arXiv package contains all necessary files."""
-    print("\n🔍 Verifying package contents...")
+    """Verify that the arXiv package contains all necessary files.
 
-    # Find the main manuscript file dynamically
-    tex_files = list(arxiv_path.glob("*.tex"))
-    main_tex_file = None
-
-    for tex_file in tex_files:
-        if tex_file.name != "Supplementary.tex":
-            main_tex_file = tex_file.name
-            break
+    The package is checked against the dependencies of its own main file, so
+    every referenced figure, input and bibliography file must be present.
+    """
+    print("\n🔍 Verifying package contents...")
+    arxiv_path = Path(arxiv_path)
 
-    if not main_tex_file:
+    main_tex = find_main_tex(arxiv_path)
+    if main_tex is None:
         print("✗ No main LaTeX file found")
         return False
 
-    required_files = [
-        main_tex_file,
-        "Supplementary.tex",
-        "rxiv_maker_style.cls",
-        "03_REFERENCES.bib",
-    ]
-
-    required_figures = [
-        "Figures/Figure_1/Figure_1.png",
-        "Figures/Figure_2/Figure_2.png",
-        "Figures/SFigure_1/SFigure_1.png",
-        "Figures/SFigure_2/SFigure_2.png",
-    ]
-
-    missing_files = []
-
-    # Check required files
-    for filename in required_files:
-        file_path = arxiv_path / filename
-        if file_path.exists():
-            print(f"✓ {filename}")
-        else:
-            print(f"✗ Missing: {filename}")
-            missing_files.append(filename)
-
-    # Check required figures
-    for figure_path in required_figures:
-        file_path = arxiv_path / figure_path
-        if file_path.exists():
-            print(f"✓ {figure_path}")
-        else:
-            print(f"✗ Missing: {figure_path}")
-            missing_files.append(figure_path)
+    dependencies, missing_files = find_tex_dependencies(main_tex, [arxiv_path])
+
+    for filename in sorted(dependencies):
+        print(f"✓ {filename}")
+    for filename in missing_files:
+        print(f"✗ Missing: {filename}")
 
     if missing_files:
         print(f"\n⚠ Warning: {len(missing_files)} files are missing!")
@@ -211,138 +347,398 @@ def verify_package(arxiv_path):
     return len(missing_files) == 0
 
 
-def test_arxiv_compilation(arxiv_path):
-    """Test compilation of the arXiv package to ensure it builds correctly."""
+def _sandbox_copy_function(main_name):
+    """Copy function filling a compilation sandbox for ``main_name``.
+
+    Read-only inputs such as figures and style files are hard-linked, falling
+    back to a copy when linking is impossible. Files the LaTeX tools may
+    write, including every ``<main_name>.*`` file such as the ``.bbl`` and the
+    ``.pdf``, are copied so that the package is never modified.
+    """
+
+    def link_or_copy(source, destination):
+        if (
+            Path(source).suffix.lower() in LINKABLE_EXTENSIONS
+            and Path(destination).stem != main_name
+        ):
+            try:
+                os.link(source, destination)
+                return destination
+            except OSError:
+                pass
+        shutil.copy2(source, destination)
+        return destination
+
+    return link_or_copy
+
+
+def seed_compilation_state(package_path, output_path, sandbox_path, main_name):
+    """Seed a sandbox with auxiliary files from the main output build.
+
+    The ``.aux`` and related files are only reused when every LaTeX source in
+    the package is identical to its counterpart in ``output_path`` and the
+    auxiliary files are newer than those sources, so that they describe the
+    same document.
+
+    Args:
+        package_path: Submission directory
+        output_path: Directory of the main Rxiv-Maker build
+        sandbox_path: Directory the test compilation runs in
+        main_name: Base name of the main LaTeX file
+
+    Returns:
+        List of seeded file names; empty when the build state is not reusable
+    """
+    package_path = Path(package_path)
+    output_path = Path(output_path)
+    aux_file = output_path / f"{main_name}.aux"
+    if not aux_file.is_file():
+        return []
+
+    newest_source = 0
+    for source in package_path.rglob("*"):
+        if source.suffix not in COMPILATION_SOURCE_EXTENSIONS:
+            continue
+        counterpart = output_path / source.relative_to(package_path)
+        if not counterpart.is_file() or not filecmp.cmp(
+            source, counterpart, shallow=False
+        ):
+            return []
+        newest_source = max(newest_source, counterpart.stat().st_mtime_ns)
+    if aux_file.stat().st_mtime_ns < newest_source:
+        return []
+
+    seeded = []
+    for extension in SEEDED_EXTENSIONS:
+        seed = output_path / f"{main_name}{extension}"
+        if seed.is_file():
+            shutil.copy2(seed, Path(sandbox_path) / seed.name)
+            seeded.append(seed.name)
+    return seeded
+
+
+def _run_pdflatex(tex_file, cwd):
+    """Run one non-interactive pdflatex pass."""
+    subprocess.run(
+        ["pdflatex", "-interaction=nonstopmode", tex_file],
+        cwd=cwd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=False,
+    )
+
+
+def test_arxiv_compilation(arxiv_path, output_dir=None):
+    """Test compilation of the arXiv package to ensure it builds correctly.
+
+    The package is compiled in a temporary sandbox so that the submission
+    directory is never touched. When ``output_dir`` holds an up-to-date build
+    of the same sources, its auxiliary files are reused and a single pass is
+    usually enough; otherwise the full pdflatex/bibtex sequence runs.
+
+    Args:
+        arxiv_path: Submission directory
+        output_dir: Directory of the main Rxiv-Maker build, if available
+    """
     print("\n🔨 Testing arXiv package compilation...")
 
-    # Change to the arXiv directory for compilation
-    original_cwd = os.getcwd()
-    os.chdir(arxiv_path)
+    arxiv_path = Path(arxiv_path)
 
     try:
         # Find the main manuscript file dynamically
-        tex_files = list(Path(".").glob("*.tex"))
-        tex_file = None
+        main_tex = find_main_tex(arxiv_path)
+        tex_file = main_tex.name if main_tex else None
 
-        for tf in tex_files:
-            if tf.name != "Supplementary.tex":
-                tex_file = tf.name
-                break
-
-        if not tex_file or not Path(tex_file).exists():
+        if not tex_file:
             print(f"❌ LaTeX file not found: {tex_file}")
             return False
 
-        # First pass
-        print("  Running first pdflatex pass...")
-        subprocess.run(
-            ["pdflatex", "-interaction=nonstopmode", tex_file],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            check=False,
-        )
+        main_name = main_tex.stem
 
-        # BibTeX pass
-        if Path("03_REFERENCES.bib").exists():
-            print("  Running bibtex...")
-            main_name = tex_file.replace(".tex", "")
-            subprocess.run(
-                ["bibtex", main_name],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                check=False,
+        with tempfile.TemporaryDirectory(prefix="arxiv_compile_") as sandbox:
+            sandbox_path = Path(sandbox) / "package"
+            shutil.copytree(
+                arxiv_path,
+                sandbox_path,
+                copy_function=_sandbox_copy_function(main_name),
             )
 
-        # Second pass
-        print("  Running second pdflatex pass...")
-        subprocess.run(
-            ["pdflatex", "-interaction=nonstopmode", tex_file],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            check=False,
-        )
+            seeded = []
+            if output_dir is not None:
+                seeded = seed_compilation_state(
+                    arxiv_path, output_dir, sandbox_path, main_name
+                )
+
+            if seeded:
+                print(f"  Reusing {', '.join(seeded)} from the main build")
+                print("  Running pdflatex pass...")
+                _run_pdflatex(tex_file, sandbox_path)
+                log_path = sandbox_path / f"{main_name}.log"
+                if log_path.exists() and "Rerun to get" in log_path.read_text(
+                    errors="replace"
+                ):
+                    print("  Running second pdflatex pass...")
+                    _run_pdflatex(tex_file, sandbox_path)
+            else:
+                # First pass
+                print("  Running first pdflatex pass...")
+                _run_pdflatex(tex_file, sandbox_path)
+
+                # BibTeX pass
+                if any(sandbox_path.glob("*.bib")):
+                    print("  Running bibtex...")
+                    subprocess.run(
+                        ["bibtex", main_name],
+                        cwd=sandbox_path,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        check=False,
+                    )
+
+                # Second pass
+                print("  Running second pdflatex pass...")
+                _run_pdflatex(tex_file, sandbox_path)
+
+                # Third pass for cross-references
+                print("  Running final pdflatex pass...")
+                _run_pdflatex(tex_file, sandbox_path)
+
+            return _check_compilation_output(sandbox_path, main_name)
 
-        # Third pass for cross-references
-        print("  Running final pdflatex pass...")
-        subprocess.run(
-            ["pdflatex", "-interaction=nonstopmode", tex_file],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            check=False,
-        )
+    except Exception as e:
+        print(f"❌ Compilation test failed with exception: {e}")
+        return False
 
-        # Check if PDF was created
-        main_name = tex_file.replace(".tex", "")
-        pdf_file = f"{main_name}.pdf"
-        log_file = f"{main_name}.log"
-
-        if Path(pdf_file).exists():
-            pdf_size = Path(pdf_file).stat().st_size
-            print(f"✅ PDF compilation successful! Size: {pdf_size:,} bytes")
-
-            # Check for common LaTeX warnings/errors in log
-            if Path(log_file).exists():
-                with open(log_file) as f:
-                    log_content = f.read()
-
-                error_count = log_content.count("! ")
-                warning_count = log_content.count("Warning:")
-
-                if error_count > 0:
-                    print(f"⚠️  Found {error_count} LaTeX errors in log")
-                    # Extract first few errors for display
-                    errors = []
-                    for line in log_content.split("\n"):
-                        if line.startswith("! "):
-                            errors.append(line)
-                            if len(errors) >= 3:  # Show first 3 errors
-                                break
-                    for error in errors:
-                        print(f"    {error}")
-
-                if warning_count > 0:
-                    print(f"📝 Found {warning_count} LaTeX warnings in log")
-
-                if error_count == 0:
-                    print("✅ No LaTeX errors detected")
-
-            return True
-        else:
-            print("❌ PDF compilation failed - no output PDF generated")
-
-            # Show compilation errors from log if available
-            if Path(log_file).exists():
-                with open(log_file) as f:
-                    log_content = f.read()
-                    print("\n📋 Last few lines from compilation log:")
-                    lines = log_content.split("\n")
-                    for line in lines[-10:]:  # Show last 10 lines
-                        if line.strip():
-                            print(f"    {line}")
 
-            return False
+def _check_compilation_output(build_path, main_name):
+    """Report on the PDF and log produced by a test compilation."""
+    pdf_file = build_path / f"{main_name}.pdf"
+    log_file = build_path / f"{main_name}.log"
+
+    if pdf_file.exists():
+        pdf_size = pdf_file.stat().st_size
+        print(f"✅ PDF compilation successful! Size: {pdf_size:,} bytes")
+
+        # Check for common LaTeX warnings/errors in log
+        if log_file.exists():
+            with open(log_file) as f:
+                log_content = f.read()
+
+            error_count = log_content.count("! ")
+            warning_count = log_content.count("Warning:")
+
+            if error_count > 0:
+                print(f"⚠️  Found {error_count} LaTeX errors in log")
+                # Extract first few errors for display
+                errors = []
+                for line in log_content.split("\n"):
+                    if line.startswith("! "):
+                        errors.append(line)
+                        if len(errors) >= 3:  # Show first 3 errors
+                            break
+                for error in errors:
+                    print(f"    {error}")
+
+            if warning_count > 0:
+                print(f"📝 Found {warning_count} LaTeX warnings in log")
+
+            if error_count == 0:
+                print("✅ No LaTeX errors detected")
+
+        return True
+    else:
+        print("❌ PDF compilation failed - no output PDF generated")
+
+        # Show compilation errors from log if available
+        if log_file.exists():
+            with open(log_file) as f:
+                log_content = f.read()
+                print("\n📋 Last few lines from compilation log:")
+                lines = log_content.split("\n")
+                for line in lines[-10:]:  # Show last 10 lines
+                    if line.strip():
+                        print(f"    {line}")
 
-    except Exception as e:
-        print(f"❌ Compilation test failed with exception: {e}")
         return False
-    finally:
-        # Always return to original directory
-        os.chdir(original_cwd)
+
+
+def _dos_timestamp(timestamp):
+    """Encode a ``(year, month, day, hour, minute, second)`` tuple for ZIP."""
+    year, month, day, hour, minute, second = timestamp
+    dos_date = (year - 1980) << 9 | month << 5 | day
+    dos_time = hour << 11 | minute << 5 | second // 2
+    return dos_time, dos_date
+
+
+def _checksum_file(path):
+    """CRC-32 and size of a file, read in chunks without loading it whole."""
+    crc = 0
+    size = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(ZIP_CHUNK_SIZE), b""):
+            crc = zlib.crc32(chunk, crc)
+            size += len(chunk)
+    # No data: stored files are streamed from disk when they are written
+    return crc, size, size, None
+
+
+def _deflate_file(path):
+    """CRC-32, sizes and raw deflate stream of a file."""
+    data = path.read_bytes()
+    compressor = zlib.compressobj(ZIP_COMPRESSION_LEVEL, zlib.DEFLATED, -zlib.MAX_WBITS)
+    compressed = compressor.compress(data) + compressor.flush()
+    return zlib.crc32(data), len(compressed), len(data), compressed
+
+
+def _prepare_zip_entry(path):
+    """Checksum a stored file or deflate a compressible one."""
+    if path.suffix.lower() in STORED_EXTENSIONS:
+        return _checksum_file(path)
+    return _deflate_file(path)
+
+
+def _bounded_map(executor, fn, items, window):
+    """Map a function over items in an executor with a bounded queue.
+
+    Unlike ``Executor.map``, which submits every item up front, at most
+    ``window`` calls are pending at a time.
+
+    Args:
+        executor: Executor to submit the calls to
+        fn: Function called with each item
+        items: Iterable of arguments
+        window: Maximum number of calls submitted but not yet consumed
+
+    Yields:
+        The result of each call, in the order of the items
+    """
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def write_reproducible_zip(source_dir, zip_path, max_workers=None):
+    """Write a byte-reproducible ZIP archive of a directory.
+
+    Entries are sorted by path and carry a fixed timestamp and permissions,
+    so the same files always produce the same archive. Already-compressed
+    formats are stored as-is and streamed from disk; everything else is
+    deflated in a thread pool (zlib releases the GIL) and written in order.
+
+    Args:
+        source_dir: Directory whose files are archived
+        zip_path: Path of the ZIP file to write
+        max_workers: Number of compression threads (default: ThreadPoolExecutor's)
+
+    Returns:
+        List of archive names in the order they were written
+
+    Raises:
+        ValueError: If the archive would need ZIP64 extensions
+    """
+    source_dir = Path(source_dir)
+    zip_path = Path(zip_path)
+    files = sorted(
+        (path.relative_to(source_dir).as_posix(), path)
+        for path in source_dir.rglob("*")
+        if path.is_file() and path.resolve() != zip_path.resolve()
+    )
+    dos_time, dos_date = _dos_timestamp(ZIP_TIMESTAMP)
+    if max_workers is None:
+        # ThreadPoolExecutor's own default
+        max_workers = min(32, (os.cpu_count() or 1) + 4)
+
+    central_directory = []
+    with (
+        ThreadPoolExecutor(max_workers=max_workers) as executor,
+        open(zip_path, "wb") as zipf,
+    ):
+        # Only a window of entries is in flight, so at most that many deflated
+        # payloads are held in memory; results come back in submission order
+        results = _bounded_map(
+            executor, _prepare_zip_entry, (path for _, path in files), 2 * max_workers
+        )
+        for (arcname, path), (crc, compressed_size, size, data) in zip(files, results):
+            offset = zipf.tell()
+            if max(offset, compressed_size, size) >= ZIP64_LIMIT:
+                raise ValueError(f"{arcname} is too large for a ZIP archive")
+            name = arcname.encode("utf-8")
+            method = zipfile.ZIP_STORED if data is None else zipfile.ZIP_DEFLATED
+            flags = 0 if name.isascii() else ZIP_UTF8_FLAG
+            fields = (method, dos_time, dos_date, crc, compressed_size, size, len(name))
+
+            zipf.write(
+                struct.pack(
+                    zipfile.structFileHeader,
+                    zipfile.stringFileHeader,
+                    ZIP_VERSION,
+                    0,
+                    flags,
+                    *fields,
+                    0,
+                )
+                + name
+            )
+            if data is None:
+                with open(path, "rb") as f:
+                    shutil.copyfileobj(f, zipf, ZIP_CHUNK_SIZE)
+            else:
+                zipf.write(data)
+
+            central_directory.append(
+                struct.pack(
+                    zipfile.structCentralDir,
+                    zipfile.stringCentralDir,
+                    ZIP_VERSION,
+                    ZIP_UNIX_SYSTEM,
+                    ZIP_VERSION,
+                    0,
+                    flags,
+                    *fields,
+                    0,
+                    0,
+                    0,
+                    0,
+                    ZIP_FILE_ATTRIBUTES,
+                    offset,
+                )
+                + name
+            )
+
+        directory_offset = zipf.tell()
+        directory = b"".join(central_directory)
+        if directory_offset + len(directory) >= ZIP64_LIMIT:
+            raise ValueError("Archive is too large for a ZIP file")
+        zipf.write(directory)
+        zipf.write(
+            struct.pack(
+                zipfile.structEndArchive,
+                zipfile.stringEndArchive,
+                0,
+                0,
+                len(files),
+                len(files),
+                len(directory),
+                directory_offset,
+                0,
+            )
+        )
+
+    return [arcname for arcname, _ in files]
 
 
 def create_zip_package(arxiv_path, zip_filename="for_arxiv.zip"):
-    """Create a ZIP file for arXiv submission."""
+    """Create a reproducible ZIP file for arXiv submission."""
     zip_path = Path(zip_filename).resolve()
 
     print(f"\n📁 Creating ZIP package: {zip_path}")
 
-    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-        for file_path in arxiv_path.rglob("*"):
-            if file_path.is_file():
-                # Store files with relative paths
-                arcname = file_path.relative_to(arxiv_path)
-                zipf.write(file_path, arcname)
-                print(f"  Added: {arcname}")
+    for arcname in write_reproducible_zip(arxiv_path, zip_path):
+        print(f"  Added: {arcname}")
 
     print(f"✅ ZIP package created: {zip_path}")
     print("📤 Ready for arXiv submission!")
@@ -3,9 +3,19 @@
 A comprehensive toolkit for automated scientific article generation and building.
 """
 
-from ._version import get_versions
+__author__ = "Rxiv-Maker Contributors"
 
-__version__ = get_versions()["version"]
-del get_versions
 
-__author__ = "Rxiv-Maker Contributors"
+def __getattr__(name):
+    """Compute ``__version__`` on first access.
+
+    Versioneer may run git to find the version, which is too slow to do every
+    time the package is imported by the command line entry point.
+    """
+    if name != "__version__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from ._version import get_versions
+
+    version = get_versions()["version"]
+    globals()["__version__"] = version
+    return version
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Command line entry point for Rxiv-Maker.
+
+Installed as the ``rxiv`` console script. Each subcommand is a module in
+``commands`` whose ``main()`` parses the remaining arguments. A command module
+is only imported once its subcommand has been chosen, so ``rxiv validate
+--help`` loads neither the conversion pipeline nor the figure libraries.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# The build modules import each other as top-level packages (converters,
+# processors, utils, ...), as they do when the Makefile runs them as scripts,
+# so their directory, src/py or the installed rxiv_maker, has to be on the path
+PACKAGE_DIR = str(Path(__file__).parent)
+if PACKAGE_DIR not in sys.path:
+    sys.path.insert(0, PACKAGE_DIR)
+
+# Module and summary of each subcommand
+COMMANDS = {
+    "generate": ("commands.generate_preprint", "Generate the LaTeX manuscript"),
+    "figures": ("commands.generate_figures", "Generate figures from FIGURES"),
+    "validate": ("commands.validate", "Validate a manuscript directory"),
+    "word-count": ("commands.analyze_word_count", "Analyze section word counts"),
+    "copy-pdf": ("commands.copy_pdf", "Copy the PDF to the manuscript directory"),
+    "config": ("commands.manuscript_config", "Print the manuscript configuration"),
+    "batch": ("commands.build_batch", "Build many manuscripts in one run"),
+    "pdf-report": ("commands.pdf_report", "Report the size of the built PDF"),
+}
+
+
+def build_parser():
+    """Build the parser that selects the subcommand."""
+    epilog = "Commands:\n" + "\n".join(
+        f"  {name:<12}{summary}" for name, (_, summary) in COMMANDS.items()
+    )
+    parser = argparse.ArgumentParser(
+        prog="rxiv",
+        description="Automated LaTeX article generation with Rxiv-Maker",
+        epilog=epilog + "\n\nRun 'rxiv COMMAND --help' for the command's options.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "command", choices=COMMANDS, metavar="COMMAND", help="command to run"
+    )
+    parser.add_argument("args", nargs=argparse.REMAINDER, help=argparse.SUPPRESS)
+    return parser
+
+
+def main(argv=None):
+    """Run the subcommand named by the first argument.
+
+    Args:
+        argv: Command line arguments without the program name, defaulting
+            to ``sys.argv[1:]``
+
+    Returns:
+        Exit status of the subcommand
+    """
+    args = build_parser().parse_args(argv)
+    module_name = COMMANDS[args.command][0]
+
+    from utils import load_environment
+
+    load_environment()
+    # Unlike importlib.import_module, __import__ is timed by -X importtime
+    command = __import__(module_name, fromlist=["main"])
+
+    # Commands parse sys.argv themselves
+    sys.argv = [f"rxiv {args.command}", *args.args]
+    return command.main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
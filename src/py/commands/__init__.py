@@ -1,11 +1,47 @@
 """Command-line interface modules for Rxiv-Maker.
 
 This package contains the main executable scripts for article and figure generation.
+
+Commands are imported on first access (PEP 562), so running one command does
+not load the dependencies of the others.
 """
 
-from .generate_figures import FigureGenerator
-from .generate_figures import main as figures_main
-from .generate_preprint import generate_preprint
-from .generate_preprint import main as preprint_main
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .generate_figures import FigureGenerator
+    from .generate_figures import main as figures_main
+    from .generate_preprint import generate_preprint
+    from .generate_preprint import main as preprint_main
+
+# Submodule and attribute of each exported name. Once the generate_preprint
+# submodule has been imported, it shadows the function of the same name;
+# import the function from the submodule to be unambiguous.
+_EXPORTS = {
+    "generate_preprint": (".generate_preprint", "generate_preprint"),
+    "preprint_main": (".generate_preprint", "main"),
+    "FigureGenerator": (".generate_figures", "FigureGenerator"),
+    "figures_main": (".generate_figures", "main"),
+}
+
+__all__ = [
+    "generate_preprint",
+    "preprint_main",
+    "FigureGenerator",
+    "figures_main",
+]
+
+
+def __getattr__(name):
+    """Import the command module defining ``name`` on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _EXPORTS[name]
+    value = getattr(importlib.import_module(module_name, __name__), attribute)
+    globals()[name] = value
+    return value
+
 
-__all__ = ["generate_preprint", "preprint_main", "FigureGenerator", "figures_main"]
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
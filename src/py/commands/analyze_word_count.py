@@ -2,7 +2,9 @@
 """Word count analysis command for Rxiv-Maker.
 
 This module provides word count analysis functionality that can be run independently
-after manuscript generation to provide statistics about the document.
+after manuscript generation to provide statistics about the document. The counts
+are read from the JSON written during manuscript generation; the manuscript is
+only converted again when no up-to-date counts are available.
 """
 
 import argparse
@@ -12,26 +14,54 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from converters.md2tex import extract_content_sections
+from converters.section_processor import count_content_sections
+from converters.word_counter import (
+    MarkdownWordCount,
+    count_words_in_text,
+    load_word_counts,
+)
 from utils import find_manuscript_md
 
-
-def count_words_in_text(text):
-    """Count words in text, excluding LaTeX commands."""
-    import re
-
-    # Remove LaTeX commands (backslash followed by word characters)
-    text_no_latex = re.sub(r"\\[a-zA-Z]+\{[^}]*\}", "", text)
-    text_no_latex = re.sub(r"\\[a-zA-Z]+", "", text_no_latex)
-    # Remove remaining LaTeX markup
-    text_no_latex = re.sub(r"[{}\\]", " ", text_no_latex)
-    # Split by whitespace and count non-empty words
-    words = [word.strip() for word in text_no_latex.split() if word.strip()]
-    return len(words)
+__all__ = [
+    "analyze_section_word_counts",
+    "count_words_in_text",
+    "report_word_counts",
+]
 
 
 def analyze_section_word_counts(content_sections):
     """Analyze word counts for each section and provide warnings."""
+    word_counts = {
+        section_key: MarkdownWordCount(words=count_words_in_text(content))
+        for section_key, content in content_sections.items()
+        if content.strip()
+    }
+    report_word_counts(word_counts)
+
+
+def _describe_other_tokens(count):
+    """Summarise the non-prose tokens of a section, e.g. ``3 citations``."""
+    parts = [
+        f"{number} {name}"
+        for number, name in (
+            (count.caption_words, "caption words"),
+            (count.citations, "citations"),
+            (count.math, "math"),
+            (count.code, "code"),
+            (count.table_words, "table words"),
+        )
+        if number
+    ]
+    return f" [{', '.join(parts)}]" if parts else ""
+
+
+def report_word_counts(word_counts, show_paragraphs=False):
+    """Print word counts for each section with guideline warnings.
+
+    Args:
+        word_counts: MarkdownWordCount per section key, in document order
+        show_paragraphs: Also print the prose words of every paragraph
+    """
     section_guidelines = {
         "abstract": {"ideal": 150, "max_warning": 250, "description": "Abstract"},
         "main": {"ideal": 1500, "max_warning": 3000, "description": "Main content"},
@@ -51,34 +81,49 @@ def analyze_section_word_counts(content_sections):
     print("=" * 50)
 
     total_words = 0
-    for section_key, content in content_sections.items():
-        if content.strip():
-            word_count = count_words_in_text(content)
-            total_words += word_count
-
-            # Get guidelines for this section
-            guidelines = section_guidelines.get(section_key, {})
-            section_name = guidelines.get(
-                "description", section_key.replace("_", " ").title()
-            )
-            ideal = guidelines.get("ideal")
-            max_warning = guidelines.get("max_warning")
-
-            # Format output
-            status = "✓"
-            warning = ""
-
-            if max_warning and word_count > max_warning:
-                status = "⚠️"
-                warning = f" (exceeds typical {max_warning} word limit)"
-            elif ideal and word_count > ideal * 1.5:
-                status = "⚠️"
-                warning = f" (consider typical ~{ideal} words)"
-
-            print(f"{status} {section_name:<15}: {word_count:>4} words{warning}")
+    total_characters = 0
+    captions = {}
+    for section_key, count in word_counts.items():
+        word_count = count.words
+        total_words += word_count
+        total_characters += count.characters
+        captions.update(count.captions)
+
+        # Get guidelines for this section
+        guidelines = section_guidelines.get(section_key, {})
+        section_name = guidelines.get(
+            "description", section_key.replace("_", " ").title()
+        )
+        ideal = guidelines.get("ideal")
+        max_warning = guidelines.get("max_warning")
+
+        # Format output
+        status = "✓"
+        warning = ""
+
+        if max_warning and word_count > max_warning:
+            status = "⚠️"
+            warning = f" (exceeds typical {max_warning} word limit)"
+        elif ideal and word_count > ideal * 1.5:
+            status = "⚠️"
+            warning = f" (consider typical ~{ideal} words)"
+
+        print(
+            f"{status} {section_name:<15}: {word_count:>4} words{warning}"
+            f"{_describe_other_tokens(count)}"
+        )
+        if show_paragraphs:
+            for number, paragraph_words in enumerate(count.paragraphs, 1):
+                print(f"    ¶{number:<3}: {paragraph_words:>4} words")
+
+    if captions:
+        print("-" * 50)
+        for label, caption_words in captions.items():
+            print(f"🖼  {label:<25}: {caption_words:>4} caption words")
 
     print("-" * 50)
     print(f"📝 Total article words: {total_words}")
+    print(f"🔤 Total prose characters: {total_characters}")
 
     # Overall article length guidance
     if total_words > 8000:
@@ -104,6 +149,17 @@ def main():
         "-m",
         help="Path to manuscript markdown file (auto-detected if not provided)",
     )
+    parser.add_argument(
+        "--output-dir",
+        "-o",
+        default="output",
+        help="Output directory holding word_count.json (default: output)",
+    )
+    parser.add_argument(
+        "--paragraphs",
+        action="store_true",
+        help="Also report the word count of every paragraph",
+    )
 
     args = parser.parse_args()
 
@@ -120,11 +176,13 @@ def main():
                 print("Error: Could not find manuscript markdown file")
                 return 1
 
-        # Extract content sections from markdown
-        content_sections = extract_content_sections(str(manuscript_md))
+        # Reuse the counts from manuscript generation when they are current
+        word_counts = load_word_counts(args.output_dir, str(manuscript_md))
+        if word_counts is None:
+            word_counts = count_content_sections(str(manuscript_md))
 
         # Analyze word counts and provide warnings
-        analyze_section_word_counts(content_sections)
+        report_word_counts(word_counts, args.paragraphs)
 
         return 0
 
@@ -0,0 +1,728 @@
+#!/usr/bin/env python3
+"""Batch builds of many manuscripts.
+
+Builds a list of manuscript directories in one process instead of running
+``make pdf`` once per manuscript. Every manuscript goes through three stages:
+
+- figures: render Mermaid diagrams and run figure scripts whose outputs are
+  missing, or whose source or recorded data inputs changed
+- convert: generate the ``.tex`` files and collect the style files, the
+  bibliography and the figures in the manuscript's output directory
+- latex: run pdflatex and bibtex, and check the PDF against its size budget
+
+Stages of different manuscripts run concurrently on one shared thread pool,
+with a separate limit per stage, since LaTeX and the Chromium behind the
+Mermaid CLI need much more memory than the conversion. Files used by several
+manuscripts are stored once by content hash and hard-linked into the output
+directories, and identical Mermaid diagrams are rendered once. The outcome of
+every stage is written to a JSON report.
+
+Usage:
+    python build_batch.py MANUSCRIPT_DIR_OR_GLOB [...] [--output-dir DIR]
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from commands.generate_figures import FigureGenerator
+from converters.word_counter import write_word_counts
+from processors.build import MAIN_FILENAME, Manuscript, build_manuscript
+from processors.pdf_analyzer import (
+    PDF_SIZE_REPORT_FILENAME,
+    analyze_pdf,
+    check_size_budget,
+    size_budget,
+    write_size_report,
+)
+from processors.template_processor import get_template_path
+from utils import copy_pdf_to_manuscript_folder, inject_rxiv_citation
+
+STAGES = ("figures", "convert", "latex")
+
+REPORT_VERSION = 1
+REPORT_FILENAME = "batch_report.json"
+LATEX_LOG_FILENAME = "batch_latex.log"
+
+# Content-addressed files shared by the manuscripts of a batch
+STORE_DIRNAME = ".store"
+
+# Files LaTeX needs next to the generated manuscript
+STYLE_SUFFIXES = (".cls", ".bst", ".sty")
+
+# Formats the Mermaid CLI renders for every diagram
+DIAGRAM_FORMATS = ("svg", "png", "pdf")
+
+# Concurrent stages allowed by default; the pool size bounds the rest
+DEFAULT_STAGE_LIMITS = {"figures": 2, "latex": 2}
+
+
+class BatchError(Exception):
+    """A stage of a manuscript build failed."""
+
+
+@dataclass
+class StageResult:
+    """Outcome of one stage of a manuscript build.
+
+    Attributes:
+        status: ``ok``, ``failed`` or ``skipped``
+        seconds: Wall-clock time of the stage
+        error: Reason the stage failed or was skipped
+        details: Stage-specific information for the report
+    """
+
+    status: str
+    seconds: float = 0.0
+    error: Optional[str] = None
+    details: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class BatchJob:
+    """One manuscript of a batch and the results of its stages.
+
+    Attributes:
+        directory: Manuscript directory
+        name: Unique name of the manuscript within the batch
+        output_dir: Output directory of the manuscript's build
+        stages: Results of the stages that have finished, by stage name
+        metadata: Manuscript configuration, once converted
+        diagnostics: Problems found in the configuration
+        pdf: Generated PDF, once compiled
+    """
+
+    directory: Path
+    name: str
+    output_dir: Path
+    stages: dict[str, StageResult] = field(default_factory=dict)
+    metadata: dict[str, Any] = field(default_factory=dict)
+    diagnostics: list[str] = field(default_factory=list)
+    pdf: Optional[Path] = None
+
+    @property
+    def status(self):
+        """``failed`` if any stage failed, ``ok`` otherwise."""
+        if any(result.status == "failed" for result in self.stages.values()):
+            return "failed"
+        return "ok"
+
+    def to_dict(self):
+        """Entry of the manuscript in the batch report."""
+        return {
+            "name": self.name,
+            "directory": str(self.directory),
+            "output_dir": str(self.output_dir),
+            "status": self.status,
+            "pdf": str(self.pdf) if self.pdf else None,
+            "diagnostics": self.diagnostics,
+            "stages": {
+                stage: {
+                    "status": result.status,
+                    "seconds": round(result.seconds, 3),
+                    "error": result.error,
+                    **result.details,
+                }
+                for stage, result in self.stages.items()
+            },
+        }
+
+
+def file_sha256(path):
+    """SHA-256 hex digest of a file's content."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ContentStore:
+    """Files of a batch stored once per content and linked where they are used.
+
+    Stored files are hard-linked into the output directories, falling back
+    to copies where the file system does not support links, so the copies
+    in the output directories must not be modified in place.
+    """
+
+    def __init__(self, root):
+        """Initialize the store.
+
+        Args:
+            root: Directory holding the stored files
+        """
+        self.root = Path(root)
+        self.files = 0
+        self.unique = 0
+        self.bytes_saved = 0
+        self._lock = threading.Lock()
+
+    def link(self, source, destination):
+        """Place a file's content at ``destination`` through the store.
+
+        Args:
+            source: File to place
+            destination: Path of the copy in an output directory
+
+        Returns:
+            True if the content was already stored for another file
+        """
+        source = Path(source)
+        destination = Path(destination)
+        stored = self.root / f"{file_sha256(source)}{source.suffix}"
+
+        with self._lock:
+            reused = stored.exists()
+            if not reused:
+                self.root.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(source, stored)
+                self.unique += 1
+            else:
+                self.bytes_saved += stored.stat().st_size
+            self.files += 1
+
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        destination.unlink(missing_ok=True)
+        try:
+            os.link(stored, destination)
+        except OSError:
+            shutil.copy2(stored, destination)
+        return reused
+
+    def stats(self):
+        """Deduplication statistics for the batch report."""
+        return {
+            "files": self.files,
+            "unique": self.unique,
+            "bytes_saved": self.bytes_saved,
+        }
+
+
+class DiagramCache:
+    """Mermaid diagrams rendered once per content for the whole batch."""
+
+    def __init__(self, root):
+        """Initialize the cache.
+
+        Args:
+            root: Directory holding the rendered diagrams by content hash
+        """
+        self.root = Path(root)
+        self.rendered = 0
+        self.reused = 0
+        self._lock = threading.Lock()
+        self._diagram_locks = {}
+
+    def render(self, mmd_file, figure_dir):
+        """Render a diagram into its figure directory, reusing earlier renders.
+
+        Args:
+            mmd_file: Mermaid source file
+            figure_dir: Directory receiving ``<stem>.<format>`` files
+
+        Returns:
+            True if the diagram had already been rendered for the batch
+        """
+        mmd_file = Path(mmd_file)
+        digest = file_sha256(mmd_file)
+        with self._lock:
+            diagram_lock = self._diagram_locks.setdefault(digest, threading.Lock())
+
+        cached_dir = self.root / digest
+        cached_source = cached_dir / "diagram.mmd"
+        with diagram_lock:
+            reused = (cached_dir / "diagram" / "diagram.pdf").exists()
+            if not reused:
+                cached_dir.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(mmd_file, cached_source)
+                FigureGenerator(cached_dir, cached_dir, "pdf").generate_mermaid_figure(
+                    cached_source
+                )
+
+        with self._lock:
+            if reused:
+                self.reused += 1
+            else:
+                self.rendered += 1
+
+        figure_dir = Path(figure_dir)
+        figure_dir.mkdir(parents=True, exist_ok=True)
+        for output_format in DIAGRAM_FORMATS:
+            rendered = cached_dir / "diagram" / f"diagram.{output_format}"
+            if rendered.exists():
+                shutil.copy2(rendered, figure_dir / f"{mmd_file.stem}.{output_format}")
+        return reused
+
+    def stats(self):
+        """Diagram statistics for the batch report."""
+        return {"diagrams_rendered": self.rendered, "diagrams_reused": self.reused}
+
+
+class StageScheduler:
+    """Run the stages of many jobs on one pool with per-stage limits.
+
+    The stages of a job run in order. A stage is only submitted once the
+    pool has a free worker and the stage is below its limit, so waiting for
+    a busy stage never blocks a worker that could run another one. When a
+    stage fails, the remaining stages of its job are skipped.
+    """
+
+    def __init__(self, stages, max_workers, limits=None, on_stage_done=None):
+        """Initialize the scheduler.
+
+        Args:
+            stages: Callable of each stage, in order, taking the job and
+                returning the stage details for the report
+            max_workers: Size of the shared worker pool
+            limits: Maximum concurrent runs by stage name; stages without a
+                limit are bounded by the pool only
+            on_stage_done: Called with the job and stage name after each stage
+        """
+        self.stages: dict[str, Callable[[BatchJob], Optional[dict]]] = dict(stages)
+        self.max_workers = max(1, max_workers)
+        self.limits = {stage: max(1, limit) for stage, limit in (limits or {}).items()}
+        self.on_stage_done = on_stage_done
+
+    def _run_stage(self, stage, job):
+        """Run one stage and record its result on the job."""
+        start = time.perf_counter()
+        try:
+            details = self.stages[stage](job) or {}
+            result = StageResult("ok", details=details)
+        except Exception as e:
+            result = StageResult("failed", error=str(e) or type(e).__name__)
+        result.seconds = time.perf_counter() - start
+        job.stages[stage] = result
+
+    def run(self, jobs):
+        """Run every stage of every job.
+
+        Args:
+            jobs: Jobs to build; their ``stages`` receive the results
+        """
+        order = list(self.stages)
+        waiting = [(job, order[0]) for job in jobs if order]
+        running = {}
+        active = Counter()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while waiting or running:
+                still_waiting = []
+                for job, stage in waiting:
+                    limit = self.limits.get(stage, self.max_workers)
+                    if len(running) >= self.max_workers or active[stage] >= limit:
+                        still_waiting.append((job, stage))
+                        continue
+                    active[stage] += 1
+                    future = pool.submit(self._run_stage, stage, job)
+                    running[future] = (job, stage)
+                waiting = still_waiting
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job, stage = running.pop(future)
+                    active[stage] -= 1
+                    if self.on_stage_done:
+                        self.on_stage_done(job, stage)
+
+                    remaining = order[order.index(stage) + 1 :]
+                    if job.stages[stage].status == "failed":
+                        for skipped in remaining:
+                            job.stages[skipped] = StageResult(
+                                "skipped", error=f"{stage} stage failed"
+                            )
+                    elif remaining:
+                        waiting.append((job, remaining[0]))
+
+
+class BatchBuilder:
+    """Stages of the manuscript builds of one batch."""
+
+    def __init__(self, output_root, force_figures=False):
+        """Initialize the builder.
+
+        Args:
+            output_root: Directory holding the output directory of every
+                manuscript, the shared store and the report
+            force_figures: Regenerate figures whose outputs already exist
+        """
+        self.output_root = Path(output_root)
+        self.force_figures = force_figures
+        self.store = ContentStore(self.output_root / STORE_DIRNAME / "files")
+        self.diagrams = DiagramCache(self.output_root / STORE_DIRNAME / "diagrams")
+        self.style_files = sorted(
+            path
+            for path in (get_template_path().parent / "style").iterdir()
+            if path.suffix in STYLE_SUFFIXES
+        )
+
+    def stages(self):
+        """Callable of each stage, in build order."""
+        return {
+            "figures": self.generate_figures,
+            "convert": self.convert,
+            "latex": self.compile_latex,
+        }
+
+    def generate_figures(self, job):
+        """Generate the missing figures of a manuscript in its FIGURES folder."""
+        figures_dir = job.directory / "FIGURES"
+        if not figures_dir.is_dir():
+            return {"generated": 0}
+
+        generator = FigureGenerator(figures_dir, figures_dir, "pdf")
+        generated = 0
+        missing = []
+
+        for mmd_file in sorted(figures_dir.glob("*.mmd")):
+            output = figures_dir / mmd_file.stem / f"{mmd_file.stem}.pdf"
+            if not (self.force_figures or generator.needs_update(mmd_file)):
+                continue
+            self.diagrams.render(mmd_file, output.parent)
+            generated += 1
+            if not output.exists():
+                missing.append(mmd_file.name)
+                continue
+            rendered = [output.with_suffix(f".{ext}") for ext in DIAGRAM_FORMATS]
+            generator.outputs.record(
+                mmd_file,
+                [path.relative_to(figures_dir) for path in rendered if path.exists()],
+            )
+
+        scripts = [
+            (figures_dir.glob("*.py"), generator.generate_python_figure),
+            (figures_dir.glob("*.R"), generator.generate_r_figure),
+        ]
+        try:
+            for paths, generate in scripts:
+                for script in sorted(paths):
+                    if not (self.force_figures or generator.needs_update(script)):
+                        continue
+                    generated += 1
+                    # Outputs of earlier runs left in place do not count
+                    if not generate(script):
+                        missing.append(script.name)
+        finally:
+            # R scripts of the manuscript share one R session
+            generator.close()
+
+        if missing:
+            raise BatchError(f"No figure generated for {', '.join(missing)}")
+
+        details = {"generated": generated}
+        if generated:
+            raster_savings = generator.optimize_raster_figures()
+            if raster_savings is not None:
+                details["raster_bytes_saved"] = raster_savings.bytes_saved
+            pdf_savings = generator.optimize_pdf_figures()
+            if pdf_savings is not None:
+                details["pdf_bytes_saved"] = pdf_savings.bytes_saved
+        return details
+
+    def convert(self, job):
+        """Generate the LaTeX files of a manuscript and collect their inputs."""
+        output_dir = job.output_dir
+        (output_dir / "Figures").mkdir(parents=True, exist_ok=True)
+
+        manuscript = Manuscript.from_directory(job.directory, str(output_dir))
+        result = build_manuscript(manuscript, output_dir=str(output_dir))
+        job.metadata = manuscript.metadata
+        job.diagnostics = result.diagnostics
+
+        (output_dir / f"{manuscript.name}.tex").write_text(result.tex, encoding="utf-8")
+        (output_dir / "Supplementary.tex").write_text(
+            result.supplementary_tex, encoding="utf-8"
+        )
+        write_word_counts(
+            str(output_dir), result.word_counts, str(job.directory / MAIN_FILENAME)
+        )
+
+        inject_rxiv_citation(manuscript.metadata, str(job.directory))
+
+        inputs = [(path, output_dir / path.name) for path in self.style_files]
+        bib_filename = manuscript.metadata.get("bibliography", "03_REFERENCES.bib")
+        if not bib_filename.endswith(".bib"):
+            bib_filename += ".bib"
+        bib_file = job.directory / bib_filename
+        if bib_file.is_file():
+            inputs.append((bib_file, output_dir / bib_file.name))
+
+        figures_dir = job.directory / "FIGURES"
+        if figures_dir.is_dir():
+            for path in sorted(figures_dir.rglob("*")):
+                relative = path.relative_to(figures_dir)
+                # Caches in FIGURES are not inputs of the LaTeX build
+                hidden = any(part.startswith(".") for part in relative.parts)
+                if path.is_file() and not hidden and "__pycache__" not in path.parts:
+                    inputs.append((path, output_dir / "Figures" / relative))
+
+        shared = sum(self.store.link(source, dest) for source, dest in inputs)
+        return {"files": len(inputs), "shared_files": shared}
+
+    def compile_latex(self, job):
+        """Compile a converted manuscript to PDF as ``make pdf`` does."""
+        if shutil.which("pdflatex") is None:
+            raise BatchError("pdflatex not found")
+
+        name = job.directory.name
+        pdflatex = ["pdflatex", "-interaction=nonstopmode", f"{name}.tex"]
+        commands = [pdflatex, ["bibtex", name], pdflatex, pdflatex]
+
+        log_path = job.output_dir / LATEX_LOG_FILENAME
+        return_codes = []
+        with open(log_path, "w", encoding="utf-8") as log:
+            for command in commands:
+                try:
+                    completed = subprocess.run(  # nosec B603
+                        command,
+                        cwd=job.output_dir,
+                        stdout=log,
+                        stderr=subprocess.STDOUT,
+                        stdin=subprocess.DEVNULL,
+                    )
+                    return_codes.append(completed.returncode)
+                except FileNotFoundError:
+                    # bibtex is optional, as in the Makefile
+                    return_codes.append(None)
+
+        pdf = job.output_dir / f"{name}.pdf"
+        if not pdf.exists():
+            raise BatchError(f"LaTeX produced no PDF, see {log_path}")
+        job.pdf = pdf
+
+        report = analyze_pdf(pdf)
+        check_size_budget(report, **size_budget(job.metadata))
+        write_size_report(report, job.output_dir / PDF_SIZE_REPORT_FILENAME)
+
+        copy_pdf_to_manuscript_folder(job.output_dir, job.metadata, str(job.directory))
+        return {
+            "return_codes": return_codes,
+            "log": str(log_path),
+            "pdf_bytes": report.file_bytes,
+            "budget_violations": report.violations,
+        }
+
+
+def find_manuscripts(patterns):
+    """Expand manuscript directories and glob patterns.
+
+    Args:
+        patterns: Directories or glob patterns matching directories
+
+    Returns:
+        Manuscript directories holding a 01_MAIN.md, without duplicates,
+        in the order given
+
+    Raises:
+        BatchError: If a pattern matches no manuscript directory
+    """
+    directories = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) or [pattern]
+        found = [
+            Path(match).resolve()
+            for match in matches
+            if (Path(match) / MAIN_FILENAME).is_file()
+        ]
+        if not found:
+            raise BatchError(f"No manuscript directory matches {pattern}")
+        directories.extend(path for path in found if path not in directories)
+    return directories
+
+
+def create_jobs(directories, output_root):
+    """Create a job per manuscript with an output directory of its own."""
+    jobs = []
+    names = Counter()
+    for directory in directories:
+        names[directory.name] += 1
+        name = directory.name
+        if names[directory.name] > 1:
+            name = f"{directory.name}-{names[directory.name]}"
+        jobs.append(BatchJob(directory, name, Path(output_root) / name))
+    return jobs
+
+
+def write_report(path, jobs, builder, settings, started, seconds):
+    """Write the consolidated JSON report of a batch.
+
+    Returns:
+        The report as a dictionary
+    """
+    statuses = Counter(job.status for job in jobs)
+    report = {
+        "version": REPORT_VERSION,
+        "started": started.isoformat(),
+        "seconds": round(seconds, 3),
+        "settings": settings,
+        "summary": {
+            "manuscripts": len(jobs),
+            "succeeded": statuses["ok"],
+            "failed": statuses["failed"],
+        },
+        "deduplication": {**builder.store.stats(), **builder.diagrams.stats()},
+        "manuscripts": [job.to_dict() for job in jobs],
+    }
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    return report
+
+
+def run_batch(
+    patterns,
+    output_root="batch-output",
+    jobs=None,
+    stage_limits=None,
+    skip=(),
+    force_figures=False,
+    report_path=None,
+):
+    """Build many manuscripts and write the batch report.
+
+    Args:
+        patterns: Manuscript directories or glob patterns
+        output_root: Directory receiving one output directory per manuscript
+        jobs: Size of the shared worker pool (default: number of CPUs)
+        stage_limits: Maximum concurrent runs by stage name
+        skip: Stages not to run
+        force_figures: Regenerate figures whose outputs already exist
+        report_path: Path of the JSON report (default: in ``output_root``)
+
+    Returns:
+        The report as a dictionary
+    """
+    started = datetime.now(timezone.utc)
+    start = time.perf_counter()
+
+    output_root = Path(output_root).resolve()
+    batch = create_jobs(find_manuscripts(patterns), output_root)
+    builder = BatchBuilder(output_root, force_figures)
+    stages = {
+        stage: run for stage, run in builder.stages().items() if stage not in skip
+    }
+    limits = {**DEFAULT_STAGE_LIMITS, **(stage_limits or {})}
+    max_workers = jobs or os.cpu_count() or 1
+
+    def report_stage(job, stage):
+        result = job.stages[stage]
+        message = f"[{stage}] {job.name}: {result.status} ({result.seconds:.1f}s)"
+        if result.error:
+            message += f" - {result.error}"
+        print(message, flush=True)
+
+    StageScheduler(stages, max_workers, limits, report_stage).run(batch)
+
+    settings = {
+        "jobs": max_workers,
+        "stage_limits": {stage: limits.get(stage, max_workers) for stage in stages},
+        "skipped_stages": [stage for stage in STAGES if stage in skip],
+    }
+    return write_report(
+        report_path or output_root / REPORT_FILENAME,
+        batch,
+        builder,
+        settings,
+        started,
+        time.perf_counter() - start,
+    )
+
+
+def main():
+    """Main entry point for the batch build command."""
+    parser = argparse.ArgumentParser(
+        description="Build many manuscripts with a shared worker pool",
+        fromfile_prefix_chars="@",
+    )
+    parser.add_argument(
+        "manuscripts",
+        nargs="+",
+        help="Manuscript directories or glob patterns (@FILE reads them from FILE)",
+    )
+    parser.add_argument(
+        "--output-dir",
+        "-o",
+        default="batch-output",
+        help="Directory for the manuscript outputs (default: batch-output)",
+    )
+    parser.add_argument(
+        "--jobs", "-j", type=int, help="Worker pool size (default: number of CPUs)"
+    )
+    parser.add_argument(
+        "--figure-jobs",
+        type=int,
+        default=DEFAULT_STAGE_LIMITS["figures"],
+        help="Concurrent figure stages (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--convert-jobs", type=int, help="Concurrent conversions (default: pool size)"
+    )
+    parser.add_argument(
+        "--latex-jobs",
+        type=int,
+        default=DEFAULT_STAGE_LIMITS["latex"],
+        help="Concurrent LaTeX builds (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--skip",
+        action="append",
+        choices=STAGES,
+        default=[],
+        help="Stage not to run; may be repeated",
+    )
+    parser.add_argument(
+        "--force-figures",
+        action="store_true",
+        help="Regenerate figures whose outputs already exist",
+    )
+    parser.add_argument(
+        "--report",
+        help=f"Path of the JSON report (default: OUTPUT_DIR/{REPORT_FILENAME})",
+    )
+
+    args = parser.parse_args()
+
+    stage_limits = {"figures": args.figure_jobs, "latex": args.latex_jobs}
+    if args.convert_jobs:
+        stage_limits["convert"] = args.convert_jobs
+
+    try:
+        report = run_batch(
+            args.manuscripts,
+            args.output_dir,
+            args.jobs,
+            stage_limits,
+            args.skip,
+            args.force_figures,
+            args.report,
+        )
+    except BatchError as e:
+        print(f"Error: {e}")
+        return 1
+
+    summary = report["summary"]
+    print(
+        f"Built {summary['succeeded']} of {summary['manuscripts']} manuscripts "
+        f"in {report['seconds']:.1f}s"
+    )
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
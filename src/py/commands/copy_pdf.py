@@ -34,7 +34,7 @@ def main():
         manuscript_md = find_manuscript_md()
 
         print(f"Reading metadata from: {manuscript_md}")
-        yaml_metadata = extract_yaml_metadata(manuscript_md)
+        yaml_metadata = extract_yaml_metadata(manuscript_md, args.output_dir)
 
         # Copy PDF with custom filename
         result = copy_pdf_to_manuscript_folder(args.output_dir, yaml_metadata)
@@ -7,24 +7,197 @@ publication-ready output files. It supports:
 - .py files: Python scripts for matplotlib/seaborn figures
 - .R files: R scripts (executes script and captures output figures)
 
+The files each source creates or modifies are recorded in the figure outputs
+manifest (see processors/figure_outputs.py), together with the data files a
+Python script reads. With --changed-only, a figure is only generated again when
+its source or one of those inputs changed, or an output is missing; the PNGs
+are still resized when the width of a figure in the manuscript changed.
+
+R scripts run one after another in a single long-lived R session by default,
+so the packages they load are only loaded once per run.
+
+The PNGs of generated figures are then downsampled to the resolution they need
+at the width they are printed at and recompressed losslessly, and their PDFs
+are compacted.
+
 Usage:
     python generate_figures.py [--output-dir OUTPUT_DIR] [--format FORMAT]
 """
 
 import argparse
+import json
 import os
 import subprocess
 import sys
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from processors.figure_outputs import FigureOutputs, changed_files, snapshot
+
 PUPPETEER_CONFIG_PATH = Path(__file__).parent / "puppeteer-config.json"
+R_WORKER_PATH = Path(__file__).parent / "r_worker.R"
+FIGURE_SCRIPT_RUNNER_PATH = (
+    Path(__file__).parent.parent / "scripts" / "run_figure_script.py"
+)
+
+# How R figure scripts are run: in one shared R session, or one Rscript each
+R_RUNNERS = ("session", "script")
+
+# Line the R session answers each script with
+R_DONE_MARKER = "RXIV_DONE"
+
+
+@lru_cache(maxsize=1)
+def rscript_available():
+    """Check once per run whether Rscript is available."""
+    try:
+        subprocess.run(
+            ["Rscript", "--version"], capture_output=True, check=True
+        )  # nosec B603 B607
+        return True
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return False
+
+
+class RSession:
+    """Long-lived R session sourcing figure scripts one after another.
+
+    The session runs ``r_worker.R``, which sources each script in its own
+    environment with the figure directory as working directory. Packages
+    attached by a script stay loaded for the next ones. A session that dies,
+    for instance in a crashing package, is restarted for the next script.
+    """
+
+    def __init__(self, rscript="Rscript"):
+        """Initialize the session, started by the first script.
+
+        Args:
+            rscript: Rscript executable running the session
+        """
+        self.rscript = rscript
+        self.process = None
+        self._scratch = None
+        self._log = None
+        self._requests = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def start(self):
+        """Start the R session."""
+        self.close()
+        self._scratch = tempfile.TemporaryDirectory(prefix="rxiv-r-")
+        self._log = open(Path(self._scratch.name) / "session.log", "w")  # noqa: SIM115
+        self.process = subprocess.Popen(  # nosec B603
+            [self.rscript, str(R_WORKER_PATH)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=self._log,
+            text=True,
+            bufsize=1,
+        )
+
+    def run(self, script, cwd):
+        """Source an R script in the session.
+
+        Args:
+            script: R script to run
+            cwd: Working directory of the script
+
+        Returns:
+            subprocess.CompletedProcess with the exit status, output and
+            messages of the script
+        """
+        if self.process is None or self.process.poll() is not None:
+            self.start()
+
+        self._requests += 1
+        token = str(self._requests)
+        scratch = Path(self._scratch.name)
+        stdout_path = scratch / f"{token}.out"
+        stderr_path = scratch / f"{token}.err"
+        request = "\t".join(
+            [
+                token,
+                str(Path(script).absolute()),
+                str(Path(cwd).absolute()),
+                str(stdout_path),
+                str(stderr_path),
+            ]
+        )
+
+        # Output of child processes bypasses the sinks of the session
+        output = []
+        returncode = None
+        try:
+            self.process.stdin.write(request + "\n")
+            self.process.stdin.flush()
+            for line in self.process.stdout:
+                if line.startswith(f"{R_DONE_MARKER} {token} "):
+                    returncode = int(line.split()[2])
+                    break
+                output.append(line)
+        except BrokenPipeError:
+            pass
+
+        stdout = "".join(output) + self._read(stdout_path)
+        stderr = self._read(stderr_path)
+        if returncode is None:
+            returncode = 1
+            self.process.wait()
+            self._log.flush()
+            stderr += "R session exited while running the script\n"
+            stderr += self._read(scratch / "session.log")
+            self.process = None
+        return subprocess.CompletedProcess(
+            [self.rscript, str(script)], returncode, stdout, stderr
+        )
+
+    def close(self):
+        """End the R session."""
+        if self.process is not None:
+            self.process.stdin.close()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+            self.process.stdout.close()
+            self.process = None
+        if self._scratch is not None:
+            self._log.close()
+            self._scratch.cleanup()
+            self._scratch = None
+
+    @staticmethod
+    def _read(path):
+        """Content of an output file of the session, if written."""
+        try:
+            return Path(path).read_text(encoding="utf-8", errors="replace")
+        except FileNotFoundError:
+            return ""
 
 
 class FigureGenerator:
     """Main class for generating figures from various source formats."""
 
     def __init__(
-        self, figures_dir="FIGURES", output_dir="FIGURES", output_format="png"
+        self,
+        figures_dir="FIGURES",
+        output_dir="FIGURES",
+        output_format="png",
+        optimize_rasters=True,
+        raster_dpi=300,
+        optimize_pdfs=True,
+        r_runner="session",
+        changed_only=False,
     ):
         """Initialize the figure generator.
 
@@ -32,11 +205,32 @@ class FigureGenerator:
             figures_dir: Directory containing source figure files
             output_dir: Directory for generated output files
             output_format: Default output format for figures
+            optimize_rasters: Whether to downsample and recompress the
+                generated PNGs for the size they are printed at
+            raster_dpi: Resolution of the PNGs at their printed size
+            optimize_pdfs: Whether to compact the generated PDFs
+            r_runner: ``session`` to run R scripts in one shared R session,
+                ``script`` to start a new Rscript for each
+            changed_only: Whether to only generate the figures whose source
+                or recorded inputs changed, or whose outputs are missing
         """
         self.figures_dir = Path(figures_dir)
         self.output_dir = Path(output_dir)
         self.output_format = output_format.lower()
+        self.optimize_rasters = optimize_rasters
+        self.raster_dpi = raster_dpi
+        self.optimize_pdfs = optimize_pdfs
+        self.r_runner = r_runner
+        self.changed_only = changed_only
+        # Names of the sources whose generation failed during this run
+        self.failed = []
         self.supported_formats = ["png", "svg", "pdf", "eps"]
+        self._r_session = None
+
+        if self.r_runner not in R_RUNNERS:
+            raise ValueError(
+                f"Unsupported R runner: {self.r_runner}. Supported: {R_RUNNERS}"
+            )
 
         if self.output_format not in self.supported_formats:
             raise ValueError(
@@ -46,6 +240,7 @@ class FigureGenerator:
 
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.outputs = FigureOutputs(self.output_dir)
 
     def generate_all_figures(self):
         """Generate all figures found in the figures directory."""
@@ -69,6 +264,14 @@ class FigureGenerator:
             print("No figure files found (.mmd, .py, or .R)")
             return
 
+        if self.changed_only:
+            mermaid_files = [f for f in mermaid_files if self.needs_update(f)]
+            python_files = [f for f in python_files if self.needs_update(f)]
+            r_files = [f for f in r_files if self.needs_update(f)]
+            if not mermaid_files and not python_files and not r_files:
+                # Still optimize, since figure widths may have changed
+                print("All figures are up to date")
+
         # Process Mermaid files
         if mermaid_files:
             print(f"Found {len(mermaid_files)} Mermaid file(s):")
@@ -86,14 +289,114 @@ class FigureGenerator:
         # Process R files
         if r_files:
             print(f"\nFound {len(r_files)} R file(s):")
-            for r_file in r_files:
-                print(f"  - {r_file.name}")
-                self.generate_r_figure(r_file)
+            try:
+                for r_file in r_files:
+                    print(f"  - {r_file.name}")
+                    self.generate_r_figure(r_file)
+            finally:
+                self.close()
+
+        if self.optimize_rasters:
+            self.optimize_raster_figures()
+        if self.optimize_pdfs:
+            self.optimize_pdf_figures()
 
         print("\nFigure generation completed!")
 
+    def optimize_raster_figures(self):
+        """Optimize the PNGs of the generated figures for their printed size.
+
+        Only figures generated from a source in the figures directory are
+        rewritten; PNGs placed in FIGURES by hand are left untouched.
+
+        Returns:
+            RasterSavings of the optimized figures, or None without Pillow
+        """
+        if not self._import_pillow():
+            return None
+
+        from processors.figure_optimizer import optimize_raster_figures
+
+        savings = optimize_raster_figures(
+            self.output_dir,
+            self._generated_figure_names(),
+            self.figures_dir.parent,
+            self.raster_dpi,
+        )
+        if savings.files:
+            print(
+                f"\nOptimized {savings.files} PNG file(s), "
+                f"{savings.downsampled} downsampled to {self.raster_dpi} dpi: "
+                f"saved {savings.bytes_saved / 1024:.1f} KB"
+            )
+        return savings
+
+    def optimize_pdf_figures(self):
+        """Compact the PDFs of the generated figures.
+
+        Only figures generated from a source in the figures directory are
+        rewritten.
+
+        Returns:
+            PdfSavings of the compacted figures, or None without pypdf
+        """
+        if not self._import_pypdf():
+            return None
+
+        from processors.figure_optimizer import optimize_pdf_figures
+
+        savings = optimize_pdf_figures(
+            self.output_dir, self._generated_figure_names()
+        )
+        if savings.files:
+            print(
+                f"Compacted {savings.files} PDF file(s), "
+                f"{savings.fonts_removed} unused font(s) removed: "
+                f"saved {savings.bytes_saved / 1024:.1f} KB"
+            )
+        for font in savings.full_fonts:
+            print(f"  ⚠️  Font embedded without subsetting: {font}")
+        return savings
+
+    def needs_update(self, source):
+        """Whether a figure source has to be run (again).
+
+        Sources recorded in the figure outputs manifest are up to date while
+        the source and the inputs it read are unchanged and its outputs
+        exist. Other sources are up to date when their PDF (and for scripts,
+        their PNG) exist.
+
+        Args:
+            source: Figure source file
+
+        Returns:
+            True if the figure should be generated
+        """
+        source = Path(source)
+        if source.name in self.outputs.figures:
+            return not self.outputs.is_up_to_date(source)
+        figure_dir = self.output_dir / source.stem
+        formats = ["pdf"] if source.suffix == ".mmd" else ["png", "pdf"]
+        return not all(
+            (figure_dir / f"{source.stem}.{output_format}").exists()
+            for output_format in formats
+        )
+
+    def _generated_figure_names(self):
+        """Names of the figures generated from sources in the figures dir."""
+        return {
+            source.stem
+            for pattern in ("*.mmd", "*.py", "*.R")
+            for source in self.figures_dir.glob(pattern)
+        }
+
     def generate_mermaid_figure(self, mmd_file):
-        """Generate figure from Mermaid diagram file."""
+        """Generate figure from Mermaid diagram file.
+
+        Returns:
+            Generated files, relative to the output directory
+        """
+        generated_files = []
         try:
             # Check if mmdc (Mermaid CLI) is available
             if not self._check_mermaid_cli():
@@ -103,7 +406,7 @@ class FigureGenerator:
                 print(
                     "     Install with: npm install -g @mermaid-js/mermaid-cli"
                 )
-                return
+                return generated_files
 
             # Create subdirectory for this figure
             figure_dir = self.output_dir / mmd_file.stem
@@ -116,8 +419,6 @@ class FigureGenerator:
             if self.output_format not in formats_to_generate:
                 formats_to_generate.append(self.output_format)
 
-            generated_files = []
-
             for format_type in formats_to_generate:
                 output_file = figure_dir / f"{mmd_file.stem}.{format_type}"
 
@@ -165,68 +466,67 @@ class FigureGenerator:
                 print(
                     f"     Total files generated: {', '.join(generated_files)}"
                 )
+            if len(generated_files) < len(formats_to_generate):
+                self._record_failure(mmd_file)
+            else:
+                self.outputs.record(mmd_file, generated_files)
 
         except Exception as e:
             print(f"  ❌ Error processing {mmd_file.name}: {e}")
+            self._record_failure(mmd_file)
+            return []
+        return generated_files
 
     def generate_python_figure(self, py_file):
-        """Generate figure from Python script."""
+        """Generate figure from Python script.
+
+        Returns:
+            Files the script created or modified, relative to the output
+            directory
+        """
         try:
             # Create subdirectory for this figure
             figure_dir = self.output_dir / py_file.stem
             figure_dir.mkdir(parents=True, exist_ok=True)
 
             print(f"  🐍 Executing {py_file.name}...")
+            before = snapshot(figure_dir)
+
+            # Execute the Python script in the figure-specific subdirectory,
+            # recording the files it reads
+            with tempfile.TemporaryDirectory(prefix="rxiv-figure-") as scratch:
+                inputs_path = Path(scratch) / "inputs.json"
+                result = subprocess.run(  # nosec B603 B607
+                    [
+                        sys.executable,
+                        str(FIGURE_SCRIPT_RUNNER_PATH),
+                        str(inputs_path),
+                        str(py_file.absolute()),
+                    ],
+                    capture_output=True,
+                    text=True,
+                    cwd=str(figure_dir.absolute()),
+                )
+                inputs = (
+                    json.loads(inputs_path.read_text(encoding="utf-8"))
+                    if inputs_path.exists()
+                    else []
+                )
 
-            # Execute the Python script in the figure-specific subdirectory
-            result = subprocess.run(  # nosec B603 B607
-                [sys.executable, str(py_file.absolute())],
-                capture_output=True,
-                text=True,
-                cwd=str(figure_dir.absolute()),
-            )
-
-            if result.stdout:
-                # Print any output from the script (like success messages)
-                for line in result.stdout.strip().split("\n"):
-                    if line.strip():
-                        print(f"     {line}")
-
-            if result.returncode != 0:
-                print(f"  ❌ Error executing {py_file.name}:")
-                if result.stderr:
-                    print(f"     {result.stderr}")
-                return
-
-            # Check for generated files by scanning the figure subdirectory
-            current_files = set()
-            for ext in ["png", "pdf", "svg", "eps"]:
-                current_files.update(figure_dir.glob(f"*.{ext}"))
-
-            # Look for files that might have been created by this script
-            base_name = py_file.stem
-            potential_files = []
-            for file_path in current_files:
-                # Check if filename contains the base name or is a common figure pattern
-                if (
-                    base_name.lower() in file_path.stem.lower()
-                    or file_path.stem.lower().startswith("figure")
-                    or file_path.stem.lower().startswith("fig")
-                ):
-                    potential_files.append(file_path)
-
-            if potential_files:
-                print("  ✅ Generated figures:")
-                for gen_file in sorted(potential_files):
-                    print(f"     - {figure_dir.name}/{gen_file.name}")
-            else:
-                print(f"  ⚠️  No output files detected for {py_file.name}")
+            return self._record_script_outputs(py_file, result, before, inputs)
 
         except Exception as e:
             print(f"  ❌ Error executing {py_file.name}: {e}")
+            self._record_failure(py_file)
+        return []
 
     def generate_r_figure(self, r_file):
-        """Generate figure from R script."""
+        """Generate figure from R script.
+
+        Returns:
+            Files the script created or modified, relative to the output
+            directory
+        """
         try:
             # Check if Rscript is available
             if not self._check_rscript():
@@ -235,60 +535,90 @@ class FigureGenerator:
                 print(
                     "Check https://www.r-project.org/ for installation instructions"
                 )
-                return
+                return []
 
             # Create subdirectory for this figure
             figure_dir = self.output_dir / r_file.stem
             figure_dir.mkdir(parents=True, exist_ok=True)
 
             print(f"  📊 Executing {r_file.name}...")
+            before = snapshot(figure_dir)
 
             # Execute the R script in the figure-specific subdirectory
-            result = subprocess.run(  # nosec B603 B607
-                ["Rscript", str(r_file.absolute())],
-                capture_output=True,
-                text=True,
-                cwd=str(figure_dir.absolute()),
-            )
-
-            if result.stdout:
-                # Print any output from the script (like success messages)
-                for line in result.stdout.strip().split("\n"):
-                    if line.strip():
-                        print(f"     {line}")
-
-            if result.returncode != 0:
-                print(f"  ❌ Error executing {r_file.name}:")
-                if result.stderr:
-                    print(f"     {result.stderr}")
-                return
-
-            # Check for generated files by scanning the figure subdirectory
-            current_files = set()
-            for ext in ["png", "pdf", "svg", "eps"]:
-                current_files.update(figure_dir.glob(f"*.{ext}"))
-
-            # Look for files that might have been created by this script
-            base_name = r_file.stem
-            potential_files = []
-            for file_path in current_files:
-                # Check if filename contains the base name or is a common figure pattern
-                if (
-                    base_name.lower() in file_path.stem.lower()
-                    or file_path.stem.lower().startswith("figure")
-                    or file_path.stem.lower().startswith("fig")
-                ):
-                    potential_files.append(file_path)
-
-            if potential_files:
-                print("  ✅ Generated figures:")
-                for gen_file in sorted(potential_files):
-                    print(f"     - {figure_dir.name}/{gen_file.name}")
+            if self.r_runner == "session":
+                if self._r_session is None:
+                    self._r_session = RSession()
+                result = self._r_session.run(r_file, figure_dir)
             else:
-                print(f"  ⚠️  No output files detected for {r_file.name}")
+                result = subprocess.run(  # nosec B603 B607
+                    ["Rscript", str(r_file.absolute())],
+                    capture_output=True,
+                    text=True,
+                    cwd=str(figure_dir.absolute()),
+                )
+
+            return self._record_script_outputs(r_file, result, before)
 
         except Exception as e:
             print(f"  ❌ Error executing {r_file.name}: {e}")
+            self._record_failure(r_file)
+        return []
+
+    def _record_script_outputs(self, script, result, before, inputs=()):
+        """Report a figure script run and record the files it generated.
+
+        Args:
+            script: Figure script that ran in its figure subdirectory
+            result: subprocess.CompletedProcess of the run
+            before: Snapshot of the figure subdirectory taken before the run
+            inputs: Absolute paths of the files the script read
+
+        Returns:
+            Files the script created or modified, relative to the output
+            directory
+        """
+        if result.stdout:
+            # Print any output from the script (like success messages)
+            for line in result.stdout.strip().split("\n"):
+                if line.strip():
+                    print(f"     {line}")
+
+        # Outputs read back by the script do not make it depend on itself
+        figure_dir = self.output_dir / script.stem
+        generated = [
+            f"{figure_dir.name}/{path}"
+            for path in changed_files(before, snapshot(figure_dir))
+        ]
+        written = {(self.output_dir / path).resolve() for path in generated}
+        inputs = [path for path in inputs if Path(path) not in written]
+
+        if result.returncode != 0:
+            print(f"  ❌ Error executing {script.name}:")
+            if result.stderr:
+                print(f"     {result.stderr}")
+            self._record_failure(script, inputs)
+            return []
+
+        self.outputs.record(script, generated, inputs)
+
+        if generated:
+            print("  ✅ Generated figures:")
+            for gen_file in generated:
+                print(f"     - {gen_file}")
+        else:
+            print(f"  ⚠️  No output files detected for {script.name}")
+        return generated
+
+    def _record_failure(self, source, inputs=()):
+        """Note a failed source for this run and in the outputs manifest."""
+        self.failed.append(source.name)
+        self.outputs.record(source, [], inputs, failed=True)
+
+    def close(self):
+        """End the R session of the generator, if one was started."""
+        if self._r_session is not None:
+            self._r_session.close()
+            self._r_session = None
 
     def _check_mermaid_cli(self):
         """Check if Mermaid CLI (mmdc) is available."""
@@ -322,6 +652,26 @@ class FigureGenerator:
             print("  ⚠️  seaborn not available")
             return None
 
+    def _import_pillow(self):
+        """Safely import Pillow."""
+        try:
+            import PIL
+
+            return PIL
+        except ImportError:
+            print("  ⚠️  Pillow not available, PNG optimization skipped")
+            return None
+
+    def _import_pypdf(self):
+        """Safely import pypdf."""
+        try:
+            import pypdf
+
+            return pypdf
+        except ImportError:
+            print("  ⚠️  pypdf not available, PDF compaction skipped")
+            return None
+
     def _import_numpy(self):
         """Safely import numpy."""
         try:
@@ -344,13 +694,7 @@ class FigureGenerator:
 
     def _check_rscript(self):
         """Check if Rscript is available."""
-        try:
-            subprocess.run(
-                ["Rscript", "--version"], capture_output=True, check=True
-            )  # nosec B603 B607
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        return rscript_available()
 
 
 def main():
@@ -377,6 +721,35 @@ def main():
         choices=["png", "svg", "pdf", "eps"],
         help="Output format for figures (default: png)",
     )
+    parser.add_argument(
+        "--raster-dpi",
+        type=int,
+        default=300,
+        help="Resolution of PNG figures at their printed size (default: 300)",
+    )
+    parser.add_argument(
+        "--no-optimize-rasters",
+        action="store_true",
+        help="Keep generated PNG figures at the size they were saved at",
+    )
+    parser.add_argument(
+        "--no-optimize-pdfs",
+        action="store_true",
+        help="Keep generated PDF figures as they were written",
+    )
+    parser.add_argument(
+        "--changed-only",
+        action="store_true",
+        help="Only generate figures whose source or data inputs changed, or "
+        "whose outputs are missing",
+    )
+    parser.add_argument(
+        "--r-runner",
+        default="session",
+        choices=R_RUNNERS,
+        help="Run R scripts in one shared R session, or in one Rscript each "
+        "(default: session)",
+    )
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Enable verbose output"
     )
@@ -388,6 +761,11 @@ def main():
             figures_dir=args.figures_dir,
             output_dir=args.output_dir,
             output_format=args.format,
+            optimize_rasters=not args.no_optimize_rasters,
+            raster_dpi=args.raster_dpi,
+            optimize_pdfs=not args.no_optimize_pdfs,
+            r_runner=args.r_runner,
+            changed_only=args.changed_only,
         )
         generator.generate_all_figures()
 
@@ -399,6 +777,10 @@ def main():
             traceback.print_exc()
         sys.exit(1)
 
+    if generator.failed:
+        print(f"\n❌ Figure generation failed for: {', '.join(generator.failed)}")
+        sys.exit(1)
+
 
 if __name__ == "__main__":
     main()
@@ -7,53 +7,57 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # Import from auxiliary modules
-# Import utility functions directly from utils.py
-import importlib.util
-import sys
-from pathlib import Path
-
+from converters.word_counter import write_word_counts
 from processors.template_processor import (
     generate_supplementary_tex,
     get_template_path,
     process_template_replacements,
 )
 from processors.yaml_processor import extract_yaml_metadata
+from utils import (
+    create_output_dir,
+    find_manuscript_md,
+    get_manuscript_path,
+    inject_rxiv_citation,
+    load_environment,
+    write_manuscript_output,
+)
 
-# Load utils.py module directly
-utils_path = Path(__file__).parent.parent / "utils.py"
-spec = importlib.util.spec_from_file_location("utils_module", utils_path)
-if spec and spec.loader:
-    utils_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(utils_module)
-
-    # Extract the functions we need
-    create_output_dir = utils_module.create_output_dir
-    find_manuscript_md = utils_module.find_manuscript_md
-    write_manuscript_output = utils_module.write_manuscript_output
-    inject_rxiv_citation = utils_module.inject_rxiv_citation
-else:
-    raise ImportError("Could not load utils.py module")
 
+def generate_preprint(output_dir, yaml_metadata, manuscript_path=None):
+    """Generate the preprint using the template.
 
-def generate_preprint(output_dir, yaml_metadata):
-    """Generate the preprint using the template."""
+    The manuscript is read from ``manuscript_path``, which defaults to the
+    MANUSCRIPT_PATH environment variable.
+    """
+    manuscript_path = get_manuscript_path(manuscript_path)
     template_path = get_template_path()
     with open(template_path) as template_file:
         template_content = template_file.read()
 
     # Find and process the manuscript markdown
-    manuscript_md = find_manuscript_md()
+    manuscript_md = find_manuscript_md(manuscript_path)
 
-    # Process all template replacements
+    # Process all template replacements, counting words as sections convert
+    word_counts = {}
     template_content = process_template_replacements(
-        template_content, yaml_metadata, str(manuscript_md)
+        template_content,
+        yaml_metadata,
+        str(manuscript_md),
+        word_counts,
+        manuscript_path,
     )
 
     # Write the generated manuscript to the output directory
-    manuscript_output = write_manuscript_output(output_dir, template_content)
+    manuscript_output = write_manuscript_output(
+        output_dir, template_content, manuscript_path
+    )
+
+    # Persist the word counts for the word count analysis
+    write_word_counts(output_dir, word_counts, str(manuscript_md))
 
     # Generate supplementary information
-    generate_supplementary_tex(output_dir, yaml_metadata)
+    generate_supplementary_tex(output_dir, yaml_metadata, manuscript_path)
 
     return manuscript_output
 
@@ -71,26 +75,30 @@ def main():
     )
 
     args = parser.parse_args()
+    load_environment()
+
+    # The environment only selects the manuscript here, at the command line
+    manuscript_path = get_manuscript_path()
 
     try:
         # Create output directory
         create_output_dir(args.output_dir)
 
         # Find and parse the manuscript markdown
-        manuscript_md = find_manuscript_md()
+        manuscript_md = find_manuscript_md(manuscript_path)
         print(f"Found manuscript: {manuscript_md}")
 
-        yaml_metadata = extract_yaml_metadata(str(manuscript_md))
+        yaml_metadata = extract_yaml_metadata(str(manuscript_md), args.output_dir)
         print(
             f"Extracted metadata: "
             f"{list(yaml_metadata.keys()) if yaml_metadata else 'None'}"
         )
 
         # Inject Rxiv-Maker citation if needed
-        inject_rxiv_citation(yaml_metadata)
+        inject_rxiv_citation(yaml_metadata, manuscript_path)
 
         # Generate the article
-        generate_preprint(args.output_dir, yaml_metadata)
+        generate_preprint(args.output_dir, yaml_metadata, manuscript_path)
 
         print("Preprint generation completed successfully!")
 
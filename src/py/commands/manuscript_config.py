@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Print the parsed manuscript configuration.
+
+This script lets the Makefile read 00_CONFIG.yml through the cached config
+loader instead of parsing the YAML itself.
+"""
+
+import argparse
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from processors.config_loader import ConfigError, load_config
+
+
+def arxiv_filename(metadata):
+    """Name of the arXiv archive copied to the manuscript directory.
+
+    Follows the ``YEAR__Lastname_et_al__for_arxiv.zip`` convention, using the
+    publication year and the last name of the first author.
+    """
+    date = metadata.get("date")
+    year = str(date).split("-")[0] if date else str(datetime.now().year)
+
+    authors = metadata.get("authors") or []
+    name = "Unknown"
+    if authors and isinstance(authors[0], dict):
+        name = authors[0].get("name") or "Unknown"
+    last_name = name.split()[-1] if " " in name else name
+
+    return f"{year}__{last_name}_et_al__for_arxiv.zip"
+
+
+def main():
+    """Main entry point for printing the manuscript configuration."""
+    parser = argparse.ArgumentParser(
+        description="Print the parsed and normalized manuscript configuration"
+    )
+    parser.add_argument("config", help="Path to 00_CONFIG.yml")
+    parser.add_argument(
+        "--output-dir",
+        "-o",
+        help="Build output directory, where the parsed config is cached",
+    )
+    parser.add_argument(
+        "--arxiv-filename",
+        action="store_true",
+        help="Print the file name of the arXiv archive instead",
+    )
+
+    args = parser.parse_args()
+
+    try:
+        config = load_config(Path(args.config), args.output_dir)
+    except (OSError, ConfigError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.arxiv_filename:
+        print(arxiv_filename(config.metadata))
+    else:
+        print(json.dumps(config.metadata, indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""PDF size report command for Rxiv-Maker.
+
+Runs after the LaTeX build: optionally compacts the built PDF, attributes
+its size to pages, figures and fonts, and writes ``pdf_size_report.json`` to
+the output directory. Figures and PDFs over the size budget of the
+manuscript (``pdf_size_budget`` in 00_CONFIG.yml, or the command line
+limits) are flagged.
+
+Usage:
+    python pdf_report.py [--output-dir OUTPUT_DIR] [--compact] [--strict]
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from processors.config_loader import CONFIG_FILENAME, load_config
+from processors.pdf_analyzer import (
+    MB,
+    PDF_SIZE_REPORT_FILENAME,
+    analyze_pdf,
+    check_size_budget,
+    compact_pdf,
+    size_budget,
+    write_size_report,
+)
+from utils import get_manuscript_path
+
+# Number of figures and fonts listed in the printed summary
+SUMMARY_ITEMS = 5
+
+
+def print_size_report(report):
+    """Print the largest parts of a PDF and its budget violations."""
+    print(f"\n📦 PDF SIZE: {report.path} ({report.file_bytes / MB:.2f} MB)")
+    for title, parts in (("Figures", report.figures), ("Fonts", report.fonts)):
+        if not parts:
+            continue
+        total = sum(part.bytes for part in parts)
+        print(f"{title}: {total / MB:.2f} MB in {len(parts)}")
+        for part in parts[:SUMMARY_ITEMS]:
+            print(f"  {part.bytes / 1024:>9.1f} KB  {part.name}")
+
+    if report.violations:
+        print("\n⚠️  Size budget exceeded:")
+        for violation in report.violations:
+            print(f"  - {violation}")
+    else:
+        print("✅ Within the size budget")
+
+
+def main():
+    """Main entry point for the PDF size report command."""
+    parser = argparse.ArgumentParser(
+        description="Analyze the size of the built PDF against a size budget"
+    )
+    parser.add_argument(
+        "--output-dir",
+        "-o",
+        default="output",
+        help="Output directory containing the built PDF (default: output)",
+    )
+    parser.add_argument(
+        "--pdf", help="PDF to analyze (default: OUTPUT_DIR/MANUSCRIPT_NAME.pdf)"
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Rewrite the PDF with compressed streams and merged duplicates",
+    )
+    parser.add_argument("--max-pdf-mb", type=float, help="Size limit of the PDF in MB")
+    parser.add_argument(
+        "--max-figure-mb", type=float, help="Size limit of each figure in MB"
+    )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Exit with an error when the size budget is exceeded",
+    )
+
+    args = parser.parse_args()
+
+    manuscript_path = get_manuscript_path()
+    pdf_path = Path(
+        args.pdf or Path(args.output_dir) / f"{os.path.basename(manuscript_path)}.pdf"
+    )
+    if not pdf_path.exists():
+        print(f"Error: PDF not found at {pdf_path}")
+        return 1
+
+    budget = {"max_pdf_mb": None, "max_figure_mb": None}
+    config_path = Path(manuscript_path) / CONFIG_FILENAME
+    if config_path.is_file():
+        budget = size_budget(load_config(config_path, args.output_dir).metadata)
+    if args.max_pdf_mb is not None:
+        budget["max_pdf_mb"] = args.max_pdf_mb
+    if args.max_figure_mb is not None:
+        budget["max_figure_mb"] = args.max_figure_mb
+
+    if args.compact:
+        saved = compact_pdf(pdf_path)
+        print(f"Compacted {pdf_path}: saved {saved / 1024:.1f} KB")
+
+    report = analyze_pdf(pdf_path)
+    check_size_budget(report, **budget)
+    report_path = write_size_report(
+        report, Path(args.output_dir) / PDF_SIZE_REPORT_FILENAME
+    )
+    print_size_report(report)
+    print(f"Size report written to: {report_path}")
+
+    return 1 if args.strict and report.violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -22,21 +22,6 @@ from typing import Any
 # Add src/py to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-try:
-    from validators import (
-        CitationValidator,
-        FigureValidator,
-        LaTeXErrorParser,
-        MathValidator,
-        ReferenceValidator,
-        SyntaxValidator,
-        ValidationLevel,
-    )
-
-    VALIDATORS_AVAILABLE = True
-except ImportError:
-    VALIDATORS_AVAILABLE = False
-
 
 class UnifiedValidator:
     """Unified validation system for rxiv-maker manuscripts."""
@@ -66,7 +51,18 @@ class UnifiedValidator:
 
     def validate_all(self) -> bool:
         """Run all available validators."""
-        if not VALIDATORS_AVAILABLE:
+        # Validators are imported here rather than at module level to keep
+        # the command's start-up, and so --help, fast
+        try:
+            from validators import (
+                CitationValidator,
+                FigureValidator,
+                LaTeXErrorParser,
+                MathValidator,
+                ReferenceValidator,
+                SyntaxValidator,
+            )
+        except ImportError:
             print("❌ Enhanced validators not available")
             print("   Install validation dependencies to use this command")
             return False
@@ -133,6 +129,8 @@ class UnifiedValidator:
 
     def _filter_errors(self, errors: list[Any]) -> list[Any]:
         """Filter errors based on settings."""
+        from validators import ValidationLevel
+
         if self.include_info:
             return errors
         else:
@@ -140,6 +138,8 @@ class UnifiedValidator:
 
     def print_detailed_report(self) -> None:
         """Print detailed validation report."""
+        from validators import ValidationLevel
+
         print("\n" + "=" * 70)
         print("DETAILED VALIDATION REPORT")
         print("=" * 70)
@@ -257,6 +257,8 @@ class UnifiedValidator:
 
     def print_summary(self) -> None:
         """Print brief validation summary."""
+        from validators import ValidationLevel
+
         if not self.all_errors:
             print("✅ Validation completed successfully - no issues found!")
             return
@@ -2,14 +2,29 @@
 
 This package contains modules for converting between different formats
 (e.g., Markdown to LaTeX).
+
+Converters are imported on first access (PEP 562), so importing one
+submodule does not load the whole conversion pipeline.
 """
 
-from .citation_processor import convert_citations_to_latex
-from .md2tex import (
-    convert_markdown_to_latex,
-    extract_content_sections,
-)
-from .text_formatters import convert_text_formatting_to_latex
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .citation_processor import convert_citations_to_latex
+    from .md2tex import (
+        convert_markdown_to_latex,
+        extract_content_sections,
+    )
+    from .text_formatters import convert_text_formatting_to_latex
+
+# Submodule defining each exported name
+_EXPORTS = {
+    "extract_content_sections": ".md2tex",
+    "convert_markdown_to_latex": ".md2tex",
+    "convert_citations_to_latex": ".citation_processor",
+    "convert_text_formatting_to_latex": ".text_formatters",
+}
 
 __all__ = [
     "extract_content_sections",
@@ -17,3 +32,16 @@ __all__ = [
     "convert_citations_to_latex",
     "convert_text_formatting_to_latex",
 ]
+
+
+def __getattr__(name):
+    """Import the submodule defining ``name`` on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
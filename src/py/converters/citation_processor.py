@@ -9,6 +9,65 @@ import re
 
 from .types import CitationKey, LatexContent, MarkdownContent, ProtectedContent
 
+# Bracketed multiple citations like [@citation1;@citation2]
+MULTIPLE_CITATION_PATTERN = re.compile(r"\[(@[^]]+)\]")
+
+# Single citations like @citation_key (but not figure/equation references)
+# Allow alphanumeric, underscore, and hyphen in citation keys
+# Exclude figure and equation references by not matching @fig: or @eq: patterns
+SINGLE_CITATION_PATTERN = re.compile(r"@(?!fig:|eq:)([a-zA-Z0-9_-]+)")
+
+# Placeholders created by md2tex._protect_markdown_tables
+MARKDOWN_TABLE_PLACEHOLDER_PATTERN = re.compile(
+    r"(XXPROTECTEDMARKDOWNTABLEXX\d+XXPROTECTEDMARKDOWNTABLEXX)"
+)
+
+
+def _split_citation_group(citations_text: str) -> list[CitationKey]:
+    """Split the inside of a bracketed citation group into citation keys."""
+    citations: list[CitationKey] = []
+    for cite in citations_text.split(";"):
+        # Remove @ symbol and whitespace
+        clean_cite = cite.strip().lstrip("@")
+        if clean_cite:
+            citations.append(clean_cite)
+    return citations
+
+
+def _convert_citations(
+    text: MarkdownContent, found_keys: dict[CitationKey, None]
+) -> LatexContent:
+    """Convert markdown citations to LaTeX, adding cited keys to ``found_keys``."""
+
+    def process_multiple_citations(match: re.Match[str]) -> str:
+        citations = _split_citation_group(match.group(1))
+        found_keys.update(dict.fromkeys(citations))
+        return "\\cite{" + ",".join(citations) + "}"
+
+    def process_single_citation(match: re.Match[str]) -> str:
+        key = match.group(1)
+        found_keys[key] = None
+        return "\\cite{" + key + "}"
+
+    text = MULTIPLE_CITATION_PATTERN.sub(process_multiple_citations, text)
+    return SINGLE_CITATION_PATTERN.sub(process_single_citation, text)
+
+
+def convert_citations_with_keys(
+    text: MarkdownContent,
+) -> tuple[LatexContent, list[CitationKey]]:
+    """Convert markdown citations to LaTeX and collect the cited keys.
+
+    Args:
+        text: Text containing markdown citations
+
+    Returns:
+        Tuple of (text with citations converted, unique keys in order of use)
+    """
+    found_keys: dict[CitationKey, None] = {}
+    text = _convert_citations(text, found_keys)
+    return text, list(found_keys)
+
 
 def convert_citations_to_latex(text: MarkdownContent) -> LatexContent:
     """Convert markdown citations to LaTeX format.
@@ -19,27 +78,41 @@ def convert_citations_to_latex(text: MarkdownContent) -> LatexContent:
     Returns:
         Text with citations converted to LaTeX format
     """
+    return convert_citations_with_keys(text)[0]
 
-    # Handle bracketed multiple citations like [@citation1;@citation2]
-    def process_multiple_citations(match: re.Match[str]) -> str:
-        citations_text = match.group(1)
-        # Split by semicolon and clean up each citation
-        citations: list[CitationKey] = []
-        for cite in citations_text.split(";"):
-            # Remove @ symbol and whitespace
-            clean_cite = cite.strip().lstrip("@")
-            if clean_cite:
-                citations.append(clean_cite)
-        return "\\cite{" + ",".join(citations) + "}"
 
-    text = re.sub(r"\[(@[^]]+)\]", process_multiple_citations, text)
+def process_citations_outside_tables_with_keys(
+    content: MarkdownContent, protected_markdown_tables: ProtectedContent
+) -> tuple[LatexContent, list[CitationKey]]:
+    """Process citations outside protected tables and return the cited keys.
+
+    The content is tokenized once on the table placeholder pattern; citations
+    are converted in every non-table segment and the keys found are collected
+    in the same pass, so the cost is linear in the size of the document.
+
+    Args:
+        content: Content to process
+        protected_markdown_tables: Dictionary of protected table content
+
+    Returns:
+        Tuple of (content with citations processed outside tables,
+        unique citation keys in order of first use)
+    """
+    found_keys: dict[CitationKey, None] = {}
+
+    if not protected_markdown_tables:
+        # No protected tables, process normally
+        return convert_citations_with_keys(content)
 
-    # Handle single citations like @citation_key (but not figure/equation references)
-    # Allow alphanumeric, underscore, and hyphen in citation keys
-    # Exclude figure and equation references by not matching @fig: or @eq: patterns
-    text = re.sub(r"@(?!fig:|eq:)([a-zA-Z0-9_-]+)", r"\\cite{\1}", text)
+    # re.split with a capturing group puts placeholders at odd indices
+    parts = MARKDOWN_TABLE_PLACEHOLDER_PATTERN.split(content)
+    for i, part in enumerate(parts):
+        if i % 2 and part in protected_markdown_tables:
+            # This is a protected table placeholder - don't process citations
+            continue
+        parts[i] = _convert_citations(part, found_keys)
 
-    return text
+    return "".join(parts), list(found_keys)
 
 
 def process_citations_outside_tables(
@@ -54,41 +127,9 @@ def process_citations_outside_tables(
     Returns:
         Content with citations processed outside tables
     """
-    # Find all protected markdown table placeholders
-    table_placeholders = list(protected_markdown_tables)
-
-    if not table_placeholders:
-        # No protected tables, process normally
-        return process_citations_in_text(content)
-
-    # Split content by table placeholders and only process non-protected parts
-    parts = [content]
-    for placeholder in table_placeholders:
-        new_parts: list[str] = []
-        for part in parts:
-            if placeholder in part:
-                split_parts = part.split(placeholder)
-                for i, split_part in enumerate(split_parts):
-                    new_parts.append(split_part)
-                    if (
-                        i < len(split_parts) - 1
-                    ):  # Don't add placeholder after last part
-                        new_parts.append(placeholder)
-            else:
-                new_parts.append(part)
-        parts = new_parts
-
-    # Process citations only in non-placeholder parts
-    processed_parts: list[str] = []
-    for part in parts:
-        if part in table_placeholders:
-            # This is a protected table placeholder - don't process citations
-            processed_parts.append(part)
-        else:
-            # This is regular text - process citations
-            processed_parts.append(process_citations_in_text(part))
-
-    return "".join(processed_parts)
+    return process_citations_outside_tables_with_keys(
+        content, protected_markdown_tables
+    )[0]
 
 
 def process_citations_in_text(text: MarkdownContent) -> LatexContent:
@@ -100,26 +141,7 @@ def process_citations_in_text(text: MarkdownContent) -> LatexContent:
     Returns:
         Text with citations converted to LaTeX
     """
-
-    # First handle bracketed multiple citations like [@citation1;@citation2]
-    def process_multiple_citations(match: re.Match[str]) -> str:
-        citations_text = match.group(1)
-        # Split by semicolon and clean up each citation
-        citations: list[CitationKey] = []
-        for cite in citations_text.split(";"):
-            # Remove @ symbol and whitespace
-            clean_cite = cite.strip().lstrip("@")
-            if clean_cite:
-                citations.append(clean_cite)
-        return "\\cite{" + ",".join(citations) + "}"
-
-    text = re.sub(r"\[(@[^]]+)\]", process_multiple_citations, text)
-
-    # Handle single citations like @citation_key (but not figure/equation references)
-    # Allow alphanumeric, underscore, and hyphen in citation keys
-    # Exclude figure and equation references by not matching @fig: or @eq: patterns
-    text = re.sub(r"@(?!fig:|eq:)([a-zA-Z0-9_-]+)", r"\\cite{\1}", text)
-    return text
+    return convert_citations_with_keys(text)[0]
 
 
 def validate_citation_key(citation_key: CitationKey) -> bool:
@@ -145,20 +167,14 @@ def extract_citations_from_text(text: MarkdownContent) -> list[CitationKey]:
     Returns:
         List of unique citation keys found in the text
     """
-    citations: list[CitationKey] = []
+    # Ordered set: bracketed citations first, then single citations
+    citations: dict[CitationKey, None] = {}
 
     # Find bracketed multiple citations
-    bracketed_matches = re.findall(r"\[(@[^]]+)\]", text)
-    for match in bracketed_matches:
-        for cite in match.split(";"):
-            clean_cite = cite.strip().lstrip("@")
-            if clean_cite and clean_cite not in citations:
-                citations.append(clean_cite)
+    for match in MULTIPLE_CITATION_PATTERN.findall(text):
+        citations.update(dict.fromkeys(_split_citation_group(match)))
 
     # Find single citations (excluding figure and equation references)
-    single_matches = re.findall(r"@(?!fig:|eq:)([a-zA-Z0-9_-]+)", text)
-    for cite in single_matches:
-        if cite not in citations:
-            citations.append(cite)
+    citations.update(dict.fromkeys(SINGLE_CITATION_PATTERN.findall(text)))
 
-    return citations
+    return list(citations)
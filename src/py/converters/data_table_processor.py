@@ -0,0 +1,556 @@
+r"""Data-file backed tables for markdown to LaTeX conversion.
+
+Large tables can be kept in CSV, TSV or Parquet files under ``FIGURES/DATA``
+or ``TABLES`` in the manuscript directory instead of being pasted into the
+markdown as pipe tables. They are referenced with a ``<data-table>`` marker
+followed by the usual table caption line::
+
+    <data-table src="TABLES/measurements.csv" longtable="true" chunk-rows="500"/>
+
+    {#stable:measurements} **Measurements.** All recorded values.
+
+Rows are streamed from the data file and formatted in batches, so memory use
+does not grow with the size of the table. Rendered rows are cached under
+``FIGURES/DATA_TABLES`` and reused as long as the SHA-256 of the data file and
+the rendering options are unchanged. With ``chunk-rows`` the rows are split
+over several files that are ``\input``-ed from the table; like every other
+file in FIGURES they are copied next to the LaTeX sources at build time.
+Renderings are moved into the cache once complete, so concurrent builds of one
+manuscript can share it.
+"""
+
+import csv
+import hashlib
+import json
+import math
+import os
+import re
+import shutil
+import tempfile
+from collections.abc import Iterator
+from itertools import chain, islice
+from pathlib import Path, PurePosixPath
+from typing import Any, Optional
+
+from .table_processor import (
+    build_table_environment,
+    format_table_rows,
+    join_table_body,
+    parse_table_caption,
+)
+from .types import (
+    EnvironmentNames,
+    LatexContent,
+    MarkdownContent,
+    ProtectedContent,
+)
+
+# <data-table src="TABLES/file.csv" .../> on a line of its own
+DATA_TABLE_PATTERN = re.compile(r"^[ \t]*<data-table\s+(.*?)\s*/?>[ \t]*$")
+DATA_TABLE_ATTRIBUTE_PATTERN = re.compile(r"([a-zA-Z][\w-]*)=([\"'])(.*?)\2")
+
+# Manuscript subdirectories data tables may be read from
+DATA_TABLE_DIRECTORIES = ("FIGURES/DATA", "TABLES")
+
+# Delimiter for each supported text format; Parquet is handled separately
+DATA_TABLE_DELIMITERS = {".csv": ",", ".tsv": "\t", ".tab": "\t"}
+PARQUET_EXTENSIONS = (".parquet", ".pq")
+
+# Rendered rows are cached in FIGURES so they are copied along with figures
+DATA_TABLE_CACHE_DIR = "DATA_TABLES"
+DATA_TABLE_LATEX_DIR = "Figures/" + DATA_TABLE_CACHE_DIR
+
+# Number of rows formatted per batch while streaming
+RENDER_BATCH_ROWS = 256
+
+# Bump when the rendered output changes so stale caches are discarded
+CACHE_VERSION = 1
+
+TRUE_VALUES = ("true", "yes", "1")
+
+
+def convert_data_tables_to_latex(
+    content: MarkdownContent,
+    protected_tables: ProtectedContent,
+    is_supplementary: bool = False,
+    manuscript_path: Optional[str] = None,
+    environment_names: Optional[EnvironmentNames] = None,
+) -> LatexContent:
+    """Replace ``<data-table>`` markers with rendered LaTeX tables.
+
+    The rendered tables are stored in ``protected_tables`` and replaced by
+    placeholders so that no further markdown processing touches them.
+
+    Args:
+        content: Markdown content that may contain data table markers
+        protected_tables: Dictionary of protected LaTeX tables to add to
+        is_supplementary: Whether this is supplementary content
+        manuscript_path: Manuscript directory (default: MANUSCRIPT_PATH)
+        environment_names: Optional mapping renaming the emitted float
+            environments, e.g. ``{"table": "stable"}``
+
+    Returns:
+        Content with data table markers replaced by placeholders
+
+    Raises:
+        FileNotFoundError: If a referenced data file does not exist
+        ValueError: If a marker is malformed or references a file outside
+            the allowed directories
+    """
+    if "<data-table" not in content:
+        return content
+
+    lines = content.split("\n")
+    result_lines: list[str] = []
+    i = 0
+    while i < len(lines):
+        marker_match = DATA_TABLE_PATTERN.match(lines[i])
+        if not marker_match:
+            result_lines.append(lines[i])
+            i += 1
+            continue
+
+        attributes = parse_data_table_attributes(marker_match.group(1))
+        caption, table_id, rotation_angle = parse_table_caption(lines, i + 1)
+        # Skip the marker, plus the blank line and caption line if present
+        i += 3 if caption else 1
+
+        latex_table = render_data_table(
+            attributes,
+            caption,
+            table_id,
+            rotation_angle,
+            is_supplementary,
+            manuscript_path,
+            environment_names,
+        )
+        placeholder = f"XXPROTECTEDTABLEXX{len(protected_tables)}XXPROTECTEDTABLEXX"
+        protected_tables[placeholder] = latex_table
+        result_lines.append(placeholder)
+
+    return "\n".join(result_lines)
+
+
+def parse_data_table_attributes(attributes_str: str) -> dict[str, str]:
+    """Parse the ``key="value"`` attributes of a data table marker.
+
+    Args:
+        attributes_str: Text between ``<data-table`` and ``/>``
+
+    Returns:
+        Dictionary of attribute names to values
+
+    Raises:
+        ValueError: If the required ``src`` attribute is missing
+    """
+    attributes = {
+        match.group(1).lower(): match.group(3)
+        for match in DATA_TABLE_ATTRIBUTE_PATTERN.finditer(attributes_str)
+    }
+    if not attributes.get("src"):
+        raise ValueError(f"<data-table> requires a src attribute: {attributes_str}")
+    return attributes
+
+
+def resolve_data_table_path(src: str, manuscript_path: Optional[str] = None) -> Path:
+    """Resolve a data table ``src`` attribute to a file in the manuscript.
+
+    Args:
+        src: Path relative to the manuscript directory
+        manuscript_path: Manuscript directory (default: MANUSCRIPT_PATH)
+
+    Returns:
+        Path to the data file
+
+    Raises:
+        FileNotFoundError: If the data file does not exist
+        ValueError: If the path is outside FIGURES/DATA and TABLES or has an
+            unsupported extension
+    """
+    if manuscript_path is None:
+        manuscript_path = os.getenv("MANUSCRIPT_PATH", "MANUSCRIPT")
+
+    relative = PurePosixPath(src)
+    in_allowed_directory = any(
+        relative.parts[: len(PurePosixPath(directory).parts)]
+        == PurePosixPath(directory).parts
+        for directory in DATA_TABLE_DIRECTORIES
+    )
+    if relative.is_absolute() or ".." in relative.parts or not in_allowed_directory:
+        raise ValueError(
+            f"Data table {src} must be inside one of: "
+            f"{', '.join(DATA_TABLE_DIRECTORIES)}"
+        )
+
+    suffix = relative.suffix.lower()
+    if suffix not in DATA_TABLE_DELIMITERS and suffix not in PARQUET_EXTENSIONS:
+        raise ValueError(f"Unsupported data table format: {src}")
+
+    path = Path(manuscript_path) / relative
+    if not path.is_file():
+        raise FileNotFoundError(f"Data table not found: {path}")
+    return path
+
+
+def data_table_fingerprint(
+    content: MarkdownContent, manuscript_path: Optional[str] = None
+) -> str:
+    """Hash the data files referenced by the data table markers in content.
+
+    Conversions of markdown containing data tables can be cached on the
+    markdown together with this fingerprint, which changes whenever one of
+    the referenced data files does.
+
+    Args:
+        content: Markdown content that may contain data table markers
+        manuscript_path: Manuscript directory (default: MANUSCRIPT_PATH)
+
+    Returns:
+        SHA-256 over the ``src`` and content hash of each referenced file
+
+    Raises:
+        FileNotFoundError: If a referenced data file does not exist
+        ValueError: If a marker is malformed or references a file outside
+            the allowed directories
+    """
+    digest = hashlib.sha256()
+    if "<data-table" in content:
+        for line in content.split("\n"):
+            marker_match = DATA_TABLE_PATTERN.match(line)
+            if not marker_match:
+                continue
+            src = parse_data_table_attributes(marker_match.group(1))["src"]
+            path = resolve_data_table_path(src, manuscript_path)
+            digest.update(f"{src}\0{_file_sha256(path)}\0".encode())
+    return digest.hexdigest()
+
+
+def render_data_table(
+    attributes: dict[str, str],
+    caption: Optional[str] = None,
+    table_id: Optional[str] = None,
+    rotation_angle: Optional[int] = None,
+    is_supplementary: bool = False,
+    manuscript_path: Optional[str] = None,
+    environment_names: Optional[EnvironmentNames] = None,
+) -> LatexContent:
+    """Render a data table marker to a LaTeX table.
+
+    Args:
+        attributes: Parsed marker attributes (src, longtable, chunk-rows,
+            columns, width)
+        caption: Optional table caption
+        table_id: Optional table ID for labeling
+        rotation_angle: Optional rotation angle for table
+        is_supplementary: Whether this is a supplementary table
+        manuscript_path: Manuscript directory (default: MANUSCRIPT_PATH)
+        environment_names: Optional mapping renaming the emitted float
+            environments, e.g. ``{"table": "stable"}``
+
+    Returns:
+        Complete LaTeX table as string
+    """
+    if manuscript_path is None:
+        manuscript_path = os.getenv("MANUSCRIPT_PATH", "MANUSCRIPT")
+
+    source = resolve_data_table_path(attributes["src"], manuscript_path)
+    chunk_rows = _parse_chunk_rows(attributes.get("chunk-rows", "0"))
+    columns = [
+        column.strip()
+        for column in attributes.get("columns", "").split(",")
+        if column.strip()
+    ]
+    use_longtable = attributes.get("longtable", "").lower() in TRUE_VALUES
+    if use_longtable and not is_supplementary:
+        # longtable cannot be used in the two-column main text
+        print(
+            f"Warning: longtable is only supported in supplementary content, "
+            f"rendering {attributes['src']} as a regular table"
+        )
+        use_longtable = False
+
+    cache_dir = (
+        Path(manuscript_path)
+        / "FIGURES"
+        / DATA_TABLE_CACHE_DIR
+        / _cache_key(attributes["src"], columns, chunk_rows)
+    )
+    manifest = _render_rows_cached(source, cache_dir, columns, chunk_rows)
+
+    if chunk_rows:
+        latex_dir = f"{DATA_TABLE_LATEX_DIR}/{cache_dir.name}"
+        body = "\n".join(f"\\input{{{latex_dir}/{part}}}" for part in manifest["parts"])
+    else:
+        body = (cache_dir / manifest["parts"][0]).read_text(encoding="utf-8")
+        body = body.rstrip("\n")
+
+    headers = manifest["headers"]
+    header_row = manifest["header_row"]
+    if use_longtable:
+        if rotation_angle:
+            print(
+                f"Warning: rotation is not supported for longtable, ignoring "
+                f"rotate={rotation_angle} for {attributes['src']}"
+            )
+        return build_longtable_environment(
+            headers, header_row, body, caption, table_id, is_supplementary
+        )
+    return build_table_environment(
+        headers,
+        header_row,
+        body,
+        caption,
+        attributes.get("width", "single"),
+        table_id,
+        rotation_angle,
+        is_supplementary,
+        environment_names,
+    )
+
+
+def build_longtable_environment(
+    headers: list[str],
+    header_row: str,
+    body: LatexContent,
+    caption: Optional[str] = None,
+    table_id: Optional[str] = None,
+    is_supplementary: bool = False,
+) -> LatexContent:
+    r"""Wrap formatted table rows in a page-breaking longtable environment.
+
+    The header row is repeated at the top of every page. Supplementary
+    longtables are numbered with the supplementary table counter, like the
+    stable environment does for floats.
+
+    Args:
+        headers: List of raw table header strings
+        header_row: Formatted header row
+        body: Formatted data rows or ``\input`` lines, may be empty
+        caption: Optional table caption
+        table_id: Optional table ID for labeling
+        is_supplementary: Whether this is a supplementary table
+
+    Returns:
+        Complete LaTeX longtable as string
+    """
+    col_spec = "|" + "l|" * len(headers)
+    latex_lines = ["\\begingroup"]
+    if is_supplementary:
+        latex_lines.append("\\renewcommand{\\thetable}{\\thestable}%")
+        latex_lines.append("\\stepcounter{stable}%")
+    latex_lines.append("\\footnotesize" if len(headers) >= 5 else "\\small")
+    latex_lines.append(f"\\begin{{longtable}}{{{col_spec}}}")
+
+    if caption:
+        label = table_id if table_id else "tab:comparison"
+        latex_lines.append(f"\\caption{{{caption}}}\\label{{{label}}}\\\\")
+
+    # Header on the first page, then repeated on every following page
+    latex_lines.extend(["\\hline", header_row, "\\hline", "\\endfirsthead"])
+    latex_lines.extend(["\\hline", header_row, "\\hline", "\\endhead"])
+
+    if body:
+        latex_lines.append(body)
+    latex_lines.append("\\end{longtable}")
+    latex_lines.append("\\endgroup")
+
+    return "\n".join(latex_lines)
+
+
+def iter_data_table_rows(path: Path) -> Iterator[list[str]]:
+    """Stream the rows of a data file, header row first.
+
+    Args:
+        path: CSV, TSV or Parquet file
+
+    Yields:
+        Each row as a list of cell strings
+    """
+    suffix = path.suffix.lower()
+    if suffix in PARQUET_EXTENSIONS:
+        yield from _iter_parquet_rows(path)
+        return
+
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        yield from csv.reader(f, delimiter=DATA_TABLE_DELIMITERS[suffix])
+
+
+def _iter_parquet_rows(path: Path) -> Iterator[list[str]]:
+    """Stream the rows of a Parquet file using pyarrow, or pandas as fallback."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        pq = None
+
+    if pq is not None:
+        parquet_file = pq.ParquetFile(path)
+        yield list(parquet_file.schema_arrow.names)
+        for batch in parquet_file.iter_batches(batch_size=RENDER_BATCH_ROWS):
+            columns = [column.to_pylist() for column in batch.columns]
+            for row in zip(*columns):
+                yield [_cell_text(value) for value in row]
+        return
+
+    try:
+        import pandas as pd
+    except ImportError as e:
+        raise ImportError(
+            f"Reading {path} requires pyarrow (pip install pyarrow) or pandas "
+            f"with a Parquet engine"
+        ) from e
+
+    frame = pd.read_parquet(path)
+    yield [str(column) for column in frame.columns]
+    for row in frame.itertuples(index=False, name=None):
+        yield [_cell_text(value) for value in row]
+
+
+def _cell_text(value: Any) -> str:
+    """Convert a Parquet cell value to table text, treating nulls as empty."""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ""
+    return str(value)
+
+
+def _render_rows_cached(
+    source: Path, cache_dir: Path, columns: list[str], chunk_rows: int
+) -> dict[str, Any]:
+    """Render the rows of ``source`` into ``cache_dir`` unless already cached.
+
+    Args:
+        source: Data file
+        cache_dir: Directory holding the rendered part files and manifest
+        columns: Header names of the columns to keep (all if empty)
+        chunk_rows: Rows per part file, or 0 for a single part
+
+    Returns:
+        Cache manifest with headers, formatted header row and part file names
+    """
+    manifest_path = cache_dir / "manifest.json"
+    key = {
+        "version": CACHE_VERSION,
+        "sha256": _file_sha256(source),
+        "columns": columns,
+        "chunk_rows": chunk_rows,
+    }
+
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("key") == key and all(
+            (cache_dir / part).is_file() for part in manifest["parts"]
+        ):
+            return manifest
+    except (OSError, ValueError, KeyError):
+        pass
+
+    # Rows are rendered into a private directory and moved in part by part,
+    # the manifest listing them last, so builds of the same manuscript
+    # running concurrently never read a partly written table
+    cache_dir.parent.mkdir(parents=True, exist_ok=True)
+    staging_dir = Path(
+        tempfile.mkdtemp(prefix=f".{cache_dir.name}-", dir=cache_dir.parent)
+    )
+    try:
+        manifest = _render_rows(source, staging_dir, columns, chunk_rows)
+        manifest["key"] = key
+        with open(staging_dir / manifest_path.name, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        cache_dir.mkdir(exist_ok=True)
+        for name in [*manifest["parts"], manifest_path.name]:
+            os.replace(staging_dir / name, cache_dir / name)
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+    for stale_part in cache_dir.glob("part_*.tex"):
+        if stale_part.name not in manifest["parts"]:
+            stale_part.unlink(missing_ok=True)
+    return manifest
+
+
+def _render_rows(
+    source: Path, cache_dir: Path, columns: list[str], chunk_rows: int
+) -> dict[str, Any]:
+    """Stream ``source`` into formatted LaTeX part files in ``cache_dir``."""
+    rows = iter_data_table_rows(source)
+    headers = next(rows, [])
+    if not headers:
+        raise ValueError(f"Data table {source} is empty")
+
+    if columns:
+        missing = [column for column in columns if column not in headers]
+        if missing:
+            raise ValueError(f"Columns not found in {source}: {', '.join(missing)}")
+        indices = [headers.index(column) for column in columns]
+        headers = columns
+    else:
+        indices = list(range(len(headers)))
+
+    # Non-blank rows restricted to the requested columns, padded if short
+    selected_rows = (
+        [row[index] if index < len(row) else "" for index in indices]
+        for row in rows
+        if any(cell.strip() for cell in row)
+    )
+
+    parts: list[str] = []
+    row_count = 0
+    first_row = next(selected_rows, None)
+    while first_row is not None:
+        parts.append(f"part_{len(parts) + 1:04d}.tex")
+        part_rows = chain(
+            [first_row],
+            islice(selected_rows, chunk_rows - 1) if chunk_rows else selected_rows,
+        )
+        with open(cache_dir / parts[-1], "w", encoding="utf-8") as part_file:
+            while batch := list(islice(part_rows, RENDER_BATCH_ROWS)):
+                part_file.write(join_table_body(format_table_rows(batch)) + "\n")
+                row_count += len(batch)
+        first_row = next(selected_rows, None)
+    rows.close()
+
+    if not parts:
+        # Header-only table: keep a single empty part so the layout is uniform
+        parts.append("part_0001.tex")
+        (cache_dir / parts[0]).write_text("", encoding="utf-8")
+
+    return {
+        "source": source.name,
+        "headers": headers,
+        "header_row": format_table_rows([headers], is_header=True)[0],
+        "rows": row_count,
+        "parts": parts,
+    }
+
+
+def _file_sha256(path: Path) -> str:
+    """Hash a file in blocks without reading it into memory."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _cache_key(src: str, columns: list[str], chunk_rows: int) -> str:
+    r"""Turn a data table path and options into a directory name safe for \input.
+
+    Renderings of the same file with different options get separate
+    directories so that tables referencing earlier parts stay valid.
+    """
+    key = re.sub(r"[^A-Za-z0-9]+", "_", str(PurePosixPath(src).with_suffix("")))
+    if columns or chunk_rows:
+        options = json.dumps([columns, chunk_rows]).encode("utf-8")
+        key += "_" + hashlib.sha256(options).hexdigest()[:8]
+    return key
+
+
+def _parse_chunk_rows(value: str) -> int:
+    """Parse the chunk-rows attribute, which must be a non-negative integer."""
+    try:
+        chunk_rows = int(value)
+    except ValueError:
+        chunk_rows = -1
+    if chunk_rows < 0:
+        raise ValueError(f"chunk-rows must be a non-negative integer: {value}")
+    return chunk_rows
@@ -8,6 +8,7 @@ import re
 from typing import Optional
 
 from .types import (
+    EnvironmentNames,
     FigureAttributes,
     FigureCaption,
     FigureId,
@@ -20,13 +21,17 @@ from .types import (
 
 
 def convert_figures_to_latex(
-    text: MarkdownContent, is_supplementary: bool = False
+    text: MarkdownContent,
+    is_supplementary: bool = False,
+    environment_names: Optional[EnvironmentNames] = None,
 ) -> LatexContent:
     r"""Convert markdown figures to LaTeX figure environments.
 
     Args:
         text: The text containing markdown figures
         is_supplementary: If True, enables supplementary content processing
+        environment_names: Optional mapping renaming the emitted float
+            environments, e.g. ``{"figure": "sfigure"}``
 
     Returns:
         Text with figures converted to LaTeX format
@@ -52,9 +57,9 @@ def convert_figures_to_latex(
     text = re.sub(r"```.*?```", protect_fenced_code, text, flags=re.DOTALL)
 
     # Process different figure formats
-    text = _process_new_figure_format(text)
-    text = _process_figure_with_attributes(text)
-    text = _process_figure_without_attributes(text)
+    text = _process_new_figure_format(text, environment_names)
+    text = _process_figure_with_attributes(text, environment_names)
+    text = _process_figure_without_attributes(text, environment_names)
 
     # Restore protected code blocks
     for i, block in enumerate(protected_blocks):
@@ -130,6 +135,7 @@ def create_latex_figure_environment(
     caption: FigureCaption,
     attributes: Optional[FigureAttributes] = None,
     is_supplementary: bool = False,
+    environment_names: Optional[EnvironmentNames] = None,
 ) -> LatexContent:
     """Create a complete LaTeX figure environment.
 
@@ -138,6 +144,8 @@ def create_latex_figure_environment(
         caption: Figure caption text
         attributes: Optional figure attributes (position, width, id)
         is_supplementary: Whether this is a supplementary figure
+        environment_names: Optional mapping renaming the emitted float
+            environments, e.g. ``{"figure": "sfigure"}``
 
     Returns:
         Complete LaTeX figure environment
@@ -196,6 +204,8 @@ def create_latex_figure_environment(
 
     # Create LaTeX figure environment - use figure* for 2-column spanning
     figure_env = "figure*" if is_twocolumn else "figure"
+    if environment_names:
+        figure_env = environment_names.get(figure_env, figure_env)
     latex_figure = f"""\\begin{{{figure_env}}}[{position}]
 \\centering
 \\includegraphics[width={width}]{{{latex_path}}}
@@ -210,7 +220,9 @@ def create_latex_figure_environment(
     return latex_figure
 
 
-def _process_new_figure_format(text: MarkdownContent) -> LatexContent:
+def _process_new_figure_format(
+    text: MarkdownContent, environment_names: Optional[EnvironmentNames] = None
+) -> LatexContent:
     r"""Process new figure format: ![](path)\n{attributes} **Caption text**."""
 
     def process_new_figure_format_full(match: re.Match[str]) -> str:
@@ -220,7 +232,9 @@ def _process_new_figure_format(text: MarkdownContent) -> LatexContent:
 
         # Parse attributes
         attributes = parse_figure_attributes(attr_string)
-        return create_latex_figure_environment(path, caption_text, attributes)
+        return create_latex_figure_environment(
+            path, caption_text, attributes, environment_names=environment_names
+        )
 
     # Handle new format: ![](path)\n{attributes} **Caption text**
     return re.sub(
@@ -231,7 +245,9 @@ def _process_new_figure_format(text: MarkdownContent) -> LatexContent:
     )
 
 
-def _process_figure_with_attributes(text: MarkdownContent) -> LatexContent:
+def _process_figure_with_attributes(
+    text: MarkdownContent, environment_names: Optional[EnvironmentNames] = None
+) -> LatexContent:
     """Process figures with attributes: ![caption](path){attributes}."""
 
     def process_figure_with_attributes(match: re.Match[str]) -> str:
@@ -241,7 +257,9 @@ def _process_figure_with_attributes(text: MarkdownContent) -> LatexContent:
 
         # Parse attributes
         attributes = parse_figure_attributes(attr_string)
-        return create_latex_figure_environment(path, caption, attributes)
+        return create_latex_figure_environment(
+            path, caption, attributes, environment_names=environment_names
+        )
 
     # Handle figures with attributes (old format)
     return re.sub(
@@ -249,13 +267,17 @@ def _process_figure_with_attributes(text: MarkdownContent) -> LatexContent:
     )
 
 
-def _process_figure_without_attributes(text: MarkdownContent) -> LatexContent:
+def _process_figure_without_attributes(
+    text: MarkdownContent, environment_names: Optional[EnvironmentNames] = None
+) -> LatexContent:
     """Process figures without attributes: ![caption](path)."""
 
     def process_figure_without_attributes(match: re.Match[str]) -> str:
         caption = match.group(1)
         path = match.group(2)
-        return create_latex_figure_environment(path, caption)
+        return create_latex_figure_environment(
+            path, caption, environment_names=environment_names
+        )
 
     # Handle figures without attributes (remaining ones)
     return re.sub(r"!\[([^\]]*)\]\(([^)]+)\)", process_figure_without_attributes, text)
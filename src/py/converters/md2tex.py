@@ -5,13 +5,18 @@ to LaTeX format, coordinating all the specialized processors.
 """
 
 import re
+from typing import Optional
 
-from .citation_processor import process_citations_outside_tables
+from .citation_processor import (
+    MARKDOWN_TABLE_PLACEHOLDER_PATTERN,
+    process_citations_outside_tables,
+)
 from .code_processor import (
     convert_code_blocks_to_latex,
     protect_code_content,
     restore_protected_code,
 )
+from .data_table_processor import convert_data_tables_to_latex
 from .figure_processor import (
     convert_equation_references_to_latex,
     convert_figure_references_to_latex,
@@ -30,7 +35,11 @@ from .supplementary_note_processor import (
     process_supplementary_notes,
     restore_supplementary_note_placeholders,
 )
-from .table_processor import convert_table_references_to_latex, convert_tables_to_latex
+from .table_processor import (
+    convert_table_references_to_latex,
+    convert_tables_to_latex,
+    restore_backtick_content,
+)
 from .text_formatters import (
     escape_special_characters,
     process_code_spans,
@@ -38,18 +47,38 @@ from .text_formatters import (
     protect_italic_outside_texttt,
     restore_protected_seqsplit,
 )
-from .types import LatexContent, MarkdownContent, ProtectedContent
+from .types import (
+    EnvironmentNames,
+    LatexContent,
+    MarkdownContent,
+    ProtectedContent,
+)
 from .url_processor import convert_links_to_latex
 
+# Float environments of the supplementary document, which numbers its
+# figures and tables separately from the main text
+SUPPLEMENTARY_ENVIRONMENT_NAMES: EnvironmentNames = {
+    "figure": "sfigure",
+    "table": "stable",
+    "table*": "stable*",
+}
+
 
 def convert_markdown_to_latex(
-    content: MarkdownContent, is_supplementary: bool = False
+    content: MarkdownContent,
+    is_supplementary: bool = False,
+    environment_names: Optional[EnvironmentNames] = None,
+    manuscript_path: Optional[str] = None,
 ) -> LatexContent:
     r"""Convert basic markdown formatting to LaTeX.
 
     Args:
         content: The markdown content to convert
         is_supplementary: If True, adds \newpage after figures and tables
+        environment_names: Optional mapping renaming the emitted float
+            environments, e.g. SUPPLEMENTARY_ENVIRONMENT_NAMES
+        manuscript_path: Manuscript directory that data tables are read
+            from (default: MANUSCRIPT_PATH)
 
     Returns:
         LaTeX formatted content
@@ -65,6 +94,9 @@ def convert_markdown_to_latex(
     protected_backtick_content: ProtectedContent = {}
     protected_tables: ProtectedContent = {}
     protected_markdown_tables: ProtectedContent = {}
+    # Supplementary note headers, kept per conversion so that conversions
+    # running concurrently in one process do not share them
+    protected_notes: ProtectedContent = {}
 
     # Protect backtick content and markdown tables BEFORE math protection
     content, protected_backtick_content = _protect_backtick_content(content)
@@ -95,10 +127,12 @@ def convert_markdown_to_latex(
         protected_markdown_tables,
         protected_tables,
         is_supplementary,
+        environment_names,
+        manuscript_path,
     )
 
     # Convert figures BEFORE headers to avoid conflicts
-    content = convert_figures_to_latex(content, is_supplementary)
+    content = convert_figures_to_latex(content, is_supplementary, environment_names)
 
     # Convert figure references BEFORE citations to avoid conflicts
     content = convert_figure_references_to_latex(content)
@@ -112,7 +146,7 @@ def convert_markdown_to_latex(
     # Process supplementary notes EARLY (only for supplementary content)
     # Must happen before text formatting to avoid conflicts with \subsection*
     if is_supplementary:
-        content = process_supplementary_notes(content)
+        content = process_supplementary_notes(content, protected_notes)
 
     # Convert headers
     content = _convert_headers(content, is_supplementary)
@@ -133,7 +167,7 @@ def convert_markdown_to_latex(
 
     # Restore supplementary note placeholders after text formatting
     if is_supplementary:
-        content = restore_supplementary_note_placeholders(content)
+        content = restore_supplementary_note_placeholders(content, protected_notes)
 
     # Convert markdown links to LaTeX URLs
     content = convert_links_to_latex(content)
@@ -263,24 +297,41 @@ def _process_tables_with_protection(
     protected_markdown_tables: ProtectedContent,
     protected_tables: ProtectedContent,
     is_supplementary: bool,
+    environment_names: Optional[EnvironmentNames] = None,
+    manuscript_path: Optional[str] = None,
 ) -> LatexContent:
     """Process tables with proper content protection."""
+    # Render data-file backed tables; they go straight into protected_tables
+    content = convert_data_tables_to_latex(
+        content,
+        protected_tables,
+        is_supplementary,
+        manuscript_path,
+        environment_names,
+    )
+
     # Restore protected markdown tables before table processing
-    for placeholder, original in protected_markdown_tables.items():
-        content = content.replace(placeholder, original)
+    if protected_markdown_tables:
+        content = MARKDOWN_TABLE_PLACEHOLDER_PATTERN.sub(
+            lambda match: protected_markdown_tables.get(match.group(0), match.group(0)),
+            content,
+        )
 
     # Temporarily restore backtick content for table processing, then re-protect it
-    temp_content = content
-
     # Only restore backticks that are actually in table rows to avoid
     # affecting verbatim blocks
-    table_lines = temp_content.split("\n")
+    # Restored lines are mapped to their protected form, so lines that are
+    # not converted get back the placeholders of the first protection pass
+    restored_lines: dict[str, str] = {}
+    table_lines = content.split("\n")
     for i, line in enumerate(table_lines):
-        if "|" in line and line.strip().startswith("|") and line.strip().endswith("|"):
+        stripped = line.strip()
+        if stripped.startswith("|") and stripped.endswith("|"):
             # This is a table row - restore backticks in this line only
-            for placeholder, original in protected_backtick_content.items():
-                line = line.replace(placeholder, original)
-            table_lines[i] = line
+            restored = restore_backtick_content(line, protected_backtick_content)
+            if restored != line:
+                restored_lines.setdefault(restored, line)
+                table_lines[i] = restored
 
     temp_content = "\n".join(table_lines)
 
@@ -289,6 +340,7 @@ def _process_tables_with_protection(
         temp_content,
         protected_backtick_content,
         is_supplementary,
+        environment_names,
     )
 
     # IMPORTANT: Protect entire LaTeX table blocks from further markdown processing
@@ -306,13 +358,11 @@ def _process_tables_with_protection(
         )
 
     # Re-protect any backtick content that wasn't converted to \texttt{} in tables
-    for original, placeholder in [
-        (v, k) for k, v in protected_backtick_content.items()
-    ]:
-        if original in table_processed_content:
-            table_processed_content = table_processed_content.replace(
-                original, placeholder
-            )
+    if restored_lines:
+        table_processed_content = "\n".join(
+            restored_lines.get(line, line)
+            for line in table_processed_content.split("\n")
+        )
 
     return table_processed_content
 
@@ -355,8 +405,7 @@ def _process_text_formatting(
     # code spans is preserved as literal text
 
     # First restore protected backtick content so we can process it
-    for placeholder, original in protected_backtick_content.items():
-        content = content.replace(placeholder, original)
+    content = restore_backtick_content(content, protected_backtick_content)
 
     # Then convert backticks to texttt with proper underscore handling
     content = process_code_spans(content)
@@ -433,6 +482,7 @@ def _restore_protected_content(
 
 # Export functions that are used by other modules to avoid circular imports
 __all__ = [
+    "SUPPLEMENTARY_ENVIRONMENT_NAMES",
     "convert_markdown_to_latex",
     "extract_content_sections",
     "map_section_title_to_key",
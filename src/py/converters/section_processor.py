@@ -5,25 +5,27 @@ and mapping of section titles to standardized keys.
 """
 
 import re
+from typing import Optional
 
 from .types import MarkdownContent, SectionDict, SectionKey, SectionTitle
+from .word_counter import WordCounts, record_section_word_count
 
 
-def extract_content_sections(article_md: MarkdownContent) -> SectionDict:
-    """Extract content sections from markdown file and convert to LaTeX.
+def split_content_sections(
+    article_md: MarkdownContent,
+) -> list[tuple[SectionKey, MarkdownContent, bool]]:
+    """Split a markdown manuscript into its ``##`` sections.
 
     Args:
         article_md: Either markdown content as string or path to markdown file
 
     Returns:
-        Dictionary mapping section keys to LaTeX content
+        List of (section key, markdown content, is supplementary) tuples in
+        document order
 
     Raises:
         FileNotFoundError: If article_md is a file path that doesn't exist
     """
-    # Import here to avoid circular imports
-    from .md2tex import convert_markdown_to_latex
-
     # Check if article_md is a file path or content
     if article_md.startswith("#") or article_md.startswith("---") or "\n" in article_md:
         # It's content, not a file path
@@ -36,9 +38,6 @@ def extract_content_sections(article_md: MarkdownContent) -> SectionDict:
     # Remove YAML front matter
     content = re.sub(r"^---\n.*?\n---\n", "", content, flags=re.DOTALL)
 
-    # Dictionary to store extracted sections
-    sections: SectionDict = {}
-
     # Split content by ## headers to find sections
     section_pattern = r"^## (.+?)$"
     section_matches = list(re.finditer(section_pattern, content, re.MULTILINE))
@@ -47,8 +46,9 @@ def extract_content_sections(article_md: MarkdownContent) -> SectionDict:
     if not section_matches:
         # Check if entire content is supplementary
         is_supplementary = "supplementary" in content.lower()
-        sections["main"] = convert_markdown_to_latex(content, is_supplementary)
-        return sections
+        return [("main", content, is_supplementary)]
+
+    sections = []
 
     # Extract main content (everything before first ## header)
     first_section_start = section_matches[0].start()
@@ -56,9 +56,7 @@ def extract_content_sections(article_md: MarkdownContent) -> SectionDict:
     if main_content:
         # Check if main content is supplementary
         is_main_supplementary = "supplementary" in main_content.lower()
-        sections["main"] = convert_markdown_to_latex(
-            main_content, is_main_supplementary
-        )
+        sections.append(("main", main_content, is_main_supplementary))
 
     # Extract each section
     for i, match in enumerate(section_matches):
@@ -79,18 +77,64 @@ def extract_content_sections(article_md: MarkdownContent) -> SectionDict:
             or "supplementary" in section_content.lower()
         )
 
-        section_content_latex = convert_markdown_to_latex(
-            section_content, is_supplementary
-        )
-
         # Map section titles to our standard keys
         section_key = map_section_title_to_key(section_title)
         if section_key:
-            sections[section_key] = section_content_latex
+            sections.append((section_key, section_content, is_supplementary))
+
+    return sections
+
+
+def extract_content_sections(
+    article_md: MarkdownContent,
+    word_counts: Optional[WordCounts] = None,
+    manuscript_path: Optional[str] = None,
+) -> SectionDict:
+    """Extract content sections from markdown file and convert to LaTeX.
+
+    Args:
+        article_md: Either markdown content as string or path to markdown file
+        word_counts: Optional dictionary filled with the word count of each
+            section's markdown as it is converted
+        manuscript_path: Manuscript directory that data tables are read
+            from (default: MANUSCRIPT_PATH)
+
+    Returns:
+        Dictionary mapping section keys to LaTeX content
+
+    Raises:
+        FileNotFoundError: If article_md is a file path that doesn't exist
+    """
+    # Import here to avoid circular imports
+    from .md2tex import convert_markdown_to_latex
+
+    sections: SectionDict = {}
+    for section_key, section_content, is_supplementary in split_content_sections(
+        article_md
+    ):
+        sections[section_key] = convert_markdown_to_latex(
+            section_content, is_supplementary, manuscript_path=manuscript_path
+        )
+        record_section_word_count(word_counts, section_key, section_content)
 
     return sections
 
 
+def count_content_sections(article_md: MarkdownContent) -> WordCounts:
+    """Count the words of each section without converting the manuscript.
+
+    Args:
+        article_md: Either markdown content as string or path to markdown file
+
+    Returns:
+        Dictionary mapping section keys to their word counts
+    """
+    word_counts: WordCounts = {}
+    for section_key, section_content, _ in split_content_sections(article_md):
+        record_section_word_count(word_counts, section_key, section_content)
+    return word_counts
+
+
 def map_section_title_to_key(title: SectionTitle) -> SectionKey:
     """Map section title to standardized key.
 
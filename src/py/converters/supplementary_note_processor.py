@@ -5,23 +5,35 @@ a reference system for citing supplementary notes from the main text.
 """
 
 import re
-from typing import TYPE_CHECKING
+from contextvars import ContextVar
+from typing import Optional
 
-if TYPE_CHECKING:
-    pass
+from .types import LatexContent, MarkdownContent, ProtectedContent
 
-from .types import LatexContent, MarkdownContent
+# Replacements of the last process_supplementary_notes call in the current
+# thread or task, for callers that do not pass their own dictionary
+_pending_replacements: ContextVar[Optional[ProtectedContent]] = ContextVar(
+    "_pending_replacements", default=None
+)
 
 
-def process_supplementary_notes(content: LatexContent) -> LatexContent:
+def process_supplementary_notes(
+    content: LatexContent, protected_notes: Optional[ProtectedContent] = None
+) -> LatexContent:
     """Process supplementary note headers and create reference labels.
 
     Converts {#snote:id} **Title** format to LaTeX format with automatic
     "Supplementary Note X:" numbering and reference labels. Processes all snote
     patterns throughout the document.
 
+    The LaTeX of each note is stored in ``protected_notes`` under the
+    placeholder replacing it, to be restored by
+    restore_supplementary_note_placeholders. Without a dictionary, the
+    replacements are kept for the current thread or task only.
+
     Args:
         content: The markdown content to process (before LaTeX conversion)
+        protected_notes: Dictionary of protected note headers to add to
 
     Returns:
         Processed content with supplementary notes formatted, protected from
@@ -89,37 +101,38 @@ def process_supplementary_notes(content: LatexContent) -> LatexContent:
     )
 
     # Store the replacements for later restoration after text formatting
-    # We use a global variable since strings don't have attributes
-    global _snote_replacements
-    _snote_replacements = replacements
+    if protected_notes is None:
+        _pending_replacements.set(replacements)
+    else:
+        protected_notes.update(replacements)
 
     return processed_content
 
 
-# Global variable to store replacements
-_snote_replacements: dict[str, str] = {}
-
-
-def restore_supplementary_note_placeholders(content: LatexContent) -> LatexContent:
+def restore_supplementary_note_placeholders(
+    content: LatexContent, protected_notes: Optional[ProtectedContent] = None
+) -> LatexContent:
     """Restore supplementary note placeholders after text formatting.
 
     This should be called after all text formatting is complete.
 
     Args:
         content: Content with supplementary note placeholders
+        protected_notes: Dictionary filled by process_supplementary_notes;
+            when not given, the replacements kept for the current thread or
+            task are restored and cleared
 
     Returns:
         Content with placeholders replaced by LaTeX commands
     """
-    global _snote_replacements
+    if protected_notes is None:
+        protected_notes = _pending_replacements.get() or {}
+        _pending_replacements.set(None)
 
     # Replace placeholders with final LaTeX
-    for placeholder, latex_replacement in _snote_replacements.items():
+    for placeholder, latex_replacement in protected_notes.items():
         content = content.replace(placeholder, latex_replacement)
 
-    # Clear the replacements after use
-    _snote_replacements = {}
-
     return content
 
 
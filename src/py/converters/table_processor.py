@@ -9,6 +9,7 @@ from typing import Optional
 
 from .citation_processor import convert_citations_to_latex
 from .types import (
+    EnvironmentNames,
     LatexContent,
     MarkdownContent,
     ProtectedContent,
@@ -16,11 +17,41 @@ from .types import (
     TableHeaders,
 )
 
+# Placeholders created by md2tex._protect_backtick_content
+BACKTICK_PLACEHOLDER_PATTERN = re.compile(
+    r"XXPROTECTEDBACKTICKXX\d+XXPROTECTEDBACKTICKXX"
+)
+
+
+def restore_backtick_content(
+    text: str, protected_backtick_content: Optional[ProtectedContent]
+) -> str:
+    """Restore protected backtick placeholders in a single pass.
+
+    Placeholders are located with one regex scan and resolved through the
+    protected content dictionary, so the cost is linear in the length of
+    ``text`` regardless of how many placeholders the document contains.
+
+    Args:
+        text: Text that may contain backtick placeholders
+        protected_backtick_content: Dict mapping placeholders to original content
+
+    Returns:
+        Text with known placeholders replaced by their original content
+    """
+    if not protected_backtick_content or "XXPROTECTEDBACKTICKXX" not in text:
+        return text
+    return BACKTICK_PLACEHOLDER_PATTERN.sub(
+        lambda match: protected_backtick_content.get(match.group(0), match.group(0)),
+        text,
+    )
+
 
 def convert_tables_to_latex(
     text: MarkdownContent,
     protected_backtick_content: Optional[ProtectedContent] = None,
     is_supplementary: bool = False,
+    environment_names: Optional[EnvironmentNames] = None,
 ) -> LatexContent:
     r"""Convert markdown tables to LaTeX table environments.
 
@@ -28,6 +59,8 @@ def convert_tables_to_latex(
         text: The text containing markdown tables
         protected_backtick_content: Dict of protected backtick content
         is_supplementary: If True, enables supplementary content processing
+        environment_names: Optional mapping renaming the emitted float
+            environments, e.g. ``{"table": "stable"}``
 
     Returns:
         Text with tables converted to LaTeX format
@@ -124,9 +157,7 @@ def convert_tables_to_latex(
                     result_lines.pop()  # Remove caption line
 
             # Check for new format table caption after the table
-            new_format_caption, table_id, rotation_angle = _parse_table_caption(
-                lines, i
-            )
+            new_format_caption, table_id, rotation_angle = parse_table_caption(lines, i)
             if new_format_caption:
                 i += 2  # Skip blank line and caption line
 
@@ -140,6 +171,7 @@ def convert_tables_to_latex(
                 protected_backtick_content,
                 rotation_angle,
                 is_supplementary,
+                environment_names,
             )
             result_lines.extend(latex_table.split("\n"))
 
@@ -162,6 +194,7 @@ def generate_latex_table(
     protected_backtick_content: Optional[ProtectedContent] = None,
     rotation_angle: Optional[int] = None,
     is_supplementary: bool = False,
+    environment_names: Optional[EnvironmentNames] = None,
 ) -> LatexContent:
     """Generate LaTeX table from headers and data rows.
 
@@ -176,17 +209,51 @@ def generate_latex_table(
         protected_backtick_content: Protected backtick content dictionary
         rotation_angle: Optional rotation angle for table
         is_supplementary: Whether this is a supplementary table
+        environment_names: Optional mapping renaming the emitted float
+            environments, e.g. ``{"table": "stable"}``
 
     Returns:
         Complete LaTeX table environment as string
     """
-    if protected_backtick_content is None:
-        protected_backtick_content = {}
+    is_markdown_syntax_table = is_markdown_syntax_header(headers)
+
+    # Format header and data rows in one batch; each row becomes a LaTeX line
+    header_row = format_table_rows(
+        [headers],
+        is_markdown_syntax_table,
+        protected_backtick_content,
+        is_header=True,
+    )[0]
+    body = join_table_body(
+        format_table_rows(
+            data_rows, is_markdown_syntax_table, protected_backtick_content
+        )
+    )
+
+    return build_table_environment(
+        headers,
+        header_row,
+        body,
+        caption,
+        width,
+        table_id,
+        rotation_angle,
+        is_supplementary,
+        environment_names,
+    )
 
-    num_cols = len(headers)
 
-    # Check if this is a Markdown Syntax Overview table to preserve literal
-    # syntax in the first column
+def is_markdown_syntax_header(headers: TableHeaders) -> bool:
+    """Check whether headers belong to a Markdown Syntax Overview table.
+
+    Such tables preserve literal syntax in their first two columns.
+
+    Args:
+        headers: List of table header strings
+
+    Returns:
+        True if the first header is "Markdown Element"
+    """
     # Remove markdown formatting from header for comparison
     first_header_clean = headers[0].lower().strip() if headers else ""
     first_header_clean = re.sub(
@@ -195,7 +262,42 @@ def generate_latex_table(
     first_header_clean = re.sub(
         r"\*(.*?)\*", r"\1", first_header_clean
     )  # Remove *italic*
-    is_markdown_syntax_table = first_header_clean == "markdown element"
+    return first_header_clean == "markdown element"
+
+
+def build_table_environment(
+    headers: TableHeaders,
+    header_row: str,
+    body: LatexContent,
+    caption: Optional[str] = None,
+    width: str = "single",
+    table_id: Optional[str] = None,
+    rotation_angle: Optional[int] = None,
+    is_supplementary: bool = False,
+    environment_names: Optional[EnvironmentNames] = None,
+) -> LatexContent:
+    """Wrap formatted table rows in a LaTeX table environment.
+
+    Chooses the column specification, float environment, rotation and
+    caption/label for a table whose rows have already been formatted.
+
+    Args:
+        headers: List of raw table header strings
+        header_row: Formatted header row (see format_table_rows)
+        body: Formatted data rows (see join_table_body), may be empty
+        caption: Optional table caption
+        width: Table width ("single" or "double")
+        table_id: Optional table ID for labeling
+        rotation_angle: Optional rotation angle for table
+        is_supplementary: Whether this is a supplementary table
+        environment_names: Optional mapping renaming the emitted float
+            environments, e.g. ``{"table": "stable"}``
+
+    Returns:
+        Complete LaTeX table environment as string
+    """
+    num_cols = len(headers)
+    is_markdown_syntax_table = is_markdown_syntax_header(headers)
 
     # Determine if we should use tabularx for better width handling
     # Use tabularx for:
@@ -227,37 +329,6 @@ def generate_latex_table(
         # Use regular column specification (all left-aligned with borders)
         col_spec = "|" + "l|" * num_cols
 
-    # Format headers
-    formatted_headers: list[str] = []
-    for i, header in enumerate(headers):
-        # For markdown syntax table, treat first two columns as literal code examples
-        is_code_example_column = i < 2 and is_markdown_syntax_table
-        formatted_headers.append(
-            _format_table_cell(
-                header,
-                is_code_example_column,
-                is_header=True,
-                protected_backtick_content=protected_backtick_content,
-            )
-        )
-
-    # Format data rows
-    formatted_data_rows: list[list[str]] = []
-    for row in data_rows:
-        formatted_row: list[str] = []
-        for i, cell in enumerate(row):
-            # For markdown syntax table, treat first two columns as literal code
-            is_code_example_column = i < 2 and is_markdown_syntax_table
-            formatted_row.append(
-                _format_table_cell(
-                    cell,
-                    is_code_example_column,
-                    is_header=False,
-                    protected_backtick_content=protected_backtick_content,
-                )
-            )
-        formatted_data_rows.append(formatted_row)
-
     # Determine table environment
     if use_tabularx:
         if is_markdown_syntax_table:
@@ -276,6 +347,8 @@ def generate_latex_table(
         table_env, position = _determine_table_environment(
             width, rotation_angle, is_supplementary
         )
+    if environment_names:
+        table_env = environment_names.get(table_env, table_env)
 
     # Build LaTeX table environment
     latex_lines = [
@@ -306,15 +379,12 @@ def generate_latex_table(
     latex_lines.append("\\hline")
 
     # Add header row
-    header_row = " & ".join(formatted_headers) + " \\\\"
     latex_lines.append(header_row)
     latex_lines.append("\\hline")
 
-    # Add data rows
-    for row in formatted_data_rows:
-        data_row = " & ".join(row) + " \\\\"
-        latex_lines.append(data_row)
-        latex_lines.append("\\hline")
+    # Add data rows, each followed by a horizontal rule
+    if body:
+        latex_lines.append(body)
 
     # Close tabular environment
     if use_tabularx:
@@ -339,6 +409,55 @@ def generate_latex_table(
     return "\n".join(latex_lines)
 
 
+def format_table_rows(
+    rows: TableData,
+    is_markdown_syntax_table: bool = False,
+    protected_backtick_content: Optional[ProtectedContent] = None,
+    is_header: bool = False,
+) -> list[str]:
+    r"""Format table rows into LaTeX tabular lines.
+
+    Every cell is formatted once and each row is assembled with a single join.
+
+    Args:
+        rows: Table rows (each row is a list of cell strings)
+        is_markdown_syntax_table: Whether the first two columns hold literal
+            markdown syntax examples
+        protected_backtick_content: Protected backtick content dictionary
+        is_header: Whether the rows are header rows
+
+    Returns:
+        One ``a & b & c \\`` line per row
+    """
+    return [
+        " & ".join(
+            _format_table_cell(
+                cell,
+                # For markdown syntax table, treat first two columns as
+                # literal code examples
+                i < 2 and is_markdown_syntax_table,
+                is_header=is_header,
+                protected_backtick_content=protected_backtick_content,
+            )
+            for i, cell in enumerate(row)
+        )
+        + " \\\\"
+        for row in rows
+    ]
+
+
+def join_table_body(formatted_rows: list[str]) -> LatexContent:
+    """Join formatted data rows, following each with a horizontal rule.
+
+    Args:
+        formatted_rows: Rows returned by format_table_rows
+
+    Returns:
+        Tabular body text, empty if there are no rows
+    """
+    return "".join(f"{row}\n\\hline\n" for row in formatted_rows)[:-1]
+
+
 def _format_table_cell(
     cell: str,
     is_markdown_example_column: bool = False,
@@ -356,12 +475,8 @@ def _format_table_cell(
     Returns:
         Formatted cell content for LaTeX
     """
-    if protected_backtick_content is None:
-        protected_backtick_content = {}
-
     # First restore any protected backtick content
-    for placeholder, original in protected_backtick_content.items():
-        cell = cell.replace(placeholder, original)
+    cell = restore_backtick_content(cell, protected_backtick_content)
 
     # If this is the "Markdown Element" column, preserve literal syntax
     if is_markdown_example_column:
@@ -682,7 +797,7 @@ def _is_table_row(line: str) -> bool:
     return "|" in line and line.startswith("|") and line.endswith("|")
 
 
-def _parse_table_caption(
+def parse_table_caption(
     lines: list[str], i: int
 ) -> tuple[Optional[str], Optional[str], Optional[int]]:
     """Parse table caption in new format after table."""
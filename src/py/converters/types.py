@@ -18,6 +18,9 @@ ProtectedContent = dict[Placeholder, str]
 FigureAttributes = dict[str, str]
 TableAttributes = dict[str, str]
 
+# Float environment renaming, e.g. {"figure": "sfigure"} in the supplement
+EnvironmentNames = dict[str, str]
+
 # Content processing types
 ContentProcessor = Union[str, list[str]]
 ProcessingContext = dict[str, Union[bool, str, int, ProtectedContent]]
@@ -0,0 +1,233 @@
+"""Word counting for manuscript sections.
+
+Sections are counted on their markdown while ``extract_content_sections``
+converts them. A single tokenizing pass separates prose words from math,
+citations, code, headings, tables and figure/table captions. The counts are
+persisted as JSON in the output directory so that the word count analysis
+never has to convert the manuscript a second time.
+"""
+
+import hashlib
+import json
+import re
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from .types import LatexContent, MarkdownContent, SectionKey
+
+WORD_COUNT_FILENAME = "word_count.json"
+
+# Bumped whenever the counting rules change, invalidating stored counts
+WORD_COUNT_VERSION = 2
+
+# One alternative per token kind; the first alternative that matches wins, so
+# spans that hide words (code, math, URLs, markup) come before plain words
+MARKDOWN_TOKEN_PATTERN = re.compile(
+    r"""
+      (?P<code_block>^[ \t]*```.*?^[ \t]*```[^\n]*$)
+    | (?P<code>``[^`]+``|`[^`\n]+`)
+    | (?P<comment><!--.*?-->)
+    | (?P<display_math>\$\$.+?\$\$)
+    | (?P<math>(?<!\\)\$[^$\n]+?(?<!\\)\$)
+    | (?P<image>!\[[^\]\n]*\]\([^)\n]*\))
+    | (?P<url>\]\([^)\n]*\)|<?https?://[^\s>)]+>?)
+    | (?P<html></?[a-zA-Z][^>\n]*>)
+    | (?P<latex>\\[a-zA-Z]+\*?)
+    | (?P<citation_group>\[@[^\]\n]+\])
+    | (?P<caption>^\{\#(?P<label>s?(?:fig|table):[^\s}]+)[^}\n]*\})
+    | (?P<attributes>\{[\#.][^}\n]*\})
+    | (?P<reference>(?<![\w.])@(?:s?fig|s?table|eq|snote):[\w-]+)
+    | (?P<citation>(?<![\w.])@[\w-]+)
+    | (?P<heading>^\#{1,6}[ \t][^\n]*)
+    | (?P<table_row>^[ \t]*\|[^\n]*)
+    | (?P<paragraph_break>\n[ \t]*\n)
+    | (?P<word>[^\W_]+(?:['’.\-][^\W_]+)*)
+    """,
+    re.MULTILINE | re.DOTALL | re.VERBOSE,
+)
+
+WORD_PATTERN = re.compile(r"[^\W_]+(?:['’.\-][^\W_]+)*")
+
+LATEX_COMMAND_WITH_ARGUMENT_PATTERN = re.compile(r"\\[a-zA-Z]+\{[^}]*\}")
+LATEX_COMMAND_PATTERN = re.compile(r"\\[a-zA-Z]+")
+LATEX_MARKUP_PATTERN = re.compile(r"[{}\\]")
+
+
+@dataclass
+class MarkdownWordCount:
+    """Token counts of a piece of manuscript markdown."""
+
+    words: int = 0
+    characters: int = 0
+    caption_words: int = 0
+    heading_words: int = 0
+    table_words: int = 0
+    math: int = 0
+    citations: int = 0
+    references: int = 0
+    code: int = 0
+    captions: dict[str, int] = field(default_factory=dict)
+    paragraphs: list[int] = field(default_factory=list)
+
+
+WordCounts = dict[SectionKey, MarkdownWordCount]
+
+
+def count_markdown_words(markdown: MarkdownContent) -> MarkdownWordCount:
+    """Count prose words and other tokens of markdown in one linear pass.
+
+    Prose words exclude math, code, citations, URLs, markup (including raw
+    LaTeX commands), headings, table cells and figure/table captions, which
+    are counted separately. A cross-reference such as ``@fig:id`` renders as
+    a figure number and counts as one prose word. Caption words are also
+    reported per caption label, and prose words per paragraph.
+
+    Args:
+        markdown: Markdown content of a section or document
+
+    Returns:
+        MarkdownWordCount with the counts of each token kind
+    """
+    count = MarkdownWordCount()
+    caption_label: Optional[str] = None
+    paragraph_words = 0
+
+    for match in MARKDOWN_TOKEN_PATTERN.finditer(markdown):
+        kind = match.lastgroup
+        if kind == "word":
+            if caption_label is not None:
+                count.caption_words += 1
+                count.captions[caption_label] += 1
+            else:
+                count.words += 1
+                count.characters += match.end() - match.start()
+                paragraph_words += 1
+        elif kind == "paragraph_break":
+            caption_label = None
+            if paragraph_words:
+                count.paragraphs.append(paragraph_words)
+                paragraph_words = 0
+        elif kind == "caption":
+            caption_label = match.group("label")
+            count.captions[caption_label] = 0
+        elif kind == "reference":
+            count.references += 1
+            if caption_label is None:
+                count.words += 1
+                paragraph_words += 1
+        elif kind == "citation_group":
+            count.citations += match.group().count("@")
+        elif kind == "citation":
+            count.citations += 1
+        elif kind in ("math", "display_math"):
+            count.math += 1
+        elif kind in ("code", "code_block"):
+            count.code += 1
+        elif kind == "heading":
+            count.heading_words += len(WORD_PATTERN.findall(match.group()))
+        elif kind == "table_row":
+            count.table_words += len(WORD_PATTERN.findall(match.group()))
+        # Comments, images, URLs, HTML tags, LaTeX commands and attribute
+        # blocks are not counted
+
+    if paragraph_words:
+        count.paragraphs.append(paragraph_words)
+    return count
+
+
+def count_words_in_text(text: LatexContent) -> int:
+    """Count words in text, excluding LaTeX commands.
+
+    Args:
+        text: LaTeX content of a section
+
+    Returns:
+        Number of whitespace-separated words left after removing LaTeX markup
+    """
+    # Remove LaTeX commands (backslash followed by word characters)
+    text_no_latex = LATEX_COMMAND_WITH_ARGUMENT_PATTERN.sub("", text)
+    text_no_latex = LATEX_COMMAND_PATTERN.sub("", text_no_latex)
+    # Remove remaining LaTeX markup
+    text_no_latex = LATEX_MARKUP_PATTERN.sub(" ", text_no_latex)
+    return len(text_no_latex.split())
+
+
+def record_section_word_count(
+    word_counts: Optional[WordCounts],
+    section_key: SectionKey,
+    markdown: MarkdownContent,
+) -> None:
+    """Add the word count of a section to ``word_counts``.
+
+    Empty sections are not recorded, and a section key seen twice keeps the
+    last count, matching the section dictionary built alongside.
+
+    Args:
+        word_counts: Counts being collected, or None when not counting
+        section_key: Standardized key of the section
+        markdown: Markdown content of the section
+    """
+    if word_counts is None:
+        return
+    if markdown.strip():
+        word_counts[section_key] = count_markdown_words(markdown)
+    else:
+        word_counts.pop(section_key, None)
+
+
+def _source_sha256(source: Path) -> str:
+    return hashlib.sha256(source.read_bytes()).hexdigest()
+
+
+def write_word_counts(
+    output_dir: str, word_counts: WordCounts, source: Optional[str] = None
+) -> Path:
+    """Persist section word counts as JSON in the output directory.
+
+    Args:
+        output_dir: Output directory of the manuscript build
+        word_counts: Counts per section key, in document order
+        source: Manuscript markdown file the counts were computed from
+
+    Returns:
+        Path of the written JSON file
+    """
+    data: dict[str, Any] = {
+        "version": WORD_COUNT_VERSION,
+        "source": str(source) if source else None,
+        "source_sha256": _source_sha256(Path(source)) if source else None,
+        "sections": {key: asdict(count) for key, count in word_counts.items()},
+        "total": sum(count.words for count in word_counts.values()),
+    }
+    path = Path(output_dir) / WORD_COUNT_FILENAME
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    return path
+
+
+def load_word_counts(
+    output_dir: str, source: Optional[str] = None
+) -> Optional[WordCounts]:
+    """Load section word counts written by a previous manuscript build.
+
+    Args:
+        output_dir: Output directory of the manuscript build
+        source: Manuscript markdown file; when given, counts computed from a
+            different version of it are ignored
+
+    Returns:
+        Counts per section key, or None if no up-to-date counts exist
+    """
+    try:
+        with open(Path(output_dir) / WORD_COUNT_FILENAME, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != WORD_COUNT_VERSION:
+            return None
+        if source and data.get("source_sha256") != _source_sha256(Path(source)):
+            return None
+        return {
+            key: MarkdownWordCount(**count) for key, count in data["sections"].items()
+        }
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
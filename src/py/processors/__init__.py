@@ -2,21 +2,61 @@
 
 This package contains core processing modules for YAML metadata,
 templates, and author information.
+
+Processors are imported on first access (PEP 562), so loading the
+configuration does not also load the template and conversion pipeline.
 """
 
-from .author_processor import (
-    generate_authors_and_affiliations,
-    generate_corresponding_authors,
-    generate_extended_author_info,
-)
-from .template_processor import get_template_path, process_template_replacements
-from .yaml_processor import extract_yaml_metadata
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .author_processor import (
+        generate_authors_and_affiliations,
+        generate_corresponding_authors,
+        generate_extended_author_info,
+    )
+    from .build import BuildResult, Manuscript, build_manuscript
+    from .config_loader import load_config
+    from .template_processor import get_template_path, process_template_replacements
+    from .yaml_processor import extract_yaml_metadata
+
+# Submodule defining each exported name
+_EXPORTS = {
+    "extract_yaml_metadata": ".yaml_processor",
+    "load_config": ".config_loader",
+    "Manuscript": ".build",
+    "BuildResult": ".build",
+    "build_manuscript": ".build",
+    "get_template_path": ".template_processor",
+    "process_template_replacements": ".template_processor",
+    "generate_authors_and_affiliations": ".author_processor",
+    "generate_corresponding_authors": ".author_processor",
+    "generate_extended_author_info": ".author_processor",
+}
 
 __all__ = [
     "extract_yaml_metadata",
+    "load_config",
+    "Manuscript",
+    "BuildResult",
+    "build_manuscript",
     "get_template_path",
     "process_template_replacements",
     "generate_authors_and_affiliations",
     "generate_corresponding_authors",
     "generate_extended_author_info",
 ]
+
+
+def __getattr__(name):
+    """Import the submodule defining ``name`` on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,19 +2,159 @@
 
 This module handles the generation of LaTeX author information sections,
 including authors and affiliations, corresponding authors, and extended author info.
-"""
-
 
-def generate_authors_and_affiliations(yaml_metadata):
-    """Generate LaTeX author and affiliation blocks from YAML metadata."""
-    authors_latex = []
-    affiliations_latex = []
+All three sections are rendered from one AuthorModel, built in a single pass
+over the authors and affiliations of the metadata and cached by a hash of
+those two sections, so large author lists are only processed once per build.
+"""
 
-    # Extract authors and affiliations from metadata
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+# Special LaTeX characters escaped in social media handles
+LATEX_SPECIAL_CHARS = str.maketrans(
+    {
+        "_": "\\_",
+        "&": "\\&",
+        "%": "\\%",
+        "#": "\\#",
+        "{": "\\{",
+        "}": "\\}",
+    }
+)
+
+
+@dataclass(frozen=True)
+class Author:
+    """One author with affiliations resolved to their numbers."""
+
+    name: str
+    affiliation_numbers: tuple = ()
+    is_corresponding: bool = False
+    is_equal: bool = False
+    email: str = ""
+    orcid: str = ""
+    x: str = ""
+    twitter: str = ""
+    bluesky: str = ""
+    linkedin: str = ""
+
+
+@dataclass(frozen=True)
+class AuthorModel:
+    """Authors and the affiliations they use, numbered by first appearance."""
+
+    authors: tuple = ()
+    affiliations: tuple = ()
+    has_equal_contributors: bool = False
+
+
+# Author models by hash of the authors and affiliations sections, least
+# recently used first; a batch build keeps the models of its last manuscripts
+AUTHOR_MODEL_CACHE_SIZE = 32
+_author_models = OrderedDict()
+# Batch builds convert manuscripts on several threads sharing the cache
+_author_models_lock = threading.Lock()
+
+
+def escape_latex_special_chars(text):
+    """Escape special LaTeX characters in text."""
+    return text.translate(LATEX_SPECIAL_CHARS)
+
+
+def build_author_model(yaml_metadata):
+    """Return the author model of the metadata, building it only once.
+
+    Models are cached by a hash of the ``authors`` and ``affiliations``
+    sections, so rendering several author blocks from the same metadata
+    processes the author list a single time. Only the most recently used
+    AUTHOR_MODEL_CACHE_SIZE models are kept.
+    """
     authors = yaml_metadata.get("authors", [])
     affiliations = yaml_metadata.get("affiliations", [])
+    key = hashlib.sha256(
+        json.dumps([authors, affiliations], sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+    with _author_models_lock:
+        model = _author_models.get(key)
+        if model is not None:
+            _author_models.move_to_end(key)
+            return model
+
+    # Built outside the lock, so other threads are not held up meanwhile
+    model = _build_author_model(authors, affiliations)
+    with _author_models_lock:
+        _author_models[key] = model
+        _author_models.move_to_end(key)
+        if len(_author_models) > AUTHOR_MODEL_CACHE_SIZE:
+            _author_models.popitem(last=False)
+    return model
+
+
+def _build_author_model(authors, affiliations):
+    """Build an author model with dictionary lookups for affiliations."""
+    # Full affiliation text by shortname; the first definition wins
+    affiliation_details = {}
+    for affil_detail in affiliations:
+        if isinstance(affil_detail, dict):
+            shortname = affil_detail.get("shortname")
+            if shortname not in affiliation_details:
+                full_name = affil_detail.get("full_name", shortname)
+                location = affil_detail.get("location", "")
+                affiliation_details[shortname] = (
+                    f"{full_name}, {location}" if location else full_name
+                )
 
-    if not authors:
+    # Number affiliations in order of first appearance among the authors
+    affil_map = {}
+    model_authors = []
+    has_equal_contributors = False
+    for author in authors:
+        if isinstance(author, str):
+            model_authors.append(Author(name=author))
+            continue
+        if not isinstance(author, dict):
+            continue
+
+        affil_numbers = [
+            affil_map.setdefault(affil_short, len(affil_map) + 1)
+            for affil_short in author.get("affiliations", [])
+        ]
+
+        is_equal = bool(author.get("co_first_author", False))
+        has_equal_contributors = has_equal_contributors or is_equal
+        model_authors.append(
+            Author(
+                name=author.get("name", "Unknown Author"),
+                affiliation_numbers=tuple(sorted(affil_numbers)),
+                is_corresponding=bool(author.get("corresponding_author", False)),
+                is_equal=is_equal,
+                email=author.get("email", ""),
+                orcid=author.get("orcid", ""),
+                x=author.get("x", ""),
+                twitter=author.get("twitter", ""),
+                bluesky=author.get("bluesky", ""),
+                linkedin=author.get("linkedin", ""),
+            )
+        )
+
+    return AuthorModel(
+        authors=tuple(model_authors),
+        affiliations=tuple(
+            affiliation_details.get(affil_short, affil_short)
+            for affil_short in affil_map
+        ),
+        has_equal_contributors=has_equal_contributors,
+    )
+
+
+def generate_authors_and_affiliations(yaml_metadata):
+    """Generate LaTeX author and affiliation blocks from YAML metadata."""
+    if not yaml_metadata.get("authors", []):
         # Fallback to default if no authors specified
         return (
             "% Use letters for affiliations, numbers to show equal "
@@ -23,79 +163,31 @@ def generate_authors_and_affiliations(yaml_metadata):
             "\\affil[1]{Institution}"
         )
 
-    # Create affiliations mapping from shortname to number and full details
-    affil_map = {}
-    used_affiliations = []  # Keep order of first appearance
-
-    # First pass: collect all unique affiliations used by authors in order of appearance
-    for author in authors:
-        if isinstance(author, dict):
-            author_affiliations = author.get("affiliations", [])
-            for affil_short in author_affiliations:
-                if affil_short not in used_affiliations:
-                    used_affiliations.append(affil_short)
-
-    # Create mapping and LaTeX for used affiliations in order of appearance
-    for i, affil_short in enumerate(used_affiliations, 1):
-        affil_map[affil_short] = i
-
-        # Find full affiliation details
-        full_affil = affil_short  # fallback to shortname
-        for affil_detail in affiliations:
-            if (
-                isinstance(affil_detail, dict)
-                and affil_detail.get("shortname") == affil_short
-            ):
-                full_name = affil_detail.get("full_name", affil_short)
-                location = affil_detail.get("location", "")
-                full_affil = f"{full_name}, {location}" if location else full_name
-                break
-
-        affiliations_latex.append(f"\\affil[{i}]{{{full_affil}}}")
+    model = build_author_model(yaml_metadata)
 
-    # Create authors with proper affiliation mapping
-    corresponding_authors = []
-    equal_contributors = []
-
-    for author in authors:
-        if isinstance(author, dict):
-            name = author.get("name", "Unknown Author")
-            author_affiliations = author.get("affiliations", [])
-            is_corresponding = author.get("corresponding_author", False)
-            is_equal = author.get("co_first_author", False)
-
-            # Map author affiliations to numbers and sort them
-            affil_numbers = []
-            for affil in author_affiliations:
-                if affil in affil_map:
-                    affil_numbers.append(affil_map[affil])
-
-            # Sort affiliation numbers for each author
-            affil_numbers.sort()
-
-            # Format affiliations for author
-            affil_str = (
-                ",".join(map(str, affil_numbers)) if affil_numbers else "1"
-            )  # Default to first affiliation
-
-            # Add special markers
-            special_markers = []
-            if is_equal:
-                special_markers.append("*")
-                equal_contributors.append(name)
-            if is_corresponding:
-                special_markers.append("\\Letter")
-                corresponding_authors.append(name)
-
-            if special_markers:
-                affil_str += "," + ",".join(special_markers)
-
-            authors_latex.append(f"\\author[{affil_str}]{{{name}}}")
-        elif isinstance(author, str):
-            authors_latex.append(f"\\author[1]{{{author}}}")
+    authors_latex = []
+    for author in model.authors:
+        # Default to first affiliation
+        affil_str = ",".join(map(str, author.affiliation_numbers)) or "1"
+
+        # Add special markers
+        special_markers = []
+        if author.is_equal:
+            special_markers.append("*")
+        if author.is_corresponding:
+            special_markers.append("\\Letter")
+        if special_markers:
+            affil_str += "," + ",".join(special_markers)
+
+        authors_latex.append(f"\\author[{affil_str}]{{{author.name}}}")
+
+    affiliations_latex = [
+        f"\\affil[{i}]{{{full_affil}}}"
+        for i, full_affil in enumerate(model.affiliations, 1)
+    ]
 
     # Add special affiliations for equal contributors
-    if equal_contributors:
+    if model.has_equal_contributors:
         affiliations_latex.append("\\affil[*]{Equally contributed authors}")
 
     # Combine all parts
@@ -109,47 +201,33 @@ def generate_authors_and_affiliations(yaml_metadata):
 
 def generate_corresponding_authors(yaml_metadata):
     """Generate LaTeX corresponding authors section from YAML metadata."""
-    authors = yaml_metadata.get("authors", [])
-
-    if not authors:
+    if not yaml_metadata.get("authors", []):
         return "% No corresponding authors found\n"
 
     corresponding_authors = []
 
-    for author in authors:
-        if isinstance(author, dict):
-            # Check if this author is marked as corresponding author
-            is_corresponding = author.get("corresponding_author", False)
-
-            if is_corresponding:
-                name = author.get("name", "Unknown Author")
-                email = author.get("email", "")
-
-                # Generate abbreviated name (first letter of first and middle
-                # names, then last name)
-                name_parts = name.split()
-                if len(name_parts) >= 2:
-                    # Get first letters of all names except the last one
-                    initials = [part[0].upper() for part in name_parts[:-1]]
-                    last_name = name_parts[-1]
-                    abbreviated_name = ". ".join(initials) + ". " + last_name
-                else:
-                    abbreviated_name = name
-
-                # Format contact information
-                contact_info = []
-                if email:
-                    # Convert @ to \at for LaTeX
-                    email_tex = email.replace("@", "\\at ")
-                    contact_info.append(email_tex)
-                # Note: Bluesky handles excluded from corresponding authors section
-
-                if contact_info:
-                    contact_str = "; ".join(contact_info)
-                    corresponding_authors.append(f"({abbreviated_name}) {contact_str}")
-                else:
-                    # If no contact info, just include the abbreviated name
-                    corresponding_authors.append(f"({abbreviated_name})")
+    for author in build_author_model(yaml_metadata).authors:
+        if not author.is_corresponding:
+            continue
+
+        # Generate abbreviated name (first letter of first and middle
+        # names, then last name)
+        name_parts = author.name.split()
+        if len(name_parts) >= 2:
+            # Get first letters of all names except the last one
+            initials = [part[0].upper() for part in name_parts[:-1]]
+            abbreviated_name = ". ".join(initials) + ". " + name_parts[-1]
+        else:
+            abbreviated_name = author.name
+
+        # Format contact information; Bluesky handles are excluded here
+        if author.email:
+            # Convert @ to \at for LaTeX
+            email_tex = author.email.replace("@", "\\at ")
+            corresponding_authors.append(f"({abbreviated_name}) {email_tex}")
+        else:
+            # If no contact info, just include the abbreviated name
+            corresponding_authors.append(f"({abbreviated_name})")
 
     if corresponding_authors:
         result = "\\begin{corrauthor}\n"
@@ -162,99 +240,71 @@ def generate_corresponding_authors(yaml_metadata):
 
 def generate_extended_author_info(yaml_metadata):
     """Generate LaTeX extended author information section from YAML metadata."""
-    authors = yaml_metadata.get("authors", [])
-
-    if not authors:
+    if not yaml_metadata.get("authors", []):
         return "% No authors found for extended author information\n"
 
-    def escape_latex_special_chars(text):
-        """Escape special LaTeX characters in text."""
-        # Replace common special characters that need escaping in LaTeX
-        text = text.replace("_", "\\_")
-        text = text.replace("&", "\\&")
-        text = text.replace("%", "\\%")
-        text = text.replace("#", "\\#")
-        text = text.replace("{", "\\{")
-        text = text.replace("}", "\\}")
-        return text
-
-    result = "\\begin{extendedauthorlist}\n"
-
     author_items = []
 
-    for author in authors:
-        if isinstance(author, dict):
-            name = author.get("name", "Unknown Author")
-            orcid = author.get("orcid", "")
-
-            # Social media handles
-            twitter = author.get("twitter", "")
-            x = author.get("x", "")
-            bluesky = author.get("bluesky", "")
-            linkedin = author.get("linkedin", "")
-
-            # Check if author has any extended information
-            has_extended_info = any([orcid, twitter, x, bluesky, linkedin])
-
-            # Only include authors with extended information
-            if not has_extended_info:
-                continue
-
-            # Build the social media line
-            social_icons = []
-
-            # Add ORCID if available
-            if orcid:
-                # Remove any https://orcid.org/ prefix if present
-                orcid_clean = orcid.replace("https://orcid.org/", "").replace(
-                    "http://orcid.org/", ""
-                )
-                social_icons.append(f"\\orcidicon{{{orcid_clean}}}")
-
-            # Prefer X over Twitter if both are present
-            if x:
-                # Clean X handle (remove @ if present)
-                x_clean = (
-                    x.replace("@", "")
-                    .replace("https://x.com/", "")
-                    .replace("http://x.com/", "")
-                )
-                x_clean = escape_latex_special_chars(x_clean)
-                social_icons.append(f"\\xicon{{{x_clean}}}")
-            elif twitter:
-                # Clean Twitter handle (remove @ if present)
-                twitter_clean = (
-                    twitter.replace("@", "")
-                    .replace("https://twitter.com/", "")
-                    .replace("http://twitter.com/", "")
-                )
-                twitter_clean = escape_latex_special_chars(twitter_clean)
-                social_icons.append(f"\\twittericon{{{twitter_clean}}}")
-
-            if bluesky:
-                # Clean Bluesky handle (remove @ if present)
-                bluesky_clean = (
-                    bluesky.replace("@", "")
-                    .replace("https://bsky.app/profile/", "")
-                    .replace("http://bsky.app/profile/", "")
-                )
-                bluesky_clean = escape_latex_special_chars(bluesky_clean)
-                social_icons.append(f"\\blueskyicon{{{bluesky_clean}}}")
-
-            if linkedin:
-                # Clean LinkedIn handle
-                linkedin_clean = linkedin.replace(
-                    "https://linkedin.com/in/", ""
-                ).replace("http://linkedin.com/in/", "")
-                linkedin_clean = escape_latex_special_chars(linkedin_clean)
-                social_icons.append(f"\\linkedinicon{{{linkedin_clean}}}")
-
-            # Create social media line
-            social_line = "; ".join(social_icons) if social_icons else ""
-
-            # Use the new extendedauthor command
-            author_items.append(f"\\extendedauthor{{{name}}}{{{social_line}}}")
+    for author in build_author_model(yaml_metadata).authors:
+        # Only include authors with extended information
+        if not any(
+            [author.orcid, author.twitter, author.x, author.bluesky, author.linkedin]
+        ):
+            continue
+
+        # Build the social media line
+        social_icons = []
+
+        if author.orcid:
+            # Remove any https://orcid.org/ prefix if present
+            orcid_clean = author.orcid.replace("https://orcid.org/", "").replace(
+                "http://orcid.org/", ""
+            )
+            social_icons.append(f"\\orcidicon{{{orcid_clean}}}")
+
+        # Prefer X over Twitter if both are present
+        if author.x:
+            # Clean X handle (remove @ if present)
+            x_clean = (
+                author.x.replace("@", "")
+                .replace("https://x.com/", "")
+                .replace("http://x.com/", "")
+            )
+            x_clean = escape_latex_special_chars(x_clean)
+            social_icons.append(f"\\xicon{{{x_clean}}}")
+        elif author.twitter:
+            # Clean Twitter handle (remove @ if present)
+            twitter_clean = (
+                author.twitter.replace("@", "")
+                .replace("https://twitter.com/", "")
+                .replace("http://twitter.com/", "")
+            )
+            twitter_clean = escape_latex_special_chars(twitter_clean)
+            social_icons.append(f"\\twittericon{{{twitter_clean}}}")
+
+        if author.bluesky:
+            # Clean Bluesky handle (remove @ if present)
+            bluesky_clean = (
+                author.bluesky.replace("@", "")
+                .replace("https://bsky.app/profile/", "")
+                .replace("http://bsky.app/profile/", "")
+            )
+            bluesky_clean = escape_latex_special_chars(bluesky_clean)
+            social_icons.append(f"\\blueskyicon{{{bluesky_clean}}}")
+
+        if author.linkedin:
+            # Clean LinkedIn handle
+            linkedin_clean = author.linkedin.replace(
+                "https://linkedin.com/in/", ""
+            ).replace("http://linkedin.com/in/", "")
+            linkedin_clean = escape_latex_special_chars(linkedin_clean)
+            social_icons.append(f"\\linkedinicon{{{linkedin_clean}}}")
+
+        # Use the new extendedauthor command
+        social_line = "; ".join(social_icons)
+        author_items.append(f"\\extendedauthor{{{author.name}}}{{{social_line}}}")
 
+    result = "\\begin{extendedauthorlist}\n"
     result += "\n".join(author_items)
     result += "\n\\end{extendedauthorlist}"
 
@@ -0,0 +1,231 @@
+"""In-memory manuscript builds.
+
+build_manuscript converts a Manuscript to the content of the main and the
+supplementary ``.tex`` files without reading the environment, changing the
+working directory or writing the results. Manuscripts are read from an
+explicit directory or given as strings, so many of them can be built in one
+process, from threads or a process pool.
+"""
+
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional
+
+from .config_loader import (
+    CONFIG_FILENAME,
+    ConfigError,
+    load_config,
+    normalize_config,
+    parse_config_text,
+    validate_config,
+)
+from .template_processor import (
+    NO_SUPPLEMENTARY_TEX,
+    get_template_path,
+    process_template_replacements,
+    render_supplementary_tex,
+)
+
+MAIN_FILENAME = "01_MAIN.md"
+SUPPLEMENTARY_FILENAME = "02_SUPPLEMENTARY_INFO.md"
+
+# YAML front matter of a markdown file without a separate config file
+FRONT_MATTER_PATTERN = re.compile(r"^---\n(.*?)\n---", re.DOTALL)
+
+
+@dataclass(frozen=True)
+class Manuscript:
+    """Sources of one manuscript, read from a directory or given in memory.
+
+    Attributes:
+        main: Markdown of the main manuscript
+        metadata: Normalized manuscript configuration
+        supplementary: Markdown of the supplementary information, if any
+        directory: Manuscript directory that data tables are read from;
+            manuscripts without data tables do not need one
+        name: Name of the manuscript, used for the generated file names
+        diagnostics: Problems found in the configuration
+    """
+
+    main: str
+    metadata: dict[str, Any]
+    supplementary: Optional[str] = None
+    directory: Optional[Path] = None
+    name: str = "MANUSCRIPT"
+    diagnostics: tuple[str, ...] = ()
+
+    @classmethod
+    def from_directory(
+        cls, directory: Path, output_dir: Optional[str] = None
+    ) -> "Manuscript":
+        """Read a manuscript directory.
+
+        Args:
+            directory: Directory holding 01_MAIN.md and 00_CONFIG.yml
+            output_dir: Output directory caching the parsed configuration
+
+        Returns:
+            The manuscript, named after its directory
+
+        Raises:
+            OSError: If the main manuscript file cannot be read
+            ConfigError: If the configuration is not a valid YAML mapping
+        """
+        directory = Path(directory)
+        main = (directory / MAIN_FILENAME).read_text(encoding="utf-8")
+        supplementary_path = directory / SUPPLEMENTARY_FILENAME
+        supplementary = (
+            supplementary_path.read_text(encoding="utf-8")
+            if supplementary_path.is_file()
+            else None
+        )
+
+        config_path = directory / CONFIG_FILENAME
+        if not config_path.is_file():
+            return cls.from_sources(
+                main, None, supplementary, directory, directory.name
+            )
+
+        config = load_config(config_path, output_dir)
+        return cls(
+            main=main,
+            metadata=config.metadata,
+            supplementary=supplementary,
+            directory=directory,
+            name=directory.name,
+            diagnostics=tuple(config.errors + config.warnings),
+        )
+
+    @classmethod
+    def from_sources(
+        cls,
+        main: str,
+        config: Optional[str] = None,
+        supplementary: Optional[str] = None,
+        directory: Optional[Path] = None,
+        name: str = "MANUSCRIPT",
+    ) -> "Manuscript":
+        """Create a manuscript from the contents of its files.
+
+        Args:
+            main: Markdown of the main manuscript
+            config: YAML of the configuration; taken from the front matter of
+                ``main`` when not given
+            supplementary: Markdown of the supplementary information
+            directory: Manuscript directory that data tables are read from
+            name: Name of the manuscript
+
+        Returns:
+            The manuscript
+
+        Raises:
+            ConfigError: If the configuration is not a valid YAML mapping
+        """
+        if config is None:
+            match = FRONT_MATTER_PATTERN.search(main)
+            config = match.group(1) if match else "{}"
+        parsed = parse_config_text(config)
+        if not isinstance(parsed, dict):
+            raise ConfigError("Config file must contain a YAML dictionary")
+        metadata = normalize_config(parsed)
+        errors, warnings = validate_config(metadata)
+        return cls(
+            main=main,
+            metadata=metadata,
+            supplementary=supplementary,
+            directory=Path(directory) if directory is not None else None,
+            name=name,
+            diagnostics=tuple(errors + warnings),
+        )
+
+
+@dataclass
+class BuildResult:
+    """Generated LaTeX of a manuscript build.
+
+    Attributes:
+        tex: Content of the main ``.tex`` file
+        supplementary_tex: Content of Supplementary.tex
+        word_counts: Word count of each section's markdown
+        diagnostics: Problems found in the configuration
+    """
+
+    tex: str
+    supplementary_tex: str
+    word_counts: dict[str, Any] = field(default_factory=dict)
+    diagnostics: list[str] = field(default_factory=list)
+
+
+@lru_cache(maxsize=1)
+def read_default_template() -> str:
+    """Read the LaTeX template of the package once per process."""
+    return get_template_path().read_text()
+
+
+def build_manuscript(
+    manuscript: Manuscript,
+    template_content: Optional[str] = None,
+    output_dir: Optional[str] = None,
+    parallel: bool = False,
+) -> BuildResult:
+    """Convert a manuscript to the content of its ``.tex`` files.
+
+    Besides the conversion caches in ``output_dir``, only the rendered rows
+    of data tables are written, to ``FIGURES/DATA_TABLES`` in the manuscript
+    directory so they are copied along with the figures. They are shared by
+    all builds of the manuscript and replaced atomically, so builds with
+    different output directories can run concurrently.
+
+    Args:
+        manuscript: Manuscript to build
+        template_content: LaTeX template (default: the package template)
+        output_dir: Output directory caching conversions, or None
+        parallel: Whether the supplementary parts may be converted in a
+            process pool; leave off when builds already run in a pool
+
+    Returns:
+        BuildResult with the generated LaTeX, the word count of each section
+        and the diagnostics of the manuscript
+
+    Raises:
+        ValueError: If the manuscript uses data tables but has no directory
+    """
+    if template_content is None:
+        template_content = read_default_template()
+
+    sources = [manuscript.main, manuscript.supplementary or ""]
+    if manuscript.directory is None and any("<data-table" in s for s in sources):
+        raise ValueError(
+            f"Manuscript {manuscript.name} uses data tables but has no directory"
+        )
+    manuscript_path = (
+        str(manuscript.directory) if manuscript.directory is not None else None
+    )
+
+    # Text without a newline would be read as the path of a markdown file
+    main = manuscript.main if "\n" in manuscript.main else manuscript.main + "\n"
+
+    word_counts: dict[str, Any] = {}
+    tex = process_template_replacements(
+        template_content, manuscript.metadata, main, word_counts, manuscript_path
+    )
+
+    if manuscript.supplementary is not None:
+        supplementary_tex = render_supplementary_tex(
+            manuscript.supplementary,
+            manuscript.metadata,
+            output_dir,
+            manuscript_path,
+            parallel,
+        )
+    else:
+        supplementary_tex = NO_SUPPLEMENTARY_TEX
+
+    return BuildResult(
+        tex=tex,
+        supplementary_tex=supplementary_tex,
+        word_counts=word_counts,
+        diagnostics=list(manuscript.diagnostics),
+    )
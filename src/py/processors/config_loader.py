@@ -0,0 +1,256 @@
+"""Cached loading of the manuscript configuration.
+
+00_CONFIG.yml is parsed once per change of the file: the parsed configuration
+is validated against CONFIG_SCHEMA, normalized (``email64`` author fields are
+decoded and dates become ISO strings) and cached as JSON in ``.cache`` under
+the output directory, keyed by the SHA-256 of the file. Every build stage
+loads the configuration through load_config and gets the cached result for
+as long as the file is unchanged.
+"""
+
+import copy
+import datetime
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from .yaml_processor import (
+    YAML_LOADER,
+    parse_yaml_simple,
+    process_author_emails,
+    yaml,
+)
+
+CONFIG_FILENAME = "00_CONFIG.yml"
+
+# Normalized configurations are cached under the output directory
+CONFIG_CACHE_DIR = Path(".cache")
+CONFIG_CACHE_FILENAME = "config.json"
+
+# Bumped whenever validation or normalization changes, invalidating caches
+CONFIG_CACHE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ConfigField:
+    """Schema entry of a top-level configuration field."""
+
+    types: tuple[type, ...]
+    description: str
+    required: bool = False
+
+
+CONFIG_SCHEMA = {
+    "title": ConfigField((str, list, dict), "Manuscript title", required=True),
+    "authors": ConfigField((list,), "List of authors", required=True),
+    "date": ConfigField((str,), "Publication date", required=True),
+    "keywords": ConfigField((list, str), "Keywords for the manuscript", required=True),
+    "affiliations": ConfigField((list,), "List of affiliations"),
+    "bibliography": ConfigField((str,), "Bibliography file name"),
+    "license": ConfigField((str,), "Manuscript license"),
+    "use_line_numbers": ConfigField((bool, str), "Number the manuscript lines"),
+    "acknowledge_rxiv_maker": ConfigField(
+        (bool, str), "Acknowledge Rxiv-Maker in the manuscript"
+    ),
+    "pdf_size_budget": ConfigField(
+        (dict,), "Size limits of the PDF and its figures (max_pdf_mb, max_figure_mb)"
+    ),
+}
+
+
+class ConfigError(ValueError):
+    """Raised when the configuration file cannot be parsed."""
+
+
+@dataclass
+class ManuscriptConfig:
+    """A normalized manuscript configuration and its schema problems."""
+
+    metadata: dict[str, Any]
+    errors: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+
+
+# Loaded configuration of each config file with the SHA-256 it was loaded
+# from, least recently used first and shared by all callers in a process
+LOADED_CONFIG_CACHE_SIZE = 32
+_loaded_configs: OrderedDict[str, tuple[str, ManuscriptConfig]] = OrderedDict()
+_loaded_configs_lock = threading.Lock()
+
+
+def parse_config_text(text: str) -> Any:
+    """Parse YAML configuration text.
+
+    Uses the C-accelerated safe loader when available, and the simple
+    built-in parser when PyYAML is not installed.
+
+    Args:
+        text: Content of the configuration file
+
+    Returns:
+        The parsed YAML document
+
+    Raises:
+        ConfigError: If the text is not valid YAML
+    """
+    if yaml is None:
+        return parse_yaml_simple(text)
+    try:
+        return yaml.load(text, Loader=YAML_LOADER)
+    except yaml.YAMLError as e:
+        raise ConfigError(str(e)) from e
+
+
+def validate_config(config: dict[str, Any]) -> tuple[list[str], list[str]]:
+    """Check a normalized configuration against CONFIG_SCHEMA.
+
+    Args:
+        config: Normalized configuration
+
+    Returns:
+        Lists of errors (missing required fields, wrong types) and warnings
+        (empty required fields)
+    """
+    errors = []
+    warnings = []
+    for name, spec in CONFIG_SCHEMA.items():
+        if name not in config:
+            if spec.required:
+                errors.append(
+                    f"Missing required config field: {name} ({spec.description})"
+                )
+            continue
+        value = config[name]
+        if spec.required and not value:
+            warnings.append(f"Config field is empty: {name} ({spec.description})")
+        elif value is not None and not isinstance(value, spec.types):
+            expected = " or ".join(t.__name__ for t in spec.types)
+            errors.append(
+                f"Config field {name} must be {expected}, "
+                f"got {type(value).__name__} ({spec.description})"
+            )
+    return errors, warnings
+
+
+def normalize_config(config: dict[str, Any]) -> dict[str, Any]:
+    """Normalize a parsed configuration for the build stages.
+
+    Dates are turned into ISO strings and ``email64`` author fields are
+    decoded into ``email``.
+
+    Args:
+        config: Configuration as parsed from YAML
+
+    Returns:
+        The normalized configuration
+    """
+    normalized = _normalize_value(config)
+    if normalized.get("authors"):
+        normalized["authors"] = process_author_emails(normalized["authors"])
+    return normalized
+
+
+def _normalize_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {str(key): _normalize_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize_value(item) for item in value]
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    return value
+
+
+def load_config(
+    config_path: Path, output_dir: Optional[str] = None
+) -> ManuscriptConfig:
+    """Load, validate and normalize a manuscript configuration file.
+
+    Results are cached in memory and, when ``output_dir`` is given, in
+    ``output_dir/.cache`` so that later build stages skip parsing too.
+    Callers get their own copy of the metadata and may modify it.
+
+    Args:
+        config_path: Path of the 00_CONFIG.yml file
+        output_dir: Output directory of the manuscript build
+
+    Returns:
+        ManuscriptConfig with the normalized metadata and schema problems
+
+    Raises:
+        OSError: If the file cannot be read
+        ConfigError: If the file is not valid YAML or not a mapping
+    """
+    data = Path(config_path).read_bytes()
+    sha256 = hashlib.sha256(data).hexdigest()
+    memo_key = str(Path(config_path).resolve())
+
+    config = None
+    with _loaded_configs_lock:
+        loaded = _loaded_configs.get(memo_key)
+    if loaded is not None and loaded[0] == sha256:
+        config = loaded[1]
+    cache_path = (
+        Path(output_dir) / CONFIG_CACHE_DIR / CONFIG_CACHE_FILENAME
+        if output_dir
+        else None
+    )
+    if config is None and cache_path is not None:
+        config = _read_cached_config(cache_path, sha256)
+    if config is None:
+        try:
+            parsed = parse_config_text(data.decode("utf-8"))
+        except UnicodeDecodeError as e:
+            raise ConfigError(f"Config file is not UTF-8: {e}") from e
+        if not isinstance(parsed, dict):
+            raise ConfigError("Config file must contain a YAML dictionary")
+        metadata = normalize_config(parsed)
+        errors, warnings = validate_config(metadata)
+        config = ManuscriptConfig(metadata, errors, warnings)
+        if cache_path is not None:
+            _write_cached_config(cache_path, config_path, sha256, config)
+    with _loaded_configs_lock:
+        _loaded_configs[memo_key] = (sha256, config)
+        _loaded_configs.move_to_end(memo_key)
+        if len(_loaded_configs) > LOADED_CONFIG_CACHE_SIZE:
+            _loaded_configs.popitem(last=False)
+
+    return ManuscriptConfig(
+        copy.deepcopy(config.metadata), list(config.errors), list(config.warnings)
+    )
+
+
+def _read_cached_config(cache_path: Path, sha256: str) -> Optional[ManuscriptConfig]:
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != CONFIG_CACHE_VERSION:
+            return None
+        if data.get("sha256") != sha256:
+            return None
+        return ManuscriptConfig(data["metadata"], data["errors"], data["warnings"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_cached_config(
+    cache_path: Path, config_path: Path, sha256: str, config: ManuscriptConfig
+) -> None:
+    data = {
+        "version": CONFIG_CACHE_VERSION,
+        "source": str(config_path),
+        "sha256": sha256,
+        "metadata": config.metadata,
+        "errors": config.errors,
+        "warnings": config.warnings,
+    }
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+    except (OSError, TypeError, ValueError) as e:
+        # Values JSON cannot represent are still returned, just not cached
+        print(f"Warning: could not cache config {config_path}: {e}")
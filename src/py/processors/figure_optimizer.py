@@ -0,0 +1,595 @@
+r"""Post-processing of generated figures before the LaTeX build.
+
+Figure scripts save PNGs at whatever resolution they were written for and the
+Mermaid CLI renders at a fixed 1200x800 pixels, while the PDF only needs as
+many pixels as the figure occupies on the page. Each PNG is downsampled to
+``dpi`` at the width it is printed at, taken from the ``width`` attribute of
+the figure in the manuscript markdown and the page geometry of
+``rxiv_maker_style.cls``, and then re-encoded losslessly.
+
+Figure PDFs are rewritten with pypdf: font resources the pages do not use,
+duplicate objects and the document metadata are removed and content streams
+are compressed. pypdf cannot subset fonts, so fonts embedded in full are only
+reported.
+
+Results are cached under ``.cache/raster`` and ``.cache/pdf`` in the figures
+directory by the SHA-256 of the input file and the optimization options, so
+regenerating an unchanged figure restores its optimized version without
+processing it again. Files are only replaced when the result is smaller, and
+the cache keeps the file each one replaced: when a figure is later printed
+wider, its PNG is resampled again from the full-resolution original. After
+each run, cached files and entries the current figures no longer refer to are
+removed, so the cache holds one original and optimized pair per figure file.
+"""
+
+import hashlib
+import json
+import math
+import re
+import shutil
+from dataclasses import dataclass, field
+from io import BytesIO
+from pathlib import Path
+
+from converters.figure_processor import parse_figure_attributes
+
+from .pdf_analyzer import write_renumbered
+
+# Page geometry of rxiv_maker_style.cls in inches: an 8.125in layout with
+# 38.5pt and 43pt margins, split in two columns 7mm apart
+TEXT_WIDTH_IN = 8.125 - (38.5 + 43) / 72.27
+COLUMN_WIDTH_IN = (TEXT_WIDTH_IN - 7 / 25.4) / 2
+
+# Length units allowed in figure widths, in inches
+LENGTH_UNITS_IN = {"in": 1.0, "cm": 1 / 2.54, "mm": 1 / 25.4, "pt": 1 / 72.27}
+
+# Markdown files and whether their figures are typeset on a two-column page;
+# the supplementary information is typeset after \onecolumn
+MANUSCRIPT_FIGURE_SOURCES = {
+    "01_MAIN.md": True,
+    "02_SUPPLEMENTARY_INFO.md": False,
+}
+
+# ![](path)\n{attributes} and ![caption](path){attributes}
+FIGURE_WITH_ATTRIBUTES_PATTERN = re.compile(
+    r"!\[[^\]]*\]\(([^)]+)\)(?:\s*\n)?\{([^}]+)\}"
+)
+FIGURE_PATTERN = re.compile(r"!\[[^\]]*\]\(([^)]+)\)")
+WIDTH_PATTERN = re.compile(
+    r"^([\d.]*)\s*(\\(?:textwidth|linewidth|columnwidth)|in|cm|mm|pt)$"
+)
+
+DEFAULT_RASTER_DPI = 300
+RASTER_CACHE_DIR = Path(".cache") / "raster"
+PDF_CACHE_DIR = Path(".cache") / "pdf"
+CACHE_MANIFEST = "manifest.json"
+
+# Subset fonts are named with a tag of six capital letters, e.g. ABCDEF+Arial
+SUBSET_FONT_PATTERN = re.compile(r"^/?[A-Z]{6}\+")
+
+# Images at most this much wider than needed are not resampled
+DOWNSAMPLE_TOLERANCE = 1.1
+
+
+@dataclass
+class RasterSavings:
+    """Outcome of optimizing the PNGs of a figures directory.
+
+    Attributes:
+        files: PNG files examined
+        downsampled: Files resampled to their printed size
+        bytes_saved: Reduction of the total size of the files
+    """
+
+    files: int = 0
+    downsampled: int = 0
+    bytes_saved: int = 0
+
+
+@dataclass
+class PdfSavings:
+    """Outcome of compacting the PDFs of a figures directory.
+
+    Attributes:
+        files: PDF files examined
+        fonts_removed: Unused font resources removed
+        bytes_saved: Reduction of the total size of the files
+        full_fonts: Fonts embedded without being subset, which pypdf cannot
+            subset; they are better subset by the program writing the figure
+    """
+
+    files: int = 0
+    fonts_removed: int = 0
+    bytes_saved: int = 0
+    full_fonts: list[str] = field(default_factory=list)
+
+
+def printed_width(attributes, two_column_page=True):
+    r"""Width in inches at which a figure is printed.
+
+    Mirrors create_latex_figure_environment: bare numbers and percentages are
+    fractions of ``\linewidth``, and figures spanning both columns of a
+    two-column page are as wide as the text.
+
+    Args:
+        attributes: Parsed figure attributes
+        two_column_page: Whether the figure is on a two-column page
+
+    Returns:
+        Printed width in inches, or None if it cannot be determined
+    """
+    width = attributes.get("width", "\\linewidth").strip()
+    spans_columns = (
+        attributes.get("span") == "2col"
+        or attributes.get("twocolumn") == "true"
+        or width == "\\textwidth"
+    )
+    line_width = (
+        COLUMN_WIDTH_IN if two_column_page and not spans_columns else TEXT_WIDTH_IN
+    )
+
+    if width.endswith("%"):
+        width = f"{width[:-1]}e-2"
+    try:
+        return float(width) * line_width
+    except ValueError:
+        pass
+
+    match = WIDTH_PATTERN.match(width)
+    if not match:
+        return None
+    factor = float(match.group(1)) if match.group(1) else 1.0
+    unit = match.group(2)
+    if unit == "\\textwidth":
+        return factor * TEXT_WIDTH_IN
+    if unit in LENGTH_UNITS_IN:
+        return factor * LENGTH_UNITS_IN[unit]
+    return factor * line_width
+
+
+def figure_widths(manuscript_dir):
+    """Printed width of each figure of a manuscript.
+
+    Args:
+        manuscript_dir: Manuscript directory holding the markdown files
+
+    Returns:
+        Widest printed width in inches by figure name, e.g. ``Figure_1``
+    """
+    widths = {}
+    for filename, two_column_page in MANUSCRIPT_FIGURE_SOURCES.items():
+        markdown_file = Path(manuscript_dir) / filename
+        if not markdown_file.is_file():
+            continue
+        content = markdown_file.read_text(encoding="utf-8")
+
+        figures = [
+            (path, parse_figure_attributes(attr_string))
+            for path, attr_string in FIGURE_WITH_ATTRIBUTES_PATTERN.findall(content)
+        ]
+        without_attributes = FIGURE_WITH_ATTRIBUTES_PATTERN.sub("", content)
+        figures += [(path, {}) for path in FIGURE_PATTERN.findall(without_attributes)]
+
+        for path, attributes in figures:
+            width = printed_width(attributes, two_column_page)
+            if width is None:
+                # Keep figures of unknown width at full resolution
+                width = math.inf
+            name = Path(path).stem
+            widths[name] = max(widths.get(name, 0.0), width)
+    return widths
+
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _encode_png(data, max_width, dpi):
+    """Downsample a PNG to ``max_width`` pixels and encode it losslessly.
+
+    Returns:
+        Tuple of the encoded PNG and whether it was resampled
+    """
+    from PIL import Image
+
+    with Image.open(BytesIO(data)) as image:
+        image.load()
+        resampled = image.width > max_width * DOWNSAMPLE_TOLERANCE
+        save_options = {"optimize": True}
+
+        if resampled:
+            if image.mode not in ("RGB", "RGBA", "L", "LA"):
+                image = image.convert("RGBA")
+            height = max(1, round(image.height * max_width / image.width))
+            image = image.resize((max_width, height), Image.Resampling.LANCZOS)
+            save_options["dpi"] = (dpi, dpi)
+        elif "dpi" in image.info:
+            save_options["dpi"] = image.info["dpi"]
+
+        # An alpha channel that is opaque everywhere carries no information
+        if image.mode == "RGBA" and image.getextrema()[3] == (255, 255):
+            image = image.convert("RGB")
+
+        buffer = BytesIO()
+        image.save(buffer, "PNG", **save_options)
+    return buffer.getvalue(), resampled
+
+
+def _optimize_cached(path, variant, cache_dir, optimize, unchanged):
+    """Replace a file by its optimized version, caching it by input hash.
+
+    The file a replaced file was optimized from is kept in the cache, so
+    optimizing it again with other options, e.g. for a wider figure, starts
+    from the original rather than from the already optimized file.
+
+    Args:
+        path: File to optimize in place
+        variant: Options of the optimization that change its result
+        cache_dir: Directory caching optimized files, or None
+        optimize: Called with the file content, returns the optimized
+            content and JSON details of the optimization
+        unchanged: Details reported when the file is kept as it is
+
+    Returns:
+        Tuple of the bytes saved and the details of the optimization
+    """
+    path = Path(path)
+    current = path.read_bytes()
+    current_sha = _sha256(current)
+    original, original_sha = current, current_sha
+
+    manifest = {}
+    manifest_path = None
+    if cache_dir is not None:
+        manifest_path = Path(cache_dir) / CACHE_MANIFEST
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            manifest = {}
+
+        # Files this cache wrote are mapped to the file they were made from
+        source_sha = manifest.get("originals", {}).get(current_sha)
+        source_file = Path(cache_dir) / f"{source_sha}{path.suffix}"
+        if source_sha is not None and source_file.is_file():
+            original, original_sha = source_file.read_bytes(), source_sha
+
+        cached = manifest.get(f"{original_sha}-{variant}")
+        if cached is not None:
+            if cached["sha256"] == current_sha:
+                return 0, unchanged
+            cached_file = Path(cache_dir) / f"{cached['sha256']}{path.suffix}"
+            if cached_file.is_file():
+                shutil.copyfile(cached_file, path)
+                saved = len(current) - cached_file.stat().st_size
+                return saved, cached["details"]
+
+    optimized, details = optimize(original)
+    # Rewriting can make already compact files larger
+    if len(optimized) >= len(original):
+        optimized, details = original, unchanged
+    optimized_sha = _sha256(optimized)
+
+    if optimized_sha != current_sha:
+        path.write_bytes(optimized)
+
+    if manifest_path is not None:
+        manifest[f"{original_sha}-{variant}"] = {
+            "sha256": optimized_sha,
+            "details": details,
+        }
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        if optimized is not original:
+            manifest.setdefault("originals", {})[optimized_sha] = original_sha
+            for sha, data in ((original_sha, original), (optimized_sha, optimized)):
+                cached_file = manifest_path.parent / f"{sha}{path.suffix}"
+                if not cached_file.is_file():
+                    cached_file.write_bytes(data)
+        manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+    return len(current) - len(optimized), details
+
+
+def _prune_cache(cache_dir, paths):
+    """Remove cached files and entries that no current file refers to.
+
+    A file refers to the entries and cached copies of its own hash and of
+    the file it was optimized from.
+
+    Args:
+        cache_dir: Directory caching optimized files
+        paths: Every file currently optimized through the cache
+    """
+    cache_dir = Path(cache_dir)
+    manifest_path = cache_dir / CACHE_MANIFEST
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return
+
+    originals = manifest.pop("originals", {})
+    live = set()
+    for path in paths:
+        sha = _sha256(Path(path).read_bytes())
+        live.add(sha)
+        if sha in originals:
+            live.add(originals[sha])
+
+    # Keys are "<sha256 of the input>-<variant>"
+    pruned = {
+        key: entry
+        for key, entry in manifest.items()
+        if key.partition("-")[0] in live and entry["sha256"] in live
+    }
+    kept_originals = {
+        optimized: original
+        for optimized, original in originals.items()
+        if optimized in live
+    }
+    if kept_originals:
+        pruned["originals"] = kept_originals
+
+    for cached_file in cache_dir.iterdir():
+        if cached_file.name != CACHE_MANIFEST and cached_file.stem not in live:
+            cached_file.unlink(missing_ok=True)
+    manifest_path.write_text(json.dumps(pruned, indent=2), encoding="utf-8")
+
+
+def optimize_png(path, printed_width_in, dpi=DEFAULT_RASTER_DPI, cache_dir=None):
+    """Optimize a PNG in place for the width it is printed at.
+
+    Args:
+        path: PNG file to optimize
+        printed_width_in: Printed width in inches; ``math.inf`` keeps the
+            resolution and only re-encodes the file
+        dpi: Resolution the figure needs on the page
+        cache_dir: Directory caching optimized PNGs by input hash, or None
+
+    Returns:
+        Tuple of the bytes saved and whether the image was downsampled
+    """
+    max_width = (
+        math.ceil(printed_width_in * dpi) if math.isfinite(printed_width_in) else 0
+    )
+    return _optimize_cached(
+        path,
+        max_width,
+        cache_dir,
+        lambda data: _encode_png(data, max_width or math.inf, dpi),
+        False,
+    )
+
+
+def _font_descriptor(font):
+    """Font descriptor of a simple or composite (Type0) font."""
+    if font.get("/Subtype") == "/Type0" and "/DescendantFonts" in font:
+        font = font["/DescendantFonts"][0].get_object()
+    descriptor = font.get("/FontDescriptor")
+    return descriptor.get_object() if descriptor is not None else None
+
+
+def _fully_embedded(font):
+    """Whether a font program is embedded without being subset."""
+    descriptor = _font_descriptor(font)
+    if descriptor is None or not any(
+        key in descriptor for key in ("/FontFile", "/FontFile2", "/FontFile3")
+    ):
+        return False
+    return not SUBSET_FONT_PATTERN.match(str(font.get("/BaseFont", "")))
+
+
+def _appearance_streams(page):
+    """Appearance streams of the annotations of a page."""
+    streams = []
+    for annotation in page.get("/Annots") or []:
+        appearances = annotation.get_object().get("/AP")
+        if appearances is None:
+            continue
+        for appearance in appearances.get_object().values():
+            appearance = appearance.get_object()
+            # An appearance is a stream or a dictionary of streams by state
+            if hasattr(appearance, "get_data"):
+                streams.append(appearance)
+            else:
+                streams.extend(state.get_object() for state in appearance.values())
+    return streams
+
+
+def _selected_fonts(stream, xobjects, pdf, visited):
+    """Names of the fonts a content stream selects from its page resources.
+
+    Form XObjects without resources of their own use those of the page, so
+    the fonts they select are collected too.
+
+    Args:
+        stream: Content stream, or array of content streams
+        xobjects: XObject dictionary of the page resources, or None
+        pdf: Document the stream belongs to
+        visited: Form XObjects already walked, updated in place
+
+    Returns:
+        Set of font resource names
+    """
+    from pypdf.generic import ContentStream
+
+    fonts = set()
+    for operands, operator in ContentStream(stream, pdf).operations:
+        if operator == b"Tf":
+            fonts.add(str(operands[0]))
+        elif operator == b"Do" and xobjects is not None:
+            xobject = xobjects.get(operands[0])
+            if xobject is None:
+                continue
+            xobject = xobject.get_object()
+            if (
+                xobject.get("/Subtype") == "/Form"
+                and "/Resources" not in xobject
+                and id(xobject) not in visited
+            ):
+                visited.add(id(xobject))
+                fonts |= _selected_fonts(xobject, xobjects, pdf, visited)
+    return fonts
+
+
+def _compact_pdf(data):
+    """Rewrite a figure PDF without unused or duplicate objects and metadata.
+
+    Returns:
+        Tuple of the rewritten PDF and the details of the optimization
+    """
+    from pypdf import PdfReader, PdfWriter
+    from pypdf.generic import IndirectObject, NameObject
+
+    writer = PdfWriter(clone_from=PdfReader(BytesIO(data)))
+
+    # Fonts used by the pages sharing each resource dictionary
+    used_fonts = {}
+    resources = {}
+    for page in writer.pages:
+        page_resources = page.get(NameObject("/Resources"))
+        if page_resources is None:
+            continue
+        raw_resources = page.raw_get(NameObject("/Resources"))
+        key = (
+            raw_resources.idnum
+            if isinstance(raw_resources, IndirectObject)
+            else page.indirect_reference.idnum
+        )
+        page_resources = page_resources.get_object()
+        resources[key] = page_resources
+        xobjects = page_resources.get("/XObject")
+        if xobjects is not None:
+            xobjects = xobjects.get_object()
+
+        # Fonts selected by the page, by forms and annotation appearances
+        # without resources of their own, which use the page resources
+        streams = [
+            stream for stream in _appearance_streams(page) if "/Resources" not in stream
+        ]
+        contents = page.get_contents()
+        if contents is not None:
+            streams.append(contents)
+        visited = set()
+        page_fonts = used_fonts.setdefault(key, set())
+        for stream in streams:
+            page_fonts |= _selected_fonts(stream, xobjects, writer, visited)
+
+    fonts_removed = 0
+    full_fonts = set()
+    for key, page_resources in resources.items():
+        fonts = page_resources.get("/Font")
+        if fonts is None:
+            continue
+        fonts = fonts.get_object()
+        for name in list(fonts):
+            if name not in used_fonts[key]:
+                del fonts[name]
+                fonts_removed += 1
+            elif _fully_embedded(fonts[name].get_object()):
+                full_fonts.add(str(fonts[name].get_object().get("/BaseFont")))
+
+    for page in writer.pages:
+        for key in ("/PieceInfo", "/Metadata"):
+            if key in page:
+                del page[key]
+        page.compress_content_streams()
+
+    writer.metadata = None
+    if "/Metadata" in writer.root_object:
+        del writer.root_object["/Metadata"]
+    writer.compress_identical_objects()
+
+    details = {"fonts_removed": fonts_removed, "full_fonts": sorted(full_fonts)}
+    return write_renumbered(writer), details
+
+
+def optimize_pdf(path, cache_dir=None):
+    """Compact a figure PDF in place.
+
+    Args:
+        path: PDF file to compact
+        cache_dir: Directory caching compacted PDFs by input hash, or None
+
+    Returns:
+        Tuple of the bytes saved and the details of the optimization: the
+        number of unused fonts removed and the fonts embedded without subset
+    """
+    return _optimize_cached(
+        path,
+        "pdf",
+        cache_dir,
+        _compact_pdf,
+        {"fonts_removed": 0, "full_fonts": []},
+    )
+
+
+def optimize_raster_figures(
+    figures_dir, figure_names, manuscript_dir=None, dpi=DEFAULT_RASTER_DPI
+):
+    """Optimize the PNGs of generated figures for their printed size.
+
+    Args:
+        figures_dir: Directory holding a subdirectory per figure
+        figure_names: Figures to optimize; only generated figures should be
+            given, since their PNGs are rewritten in place
+        manuscript_dir: Manuscript directory whose markdown gives the figure
+            widths (default: the parent of ``figures_dir``)
+        dpi: Resolution the figures need on the page
+
+    Returns:
+        RasterSavings of the optimized figures
+    """
+    figures_dir = Path(figures_dir)
+    if manuscript_dir is None:
+        manuscript_dir = figures_dir.parent
+    widths = figure_widths(manuscript_dir)
+    cache_dir = figures_dir / RASTER_CACHE_DIR
+
+    savings = RasterSavings()
+    optimized = []
+    for name in sorted(figure_names):
+        figure_dir = figures_dir / name
+        if not figure_dir.is_dir():
+            continue
+        # Figures not referenced by the manuscript keep the full text width
+        width = widths.get(name, TEXT_WIDTH_IN)
+        for png in sorted(figure_dir.glob("*.png")):
+            saved, resampled = optimize_png(png, width, dpi, cache_dir)
+            savings.files += 1
+            savings.downsampled += int(resampled)
+            savings.bytes_saved += saved
+            optimized.append(png)
+    _prune_cache(cache_dir, optimized)
+    return savings
+
+
+def optimize_pdf_figures(figures_dir, figure_names):
+    """Compact the PDFs of generated figures.
+
+    Args:
+        figures_dir: Directory holding a subdirectory per figure
+        figure_names: Figures to compact; only generated figures should be
+            given, since their PDFs are rewritten in place
+
+    Returns:
+        PdfSavings of the compacted figures
+    """
+    figures_dir = Path(figures_dir)
+    cache_dir = figures_dir / PDF_CACHE_DIR
+
+    savings = PdfSavings()
+    optimized = []
+    full_fonts = set()
+    for name in sorted(figure_names):
+        figure_dir = figures_dir / name
+        if not figure_dir.is_dir():
+            continue
+        for pdf in sorted(figure_dir.glob("*.pdf")):
+            saved, details = optimize_pdf(pdf, cache_dir)
+            savings.files += 1
+            savings.fonts_removed += details["fonts_removed"]
+            savings.bytes_saved += saved
+            full_fonts.update(details["full_fonts"])
+            optimized.append(pdf)
+    savings.full_fonts = sorted(full_fonts)
+    _prune_cache(cache_dir, optimized)
+    return savings
@@ -0,0 +1,184 @@
+"""Record of the files generated by each figure source, and of its inputs.
+
+FigureGenerator snapshots the entries of a figure directory (modification
+time, inode and size) before and after running a figure script, and records
+the files the script created or modified in a manifest kept in the figures
+directory. Python scripts run under an audit hook recording the data files
+they read (see scripts/run_figure_script.py); those are stored with the
+SHA-256 of their content, as is the source itself::
+
+    {
+      "version": 2,
+      "figures": {
+        "SFigure_2.py": {
+          "outputs": ["SFigure_2/SFigure_2.pdf", ...],
+          "source": "<sha256>",
+          "inputs": {"DATA/SFigure_2/arxiv_monthly_submissions.csv": "<sha256>"}
+        }
+      }
+    }
+
+Paths are relative to the figures directory, or absolute for inputs outside
+it. Later stages, such as the batch builder and the figure validator, read
+the outputs of a source from the manifest rather than globbing the figure
+directories and guessing by name, and a figure is up to date as long as its
+source and recorded inputs are unchanged.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+FIGURE_OUTPUTS_MANIFEST = Path(".cache") / "figure_outputs.json"
+FIGURE_OUTPUTS_VERSION = 2
+
+
+def snapshot(directory):
+    """Snapshot the files below a directory.
+
+    Hidden entries and ``__pycache__`` directories are left out.
+
+    Args:
+        directory: Directory to snapshot
+
+    Returns:
+        Dict mapping the POSIX path of each file relative to ``directory`` to
+        its (modification time in ns, inode, size)
+    """
+    entries = {}
+    stack = [(Path(directory), "")]
+    while stack:
+        path, prefix = stack.pop()
+        try:
+            scanned = list(os.scandir(path))
+        except OSError:
+            continue
+        for entry in scanned:
+            if entry.name.startswith(".") or entry.name == "__pycache__":
+                continue
+            relative = f"{prefix}{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                stack.append((Path(entry.path), f"{relative}/"))
+            elif entry.is_file():
+                stat = entry.stat()
+                entries[relative] = (stat.st_mtime_ns, stat.st_ino, stat.st_size)
+    return entries
+
+
+def changed_files(before, after):
+    """Files created or modified between two snapshots, sorted by path."""
+    return sorted(path for path, entry in after.items() if before.get(path) != entry)
+
+
+def _sha256(path):
+    """SHA-256 of a file, or None if it cannot be read."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+class FigureOutputs:
+    """Manifest of the files generated by each figure source."""
+
+    def __init__(self, figures_dir):
+        """Load the manifest of a figures directory.
+
+        Args:
+            figures_dir: Directory holding the figure subdirectories
+        """
+        self.figures_dir = Path(figures_dir)
+        self.path = self.figures_dir / FIGURE_OUTPUTS_MANIFEST
+        self.figures = {}
+        try:
+            manifest = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if manifest.get("version") == FIGURE_OUTPUTS_VERSION:
+            self.figures = manifest.get("figures", {})
+
+    def record(self, source, outputs, inputs=(), failed=False):
+        """Record the files a figure source generated and save the manifest.
+
+        Args:
+            source: Figure source file
+            outputs: Generated files, relative to the figures directory
+            inputs: Files the source read, absolute or relative to the
+                figures directory
+            failed: Whether generating the figure failed; failed figures are
+                never up to date
+        """
+        source = Path(source)
+        entry = {
+            "outputs": sorted(Path(output).as_posix() for output in outputs),
+            "source": _sha256(source),
+            "inputs": {
+                self._relative(path): _sha256(self._resolve(path))
+                for path in sorted(inputs)
+            },
+        }
+        if failed:
+            entry["failed"] = True
+        self.figures[source.name] = entry
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        manifest = {"version": FIGURE_OUTPUTS_VERSION, "figures": self.figures}
+        self.path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+    def outputs(self, source):
+        """Recorded outputs of a figure source that still exist.
+
+        Args:
+            source: Figure source file, or its name
+
+        Returns:
+            Paths relative to the figures directory
+        """
+        entry = self.figures.get(Path(source).name, {})
+        return [
+            output
+            for output in entry.get("outputs", [])
+            if (self.figures_dir / output).is_file()
+        ]
+
+    def is_up_to_date(self, source):
+        """Whether a figure source was generated from its current inputs.
+
+        Args:
+            source: Figure source file
+
+        Returns:
+            True if the source is recorded with outputs that all still exist,
+            and neither the source nor any recorded input changed since
+        """
+        source = Path(source)
+        entry = self.figures.get(source.name)
+        if not entry or entry.get("failed") or not entry["outputs"]:
+            return False
+        if len(self.outputs(source)) != len(entry["outputs"]):
+            return False
+        if entry["source"] != _sha256(source):
+            return False
+        return all(
+            _sha256(self._resolve(path)) == digest
+            for path, digest in entry["inputs"].items()
+        )
+
+    def _relative(self, path):
+        """Path of a file relative to the figures directory, when inside it."""
+        path = Path(path)
+        if path.is_absolute():
+            try:
+                path = path.relative_to(self.figures_dir.resolve())
+            except ValueError:
+                return path.as_posix()
+        return path.as_posix()
+
+    def _resolve(self, path):
+        """Location of a recorded file, which may be absolute."""
+        return self.figures_dir / path
@@ -0,0 +1,321 @@
+"""Size analysis and compaction of the built manuscript PDF.
+
+analyze_pdf attributes the stream bytes of the PDF to its pages, to the
+figures included by pdflatex and to the embedded fonts. Figures included from
+PDF files are named by the ``/PTEX.FileName`` pdflatex records; raster images
+are matched to the files in the ``Figures`` directory by their pixel size.
+
+The result is checked against the size budget of the manuscript, the
+``pdf_size_budget`` section of 00_CONFIG.yml::
+
+    pdf_size_budget:
+      max_pdf_mb: 10
+      max_figure_mb: 2
+
+Sizes count the (compressed) stream data of the objects reachable from a
+page, figure or font. Objects shared by several pages are attributed to the
+first page using them.
+"""
+
+import json
+from dataclasses import asdict, dataclass, field
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Optional
+
+PDF_SIZE_REPORT_FILENAME = "pdf_size_report.json"
+PDF_SIZE_REPORT_VERSION = 1
+
+# Configuration section holding the size limits, in megabytes
+PDF_SIZE_BUDGET_KEY = "pdf_size_budget"
+
+MB = 1024 * 1024
+
+# Raster formats matched to images by their pixel size
+RASTER_SUFFIXES = (".png", ".jpg", ".jpeg")
+
+# Keys leading back up the object tree rather than to owned objects
+BACK_REFERENCE_KEYS = {"/Parent", "/P", "/Dest", "/Prev", "/Next", "/First", "/Last"}
+
+
+@dataclass
+class PdfPart:
+    """Size of a page, figure or font of a PDF.
+
+    Attributes:
+        name: Page number, figure file or font name
+        bytes: Stream bytes attributed to the part
+        pages: Pages the part appears on
+    """
+
+    name: str
+    bytes: int
+    pages: list[int] = field(default_factory=list)
+
+
+@dataclass
+class PdfSizeReport:
+    """Sizes of a PDF and of its pages, figures and fonts.
+
+    Attributes:
+        path: Analyzed PDF
+        file_bytes: Size of the PDF file
+        pages: Size of each page, in page order
+        figures: Size of each figure, largest first
+        fonts: Size of each embedded font, largest first
+        violations: Limits of the size budget the PDF exceeds
+    """
+
+    path: str
+    file_bytes: int
+    pages: list[PdfPart] = field(default_factory=list)
+    figures: list[PdfPart] = field(default_factory=list)
+    fonts: list[PdfPart] = field(default_factory=list)
+    violations: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Content of the JSON size report."""
+        return {"version": PDF_SIZE_REPORT_VERSION, **asdict(self)}
+
+
+def _stream_bytes(obj, seen):
+    """Stream bytes of ``obj`` and the objects it owns not yet in ``seen``."""
+    from pypdf.generic import ArrayObject, DictionaryObject, IndirectObject
+
+    total = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, IndirectObject):
+            if item.idnum in seen:
+                continue
+            seen.add(item.idnum)
+            item = item.get_object()
+        if isinstance(item, DictionaryObject):
+            # Stream objects are dictionaries holding their encoded data
+            total += len(getattr(item, "_data", b"") or b"")
+            stack.extend(
+                value for key, value in item.items() if key not in BACK_REFERENCE_KEYS
+            )
+        elif isinstance(item, ArrayObject):
+            stack.extend(item)
+    return total
+
+
+def _raster_sizes(figures_dir):
+    """Figure files of each pixel size in the figures directory."""
+    if figures_dir is None or not Path(figures_dir).is_dir():
+        return {}
+    try:
+        from PIL import Image
+    except ImportError:
+        return {}
+
+    sizes = {}
+    for path in sorted(Path(figures_dir).rglob("*")):
+        if path.suffix.lower() not in RASTER_SUFFIXES or any(
+            part.startswith(".") for part in path.parts
+        ):
+            continue
+        try:
+            with Image.open(path) as image:
+                size = image.size
+        except OSError:
+            continue
+        name = path.relative_to(Path(figures_dir).parent).as_posix()
+        sizes.setdefault(size, []).append(name)
+    return sizes
+
+
+def _figure_name(xobject, raster_sizes):
+    """File a figure XObject was included from, if it can be told."""
+    file_name = xobject.get("/PTEX.FileName")
+    if file_name is not None:
+        return str(file_name).removeprefix("./")
+    if xobject.get("/Subtype") == "/Image":
+        names = raster_sizes.get((xobject.get("/Width"), xobject.get("/Height")))
+        if names:
+            return " or ".join(names)
+    return None
+
+
+def _collect_fonts(obj, fonts, visited):
+    """Collect the font dictionaries reachable from ``obj`` by object number."""
+    from pypdf.generic import ArrayObject, DictionaryObject, IndirectObject
+
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, IndirectObject):
+            if item.idnum in visited:
+                continue
+            visited.add(item.idnum)
+            resolved = item.get_object()
+            if (
+                isinstance(resolved, DictionaryObject)
+                and resolved.get("/Type") == "/Font"
+            ):
+                fonts[item.idnum] = resolved
+                continue
+            item = resolved
+        if isinstance(item, DictionaryObject):
+            stack.extend(
+                value for key, value in item.items() if key not in BACK_REFERENCE_KEYS
+            )
+        elif isinstance(item, ArrayObject):
+            stack.extend(item)
+
+
+def analyze_pdf(pdf_path, figures_dir=None):
+    """Attribute the size of a PDF to its pages, figures and fonts.
+
+    Args:
+        pdf_path: PDF to analyze
+        figures_dir: Directory of the included figure files, used to name
+            raster images (default: ``Figures`` next to the PDF)
+
+    Returns:
+        PdfSizeReport without budget violations
+    """
+    from pypdf import PdfReader
+    from pypdf.generic import IndirectObject
+
+    pdf_path = Path(pdf_path)
+    if figures_dir is None:
+        figures_dir = pdf_path.parent / "Figures"
+    reader = PdfReader(pdf_path)
+    raster_sizes = _raster_sizes(figures_dir)
+
+    report = PdfSizeReport(path=str(pdf_path), file_bytes=pdf_path.stat().st_size)
+    figures = {}
+    fonts = {}
+    visited_fonts = set()
+    page_seen = set()
+
+    for number, page in enumerate(reader.pages, 1):
+        resources = page.get("/Resources")
+        xobjects = resources.get("/XObject") if resources is not None else None
+        for name, reference in (xobjects.get_object() if xobjects else {}).items():
+            if not isinstance(reference, IndirectObject):
+                continue
+            xobject = reference.get_object()
+            part = figures.get(reference.idnum)
+            if part is None:
+                figure_name = _figure_name(xobject, raster_sizes)
+                part = PdfPart(
+                    name=figure_name or f"page {number} {name}",
+                    bytes=_stream_bytes(reference, set()),
+                )
+                figures[reference.idnum] = part
+            if number not in part.pages:
+                part.pages.append(number)
+
+        _collect_fonts(page, fonts, visited_fonts)
+        page_bytes = _stream_bytes(page.get("/Contents"), page_seen)
+        page_bytes += _stream_bytes(resources, page_seen) if resources else 0
+        report.pages.append(PdfPart(name=str(number), bytes=page_bytes))
+
+    font_parts = {}
+    for idnum, font in fonts.items():
+        name = str(font.get("/BaseFont", f"font {idnum}")).lstrip("/")
+        size = _stream_bytes(font, set())
+        part = font_parts.setdefault(name, PdfPart(name=name, bytes=0))
+        part.bytes += size
+
+    report.figures = sorted(figures.values(), key=lambda part: -part.bytes)
+    report.fonts = sorted(font_parts.values(), key=lambda part: -part.bytes)
+    return report
+
+
+def size_budget(metadata: dict[str, Any]) -> dict[str, Optional[float]]:
+    """Size limits in megabytes from the manuscript configuration."""
+    budget = metadata.get(PDF_SIZE_BUDGET_KEY) or {}
+    return {
+        "max_pdf_mb": budget.get("max_pdf_mb"),
+        "max_figure_mb": budget.get("max_figure_mb"),
+    }
+
+
+def check_size_budget(report, max_pdf_mb=None, max_figure_mb=None):
+    """Record the limits of the size budget a PDF exceeds on its report.
+
+    Args:
+        report: PdfSizeReport of the PDF
+        max_pdf_mb: Size limit of the whole PDF, or None
+        max_figure_mb: Size limit of each figure, or None
+
+    Returns:
+        The violations, also stored in ``report.violations``
+    """
+    violations = []
+    if max_pdf_mb is not None and report.file_bytes > max_pdf_mb * MB:
+        violations.append(
+            f"PDF is {report.file_bytes / MB:.2f} MB, over the {max_pdf_mb} MB limit"
+        )
+    if max_figure_mb is not None:
+        for figure in report.figures:
+            if figure.bytes > max_figure_mb * MB:
+                violations.append(
+                    f"Figure {figure.name} is {figure.bytes / MB:.2f} MB, "
+                    f"over the {max_figure_mb} MB limit"
+                )
+    report.violations = violations
+    return violations
+
+
+def write_size_report(report, path):
+    """Write a PdfSizeReport as JSON and return its path."""
+    path = Path(path)
+    path.write_text(json.dumps(report.to_dict(), indent=2), encoding="utf-8")
+    return path
+
+
+def write_renumbered(writer):
+    """Write a PDF without the free entries left by removed objects.
+
+    Args:
+        writer: pypdf PdfWriter holding the document
+
+    Returns:
+        Content of the PDF file
+    """
+    from pypdf import PdfReader, PdfWriter
+
+    buffer = BytesIO()
+    writer.write(buffer)
+    buffer.seek(0)
+    # Cloning the written document numbers its objects consecutively again
+    renumbered = PdfWriter(clone_from=PdfReader(buffer))
+    buffer = BytesIO()
+    renumbered.write(buffer)
+    return buffer.getvalue()
+
+
+def compact_pdf(pdf_path):
+    """Rewrite a PDF with compressed content streams and merged duplicates.
+
+    Identical objects, such as an image included several times from copies
+    of the same file, are stored once. Metadata is kept. The file is only
+    replaced when the result is smaller.
+
+    Args:
+        pdf_path: PDF to rewrite in place
+
+    Returns:
+        Bytes saved
+    """
+    from pypdf import PdfReader, PdfWriter
+
+    pdf_path = Path(pdf_path)
+    original = pdf_path.read_bytes()
+
+    writer = PdfWriter(clone_from=PdfReader(BytesIO(original)))
+    for page in writer.pages:
+        page.compress_content_streams()
+    writer.compress_identical_objects()
+
+    compacted = write_renumbered(writer)
+    if len(compacted) >= len(original):
+        return 0
+    pdf_path.write_bytes(compacted)
+    return len(original) - len(compacted)
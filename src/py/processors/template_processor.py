@@ -3,8 +3,12 @@
 This module handles template content generation and replacement operations.
 """
 
+import hashlib
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, partial
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -12,7 +16,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import os
 
-from converters.md2tex import extract_content_sections
+from converters.md2tex import (
+    SUPPLEMENTARY_ENVIRONMENT_NAMES,
+    extract_content_sections,
+)
 from processors.author_processor import (
     generate_authors_and_affiliations,
     generate_corresponding_authors,
@@ -21,14 +28,55 @@ from processors.author_processor import (
 
 
 def get_template_path():
-    """Get the path to the template file."""
-    return Path(__file__).parent.parent.parent / "tex" / "template.tex"
+    """Get the path to the template file.
+
+    The template is in ``src/tex`` of a source checkout and in the ``tex``
+    directory of the installed package.
+    """
+    package_dir = Path(__file__).parent.parent
+    installed = package_dir / "tex" / "template.tex"
+    if installed.is_file():
+        return installed
+    return package_dir.parent / "tex" / "template.tex"
+
 
+# Template placeholders like <PY-RPL:MAIN-CONTENT>
+TEMPLATE_PLACEHOLDER_PATTERN = re.compile(r"<PY-RPL:([A-Z0-9-]+)>")
+
+
+@lru_cache(maxsize=16)
+def parse_template(template_content):
+    """Split a template into alternating literal and placeholder segments.
+
+    Even indices hold literal text and odd indices hold placeholder names.
+    Parsed templates are cached by content, so each template is scanned once.
+    """
+    return tuple(TEMPLATE_PLACEHOLDER_PATTERN.split(template_content))
 
-def find_supplementary_md():
-    """Find supplementary information file in the manuscript directory."""
+
+def render_template(template_content, values):
+    """Fill template placeholders from ``values`` in a single pass.
+
+    Placeholders without a value are kept verbatim, and placeholder syntax
+    inside substituted values is never expanded.
+    """
+    segments = list(parse_template(template_content))
+    for index in range(1, len(segments), 2):
+        name = segments[index]
+        segments[index] = values.get(name, f"<PY-RPL:{name}>")
+    return "".join(segments)
+
+
+def find_supplementary_md(manuscript_path=None):
+    """Find supplementary information file in the manuscript directory.
+
+    Args:
+        manuscript_path: Manuscript directory, relative to the working
+            directory (default: MANUSCRIPT_PATH)
+    """
     current_dir = Path.cwd()
-    manuscript_path = os.getenv("MANUSCRIPT_PATH", "MANUSCRIPT")
+    if manuscript_path is None:
+        manuscript_path = os.getenv("MANUSCRIPT_PATH", "MANUSCRIPT")
 
     # Look for supplementary file: 02_SUPPLEMENTARY_INFO.md
     supplementary_md = current_dir / manuscript_path / "02_SUPPLEMENTARY_INFO.md"
@@ -86,54 +134,235 @@ def generate_supplementary_cover_page(yaml_metadata):
     return cover_latex
 
 
-def generate_supplementary_tex(output_dir, yaml_metadata=None):
-    """Generate Supplementary.tex file from supplementary markdown."""
-    from converters.md2tex import convert_markdown_to_latex
+# Supplementary parts in document order, see parse_supplementary_sections
+SUPPLEMENTARY_PARTS = ("tables", "notes", "figures")
+
+# Converted parts are cached per part under the output directory
+SUPPLEMENTARY_CACHE_DIR = Path(".cache") / "supplementary"
+
+# Bumped whenever the cache layout changes; changes to the conversion itself
+# are picked up from the converter sources, see _converter_fingerprint
+SUPPLEMENTARY_CACHE_VERSION = 1
+
+# Sources of the markdown to LaTeX conversion
+CONVERTERS_DIR = Path(__file__).parent.parent / "converters"
+
+# Figure and table environments; raw LaTeX in the supplementary markdown is
+# passed through by the converter and renamed after conversion
+FLOAT_ENVIRONMENT_PATTERN = re.compile(r"\\(begin|end)\{(figure|table\*?)\}")
+
+# Content of Supplementary.tex for manuscripts without supplementary markdown
+NO_SUPPLEMENTARY_TEX = "% No supplementary information provided\n"
+
+
+def convert_supplementary_part(content, manuscript_path=None):
+    """Convert the markdown of one supplementary part to LaTeX.
+
+    Runs in a worker process; every call starts from a fresh converter
+    state, so the parts can be converted independently.
+    """
+    from converters.md2tex import (
+        SUPPLEMENTARY_ENVIRONMENT_NAMES,
+        convert_markdown_to_latex,
+    )
+
+    return convert_markdown_to_latex(
+        content,
+        is_supplementary=True,
+        environment_names=SUPPLEMENTARY_ENVIRONMENT_NAMES,
+        manuscript_path=manuscript_path,
+    )
+
+
+@lru_cache(maxsize=1)
+def _converter_fingerprint():
+    """Hash the converter sources, so that editing them invalidates the cache."""
+    digest = hashlib.sha256()
+    for source in sorted(CONVERTERS_DIR.glob("*.py")):
+        digest.update(f"{source.name}\0".encode())
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
 
-    supplementary_md = find_supplementary_md()
+
+def _supplementary_part_cache_key(content, manuscript_path=None):
+    """Hash a supplementary part, the data files it references and converters.
+
+    Returns None if a referenced data file cannot be resolved; the part is
+    then not cached and its conversion reports the error.
+    """
+    from converters.data_table_processor import data_table_fingerprint
+
+    try:
+        fingerprint = data_table_fingerprint(content, manuscript_path)
+    except (OSError, ValueError):
+        return None
+    digest = hashlib.sha256(f"{SUPPLEMENTARY_CACHE_VERSION}\0".encode())
+    digest.update(_converter_fingerprint().encode("ascii"))
+    digest.update(content.encode("utf-8"))
+    digest.update(fingerprint.encode("ascii"))
+    return digest.hexdigest()
+
+
+def _read_cached_part(cache_dir, name, key):
+    try:
+        return (cache_dir / f"{name}-{key}.tex").read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def _write_cached_part(cache_dir, name, key, latex):
+    """Store a converted part, replacing older conversions of the same part."""
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for stale in cache_dir.glob(f"{name}-*.tex"):
+            stale.unlink()
+        (cache_dir / f"{name}-{key}.tex").write_text(latex, encoding="utf-8")
+    except OSError as e:
+        print(f"Warning: could not cache supplementary {name}: {e}")
+
+
+def _convert_parts_in_pool(contents, manuscript_path=None):
+    """Convert parts in worker processes, in order.
+
+    Returns None if no process pool can be used here.
+    """
+    convert = partial(convert_supplementary_part, manuscript_path=manuscript_path)
+    try:
+        with ProcessPoolExecutor(max_workers=len(contents)) as executor:
+            return list(executor.map(convert, contents))
+    except (OSError, NotImplementedError, BrokenProcessPool):
+        return None
+
+
+def convert_supplementary_parts(
+    parts, output_dir=None, manuscript_path=None, parallel=True
+):
+    """Convert supplementary parts to LaTeX, concurrently and with a cache.
+
+    Each part is a separate document, cached under the output directory by
+    the hash of its markdown and of the data files it references. Parts
+    that are not cached are converted in a process pool when there are
+    several of them, and one after another otherwise or when no pool can be
+    started.
+
+    Args:
+        parts: Markdown of each part by name, see SUPPLEMENTARY_PARTS
+        output_dir: Output directory of the manuscript build, or None to
+            convert without caching
+        manuscript_path: Manuscript directory that data tables are read
+            from (default: MANUSCRIPT_PATH)
+        parallel: Whether several parts may be converted in a process pool
+
+    Returns:
+        dict: LaTeX of each part by name, in the order of ``parts``
+    """
+    cache_dir = Path(output_dir) / SUPPLEMENTARY_CACHE_DIR if output_dir else None
+    converted = {}
+    keys = {}
+    for name, content in parts.items():
+        keys[name] = None
+        if cache_dir is not None:
+            keys[name] = _supplementary_part_cache_key(content, manuscript_path)
+        if keys[name] is not None:
+            converted[name] = _read_cached_part(cache_dir, name, keys[name])
+
+    pending = [name for name in parts if converted.get(name) is None]
+    contents = [parts[name] for name in pending]
+    results = None
+    if parallel and len(pending) > 1:
+        results = _convert_parts_in_pool(contents, manuscript_path)
+    if results is None:
+        results = [
+            convert_supplementary_part(content, manuscript_path) for content in contents
+        ]
+
+    for name, latex in zip(pending, results):
+        converted[name] = latex
+        if keys[name] is not None:
+            _write_cached_part(cache_dir, name, keys[name], latex)
+
+    return {name: converted[name] for name in parts}
+
+
+def generate_supplementary_tex(output_dir, yaml_metadata=None, manuscript_path=None):
+    """Generate Supplementary.tex file from supplementary markdown."""
+    supplementary_md = find_supplementary_md(manuscript_path)
     if not supplementary_md:
         # Create empty supplementary file
         supplementary_tex_path = Path(output_dir) / "Supplementary.tex"
         with open(supplementary_tex_path, "w") as f:
-            f.write("% No supplementary information provided\n")
+            f.write(NO_SUPPLEMENTARY_TEX)
         return
 
     # Read and parse supplementary markdown content
     with open(supplementary_md) as f:
         supplementary_content = f.read()
 
-    # Parse and separate content into sections
-    sections = parse_supplementary_sections(supplementary_content)
+    final_latex = render_supplementary_tex(
+        supplementary_content, yaml_metadata, output_dir, manuscript_path
+    )
 
-    # Convert each section to LaTeX separately
-    tables_latex = ""
-    notes_latex = ""
-    figures_latex = ""
+    # Write Supplementary.tex file
+    supplementary_tex_path = Path(output_dir) / "Supplementary.tex"
+    with open(supplementary_tex_path, "w") as f:
+        f.write(final_latex)
 
-    if sections["tables"]:
-        # Process tables section with special handling for section headers
-        tables_content = sections["tables"]
+    print(f"Generated supplementary information: {supplementary_tex_path}")
 
-        # Convert section headers to regular LaTeX sections
-        tables_content = re.sub(
-            r"^## (.+)$", r"\\section*{\1}", tables_content, flags=re.MULTILINE
-        )
 
-        tables_latex = "% Supplementary Tables\n\n" + convert_markdown_to_latex(
-            tables_content, is_supplementary=True
-        )
+def _supplementary_float_environment(match):
+    """Rename a matched figure or table environment for the supplement."""
+    name = SUPPLEMENTARY_ENVIRONMENT_NAMES[match.group(2)]
+    return f"\\{match.group(1)}{{{name}}}"
 
-    if sections["notes"]:
-        # Process notes section with special handling for section headers
-        notes_content = sections["notes"]
 
-        # Convert section headers to regular LaTeX sections (not supplementary notes)
-        # This prevents "## Supplementary Notes" from becoming
-        # "Supp. Note 1: Supplementary Notes"
-        notes_content = re.sub(
-            r"^## (.+)$", r"\\section*{\1}", notes_content, flags=re.MULTILINE
+def render_supplementary_tex(
+    supplementary_content,
+    yaml_metadata=None,
+    output_dir=None,
+    manuscript_path=None,
+    parallel=True,
+):
+    """Convert supplementary markdown to the content of Supplementary.tex.
+
+    Args:
+        supplementary_content: Markdown of 02_SUPPLEMENTARY_INFO.md
+        yaml_metadata: Manuscript metadata for the cover page, if any
+        output_dir: Output directory caching the converted parts, or None
+        manuscript_path: Manuscript directory that data tables are read
+            from (default: MANUSCRIPT_PATH)
+        parallel: Whether the parts may be converted in a process pool
+
+    Returns:
+        str: LaTeX content of Supplementary.tex
+    """
+    # Parse and separate content into sections
+    sections = parse_supplementary_sections(supplementary_content)
+
+    # Convert section headers to regular LaTeX sections. For the notes this
+    # prevents "## Supplementary Notes" from becoming
+    # "Supp. Note 1: Supplementary Notes"
+    parts = {
+        name: re.sub(
+            r"^## (.+)$", r"\\section*{\1}", sections[name], flags=re.MULTILINE
         )
+        for name in SUPPLEMENTARY_PARTS
+        if sections[name]
+    }
 
+    # The parts are independent documents, converted separately
+    converted = convert_supplementary_parts(
+        parts, output_dir, manuscript_path, parallel
+    )
+
+    tables_latex = ""
+    notes_latex = ""
+    figures_latex = ""
+
+    if "tables" in converted:
+        tables_latex = "% Supplementary Tables\n\n" + converted["tables"]
+
+    if "notes" in converted:
         # Set up supplementary note numbering before the content
         note_setup = """
 % Setup subsection numbering for supplementary notes
@@ -141,29 +370,20 @@ def generate_supplementary_tex(output_dir, yaml_metadata=None):
 \\setcounter{subsection}{0}
 
 """
-        notes_latex = (
-            "% Supplementary Notes\n"
-            + note_setup
-            + convert_markdown_to_latex(notes_content, is_supplementary=True)
-        )
+        notes_latex = "% Supplementary Notes\n" + note_setup + converted["notes"]
 
-    if sections["figures"]:
-        # Process figures section with special handling for section headers
-        figures_content = sections["figures"]
-
-        # Convert section headers to regular LaTeX sections
-        figures_content = re.sub(
-            r"^## (.+)$", r"\\section*{\1}", figures_content, flags=re.MULTILINE
-        )
-
-        figures_latex = "% Supplementary Figures\n\n" + convert_markdown_to_latex(
-            figures_content, is_supplementary=True
-        )
+    if "figures" in converted:
+        figures_latex = "% Supplementary Figures\n\n" + converted["figures"]
 
     # Combine sections in proper order
     supplementary_latex = tables_latex + "\n" + notes_latex + "\n" + figures_latex
 
-    # Set up supplementary figure and table environment and numbering
+    # Floats written as raw LaTeX use the supplementary environments too
+    supplementary_latex = FLOAT_ENVIRONMENT_PATTERN.sub(
+        _supplementary_float_environment, supplementary_latex
+    )
+
+    # Set up names for the sfigure and stable environments emitted above
     supplementary_setup = """% Setup for supplementary figures and tables
 % Note: All supplementary counters and environments are already defined
 % in the class file
@@ -172,71 +392,13 @@ def generate_supplementary_tex(output_dir, yaml_metadata=None):
 
 """
 
-    # Process the LaTeX to convert figure environments to sfigure environments
-    # Replace \begin{figure} with \begin{sfigure} and \end{figure} with \end{sfigure}
-    # Also preserve \newpage commands that come after figures
-    # (with or without line breaks)
-    supplementary_latex = supplementary_latex.replace(
-        "\\begin{figure}", "\\begin{sfigure}"
-    )
-    # Handle newpage with line breaks (using escaped backslashes)
-    supplementary_latex = supplementary_latex.replace(
-        "\\end{figure}\n\\newpage", "\\end{sfigure}\n\\newpage"
-    )
-    # Handle newpage without line breaks
-    supplementary_latex = supplementary_latex.replace(
-        "\\end{figure}\\newpage", "\\end{sfigure}\\newpage"
-    )
-    # Handle remaining figure endings
-    supplementary_latex = supplementary_latex.replace("\\end{figure}", "\\end{sfigure}")
-
-    # Process the LaTeX to convert table environments to stable environments
-    # Replace \begin{table} with \begin{stable} and \end{table} with \end{stable}
-    # Also preserve \newpage commands that come after tables
-    # (with or without line breaks)
-    supplementary_latex = supplementary_latex.replace(
-        "\\begin{table}", "\\begin{stable}"
-    )
-    # Handle newpage with line breaks (using escaped backslashes)
-    supplementary_latex = supplementary_latex.replace(
-        "\\end{table}\n\\newpage", "\\end{stable}\n\\newpage"
-    )
-    # Handle newpage without line breaks
-    supplementary_latex = supplementary_latex.replace(
-        "\\end{table}\\newpage", "\\end{stable}\\newpage"
-    )
-    # Handle remaining table endings
-    supplementary_latex = supplementary_latex.replace("\\end{table}", "\\end{stable}")
-
-    # Also handle two-column tables
-    supplementary_latex = supplementary_latex.replace(
-        "\\begin{table*}", "\\begin{stable*}"
-    )
-    # Handle newpage with line breaks (using escaped backslashes)
-    supplementary_latex = supplementary_latex.replace(
-        "\\end{table*}\n\\newpage", "\\end{stable*}\n\\newpage"
-    )
-    # Handle newpage without line breaks
-    supplementary_latex = supplementary_latex.replace(
-        "\\end{table*}\\newpage", "\\end{stable*}\\newpage"
-    )
-    # Handle remaining table* endings
-    supplementary_latex = supplementary_latex.replace("\\end{table*}", "\\end{stable*}")
-
     # Generate cover page if yaml_metadata is provided
     cover_page_latex = ""
     if yaml_metadata:
         cover_page_latex = generate_supplementary_cover_page(yaml_metadata)
 
     # Combine setup, cover page, and content
-    final_latex = supplementary_setup + cover_page_latex + supplementary_latex
-
-    # Write Supplementary.tex file
-    supplementary_tex_path = Path(output_dir) / "Supplementary.tex"
-    with open(supplementary_tex_path, "w") as f:
-        f.write(final_latex)
-
-    print(f"Generated supplementary information: {supplementary_tex_path}")
+    return supplementary_setup + cover_page_latex + supplementary_latex
 
 
 def generate_keywords(yaml_metadata):
@@ -267,8 +429,15 @@ def generate_bibliography(yaml_metadata):
     return f"\\bibliography{{{bibliography}}}"
 
 
-def process_template_replacements(template_content, yaml_metadata, article_md):
-    """Process all template replacements with metadata and content."""
+def process_template_replacements(
+    template_content, yaml_metadata, article_md, word_counts=None, manuscript_path=None
+):
+    """Process all template replacements with metadata and content.
+
+    If ``word_counts`` is a dictionary, it is filled with the word count of
+    each section while the sections are converted. Data tables are read from
+    ``manuscript_path`` (default: MANUSCRIPT_PATH).
+    """
     # Process draft watermark based on status field
     is_draft = False
     if "status" in yaml_metadata:
@@ -282,18 +451,21 @@ def process_template_replacements(template_content, yaml_metadata, article_md):
             r"\documentclass[times, twoside, watermark]{rxiv_maker_style}",
         )
 
+    # Values of the <PY-RPL:...> placeholders, substituted in a single pass
+    values = {}
+
     # Process line numbers
     txt = ""
     if "use_line_numbers" in yaml_metadata:
         use_line_numbers = str(yaml_metadata["use_line_numbers"]).lower() == "true"
         if use_line_numbers:
             txt = "% Add number to the lines\n\\usepackage{lineno}\n\\linenumbers\n"
-    template_content = template_content.replace("<PY-RPL:USE-LINE-NUMBERS>", txt)
+    values["USE-LINE-NUMBERS"] = txt
 
     # Process date
     date_str = yaml_metadata.get("date", "")
     txt = f"\\renewcommand{{\\today}}{{{date_str}}}\n" if date_str else ""
-    template_content = template_content.replace("<PY-RPL:DATE>", txt)
+    values["DATE"] = txt
 
     # Process lead author
     lead_author = "Unknown"
@@ -319,7 +491,7 @@ def process_template_replacements(template_content, yaml_metadata, article_md):
         elif isinstance(first_author, str):
             lead_author = first_author.split()[-1]
     txt = f"\\leadauthor{{{lead_author}}}\n"
-    template_content = template_content.replace("<PY-RPL:LEAD-AUTHOR>", txt)
+    values["LEAD-AUTHOR"] = txt
 
     # Process long title
     long_title = "Untitled Article"
@@ -337,7 +509,7 @@ def process_template_replacements(template_content, yaml_metadata, article_md):
         elif isinstance(yaml_metadata["title"], str):
             long_title = yaml_metadata["title"]
     txt = f"\\title{{{long_title}}}\n"
-    template_content = template_content.replace("<PY-RPL:LONG-TITLE-STR>", txt)
+    values["LONG-TITLE-STR"] = txt
 
     # Process short title
     short_title = "Untitled"
@@ -359,50 +531,38 @@ def process_template_replacements(template_content, yaml_metadata, article_md):
                 else yaml_metadata["title"]
             )
     txt = f"\\shorttitle{{{short_title}}}\n"
-    template_content = template_content.replace("<PY-RPL:SHORT-TITLE-STR>", txt)
+    values["SHORT-TITLE-STR"] = txt
 
     # Generate authors and affiliations dynamically
     authors_and_affiliations = generate_authors_and_affiliations(yaml_metadata)
-    template_content = template_content.replace(
-        "<PY-RPL:AUTHORS-AND-AFFILIATIONS>", authors_and_affiliations
-    )
+    values["AUTHORS-AND-AFFILIATIONS"] = authors_and_affiliations
 
     # Generate corresponding authors section
     corresponding_authors = generate_corresponding_authors(yaml_metadata)
-    template_content = template_content.replace(
-        "<PY-RPL:CORRESPONDING-AUTHORS>", corresponding_authors
-    )
+    values["CORRESPONDING-AUTHORS"] = corresponding_authors
 
     # Generate extended author information section
     extended_author_info = generate_extended_author_info(yaml_metadata)
-    template_content = template_content.replace(
-        "<PY-RPL:EXTENDED-AUTHOR-INFO>", extended_author_info
-    )
+    values["EXTENDED-AUTHOR-INFO"] = extended_author_info
 
     # Generate keywords section
     keywords_section = generate_keywords(yaml_metadata)
-    template_content = template_content.replace("<PY-RPL:KEYWORDS>", keywords_section)
+    values["KEYWORDS"] = keywords_section
 
     # Generate bibliography section
     bibliography_section = generate_bibliography(yaml_metadata)
-    template_content = template_content.replace(
-        "<PY-RPL:BIBLIOGRAPHY>", bibliography_section
-    )
+    values["BIBLIOGRAPHY"] = bibliography_section
 
     # Extract content sections from markdown
-    content_sections = extract_content_sections(article_md)
-
-    # Replace content placeholders with extracted sections
-    template_content = template_content.replace(
-        "<PY-RPL:ABSTRACT>", content_sections.get("abstract", "")
-    )
-    template_content = template_content.replace(
-        "<PY-RPL:MAIN-CONTENT>", content_sections.get("main", "")
-    )
-    template_content = template_content.replace(
-        "<PY-RPL:METHODS>", content_sections.get("methods", "")
+    content_sections = extract_content_sections(
+        article_md, word_counts, manuscript_path
     )
 
+    # Fill content placeholders with extracted sections
+    values["ABSTRACT"] = content_sections.get("abstract", "")
+    values["MAIN-CONTENT"] = content_sections.get("main", "")
+    values["METHODS"] = content_sections.get("methods", "")
+
     # Handle main content sections conditionally
     # Results section
     results_content = content_sections.get("results", "").strip()
@@ -410,9 +570,7 @@ def process_template_replacements(template_content, yaml_metadata, article_md):
         results_section = f"\\section*{{Results}}\n{results_content}"
     else:
         results_section = ""
-    template_content = template_content.replace(
-        "<PY-RPL:RESULTS-SECTION>", results_section
-    )
+    values["RESULTS-SECTION"] = results_section
 
     # Discussion section
     discussion_content = content_sections.get("discussion", "").strip()
@@ -420,9 +578,7 @@ def process_template_replacements(template_content, yaml_metadata, article_md):
         discussion_section = f"\\section*{{Discussion}}\n{discussion_content}"
     else:
         discussion_section = ""
-    template_content = template_content.replace(
-        "<PY-RPL:DISCUSSION-SECTION>", discussion_section
-    )
+    values["DISCUSSION-SECTION"] = discussion_section
 
     # Conclusions section
     conclusions_content = content_sections.get("conclusion", "").strip()
@@ -430,9 +586,7 @@ def process_template_replacements(template_content, yaml_metadata, article_md):
         conclusions_section = f"\\section*{{Conclusions}}\n{conclusions_content}"
     else:
         conclusions_section = ""
-    template_content = template_content.replace(
-        "<PY-RPL:CONCLUSIONS-SECTION>", conclusions_section
-    )
+    values["CONCLUSIONS-SECTION"] = conclusions_section
 
     # Handle optional sections conditionally
     # Data availability
@@ -443,9 +597,7 @@ def process_template_replacements(template_content, yaml_metadata, article_md):
 \\end{{data}}"""
     else:
         data_block = ""
-    template_content = template_content.replace(
-        "<PY-RPL:DATA-AVAILABILITY-BLOCK>", data_block
-    )
+    values["DATA-AVAILABILITY-BLOCK"] = data_block
 
     # Code availability
     code_availability = content_sections.get("code_availability", "").strip()
@@ -455,9 +607,7 @@ def process_template_replacements(template_content, yaml_metadata, article_md):
 \\end{{code}}"""
     else:
         code_block = ""
-    template_content = template_content.replace(
-        "<PY-RPL:CODE-AVAILABILITY-BLOCK>", code_block
-    )
+    values["CODE-AVAILABILITY-BLOCK"] = code_block
 
     # Author contributions
     author_contributions = content_sections.get("author_contributions", "").strip()
@@ -467,9 +617,7 @@ def process_template_replacements(template_content, yaml_metadata, article_md):
 \\end{{contributions}}"""
     else:
         contributions_block = ""
-    template_content = template_content.replace(
-        "<PY-RPL:AUTHOR-CONTRIBUTIONS-BLOCK>", contributions_block
-    )
+    values["AUTHOR-CONTRIBUTIONS-BLOCK"] = contributions_block
 
     # Acknowledgements
     acknowledgements = content_sections.get("acknowledgements", "").strip()
@@ -479,13 +627,9 @@ def process_template_replacements(template_content, yaml_metadata, article_md):
 \\end{{acknowledgements}}"""
     else:
         acknowledgements_block = ""
-    template_content = template_content.replace(
-        "<PY-RPL:ACKNOWLEDGEMENTS-BLOCK>", acknowledgements_block
-    )
+    values["ACKNOWLEDGEMENTS-BLOCK"] = acknowledgements_block
 
-    template_content = template_content.replace(
-        "<PY-RPL:FUNDING>", content_sections.get("funding", "")
-    )
+    values["FUNDING"] = content_sections.get("funding", "")
     # Generate manuscript preparation content
     manuscript_prep_content = content_sections.get("manuscript_preparation", "")
 
@@ -514,12 +658,9 @@ def process_template_replacements(template_content, yaml_metadata, article_md):
     else:
         manuscript_prep_block = ""
 
-    template_content = template_content.replace(
-        "<PY-RPL:MANUSCRIPT-PREPARATION-BLOCK>",
-        manuscript_prep_block,
-    )
+    values["MANUSCRIPT-PREPARATION-BLOCK"] = manuscript_prep_block
 
-    return template_content
+    return render_template(template_content, values)
 
 
 def parse_supplementary_sections(content):
@@ -10,6 +10,9 @@ try:
 except ImportError:
     yaml = None  # type: ignore[assignment]
 
+# The C-accelerated loader when libyaml is available
+YAML_LOADER = getattr(yaml, "CSafeLoader", None) or getattr(yaml, "SafeLoader", None)
+
 
 # Import email processing utilities
 def _get_email_processor():
@@ -58,31 +61,23 @@ def find_config_file(md_file):
     return None
 
 
-def extract_yaml_metadata(md_file):
-    """Extract yaml metadata from separate config file or from the markdown file."""
+def extract_yaml_metadata(md_file, output_dir=None):
+    """Extract yaml metadata from separate config file or from the markdown file.
+
+    A separate config file is loaded through config_loader.load_config, which
+    caches the normalized configuration in ``output_dir`` when given.
+    """
+    from .config_loader import ConfigError, load_config
+
     # First try to find separate config file
     config_file = find_config_file(md_file)
     if config_file:
         print(f"Loading metadata from separate config file: {config_file}")
-        with open(config_file) as file:
-            yaml_content = file.read()
-
-        if yaml:
-            try:
-                metadata = yaml.safe_load(yaml_content)
-                # Process email64 fields if present
-                if metadata and "authors" in metadata:
-                    metadata["authors"] = process_author_emails(metadata["authors"])
-                return metadata
-            except yaml.YAMLError as e:
-                print(f"Error parsing YAML config file: {e}")
-                return {}
-        else:
-            metadata = parse_yaml_simple(yaml_content)
-            # Process email64 fields if present
-            if metadata and "authors" in metadata:
-                metadata["authors"] = process_author_emails(metadata["authors"])
-            return metadata
+        try:
+            return load_config(config_file, output_dir).metadata
+        except ConfigError as e:
+            print(f"Error parsing YAML config file: {e}")
+            return {}
 
     # Fall back to extracting from markdown file
     print(f"Looking for YAML metadata in markdown file: {md_file}")
@@ -95,7 +90,7 @@ def extract_yaml_metadata(md_file):
         yaml_content = match.group(1)
         if yaml:
             try:
-                metadata = yaml.safe_load(yaml_content)
+                metadata = yaml.load(yaml_content, Loader=YAML_LOADER)
                 # Process email64 fields if present
                 if metadata and "authors" in metadata:
                     metadata["authors"] = process_author_emails(metadata["authors"])
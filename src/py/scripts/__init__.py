@@ -1,5 +1,5 @@
 """Utility scripts for rxiv-maker."""
 
-from . import custom_doc_generator, validate_manuscript
+from . import custom_doc_generator, run_figure_script, validate_manuscript
 
-__all__ = ["custom_doc_generator", "validate_manuscript"]
+__all__ = ["custom_doc_generator", "run_figure_script", "validate_manuscript"]
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Run a Python figure script and record the files it reads.
+
+FigureGenerator runs Python figure scripts through this wrapper. An audit hook
+(PEP 578) records every file opened for reading while the script runs, so the
+build knows which data files a figure depends on. Files of the Python
+installation, such as the modules and fonts of the plotting libraries, are
+left out. The list is written as JSON when the script ends, also when it fails.
+
+The wrapper only uses the standard library and runs the script as
+``python SCRIPT`` would: as ``__main__``, with its directory first on the
+module search path.
+
+Usage:
+    python run_figure_script.py INPUTS_JSON SCRIPT [ARGS...]
+"""
+
+import json
+import os
+import runpy
+import site
+import sys
+import sysconfig
+
+# Modes and flags opening a file for writing
+WRITE_MODES = set("wax+")
+WRITE_FLAGS = os.O_WRONLY | os.O_RDWR
+
+
+def library_roots():
+    """Directories of the Python installation and its packages."""
+    paths = sysconfig.get_paths()
+    roots = {
+        paths[key]
+        for key in ("stdlib", "platstdlib", "purelib", "platlib")
+        if key in paths
+    }
+    roots.update(site.getsitepackages())
+    if site.ENABLE_USER_SITE:
+        roots.add(site.getusersitepackages())
+    return tuple(os.path.join(os.path.realpath(root), "") for root in roots)
+
+
+def record_inputs(inputs, excluded):
+    """Audit hook adding the files opened for reading to ``inputs``."""
+
+    def audit(event, args):
+        if event != "open":
+            return
+        try:
+            path, mode, flags = args
+            if path is None or isinstance(path, int):
+                return
+            if mode is not None:
+                if WRITE_MODES.intersection(mode):
+                    return
+            elif flags & WRITE_FLAGS:
+                return
+            path = os.path.realpath(os.fsdecode(path))
+            if not path.startswith(excluded):
+                inputs.add(path)
+        except Exception:  # auditing must never break the script
+            pass
+
+    return audit
+
+
+def main():
+    """Run the figure script given on the command line."""
+    if len(sys.argv) < 3:
+        print(__doc__)
+        return 2
+
+    inputs_path = os.path.abspath(sys.argv[1])
+    script = os.path.realpath(sys.argv[2])
+    sys.argv = [script, *sys.argv[3:]]
+    sys.path[0] = os.path.dirname(script)
+
+    inputs = set()
+    sys.addaudithook(record_inputs(inputs, library_roots()))
+    try:
+        runpy.run_path(script, run_name="__main__")
+    finally:
+        # The script itself is tracked by the generator; failed opens and
+        # directories are not inputs
+        inputs.discard(script)
+        with open(inputs_path, "w", encoding="utf-8") as f:
+            json.dump(sorted(path for path in inputs if os.path.isfile(path)), f)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -21,20 +21,20 @@ import argparse
 import logging
 import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
-import yaml
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from processors.config_loader import (
+    CONFIG_FILENAME,
+    CONFIG_SCHEMA,
+    ConfigError,
+    load_config,
+)
 
 # Import new validators
 try:
-    import os
-    import sys
-
-    # Add parent directory to path for relative imports
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    parent_dir = os.path.dirname(current_dir)
-    sys.path.insert(0, parent_dir)
-
     from validators import (
         CitationValidator,
         FigureValidator,
@@ -72,10 +72,7 @@ class ManuscriptValidator:
     }
 
     REQUIRED_CONFIG_FIELDS = {
-        "title": "Manuscript title",
-        "authors": "List of authors",
-        "date": "Publication date",
-        "keywords": "Keywords for the manuscript",
+        name: spec.description for name, spec in CONFIG_SCHEMA.items() if spec.required
     }
 
     def __init__(
@@ -83,9 +80,11 @@ class ManuscriptValidator:
         manuscript_path: Path,
         skip_enhanced: bool = False,
         show_stats: bool = False,
+        output_dir: Optional[str] = None,
     ):
         """Initialize validator with manuscript directory path."""
         self.manuscript_path = Path(manuscript_path)
+        self.output_dir = output_dir
         self.errors: list[str] = []
         self.warnings: list[str] = []
         self.info_messages: list[str] = []
@@ -153,36 +152,24 @@ class ManuscriptValidator:
         return all_dirs_present
 
     def validate_config_file(self) -> bool:
-        """Validate the configuration YAML file."""
-        config_path = self.manuscript_path / "00_CONFIG.yml"
+        """Validate the configuration YAML file against the config schema."""
+        config_path = self.manuscript_path / CONFIG_FILENAME
         if not config_path.exists():
             # This error is already caught in validate_required_files
             return False
 
         try:
-            with open(config_path, encoding="utf-8") as f:
-                config = yaml.safe_load(f)
-        except yaml.YAMLError as e:
+            config = load_config(config_path, self.output_dir)
+        except ConfigError as e:
             self.errors.append(f"Invalid YAML in config file: {e}")
             return False
         except Exception as e:
             self.errors.append(f"Error reading config file: {e}")
             return False
 
-        if not isinstance(config, dict):
-            self.errors.append("Config file must contain a YAML dictionary")
-            return False
-
-        # Check required fields
-        config_valid = True
-        for field, description in self.REQUIRED_CONFIG_FIELDS.items():
-            if field not in config:
-                self.errors.append(
-                    f"Missing required config field: {field} ({description})"
-                )
-                config_valid = False
-            elif not config[field]:
-                self.warnings.append(f"Config field is empty: {field} ({description})")
+        self.errors.extend(config.errors)
+        self.warnings.extend(config.warnings)
+        config_valid = not config.errors
 
         if config_valid:
             logger.info("✓ Configuration file is valid")
@@ -579,6 +566,11 @@ For LaTeX compilation errors after building, check the .log file in output/
         help="Show detailed validation statistics",
     )
 
+    parser.add_argument(
+        "--output-dir",
+        help="Build output directory, where the parsed config is cached",
+    )
+
     parser.add_argument(
         "--detailed",
         action="store_true",
@@ -614,7 +606,10 @@ For LaTeX compilation errors after building, check the .log file in output/
 
     # Validate the manuscript
     validator = ManuscriptValidator(
-        args.manuscript_path, skip_enhanced=args.basic_only, show_stats=args.show_stats
+        args.manuscript_path,
+        skip_enhanced=args.basic_only,
+        show_stats=args.show_stats,
+        output_dir=args.output_dir,
     )
     validation_passed = validator.validate()
     validator.print_summary()
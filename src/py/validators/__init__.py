@@ -2,20 +2,41 @@
 
 This package provides comprehensive validation for markdown manuscripts,
 YAML configuration, and LaTeX compilation errors.
+
+Validators are imported on first access (PEP 562), so importing the package
+to build a command line parser does not load any of them.
 """
 
-from .base_validator import (
-    BaseValidator,
-    ValidationError,
-    ValidationLevel,
-    ValidationResult,
-)
-from .citation_validator import CitationValidator
-from .figure_validator import FigureValidator
-from .latex_error_parser import LaTeXErrorParser
-from .math_validator import MathValidator
-from .reference_validator import ReferenceValidator
-from .syntax_validator import SyntaxValidator
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base_validator import (
+        BaseValidator,
+        ValidationError,
+        ValidationLevel,
+        ValidationResult,
+    )
+    from .citation_validator import CitationValidator
+    from .figure_validator import FigureValidator
+    from .latex_error_parser import LaTeXErrorParser
+    from .math_validator import MathValidator
+    from .reference_validator import ReferenceValidator
+    from .syntax_validator import SyntaxValidator
+
+# Submodule defining each exported name
+_EXPORTS = {
+    "BaseValidator": ".base_validator",
+    "ValidationResult": ".base_validator",
+    "ValidationError": ".base_validator",
+    "ValidationLevel": ".base_validator",
+    "LaTeXErrorParser": ".latex_error_parser",
+    "CitationValidator": ".citation_validator",
+    "ReferenceValidator": ".reference_validator",
+    "FigureValidator": ".figure_validator",
+    "MathValidator": ".math_validator",
+    "SyntaxValidator": ".syntax_validator",
+}
 
 __all__ = [
     "BaseValidator",
@@ -29,3 +50,16 @@ __all__ = [
     "MathValidator",
     "SyntaxValidator",
 ]
+
+
+def __getattr__(name):
+    """Import the submodule defining ``name`` on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
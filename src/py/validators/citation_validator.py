@@ -6,6 +6,16 @@ from typing import Any
 
 from .base_validator import BaseValidator, ValidationLevel, ValidationResult
 
+try:
+    from ..converters.citation_processor import (
+        process_citations_outside_tables_with_keys,
+    )
+except ImportError:
+    # Imported as the top-level validators package, with src/py on the path
+    from converters.citation_processor import (
+        process_citations_outside_tables_with_keys,
+    )
+
 
 class CitationValidator(BaseValidator):
     """Validates citation syntax and checks against bibliography."""
@@ -118,6 +128,13 @@ class CitationValidator(BaseValidator):
             )
             return errors
 
+        # The keys the converter cites, collected in the same pass that
+        # converts them; the scan below only locates them for line numbers
+        _, cited_keys = process_citations_outside_tables_with_keys(content, {})
+        if not cited_keys:
+            return errors
+        cited = set(cited_keys)
+
         lines = content.split("\n")
 
         for line_num, line in enumerate(lines, 1):
@@ -125,15 +142,17 @@ class CitationValidator(BaseValidator):
             if self.CITATION_PATTERNS["protected_citation"].search(line):
                 continue
 
-            line_errors = self._validate_line_citations(line, file_path, line_num)
+            line_errors = self._validate_line_citations(
+                line, file_path, line_num, cited
+            )
             errors.extend(line_errors)
 
         return errors
 
     def _validate_line_citations(
-        self, line: str, file_path: str, line_num: int
+        self, line: str, file_path: str, line_num: int, cited: set[str]
     ) -> list:
-        """Validate citations in a single line."""
+        """Validate the citations of ``cited`` found in a single line."""
         errors = []
 
         # Check bracketed citations: [@key1;@key2]
@@ -142,7 +161,7 @@ class CitationValidator(BaseValidator):
             citations = [c.strip() for c in citation_group.split(";")]
 
             for citation in citations:
-                if citation.startswith("@"):
+                if citation.startswith("@") and citation[1:] in cited:
                     key = citation[1:]  # Remove @ prefix
                     cite_errors = self._validate_citation_key(
                         key, file_path, line_num, match.start(), line
@@ -152,6 +171,8 @@ class CitationValidator(BaseValidator):
         # Check single citations: @key (but not @fig:, @eq:, etc.)
         for match in self.CITATION_PATTERNS["single_citation"].finditer(line):
             key = match.group(1)
+            if key not in cited:
+                continue
             cite_errors = self._validate_citation_key(
                 key, file_path, line_num, match.start(), line
             )
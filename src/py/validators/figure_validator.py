@@ -1,5 +1,6 @@
 """Figure validator for checking figure syntax, attributes, and file existence."""
 
+import json
 import os
 import re
 from typing import Any
@@ -38,6 +39,10 @@ class FigureValidator(BaseValidator):
     # Valid file extensions for figures
     VALID_EXTENSIONS = {".png", ".jpg", ".jpeg", ".pdf", ".svg", ".eps", ".py", ".mmd"}
 
+    # Manifest of the files generated by each figure source, relative to the
+    # FIGURES directory (written by processors/figure_outputs.py)
+    FIGURE_OUTPUTS_MANIFEST = os.path.join(".cache", "figure_outputs.json")
+
     # Valid width formats
     WIDTH_PATTERNS = {
         "percentage": re.compile(r"^\d+(\.\d+)?%$"),  # 80%
@@ -56,6 +61,7 @@ class FigureValidator(BaseValidator):
         self.figures_dir = os.path.join(manuscript_path, "FIGURES")
         self.found_figures: list[dict] = []
         self.available_files: set[str] = set()
+        self.generated_outputs: dict[str, list[str]] = {}
 
     def validate(self) -> ValidationResult:
         """Validate figures in manuscript files."""
@@ -88,6 +94,7 @@ class FigureValidator(BaseValidator):
 
         # Scan available figure files
         self.available_files = self._scan_available_files()
+        self.generated_outputs = self._load_generated_outputs()
         metadata["available_files"] = len(self.available_files)
 
         # Process manuscript files
@@ -116,7 +123,11 @@ class FigureValidator(BaseValidator):
         available = set()
 
         try:
-            for root, _, files in os.walk(self.figures_dir):
+            for root, dirs, files in os.walk(self.figures_dir):
+                # Skip caches such as .cache/ and __pycache__/
+                dirs[:] = [
+                    d for d in dirs if not d.startswith(".") and d != "__pycache__"
+                ]
                 for file in files:
                     # Skip hidden files and temporary files
                     if file.startswith(".") or file.startswith("~"):
@@ -132,6 +143,20 @@ class FigureValidator(BaseValidator):
 
         return available
 
+    def _load_generated_outputs(self) -> dict[str, list[str]]:
+        """Load the files recorded for each figure source by the generator."""
+        manifest_path = os.path.join(self.figures_dir, self.FIGURE_OUTPUTS_MANIFEST)
+        try:
+            with open(manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        return {
+            source: entry.get("outputs", [])
+            for source, entry in manifest.get("figures", {}).items()
+        }
+
     def _validate_file_figures(self, file_path: str, file_type: str) -> list:
         """Validate figures in a specific file."""
         errors = []
@@ -476,6 +501,10 @@ class FigureValidator(BaseValidator):
 
     def _get_expected_outputs(self, source_file: str) -> list[str]:
         """Get expected output files for source files (.py, .mmd)."""
+        # Files the generator recorded for the source are its outputs
+        if source_file in self.generated_outputs:
+            return self.generated_outputs[source_file]
+
         base_name = os.path.splitext(source_file)[0]
         ext = os.path.splitext(source_file)[1].lower()
 
@@ -528,6 +557,8 @@ class FigureValidator(BaseValidator):
 
         # Add pipeline files to referenced files
         referenced_files.update(pipeline_files)
+        for outputs in self.generated_outputs.values():
+            referenced_files.update(outputs)
 
         # Find unused files (excluding data files, hidden files, and pipeline files)
         unused_files = []
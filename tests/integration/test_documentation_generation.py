@@ -40,7 +40,7 @@ def test_full_documentation_generation():
 
         # Copy a small subset of files for testing
         sample_files = [
-            "utils.py",
+            "cli.py",
             "commands/generate_docs.py",
             "processors/yaml_processor.py",
         ]
@@ -74,13 +74,13 @@ def test_full_documentation_generation():
             successful_modules = []
 
             # Test generating docs for a single module
-            test_file = temp_src / "utils.py"
+            test_file = temp_src / "cli.py"
             result = generate_module_docs(docs_dir, test_file)
 
             if result:
                 # If lazydocs works, add to successful list
-                successful_modules.append(Path("utils.py"))
-                print(f"Generated docs for utils.py: {result}")
+                successful_modules.append(Path("cli.py"))
+                print(f"Generated docs for cli.py: {result}")
 
             # Generate enhanced index with our successful modules
             if successful_modules:
@@ -97,7 +97,7 @@ def test_full_documentation_generation():
                 with open(index_path) as f:
                     content = f.read()
                     assert "# API Documentation" in content
-                    assert "utils.py.md" in content
+                    assert "cli.py.md" in content
             else:
                 pytest.skip(
                     "No documentation generated - lazydocs may not be working correctly"
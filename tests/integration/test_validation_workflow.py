@@ -24,6 +24,9 @@ class TestValidationWorkflow:
         self.figures_dir = os.path.join(self.manuscript_dir, "FIGURES")
         os.makedirs(self.figures_dir)
 
+        # Keep build output, such as the config cache, out of the project
+        self.output_dir = os.path.join(self.temp_dir, "output")
+
     def teardown_method(self):
         """Clean up test fixtures after each test method."""
         shutil.rmtree(self.temp_dir, ignore_errors=True)
@@ -166,7 +169,12 @@ Reference to undefined figure @fig:nonexistent.
 
         # Run make validate
         result = subprocess.run(
-            ["make", "validate", f"MANUSCRIPT_PATH={self.manuscript_dir}"],
+            [
+                "make",
+                "validate",
+                f"MANUSCRIPT_PATH={self.manuscript_dir}",
+                f"OUTPUT_DIR={self.output_dir}",
+            ],
             cwd=project_root,
             capture_output=True,
             text=True,
@@ -184,7 +192,12 @@ Reference to undefined figure @fig:nonexistent.
 
         # Run make validate
         result = subprocess.run(
-            ["make", "validate", f"MANUSCRIPT_PATH={self.manuscript_dir}"],
+            [
+                "make",
+                "validate",
+                f"MANUSCRIPT_PATH={self.manuscript_dir}",
+                f"OUTPUT_DIR={self.output_dir}",
+            ],
             cwd=project_root,
             capture_output=True,
             text=True,
@@ -233,7 +246,12 @@ Reference to undefined figure @fig:nonexistent.
 
         # Try to run make pdf - should fail due to validation errors
         result = subprocess.run(
-            ["make", "pdf", f"MANUSCRIPT_PATH={self.manuscript_dir}"],
+            [
+                "make",
+                "pdf",
+                f"MANUSCRIPT_PATH={self.manuscript_dir}",
+                f"OUTPUT_DIR={self.output_dir}",
+            ],
             cwd=project_root,
             capture_output=True,
             text=True,
@@ -251,7 +269,12 @@ Reference to undefined figure @fig:nonexistent.
 
         # Run validation first
         validation_result = subprocess.run(
-            ["make", "validate", f"MANUSCRIPT_PATH={self.manuscript_dir}"],
+            [
+                "make",
+                "validate",
+                f"MANUSCRIPT_PATH={self.manuscript_dir}",
+                f"OUTPUT_DIR={self.output_dir}",
+            ],
             cwd=project_root,
             capture_output=True,
             text=True,
@@ -0,0 +1 @@
+"""Performance and complexity regression tests for Rxiv-Maker."""
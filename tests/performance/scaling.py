@@ -0,0 +1,114 @@
+"""Empirical complexity measurement helpers for converter scaling tests.
+
+Each converter is run on inputs of size n, 2n, 4n and 8n. The growth
+exponent is the least-squares slope of log(time) against log(size), so a
+linear converter measures close to 1.0 and a quadratic one close to 2.0.
+Tests declare the bound a converter must stay within; the tolerance absorbs
+timing noise without letting a linear path silently turn quadratic.
+"""
+
+import gc
+import math
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+# Expected growth exponent for each declared complexity class
+COMPLEXITY_EXPONENTS = {
+    "O(n)": 1.0,
+    "O(n log n)": 1.15,
+    "O(n^2)": 2.0,
+}
+
+DEFAULT_FACTORS = (1, 2, 4, 8)
+DEFAULT_TOLERANCE = 0.35
+
+
+@dataclass
+class ScalingResult:
+    """Timings of one converter over increasing input sizes."""
+
+    name: str
+    sizes: list[int]
+    timings: list[float]
+
+    @property
+    def exponent(self) -> float:
+        """Least-squares growth exponent of time with respect to size."""
+        log_sizes = [math.log(size) for size in self.sizes]
+        log_times = [math.log(max(timing, 1e-9)) for timing in self.timings]
+        mean_size = sum(log_sizes) / len(log_sizes)
+        mean_time = sum(log_times) / len(log_times)
+        covariance = sum(
+            (s - mean_size) * (t - mean_time) for s, t in zip(log_sizes, log_times)
+        )
+        variance = sum((s - mean_size) ** 2 for s in log_sizes)
+        return covariance / variance
+
+    def describe(self) -> str:
+        """Human-readable summary used in assertion messages."""
+        points = ", ".join(
+            f"n={size}: {timing * 1000:.2f} ms"
+            for size, timing in zip(self.sizes, self.timings)
+        )
+        return f"{self.name}: exponent {self.exponent:.2f} ({points})"
+
+
+def measure_scaling(
+    name: str,
+    make_input: Callable[[int], Any],
+    run: Callable[[Any], Any],
+    base_size: int,
+    factors: tuple[int, ...] = DEFAULT_FACTORS,
+    repeat: int = 3,
+) -> ScalingResult:
+    """Time ``run`` on inputs built by ``make_input`` at increasing sizes.
+
+    Args:
+        name: Converter name used in reports
+        make_input: Builds the converter input for a given size
+        run: Runs the converter on a prepared input
+        base_size: Size n of the smallest input
+        factors: Multipliers applied to ``base_size``
+        repeat: Timed runs per size; the fastest run is kept
+
+    Returns:
+        ScalingResult with the best timing at each size
+    """
+    sizes = [base_size * factor for factor in factors]
+    timings = []
+    for size in sizes:
+        best = float("inf")
+        for _ in range(repeat):
+            # Inputs may be mutated by the converter, so rebuild for every run
+            data = make_input(size)
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                start = time.perf_counter()
+                run(data)
+                best = min(best, time.perf_counter() - start)
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+        timings.append(best)
+    return ScalingResult(name, sizes, timings)
+
+
+def assert_within_complexity(
+    result: ScalingResult, bound: str, tolerance: float = DEFAULT_TOLERANCE
+) -> None:
+    """Fail if the measured growth exceeds the declared complexity bound.
+
+    Args:
+        result: Measured scaling of a converter
+        bound: Declared complexity class, a key of COMPLEXITY_EXPONENTS
+        tolerance: Allowed excess over the declared exponent
+
+    Raises:
+        AssertionError: If the measured exponent exceeds the bound
+    """
+    limit = COMPLEXITY_EXPONENTS[bound] + tolerance
+    assert result.exponent <= limit, (
+        f"{result.describe()} exceeds declared bound {bound} (limit {limit:.2f})"
+    )
@@ -0,0 +1,46 @@
+"""Complexity regression tests for the author information processor."""
+
+import pytest
+
+from src.py.processors import author_processor
+from src.py.processors.author_processor import generate_authors_and_affiliations
+
+from .scaling import assert_within_complexity, measure_scaling
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+
+def _consortium_metadata(n: int) -> dict:
+    """Metadata with ``n`` authors sharing ``n // 2`` affiliations."""
+    affiliations = [
+        {"shortname": f"A{i}", "full_name": f"Institute {i}", "location": "City"}
+        for i in range(max(n // 2, 1))
+    ]
+    authors = [
+        {
+            "name": f"Author {i} Name",
+            "affiliations": [f"A{i // 2}", f"A{(i * 7) % len(affiliations)}"],
+            "corresponding_author": i % 50 == 0,
+            "orcid": f"0000-0000-0000-{i:04d}",
+        }
+        for i in range(n)
+    ]
+    return {"authors": authors, "affiliations": affiliations}
+
+
+class TestAuthorScaling:
+    """Declared complexity bounds for author rendering."""
+
+    def test_authors_and_affiliations_are_linear(self):
+        def render(metadata):
+            # Measure building the model, not the cache lookup
+            author_processor._author_models.clear()
+            return generate_authors_and_affiliations(metadata)
+
+        result = measure_scaling(
+            "generate_authors_and_affiliations",
+            _consortium_metadata,
+            render,
+            base_size=250,
+        )
+        assert_within_complexity(result, "O(n)")
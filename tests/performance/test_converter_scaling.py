@@ -0,0 +1,199 @@
+"""Complexity regression tests for the markdown to LaTeX converters.
+
+Each test runs one converter on inputs of size n, 2n, 4n and 8n and fails if
+the measured growth exceeds the declared bound. Paths that are currently
+known to be superlinear are declared as O(n^2) so that they cannot get any
+worse; their bound is tightened once they are fixed.
+"""
+
+import itertools
+
+import pytest
+
+from src.py.converters.citation_processor import (
+    convert_citations_to_latex,
+    process_citations_outside_tables,
+)
+from src.py.converters.code_processor import (
+    protect_code_content,
+    restore_protected_code,
+)
+from src.py.converters.data_table_processor import render_data_table
+from src.py.converters.math_processor import (
+    protect_math_expressions,
+    restore_math_expressions,
+)
+from src.py.converters.md2tex import (
+    _process_tables_with_protection,
+    _protect_backtick_content,
+    _protect_markdown_tables,
+    convert_markdown_to_latex,
+    extract_content_sections,
+)
+from src.py.converters.table_processor import convert_tables_to_latex
+from src.py.converters.word_counter import count_markdown_words
+
+from .scaling import assert_within_complexity, measure_scaling
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+
+def _document_with_tables(n: int) -> str:
+    """Markdown with ``n`` small tables, each surrounded by cited prose."""
+    blocks = []
+    for i in range(n):
+        blocks.append(
+            f"Paragraph {i} cites @key{i} and [@a{i};@b{i}] with `code_{i}`.\n\n"
+            f"| **Name** | **Value** |\n"
+            f"|----------|-----------|\n"
+            f"| `x{i}` | @ref{i} |\n\n"
+            f"{{#table:t{i}}} **Caption {i}.** Table description.\n"
+        )
+    return "\n".join(blocks)
+
+
+def _prose_with_citations(n: int) -> str:
+    return " ".join(f"Sentence {i} cites @key{i} and [@a{i};@b{i}]." for i in range(n))
+
+
+def _table_with_rows(n: int) -> str:
+    rows = "\n".join(f"| `cell_{i}` | value {i} | @ref{i} |" for i in range(n))
+    return f"| **A** | **B** | **C** |\n|---|---|---|\n{rows}\n"
+
+
+def _mixed_backtick_lines(n: int) -> str:
+    lines = []
+    for i in range(n):
+        if i % 2:
+            lines.append(f"| `c{i}` | `d{i}` |")
+        else:
+            lines.append(f"Paragraph with `e{i}` inline code.")
+    return "\n".join(lines)
+
+
+def _document_with_sections(n: int) -> str:
+    sections = ["# Title", ""]
+    for i in range(n):
+        sections.append(f"## Section {i}")
+        sections.append(
+            f"Text with **bold**, *italic*, $x_{i}$, @key{i} and `code_{i}`.\n"
+        )
+    return "\n".join(sections)
+
+
+class TestConverterScaling:
+    """Declared complexity bounds for the converter pipeline."""
+
+    def test_citation_conversion_is_linear(self):
+        result = measure_scaling(
+            "convert_citations_to_latex",
+            _prose_with_citations,
+            convert_citations_to_latex,
+            base_size=1000,
+        )
+        assert_within_complexity(result, "O(n)")
+
+    def test_citations_outside_tables(self):
+        result = measure_scaling(
+            "process_citations_outside_tables",
+            lambda n: _protect_markdown_tables(_document_with_tables(n)),
+            lambda args: process_citations_outside_tables(*args),
+            base_size=100,
+        )
+        assert_within_complexity(result, "O(n)")
+
+    def test_table_protection_backtick_restore(self):
+        result = measure_scaling(
+            "_process_tables_with_protection",
+            lambda n: _protect_backtick_content(_mixed_backtick_lines(n)),
+            lambda args: _process_tables_with_protection(
+                args[0], args[1], {}, {}, False
+            ),
+            base_size=100,
+        )
+        assert_within_complexity(result, "O(n)")
+
+    def test_large_table_rows(self):
+        result = measure_scaling(
+            "convert_tables_to_latex",
+            lambda n: _protect_backtick_content(_table_with_rows(n)),
+            lambda args: convert_tables_to_latex(args[0], args[1]),
+            base_size=100,
+        )
+        assert_within_complexity(result, "O(n)")
+
+    def test_data_table_rendering(self, tmp_path):
+        counter = itertools.count()
+
+        def make_manuscript(n):
+            # A fresh directory per run so the rendering cache never hits
+            manuscript_dir = tmp_path / f"m{next(counter)}"
+            (manuscript_dir / "TABLES").mkdir(parents=True)
+            rows = "\n".join(f"item_{i},{i},50% of @ref{i}" for i in range(n))
+            (manuscript_dir / "TABLES" / "data.csv").write_text(
+                f"name,value,note\n{rows}\n", encoding="utf-8"
+            )
+            return str(manuscript_dir)
+
+        result = measure_scaling(
+            "render_data_table",
+            make_manuscript,
+            lambda path: render_data_table(
+                {"src": "TABLES/data.csv", "chunk-rows": "500"},
+                manuscript_path=path,
+            ),
+            base_size=500,
+        )
+        assert_within_complexity(result, "O(n)")
+
+    def test_math_placeholder_restore(self):
+        result = measure_scaling(
+            "restore_math_expressions",
+            lambda n: protect_math_expressions(
+                " ".join(f"text $x_{i}$ more" for i in range(n))
+            ),
+            lambda args: restore_math_expressions(*args),
+            base_size=200,
+        )
+        assert_within_complexity(result, "O(n^2)")
+
+    def test_code_placeholder_restore(self):
+        result = measure_scaling(
+            "restore_protected_code",
+            lambda n: protect_code_content(
+                "\n\n".join(
+                    f"\\begin{{verbatim}}\nline {i}\n\\end{{verbatim}}"
+                    for i in range(n)
+                )
+            ),
+            lambda args: restore_protected_code(*args),
+            base_size=400,
+        )
+        assert_within_complexity(result, "O(n^2)")
+
+    def test_extract_content_sections(self):
+        result = measure_scaling(
+            "extract_content_sections",
+            _document_with_sections,
+            extract_content_sections,
+            base_size=25,
+        )
+        assert_within_complexity(result, "O(n)")
+
+    def test_full_conversion_with_tables(self):
+        result = measure_scaling(
+            "convert_markdown_to_latex",
+            _document_with_tables,
+            convert_markdown_to_latex,
+            base_size=25,
+        )
+        assert_within_complexity(result, "O(n)")
+
+    def test_markdown_word_count(self):
+        result = measure_scaling(
+            "count_markdown_words",
+            _document_with_tables,
+            count_markdown_words,
+            base_size=100,
+        )
+        assert_within_complexity(result, "O(n)")
@@ -0,0 +1,75 @@
+"""Start-up budget of the rxiv command line entry point.
+
+Runs ``rxiv validate --help`` under ``python -X importtime`` and checks that
+showing a command's help neither imports the heavy dependencies of the build
+nor spends more than the import budget.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+CLI = Path(__file__).parent.parent.parent / "src" / "py" / "cli.py"
+
+# Total import time allowed for showing the help of a command
+IMPORT_BUDGET_US = 100_000
+
+# Modules only needed once a command actually runs
+HEAVY_MODULES = [
+    "numpy",
+    "matplotlib",
+    "pandas",
+    "yaml",
+    "dotenv",
+    "converters.md2tex",
+    "processors.template_processor",
+    "validators.citation_validator",
+    "commands.generate_preprint",
+    "commands.generate_figures",
+]
+
+
+def _import_times(args, cwd):
+    """Cumulative import time in microseconds of each top-level import."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", str(CLI), *args],
+        capture_output=True,
+        text=True,
+        cwd=cwd,
+    )
+    assert result.returncode == 0, result.stderr
+
+    imported = {}
+    top_level = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        imported[name.strip()] = int(cumulative)
+        # Nested imports are indented below the module importing them
+        if not name[1:].startswith(" "):
+            top_level[name.strip()] = int(cumulative)
+    return imported, top_level
+
+
+def test_help_imports_no_command(tmp_path):
+    imported, _ = _import_times(["--help"], tmp_path)
+    assert not [name for name in imported if name.startswith("commands")]
+
+
+def test_validate_help_skips_heavy_imports(tmp_path):
+    imported, _ = _import_times(["validate", "--help"], tmp_path)
+    assert "commands.validate" in imported
+    assert [name for name in HEAVY_MODULES if name in imported] == []
+
+
+def test_validate_help_import_budget(tmp_path):
+    _, top_level = _import_times(["validate", "--help"], tmp_path)
+    total = sum(top_level.values())
+    assert total < IMPORT_BUDGET_US, sorted(
+        top_level.items(), key=lambda item: item[1], reverse=True
+    )[:10]
@@ -1,6 +1,11 @@
 """Unit tests for the author_processor module."""
 
+from concurrent.futures import ThreadPoolExecutor
+
+from src.py.processors import author_processor
 from src.py.processors.author_processor import (
+    AUTHOR_MODEL_CACHE_SIZE,
+    build_author_model,
     generate_authors_and_affiliations,
     generate_corresponding_authors,
     generate_extended_author_info,
@@ -100,3 +105,63 @@ class TestAuthorProcessor:
         result = generate_authors_and_affiliations(yaml_metadata)
         # Should handle special characters appropriately for LaTeX
         assert result is not None
+
+
+class TestAuthorModel:
+    """Test the shared author model behind the three author blocks."""
+
+    def test_affiliations_numbered_by_first_appearance(self):
+        """Test numbering, sorting and the first matching affiliation."""
+        yaml_metadata = {
+            "authors": [
+                {"name": "A One", "affiliations": ["Y", "X"]},
+                {"name": "B Two", "affiliations": ["Z", "X"], "co_first_author": True},
+                "Plain Author",
+            ],
+            "affiliations": [
+                {"shortname": "X", "full_name": "Xen", "location": "Lisbon"},
+                {"shortname": "X", "full_name": "Duplicate"},
+                {"shortname": "Y", "full_name": "Yale"},
+            ],
+        }
+        model = build_author_model(yaml_metadata)
+        assert model.affiliations == ("Yale", "Xen, Lisbon", "Z")
+        assert [a.affiliation_numbers for a in model.authors] == [(1, 2), (2, 3), ()]
+
+        result = generate_authors_and_affiliations(yaml_metadata)
+        assert "\\author[1,2]{A One}" in result
+        assert "\\author[2,3,*]{B Two}" in result
+        assert "\\author[1]{Plain Author}" in result
+        assert "\\affil[3]{Z}" in result
+        assert result.endswith("\\affil[*]{Equally contributed authors}")
+
+    def test_model_cached_by_author_sections(self):
+        """Test that the model is built once per authors section."""
+        yaml_metadata = {"authors": [{"name": "A One", "corresponding_author": True}]}
+        model = build_author_model(yaml_metadata)
+        assert build_author_model({**yaml_metadata, "title": "Other"}) is model
+
+        yaml_metadata["authors"][0]["email"] = "a@b.org"
+        assert build_author_model(yaml_metadata) is not model
+        assert "(A. One) a\\at b.org" in generate_corresponding_authors(yaml_metadata)
+
+    def test_model_cache_is_bounded(self):
+        """Test that only the most recently used models are kept."""
+        first = {"authors": ["First Author"]}
+        model = build_author_model(first)
+        for i in range(AUTHOR_MODEL_CACHE_SIZE):
+            build_author_model({"authors": [f"Author {i}"]})
+            build_author_model(first)
+
+        assert len(author_processor._author_models) == AUTHOR_MODEL_CACHE_SIZE
+        assert build_author_model(first) is model
+
+    def test_model_cache_is_thread_safe(self):
+        """Test that concurrent builds keep the cache consistent."""
+        metadata = [
+            {"authors": [f"Author {i}"]} for i in range(2 * AUTHOR_MODEL_CACHE_SIZE)
+        ]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(build_author_model, metadata * 20))
+
+        assert len(author_processor._author_models) == AUTHOR_MODEL_CACHE_SIZE
@@ -0,0 +1,97 @@
+"""Unit tests for in-memory manuscript builds."""
+
+from pathlib import Path
+
+import pytest
+
+from src.py.processors.build import Manuscript, build_manuscript
+from src.py.processors.template_processor import NO_SUPPLEMENTARY_TEX
+
+TEMPLATE = "<PY-RPL:LONG-TITLE-STR><PY-RPL:ABSTRACT>\n<PY-RPL:MAIN-CONTENT>"
+
+CONFIG = """title:
+  - long: "In Memory"
+authors:
+  - name: "Jane Doe"
+date: "2025-01-01"
+keywords: ["memory"]
+"""
+
+MAIN = """## Abstract
+
+A short abstract.
+
+## Introduction
+
+Text with **bold** words.
+"""
+
+DATA_TABLE_MAIN = """## Introduction
+
+<data-table src="TABLES/data.csv" />
+"""
+
+
+@pytest.fixture
+def elsewhere(temp_dir, monkeypatch):
+    """Run from an unrelated directory with MANUSCRIPT_PATH pointing nowhere."""
+    monkeypatch.chdir(temp_dir)
+    monkeypatch.setenv("MANUSCRIPT_PATH", "does-not-exist")
+    return temp_dir
+
+
+class TestInMemoryBuild:
+    """Test building manuscripts given as strings."""
+
+    def test_build_from_sources(self, elsewhere):
+        manuscript = Manuscript.from_sources(MAIN, CONFIG)
+        result = build_manuscript(manuscript, TEMPLATE)
+        assert result.tex.startswith("\\title{In Memory}\nA short abstract.")
+        assert "\\textbf{bold}" in result.tex
+        assert result.supplementary_tex == NO_SUPPLEMENTARY_TEX
+        assert result.word_counts["abstract"].words == 3
+        assert result.diagnostics == []
+        assert list(elsewhere.iterdir()) == []
+
+    def test_front_matter_and_diagnostics(self, elsewhere):
+        manuscript = Manuscript.from_sources('---\ntitle: "Front"\n---\n' + MAIN)
+        assert manuscript.metadata == {"title": "Front"}
+        assert len(build_manuscript(manuscript, TEMPLATE).diagnostics) == 3
+
+    def test_supplementary(self, elsewhere):
+        supplementary = "## Supplementary Notes\n\n### A note\n\nSome text.\n"
+        manuscript = Manuscript.from_sources(MAIN, CONFIG, supplementary)
+        result = build_manuscript(manuscript, TEMPLATE)
+        assert "Supp. Note" in result.supplementary_tex
+        assert "In Memory" in result.supplementary_tex
+
+    def test_data_tables_read_from_directory(self, elsewhere):
+        manuscript_dir = elsewhere / "paper"
+        (manuscript_dir / "TABLES").mkdir(parents=True)
+        (manuscript_dir / "TABLES" / "data.csv").write_text("a,b\nx_1,2\n")
+
+        with pytest.raises(ValueError, match="no directory"):
+            build_manuscript(Manuscript.from_sources(DATA_TABLE_MAIN, CONFIG))
+
+        manuscript = Manuscript.from_sources(
+            DATA_TABLE_MAIN, CONFIG, directory=manuscript_dir
+        )
+        assert "x\\_1" in build_manuscript(manuscript, TEMPLATE).tex
+
+
+class TestDirectoryBuild:
+    """Test building manuscripts read from an explicit directory."""
+
+    def test_matches_files_of_directory(self, elsewhere):
+        manuscript_dir = elsewhere / "paper"
+        manuscript_dir.mkdir()
+        (manuscript_dir / "00_CONFIG.yml").write_text(CONFIG)
+        (manuscript_dir / "01_MAIN.md").write_text(MAIN)
+
+        manuscript = Manuscript.from_directory(manuscript_dir)
+        assert manuscript.name == "paper"
+        assert manuscript.directory == Path(manuscript_dir)
+        assert manuscript.supplementary is None
+        result = build_manuscript(manuscript, TEMPLATE)
+        expected = build_manuscript(Manuscript.from_sources(MAIN, CONFIG), TEMPLATE)
+        assert result.tex == expected.tex
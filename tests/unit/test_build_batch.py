@@ -0,0 +1,148 @@
+"""Unit tests for batch builds of many manuscripts."""
+
+import json
+import threading
+import time
+
+import pytest
+
+from src.py.commands.build_batch import (
+    BatchError,
+    BatchJob,
+    ContentStore,
+    StageScheduler,
+    create_jobs,
+    find_manuscripts,
+    run_batch,
+)
+
+CONFIG = """title:
+  - long: "Batch"
+authors:
+  - name: "Jane Doe"
+date: "2025-01-01"
+keywords: ["batch"]
+"""
+
+MAIN = """## Abstract
+
+A short abstract.
+
+## Introduction
+
+Text with **bold** words.
+"""
+
+BIB = "@article{doe2025, title={Shared}, year={2025}}\n"
+
+
+def make_manuscript(directory, figure=b"shared figure"):
+    """Write a small manuscript with a bibliography and a figure."""
+    (directory / "FIGURES" / "Figure_1").mkdir(parents=True)
+    (directory / "00_CONFIG.yml").write_text(CONFIG)
+    (directory / "01_MAIN.md").write_text(MAIN)
+    (directory / "03_REFERENCES.bib").write_text(BIB)
+    (directory / "FIGURES" / "Figure_1" / "Figure_1.png").write_bytes(figure)
+    return directory
+
+
+class TestStageScheduler:
+    """Test scheduling stages on the shared pool."""
+
+    def test_stage_limits(self, temp_dir):
+        jobs = create_jobs([temp_dir / str(i) for i in range(6)], temp_dir)
+        lock = threading.Lock()
+        running = {"fast": 0, "slow": 0}
+        peak = {"fast": 0, "slow": 0}
+
+        def stage(name):
+            def run(job):
+                with lock:
+                    running[name] += 1
+                    peak[name] = max(peak[name], running[name])
+                time.sleep(0.02)
+                with lock:
+                    running[name] -= 1
+
+            return run
+
+        stages = {"fast": stage("fast"), "slow": stage("slow")}
+        StageScheduler(stages, max_workers=4, limits={"slow": 1}).run(jobs)
+
+        assert peak["slow"] == 1
+        assert peak["fast"] > 1
+        assert all(job.status == "ok" for job in jobs)
+        assert all(list(job.stages) == ["fast", "slow"] for job in jobs)
+
+    def test_failed_stage_skips_the_rest(self, temp_dir):
+        jobs = [BatchJob(temp_dir, "a", temp_dir), BatchJob(temp_dir, "b", temp_dir)]
+
+        def fail_a(job):
+            if job.name == "a":
+                raise BatchError("broken")
+
+        stages = {"first": fail_a, "second": lambda job: {"ran": True}}
+        StageScheduler(stages, max_workers=2).run(jobs)
+
+        assert jobs[0].stages["first"].error == "broken"
+        assert jobs[0].stages["second"].status == "skipped"
+        assert jobs[1].stages["second"].details == {"ran": True}
+        assert [job.status for job in jobs] == ["failed", "ok"]
+
+
+class TestContentStore:
+    """Test storing shared files once."""
+
+    def test_identical_files_are_stored_once(self, temp_dir):
+        for name in ("a.bib", "b.bib"):
+            (temp_dir / name).write_text(BIB)
+        store = ContentStore(temp_dir / "store")
+
+        assert not store.link(temp_dir / "a.bib", temp_dir / "out" / "a.bib")
+        assert store.link(temp_dir / "b.bib", temp_dir / "out" / "b.bib")
+        assert (temp_dir / "out" / "b.bib").read_text() == BIB
+        assert store.stats() == {
+            "files": 2,
+            "unique": 1,
+            "bytes_saved": len(BIB),
+        }
+
+
+class TestRunBatch:
+    """Test building several manuscript directories."""
+
+    def test_find_manuscripts(self, temp_dir):
+        make_manuscript(temp_dir / "paper_a")
+        make_manuscript(temp_dir / "paper_b")
+        (temp_dir / "notes").mkdir()
+
+        found = find_manuscripts([str(temp_dir / "*"), str(temp_dir / "paper_a")])
+        assert [path.name for path in found] == ["paper_a", "paper_b"]
+        with pytest.raises(BatchError, match="No manuscript"):
+            find_manuscripts([str(temp_dir / "notes")])
+
+    def test_converts_and_deduplicates(self, temp_dir):
+        make_manuscript(temp_dir / "paper_a")
+        make_manuscript(temp_dir / "paper_b")
+        make_manuscript(temp_dir / "paper_c", figure=b"other figure")
+        output_root = temp_dir / "out"
+
+        report = run_batch([str(temp_dir / "paper_*")], output_root, skip=["latex"])
+
+        assert report["summary"] == {"manuscripts": 3, "succeeded": 3, "failed": 0}
+        assert json.loads((output_root / "batch_report.json").read_text()) == report
+
+        output = output_root / "paper_b"
+        assert "\\textbf{bold}" in (output / "paper_b.tex").read_text()
+        assert (output / "Supplementary.tex").exists()
+        assert (output / "03_REFERENCES.bib").read_text() == BIB
+        assert (output / "Figures" / "Figure_1" / "Figure_1.png").exists()
+
+        # Style files and the bibliography are shared by all three manuscripts,
+        # the figure by the first two
+        files = report["deduplication"]["files"]
+        assert report["deduplication"]["unique"] == files // 3 + 1
+
+        stages = report["manuscripts"][0]["stages"]
+        assert list(stages) == ["figures", "convert"]
+        assert stages["convert"]["status"] == "ok"
@@ -0,0 +1,126 @@
+"""Unit tests for the cached manuscript config loader."""
+
+import json
+from collections import OrderedDict
+
+import pytest
+
+from src.py.commands.manuscript_config import arxiv_filename
+from src.py.processors import config_loader
+from src.py.processors.config_loader import (
+    CONFIG_CACHE_DIR,
+    CONFIG_CACHE_FILENAME,
+    LOADED_CONFIG_CACHE_SIZE,
+    ConfigError,
+    load_config,
+    validate_config,
+)
+
+CONFIG_YAML = """title:
+  - long: "A Long Title"
+  - short: "Short"
+date: 2025-06-20
+keywords: ["a", "b"]
+authors:
+  - name: "Jane Q. Doe"
+    email64: "amFuZUBleGFtcGxlLm9yZw=="
+"""
+
+
+@pytest.fixture(autouse=True)
+def fresh_memo(monkeypatch):
+    """Start every test without configurations loaded in memory."""
+    monkeypatch.setattr(config_loader, "_loaded_configs", OrderedDict())
+
+
+@pytest.fixture
+def config_file(temp_dir):
+    """A 00_CONFIG.yml with an unquoted date and an encoded email."""
+    path = temp_dir / "00_CONFIG.yml"
+    path.write_text(CONFIG_YAML, encoding="utf-8")
+    return path
+
+
+class TestConfigLoading:
+    """Test parsing, normalization and validation."""
+
+    def test_normalized_metadata(self, config_file):
+        """Test that dates become strings and email64 fields are decoded."""
+        config = load_config(config_file)
+        assert config.metadata["date"] == "2025-06-20"
+        assert config.metadata["authors"] == [
+            {"name": "Jane Q. Doe", "email": "jane@example.org"}
+        ]
+        assert config.errors == []
+        assert config.warnings == []
+
+    def test_schema_problems(self):
+        """Test missing, empty and mistyped fields."""
+        errors, warnings = validate_config(
+            {"title": "T", "authors": [], "date": "2025", "keywords": 3}
+        )
+        assert errors == [
+            "Config field keywords must be list or str, got int "
+            "(Keywords for the manuscript)"
+        ]
+        assert warnings == ["Config field is empty: authors (List of authors)"]
+        errors, _ = validate_config({"title": "T"})
+        assert len(errors) == 3
+
+    def test_invalid_yaml(self, temp_dir):
+        """Test that unparsable and non-mapping files raise ConfigError."""
+        path = temp_dir / "00_CONFIG.yml"
+        path.write_text('title: "unclosed\n', encoding="utf-8")
+        with pytest.raises(ConfigError):
+            load_config(path)
+        path.write_text("- just\n- a list\n", encoding="utf-8")
+        with pytest.raises(ConfigError):
+            load_config(path)
+
+    def test_callers_get_copies(self, config_file):
+        """Test that modifying loaded metadata does not affect later loads."""
+        load_config(config_file).metadata["authors"].append({"name": "Extra"})
+        assert len(load_config(config_file).metadata["authors"]) == 1
+
+    def test_memo_keeps_one_entry_per_file(self, config_file, temp_dir):
+        """Test that edited and other config files do not grow the memo."""
+        load_config(config_file)
+        config_file.write_text(CONFIG_YAML.replace("2025-06-20", "2026-01-01"))
+        assert load_config(config_file).metadata["date"] == "2026-01-01"
+        assert len(config_loader._loaded_configs) == 1
+
+        for i in range(LOADED_CONFIG_CACHE_SIZE):
+            other = temp_dir / f"config_{i}.yml"
+            other.write_text(CONFIG_YAML, encoding="utf-8")
+            load_config(other)
+        assert len(config_loader._loaded_configs) == LOADED_CONFIG_CACHE_SIZE
+        assert str(config_file.resolve()) not in config_loader._loaded_configs
+
+    def test_arxiv_filename(self, config_file):
+        """Test the archive name used by the arxiv Makefile target."""
+        metadata = load_config(config_file).metadata
+        assert arxiv_filename(metadata) == "2025__Doe_et_al__for_arxiv.zip"
+
+
+class TestConfigCache:
+    """Test the JSON cache in the output directory."""
+
+    def test_cache_reused_until_file_changes(self, config_file, temp_dir):
+        """Test that the cached config is used while the file is unchanged."""
+        output_dir = temp_dir / "output"
+        load_config(config_file, str(output_dir))
+        cache_path = output_dir / CONFIG_CACHE_DIR / CONFIG_CACHE_FILENAME
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        assert cached["metadata"]["authors"][0]["email"] == "jane@example.org"
+
+        # Tamper with the cache: a cache hit in a new process returns it
+        cached["metadata"]["title"] = "cached"
+        cache_path.write_text(json.dumps(cached), encoding="utf-8")
+        config_loader._loaded_configs.clear()
+        assert load_config(config_file, str(output_dir)).metadata["title"] == "cached"
+
+        # Changing the file invalidates the cache
+        config_file.write_text(CONFIG_YAML.replace("2025-06-20", "2026-01-01"))
+        config = load_config(config_file, str(output_dir))
+        assert config.metadata["date"] == "2026-01-01"
+        assert config.metadata["title"] != "cached"
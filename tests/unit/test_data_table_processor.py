@@ -0,0 +1,251 @@
+"""Unit tests for data-file backed tables."""
+
+import json
+
+import pytest
+
+from src.py.converters.data_table_processor import (
+    DATA_TABLE_CACHE_DIR,
+    convert_data_tables_to_latex,
+    data_table_fingerprint,
+    parse_data_table_attributes,
+    render_data_table,
+    resolve_data_table_path,
+)
+from src.py.converters.md2tex import convert_markdown_to_latex
+
+
+@pytest.fixture
+def manuscript_dir(temp_dir):
+    """Manuscript directory with a CSV and a TSV data table."""
+    tables_dir = temp_dir / "TABLES"
+    tables_dir.mkdir()
+    rows = "\n".join(f"item_{i},{i * 2},{i}% of @ref{i}" for i in range(5))
+    (tables_dir / "values.csv").write_text(
+        f"name,value,note\n{rows}\n\n", encoding="utf-8"
+    )
+    data_dir = temp_dir / "FIGURES" / "DATA" / "SFigure_1"
+    data_dir.mkdir(parents=True)
+    (data_dir / "values.tsv").write_text("x\ty\n1\t1\n2\t4\n", encoding="utf-8")
+    return temp_dir
+
+
+def _cache_dirs(manuscript_dir):
+    return sorted((manuscript_dir / "FIGURES" / DATA_TABLE_CACHE_DIR).iterdir())
+
+
+class TestDataTableAttributes:
+    """Test data table marker parsing and path resolution."""
+
+    def test_parse_attributes(self):
+        """Test that quoted attributes are parsed."""
+        attributes = parse_data_table_attributes(
+            'src="TABLES/a.csv" longtable=\'true\' chunk-rows="100"'
+        )
+        assert attributes == {
+            "src": "TABLES/a.csv",
+            "longtable": "true",
+            "chunk-rows": "100",
+        }
+
+    def test_missing_src_raises(self):
+        """Test that a marker without src is rejected."""
+        with pytest.raises(ValueError):
+            parse_data_table_attributes('longtable="true"')
+
+    def test_resolve_allowed_directories(self, manuscript_dir):
+        """Test that files under TABLES and FIGURES/DATA are resolved."""
+        path = resolve_data_table_path("TABLES/values.csv", str(manuscript_dir))
+        assert path == manuscript_dir / "TABLES" / "values.csv"
+        path = resolve_data_table_path(
+            "FIGURES/DATA/SFigure_1/values.tsv", str(manuscript_dir)
+        )
+        assert path.name == "values.tsv"
+
+    @pytest.mark.parametrize(
+        "src",
+        ["values.csv", "FIGURES/values.csv", "TABLES/../00_CONFIG.yml", "/tmp/a.csv"],
+    )
+    def test_resolve_rejects_other_locations(self, manuscript_dir, src):
+        """Test that files outside the data directories are rejected."""
+        with pytest.raises(ValueError):
+            resolve_data_table_path(src, str(manuscript_dir))
+
+    def test_resolve_missing_file(self, manuscript_dir):
+        """Test that a missing data file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            resolve_data_table_path("TABLES/missing.csv", str(manuscript_dir))
+
+    def test_fingerprint_follows_data_files(self, manuscript_dir):
+        """Test that the fingerprint changes with the referenced data files."""
+        markdown = 'Text.\n\n<data-table src="TABLES/values.csv"/>\n'
+        before = data_table_fingerprint(markdown, str(manuscript_dir))
+        assert before == data_table_fingerprint(markdown, str(manuscript_dir))
+        assert before != data_table_fingerprint("Text.\n", str(manuscript_dir))
+
+        (manuscript_dir / "TABLES" / "values.csv").write_text("name\nnew\n")
+        assert before != data_table_fingerprint(markdown, str(manuscript_dir))
+
+
+class TestDataTableRendering:
+    """Test rendering of data tables to LaTeX."""
+
+    def test_inline_table(self, manuscript_dir):
+        """Test that rows are formatted like markdown table cells."""
+        result = render_data_table(
+            {"src": "TABLES/values.csv"},
+            "Values.",
+            "table:values",
+            manuscript_path=str(manuscript_dir),
+        )
+        assert "\\begin{table}[ht]" in result
+        assert "name & value & note \\\\" in result
+        assert "item\\_3 & 6 & 3\\% of \\cite{ref3} \\\\" in result
+        assert result.count("\\hline") == 7
+        assert "\\label{table:values}" in result
+
+    def test_tsv_and_column_selection(self, manuscript_dir):
+        """Test TSV input and the columns attribute."""
+        result = render_data_table(
+            {"src": "FIGURES/DATA/SFigure_1/values.tsv", "columns": "y"},
+            manuscript_path=str(manuscript_dir),
+        )
+        assert "\\begin{tabular}{|l|}" in result
+        assert "y \\\\" in result
+        assert "4 \\\\" in result
+
+    def test_unknown_column_raises(self, manuscript_dir):
+        """Test that selecting a missing column is an error."""
+        with pytest.raises(ValueError):
+            render_data_table(
+                {"src": "TABLES/values.csv", "columns": "name,missing"},
+                manuscript_path=str(manuscript_dir),
+            )
+
+    def test_chunked_rows_are_input(self, manuscript_dir):
+        """Test that chunk-rows splits rows over \\input-ed part files."""
+        result = render_data_table(
+            {"src": "TABLES/values.csv", "chunk-rows": "2"},
+            manuscript_path=str(manuscript_dir),
+        )
+        (cache_dir,) = _cache_dirs(manuscript_dir)
+        parts = sorted(cache_dir.glob("part_*.tex"))
+        assert [part.name for part in parts] == [
+            "part_0001.tex",
+            "part_0002.tex",
+            "part_0003.tex",
+        ]
+        for part in parts:
+            assert f"\\input{{Figures/DATA_TABLES/{cache_dir.name}/{part.name}}}" in (
+                result
+            )
+        assert "item\\_4" in parts[2].read_text(encoding="utf-8")
+        assert "item\\_4" not in result
+
+    def test_cache_reused_until_file_changes(self, manuscript_dir):
+        """Test that renderings are cached by the data file hash."""
+        attributes = {"src": "TABLES/values.csv"}
+        render_data_table(attributes, manuscript_path=str(manuscript_dir))
+        (cache_dir,) = _cache_dirs(manuscript_dir)
+        part = cache_dir / "part_0001.tex"
+
+        # Tamper with the cached part: a cache hit returns it unchanged
+        part.write_text("cached \\\\", encoding="utf-8")
+        result = render_data_table(attributes, manuscript_path=str(manuscript_dir))
+        assert "cached \\\\" in result
+
+        # Changing the data file invalidates the cache
+        (manuscript_dir / "TABLES" / "values.csv").write_text(
+            "name\nfresh\n", encoding="utf-8"
+        )
+        result = render_data_table(attributes, manuscript_path=str(manuscript_dir))
+        assert "cached" not in result
+        assert "fresh \\\\" in result
+        manifest = json.loads((cache_dir / "manifest.json").read_text())
+        assert manifest["rows"] == 1
+
+    def test_rerendering_replaces_parts(self, manuscript_dir):
+        """Test that a new rendering replaces the parts of the previous one."""
+        attributes = {"src": "TABLES/values.csv", "chunk-rows": "2"}
+        render_data_table(attributes, manuscript_path=str(manuscript_dir))
+        (manuscript_dir / "TABLES" / "values.csv").write_text(
+            "name\nfresh\n", encoding="utf-8"
+        )
+        render_data_table(attributes, manuscript_path=str(manuscript_dir))
+
+        (cache_dir,) = _cache_dirs(manuscript_dir)
+        assert [path.name for path in cache_dir.parent.iterdir()] == [cache_dir.name]
+        assert sorted(path.name for path in cache_dir.iterdir()) == [
+            "manifest.json",
+            "part_0001.tex",
+        ]
+
+    def test_longtable_in_supplementary(self, manuscript_dir):
+        """Test that longtable repeats the header and uses the stable counter."""
+        result = render_data_table(
+            {"src": "TABLES/values.csv", "longtable": "true"},
+            "Values.",
+            "stable:values",
+            is_supplementary=True,
+            manuscript_path=str(manuscript_dir),
+        )
+        assert "\\stepcounter{stable}%" in result
+        assert "\\begin{longtable}{|l|l|l|}" in result
+        assert "\\caption{Values.}\\label{stable:values}\\\\" in result
+        assert result.count("name & value & note \\\\") == 2
+        assert "\\endhead" in result
+
+    def test_longtable_falls_back_in_main_text(self, manuscript_dir):
+        """Test that longtable is not used in the two-column main text."""
+        result = render_data_table(
+            {"src": "TABLES/values.csv", "longtable": "true"},
+            manuscript_path=str(manuscript_dir),
+        )
+        assert "longtable" not in result
+        assert "\\begin{table}[ht]" in result
+
+
+class TestDataTableConversion:
+    """Test data table markers inside the markdown conversion pipeline."""
+
+    def test_marker_with_caption(self, manuscript_dir):
+        """Test that markers and captions are replaced by a protected table."""
+        protected_tables = {}
+        markdown = (
+            'Before.\n\n<data-table src="TABLES/values.csv"/>\n\n'
+            "{#table:values rotate=90} **Values.** All of them.\n\nAfter."
+        )
+        result = convert_data_tables_to_latex(
+            markdown, protected_tables, manuscript_path=str(manuscript_dir)
+        )
+        assert result == ("Before.\n\nXXPROTECTEDTABLEXX0XXPROTECTEDTABLEXX\n\nAfter.")
+        latex = protected_tables["XXPROTECTEDTABLEXX0XXPROTECTEDTABLEXX"]
+        assert "\\rotatebox{90}{%" in latex
+        assert "\\caption{\\textbf{Values.} All of them.}" in latex
+
+    def test_convert_markdown_to_latex(self, manuscript_dir, monkeypatch):
+        """Test the full conversion leaves the rendered table untouched."""
+        monkeypatch.setenv("MANUSCRIPT_PATH", str(manuscript_dir))
+        markdown = (
+            'Text with @cite.\n\n<data-table src="TABLES/values.csv"/>\n\n'
+            "{#table:values} **Values.** All of them.\n"
+        )
+        result = convert_markdown_to_latex(markdown)
+        assert "Text with \\cite{cite}." in result
+        assert "item\\_0 & 0 & 0\\% of \\cite{ref0} \\\\" in result
+        assert "<data-table" not in result
+        assert "XXPROTECTEDTABLEXX" not in result
+
+    def test_parquet_table(self, manuscript_dir):
+        """Test that Parquet files are streamed through pyarrow."""
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        table = pa.table({"gene": ["abc", None], "count": [1, 2]})
+        pq.write_table(table, manuscript_dir / "TABLES" / "counts.parquet")
+
+        result = render_data_table(
+            {"src": "TABLES/counts.parquet"}, manuscript_path=str(manuscript_dir)
+        )
+        assert "gene & count \\\\" in result
+        assert "abc & 1 \\\\" in result
+        assert " & 2 \\\\" in result
@@ -0,0 +1,354 @@
+"""Unit tests for the optimization of generated figures."""
+
+import hashlib
+import json
+import math
+
+import pytest
+
+from src.py.commands.generate_figures import FigureGenerator
+from src.py.processors.figure_optimizer import (
+    COLUMN_WIDTH_IN,
+    PDF_CACHE_DIR,
+    RASTER_CACHE_DIR,
+    TEXT_WIDTH_IN,
+    figure_widths,
+    optimize_pdf,
+    optimize_png,
+    printed_width,
+)
+
+Image = pytest.importorskip("PIL.Image")
+pypdf = pytest.importorskip("pypdf")
+
+MAIN = """## Results
+
+![](FIGURES/Figure_1/Figure_1.svg)
+{#fig:one width="50%"} **One.** Half a column.
+
+![](FIGURES/Figure_2/Figure_2.svg)
+{#fig:two width="\\textwidth"} **Two.** Both columns.
+
+![Three](FIGURES/Figure_3.png)
+"""
+
+SUPPLEMENTARY = """![](FIGURES/SFigure_1/SFigure_1.svg)
+{#sfig:one width="0.5"} **One.** Half the text.
+"""
+
+
+def write_png(path, width, height=None):
+    """Write an opaque RGBA gradient."""
+    height = height or width // 2
+    image = Image.new("RGBA", (width, height))
+    image.putdata(
+        [
+            (x * 255 // width, y * 255 // height, 128, 255)
+            for y in range(height)
+            for x in range(width)
+        ]
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    image.save(path)
+    return path
+
+
+def write_pdf(path, pages=3, embedded_font=False, text_in="page"):
+    """Write an uncompressed PDF with an unused font and metadata on each page.
+
+    The text is drawn by the page, by a form XObject without resources
+    (``text_in="form"``) or by an annotation appearance (``"annotation"``).
+    """
+    from pypdf.generic import (
+        ArrayObject,
+        DecodedStreamObject,
+        DictionaryObject,
+        NameObject,
+        NumberObject,
+    )
+
+    writer = pypdf.PdfWriter()
+
+    def font(base_font):
+        entries = {
+            NameObject("/Type"): NameObject("/Font"),
+            NameObject("/Subtype"): NameObject("/TrueType"),
+            NameObject("/BaseFont"): NameObject(base_font),
+        }
+        if embedded_font:
+            program = DecodedStreamObject()
+            program.set_data(b"font program")
+            entries[NameObject("/FontDescriptor")] = writer._add_object(
+                DictionaryObject(
+                    {
+                        NameObject("/Type"): NameObject("/FontDescriptor"),
+                        NameObject("/Flags"): NumberObject(32),
+                        NameObject("/FontFile2"): writer._add_object(program),
+                    }
+                )
+            )
+        return writer._add_object(DictionaryObject(entries))
+
+    for _ in range(pages):
+        page = writer.add_blank_page(200, 200)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {
+                NameObject("/Font"): DictionaryObject(
+                    {
+                        NameObject("/F1"): font("/Helvetica"),
+                        NameObject("/F2"): font("/Courier"),
+                    }
+                )
+            }
+        )
+        content = DecodedStreamObject()
+        content.set_data(b"BT /F1 12 Tf 10 10 Td (Hello figure) Tj ET\n" * 50)
+        if text_in != "page":
+            content[NameObject("/Subtype")] = NameObject("/Form")
+            content[NameObject("/BBox")] = ArrayObject(
+                [NumberObject(0), NumberObject(0), NumberObject(200), NumberObject(200)]
+            )
+            form = writer._add_object(content)
+            content = DecodedStreamObject()
+        if text_in == "form":
+            page["/Resources"][NameObject("/XObject")] = DictionaryObject(
+                {NameObject("/Fm1"): form}
+            )
+            content.set_data(b"q /Fm1 Do Q\n")
+        elif text_in == "annotation":
+            annotation = DictionaryObject(
+                {
+                    NameObject("/Type"): NameObject("/Annot"),
+                    NameObject("/Subtype"): NameObject("/FreeText"),
+                    NameObject("/Rect"): form["/BBox"],
+                    NameObject("/AP"): DictionaryObject({NameObject("/N"): form}),
+                }
+            )
+            page[NameObject("/Annots")] = ArrayObject([writer._add_object(annotation)])
+        page[NameObject("/Contents")] = writer._add_object(content)
+    writer.add_metadata({"/Producer": "test", "/Title": "Figure"})
+    path.parent.mkdir(parents=True, exist_ok=True)
+    writer.write(path)
+    return path
+
+
+class TestPrintedWidth:
+    """Test the printed width of figures."""
+
+    @pytest.mark.parametrize(
+        "attributes,two_column_page,expected",
+        [
+            ({}, True, COLUMN_WIDTH_IN),
+            ({}, False, TEXT_WIDTH_IN),
+            ({"width": "80%"}, True, 0.8 * COLUMN_WIDTH_IN),
+            ({"width": "0.5"}, False, 0.5 * TEXT_WIDTH_IN),
+            ({"width": "\\textwidth"}, True, TEXT_WIDTH_IN),
+            ({"width": "0.5\\linewidth", "span": "2col"}, True, 0.5 * TEXT_WIDTH_IN),
+            ({"width": "5cm"}, True, 5 / 2.54),
+        ],
+    )
+    def test_widths(self, attributes, two_column_page, expected):
+        assert printed_width(attributes, two_column_page) == pytest.approx(expected)
+
+    def test_unknown_width(self):
+        assert printed_width({"width": "\\figwidth"}) is None
+
+    def test_figure_widths_of_manuscript(self, temp_dir):
+        (temp_dir / "01_MAIN.md").write_text(MAIN)
+        (temp_dir / "02_SUPPLEMENTARY_INFO.md").write_text(SUPPLEMENTARY)
+        assert figure_widths(temp_dir) == pytest.approx(
+            {
+                "Figure_1": 0.5 * COLUMN_WIDTH_IN,
+                "Figure_2": TEXT_WIDTH_IN,
+                "Figure_3": COLUMN_WIDTH_IN,
+                "SFigure_1": 0.5 * TEXT_WIDTH_IN,
+            }
+        )
+
+
+class TestOptimizePng:
+    """Test downsampling and caching PNGs."""
+
+    def test_downsamples_to_printed_size(self, temp_dir):
+        png = write_png(temp_dir / "figure.png", 1200)
+        saved, resampled = optimize_png(png, 2.0, dpi=300)
+        assert resampled
+        assert saved > 0
+        with Image.open(png) as image:
+            assert image.size == (600, 300)
+            assert image.mode == "RGB"
+
+    def test_small_images_keep_their_size(self, temp_dir):
+        png = write_png(temp_dir / "figure.png", 620)
+        _, resampled = optimize_png(png, 2.0, dpi=300)
+        assert not resampled
+        with Image.open(png) as image:
+            assert image.width == 620
+
+    def test_unknown_width_keeps_resolution(self, temp_dir):
+        png = write_png(temp_dir / "figure.png", 1200)
+        optimize_png(png, math.inf)
+        with Image.open(png) as image:
+            assert image.width == 1200
+
+    def test_cached_by_input_hash(self, temp_dir):
+        cache_dir = temp_dir / "cache"
+        png = write_png(temp_dir / "figure.png", 1200)
+        original = png.read_bytes()
+        saved, _ = optimize_png(png, 2.0, 300, cache_dir)
+        optimized = png.read_bytes()
+
+        # The optimized file is recognized, a regenerated original restored
+        assert optimize_png(png, 2.0, 300, cache_dir) == (0, False)
+        png.write_bytes(original)
+        assert optimize_png(png, 2.0, 300, cache_dir) == (saved, True)
+        assert png.read_bytes() == optimized
+
+    def test_wider_figure_is_resampled_from_original(self, temp_dir):
+        cache_dir = temp_dir / "cache"
+        png = write_png(temp_dir / "figure.png", 1200)
+        optimize_png(png, 2.0, 300, cache_dir)
+
+        optimize_png(png, 3.0, 300, cache_dir)
+        with Image.open(png) as image:
+            assert image.width == 900
+        optimize_png(png, math.inf, 300, cache_dir)
+        with Image.open(png) as image:
+            assert image.width == 1200
+
+
+class TestOptimizePdf:
+    """Test compacting figure PDFs."""
+
+    def test_compacts_pdf(self, temp_dir):
+        pdf = write_pdf(temp_dir / "figure.pdf")
+        size = pdf.stat().st_size
+
+        saved, details = optimize_pdf(pdf)
+
+        assert saved == size - pdf.stat().st_size > 0
+        assert details == {"fonts_removed": 3, "full_fonts": []}
+        reader = pypdf.PdfReader(pdf)
+        assert not reader.metadata
+        assert [list(page["/Resources"]["/Font"]) for page in reader.pages] == [
+            ["/F1"]
+        ] * 3
+        assert reader.pages[2].extract_text().startswith("Hello figure")
+
+    @pytest.mark.parametrize("text_in", ["form", "annotation"])
+    def test_keeps_fonts_used_through_page_resources(self, temp_dir, text_in):
+        pdf = write_pdf(temp_dir / "figure.pdf", pages=1, text_in=text_in)
+
+        _, details = optimize_pdf(pdf)
+
+        assert details["fonts_removed"] == 1
+        fonts = pypdf.PdfReader(pdf).pages[0]["/Resources"]["/Font"]
+        assert fonts["/F1"]["/BaseFont"] == "/Helvetica"
+        assert "/F2" not in fonts
+
+    def test_reports_fonts_embedded_in_full(self, temp_dir):
+        pdf = write_pdf(temp_dir / "figure.pdf", embedded_font=True)
+        _, details = optimize_pdf(pdf)
+        assert details["full_fonts"] == ["/Helvetica"]
+
+    def test_compact_pdf_is_kept(self, temp_dir):
+        pdf = write_pdf(temp_dir / "figure.pdf")
+        optimize_pdf(pdf)
+        compacted = pdf.read_bytes()
+        assert optimize_pdf(pdf) == (0, {"fonts_removed": 0, "full_fonts": []})
+        assert pdf.read_bytes() == compacted
+
+    def test_cached_by_input_hash(self, temp_dir):
+        cache_dir = temp_dir / "cache"
+        pdf = write_pdf(temp_dir / "figure.pdf")
+        original = pdf.read_bytes()
+        result = optimize_pdf(pdf, cache_dir)
+        compacted = pdf.read_bytes()
+
+        pdf.write_bytes(original)
+        assert optimize_pdf(pdf, cache_dir) == result
+        assert pdf.read_bytes() == compacted
+
+
+class TestFigureGenerator:
+    """Test the optimization stage of the figure generator."""
+
+    def test_only_generated_figures_are_optimized(self, temp_dir):
+        figures_dir = temp_dir / "FIGURES"
+        (temp_dir / "01_MAIN.md").write_text(MAIN)
+        figures_dir.mkdir()
+        (figures_dir / "Figure_1.mmd").write_text("graph TD; A-->B")
+        generated = write_png(figures_dir / "Figure_1" / "Figure_1.png", 2000)
+        by_hand = write_png(figures_dir / "Figure_2" / "Figure_2.png", 1500)
+        hand_bytes = by_hand.read_bytes()
+
+        savings = FigureGenerator(figures_dir, figures_dir).optimize_raster_figures()
+
+        assert (savings.files, savings.downsampled) == (1, 1)
+        assert savings.bytes_saved > 0
+        with Image.open(generated) as image:
+            assert image.width == math.ceil(0.5 * COLUMN_WIDTH_IN * 300)
+        assert by_hand.read_bytes() == hand_bytes
+        assert (figures_dir / RASTER_CACHE_DIR / "manifest.json").is_file()
+
+    def test_cache_keeps_pair_of_current_figure(self, temp_dir):
+        figures_dir = temp_dir / "FIGURES"
+        (temp_dir / "01_MAIN.md").write_text(MAIN)
+        figures_dir.mkdir()
+        (figures_dir / "Figure_1.py").write_text("")
+        png = figures_dir / "Figure_1" / "Figure_1.png"
+        generator = FigureGenerator(figures_dir, figures_dir)
+
+        # Each regeneration writes a different full-resolution PNG
+        for width in (2000, 2400, 2800):
+            write_png(png, width)
+            original = hashlib.sha256(png.read_bytes()).hexdigest()
+            generator.optimize_raster_figures()
+
+        cache_dir = figures_dir / RASTER_CACHE_DIR
+        optimized = hashlib.sha256(png.read_bytes()).hexdigest()
+        assert sorted(path.name for path in cache_dir.iterdir()) == sorted(
+            ["manifest.json", f"{original}.png", f"{optimized}.png"]
+        )
+        manifest = json.loads((cache_dir / "manifest.json").read_text())
+        assert manifest["originals"] == {optimized: original}
+        assert [key.partition("-")[0] for key in manifest] == [
+            original,
+            "originals",
+        ]
+
+    def test_changed_only_optimizes_for_new_widths(self, temp_dir):
+        figures_dir = temp_dir / "FIGURES"
+        main = temp_dir / "01_MAIN.md"
+        main.write_text(MAIN)
+        figures_dir.mkdir()
+        (figures_dir / "Figure_1.py").write_text("")
+        png = write_png(figures_dir / "Figure_1" / "Figure_1.png", 3000)
+        write_pdf(figures_dir / "Figure_1" / "Figure_1.pdf")
+        generator = FigureGenerator(
+            figures_dir, figures_dir, changed_only=True, optimize_pdfs=False
+        )
+        generator.needs_update = lambda source: False
+
+        generator.generate_all_figures()
+        main.write_text(MAIN.replace('width="50%"', 'width="\\textwidth"'))
+        generator.generate_all_figures()
+
+        with Image.open(png) as image:
+            assert image.width == math.ceil(TEXT_WIDTH_IN * 300)
+
+    def test_generated_pdfs_are_compacted(self, temp_dir):
+        figures_dir = temp_dir / "FIGURES"
+        figures_dir.mkdir()
+        (figures_dir / "Figure_1.py").write_text("")
+        generated = write_pdf(figures_dir / "Figure_1" / "Figure_1.pdf")
+        by_hand = write_pdf(figures_dir / "Figure_2" / "Figure_2.pdf")
+        hand_bytes = by_hand.read_bytes()
+
+        savings = FigureGenerator(figures_dir, figures_dir).optimize_pdf_figures()
+
+        assert (savings.files, savings.fonts_removed) == (1, 3)
+        assert savings.bytes_saved > 0
+        assert generated.stat().st_size < len(hand_bytes)
+        assert by_hand.read_bytes() == hand_bytes
+        assert (figures_dir / PDF_CACHE_DIR / "manifest.json").is_file()
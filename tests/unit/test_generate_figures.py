@@ -0,0 +1,204 @@
+"""Unit tests for running figure scripts and tracking their outputs."""
+
+import shutil
+import subprocess
+
+import pytest
+
+from src.py.commands import generate_figures
+from src.py.commands.generate_figures import FigureGenerator, RSession
+from src.py.processors.figure_outputs import (
+    FIGURE_OUTPUTS_MANIFEST,
+    FigureOutputs,
+    changed_files,
+    snapshot,
+)
+
+requires_r = pytest.mark.skipif(
+    shutil.which("Rscript") is None, reason="Rscript not available"
+)
+
+SCRIPT = """args <- commandArgs(trailingOnly = FALSE)
+script <- sub("--file=", "", args[grep("--file=", args)])
+cat("running", basename(script), "in", basename(getwd()), "\\n")
+if (exists("leaked")) stop("state leaked from an earlier script")
+leaked <- TRUE
+message("a message")
+writeLines("plot", "{name}.pdf")
+"""
+
+
+def write_script(directory, name, body=None):
+    """Write an R figure script and create its figure directory."""
+    (directory / name).mkdir(parents=True, exist_ok=True)
+    script = directory / f"{name}.R"
+    script.write_text(body or SCRIPT.replace("{name}", name))
+    return script
+
+
+PYTHON_SCRIPT = """from pathlib import Path
+
+Path("Figure_1.png").write_text("png")
+Path("table.csv").write_text("a,b")
+Path("nested").mkdir(exist_ok=True)
+Path("nested/Figure_1.pdf").write_text("pdf")
+"""
+
+DATA_SCRIPT = """import json
+from pathlib import Path
+
+data = Path(__file__).parent / "DATA" / "Figure_1" / "data.csv"
+rows = data.read_text().splitlines()
+Path("Figure_1.png").write_text(json.dumps(rows))
+Path("Figure_1.png").read_text()
+"""
+
+
+class TestFigureOutputs:
+    """Test tracking the files generated by figure scripts."""
+
+    def test_snapshot_changes(self, temp_dir):
+        (temp_dir / "kept.png").write_text("old")
+        (temp_dir / "rewritten.png").write_text("old")
+        (temp_dir / ".hidden").write_text("old")
+        before = snapshot(temp_dir)
+
+        (temp_dir / "rewritten.png").write_text("new content")
+        (temp_dir / "sub").mkdir()
+        (temp_dir / "sub" / "created.pdf").write_text("new")
+        (temp_dir / ".hidden").write_text("new content")
+
+        assert set(before) == {"kept.png", "rewritten.png"}
+        assert changed_files(before, snapshot(temp_dir)) == [
+            "rewritten.png",
+            "sub/created.pdf",
+        ]
+
+    def test_python_script_outputs_are_recorded(self, temp_dir):
+        (temp_dir / "Figure_1.py").write_text(PYTHON_SCRIPT)
+        stale = temp_dir / "Figure_1" / "Figure_1.svg"
+        stale.parent.mkdir()
+        stale.write_text("left from an earlier run")
+
+        generator = FigureGenerator(temp_dir, temp_dir)
+        generated = generator.generate_python_figure(temp_dir / "Figure_1.py")
+
+        expected = [
+            "Figure_1/Figure_1.png",
+            "Figure_1/nested/Figure_1.pdf",
+            "Figure_1/table.csv",
+        ]
+        assert generated == expected
+        assert (temp_dir / FIGURE_OUTPUTS_MANIFEST).is_file()
+        assert FigureOutputs(temp_dir).outputs("Figure_1.py") == expected
+
+    def test_data_inputs_are_recorded(self, temp_dir):
+        data = temp_dir / "DATA" / "Figure_1" / "data.csv"
+        data.parent.mkdir(parents=True)
+        data.write_text("a,b\n1,2\n")
+        script = temp_dir / "Figure_1.py"
+        script.write_text(DATA_SCRIPT)
+        generator = FigureGenerator(temp_dir, temp_dir, changed_only=True)
+        assert generator.needs_update(script)
+
+        generator.generate_python_figure(script)
+
+        entry = FigureOutputs(temp_dir).figures["Figure_1.py"]
+        assert list(entry["inputs"]) == ["DATA/Figure_1/data.csv"]
+        assert not generator.needs_update(script)
+
+        # Only a change of the data, the script or an output triggers a rebuild
+        (temp_dir / "DATA" / "Figure_1" / "unused.csv").write_text("x")
+        assert not generator.needs_update(script)
+        data.write_text("a,b\n1,3\n")
+        assert generator.needs_update(script)
+        generator.generate_python_figure(script)
+        assert not generator.needs_update(script)
+        script.write_text(DATA_SCRIPT + "\n")
+        assert generator.needs_update(script)
+        generator.generate_python_figure(script)
+        (temp_dir / "Figure_1" / "Figure_1.png").unlink()
+        assert generator.needs_update(script)
+
+    def test_failed_script_is_recorded(self, temp_dir):
+        script = temp_dir / "Figure_1.py"
+        script.write_text("raise SystemExit(1)\n")
+        generator = FigureGenerator(temp_dir, temp_dir)
+        assert generator.generate_python_figure(script) == []
+
+        assert generator.failed == ["Figure_1.py"]
+        manifest = FigureOutputs(temp_dir)
+        assert manifest.figures["Figure_1.py"]["failed"]
+        assert manifest.outputs("Figure_1.py") == []
+        assert generator.needs_update(script)
+
+    def test_failed_script_fails_the_command(self, temp_dir, monkeypatch):
+        (temp_dir / "Figure_1.py").write_text("raise SystemExit(1)\n")
+        (temp_dir / "Figure_2.py").write_text(PYTHON_SCRIPT)
+        monkeypatch.setattr(
+            "sys.argv",
+            ["generate_figures.py", "-d", str(temp_dir), "-o", str(temp_dir)],
+        )
+        with pytest.raises(SystemExit) as exc_info:
+            generate_figures.main()
+        assert exc_info.value.code == 1
+        assert FigureOutputs(temp_dir).outputs("Figure_2.py")
+
+
+class TestRscriptCheck:
+    """Test checking for Rscript."""
+
+    def test_checked_once_per_run(self, temp_dir, monkeypatch):
+        calls = []
+
+        def run(command, **kwargs):
+            calls.append(command)
+            raise FileNotFoundError(command[0])
+
+        generate_figures.rscript_available.cache_clear()
+        monkeypatch.setattr(subprocess, "run", run)
+        try:
+            generator = FigureGenerator(temp_dir, temp_dir, r_runner="script")
+            assert not generator._check_rscript()
+            assert not FigureGenerator(temp_dir, temp_dir)._check_rscript()
+        finally:
+            generate_figures.rscript_available.cache_clear()
+        assert calls == [["Rscript", "--version"]]
+
+    def test_unknown_runner(self, temp_dir):
+        with pytest.raises(ValueError, match="R runner"):
+            FigureGenerator(temp_dir, temp_dir, r_runner="daemon")
+
+
+class TestRSession:
+    """Test the persistent R session."""
+
+    def test_session_that_exits_is_reported(self, temp_dir):
+        script = write_script(temp_dir, "SFigure_1")
+        with RSession(rscript="false") as session:
+            result = session.run(script, temp_dir / "SFigure_1")
+            assert result.returncode == 1
+            assert "R session exited" in result.stderr
+            assert session.process is None
+
+    @requires_r
+    def test_scripts_share_one_session(self, temp_dir):
+        scripts = [write_script(temp_dir, name) for name in ("Fig_1", "Fig_2")]
+        failing = write_script(temp_dir, "Fig_3", 'stop("broken")\n')
+        quitting = write_script(temp_dir, "Fig_4", "quit(status = 3)\n")
+
+        with RSession() as session:
+            results = [session.run(path, temp_dir / path.stem) for path in scripts]
+            pid = session.process.pid
+            failed = session.run(failing, temp_dir / "Fig_3")
+            quit_result = session.run(quitting, temp_dir / "Fig_4")
+            assert session.process.pid == pid
+
+        for script, result in zip(scripts, results):
+            assert result.returncode == 0, result.stderr
+            assert result.stdout.strip() == f"running {script.name} in {script.stem}"
+            assert "a message" in result.stderr
+            assert (temp_dir / script.stem / f"{script.stem}.pdf").exists()
+        assert failed.returncode == 1
+        assert "broken" in failed.stderr
+        assert quit_result.returncode == 3
@@ -2,7 +2,13 @@
 
 import re
 
-from src.py.converters.citation_processor import convert_citations_to_latex
+from src.py.converters.citation_processor import (
+    convert_citations_to_latex,
+    convert_citations_with_keys,
+    extract_citations_from_text,
+    process_citations_outside_tables,
+    process_citations_outside_tables_with_keys,
+)
 from src.py.converters.code_processor import convert_code_blocks_to_latex
 from src.py.converters.figure_processor import (
     convert_figure_references_to_latex,
@@ -11,6 +17,7 @@ from src.py.converters.figure_processor import (
 from src.py.converters.html_processor import convert_html_comments_to_latex
 from src.py.converters.list_processor import convert_lists_to_latex
 from src.py.converters.md2tex import (
+    SUPPLEMENTARY_ENVIRONMENT_NAMES,
     convert_markdown_to_latex,
     extract_content_sections,
     map_section_title_to_key,
@@ -109,6 +116,45 @@ class TestCitationConversion:
         result = convert_citations_to_latex(text)
         assert result == expected
 
+    def test_convert_citations_with_keys(self):
+        """Test that cited keys are collected once, in order of use."""
+        text = "See [@b;@a] and @a, then @c and @fig:one."
+        result, keys = convert_citations_with_keys(text)
+        assert result == r"See \cite{b,a} and \cite{a}, then \cite{c} and @fig:one."
+        assert keys == ["b", "a", "c"]
+
+    def test_citations_outside_tables_skip_placeholders(self):
+        """Test that protected table placeholders are left untouched."""
+        placeholder = "XXPROTECTEDMARKDOWNTABLEXX0XXPROTECTEDMARKDOWNTABLEXX"
+        content = f"Before @first.\n\n{placeholder}\n\nAfter [@second;@third]."
+        protected = {placeholder: "| @in_table |\n|---|\n"}
+
+        result = process_citations_outside_tables(content, protected)
+        assert result == (
+            f"Before \\cite{{first}}.\n\n{placeholder}\n\nAfter \\cite{{second,third}}."
+        )
+
+        result_with_keys, keys = process_citations_outside_tables_with_keys(
+            content, protected
+        )
+        assert result_with_keys == result
+        # Keys are in document order; citations inside tables are left out
+        assert keys == ["first", "second", "third"]
+        assert "in_table" not in keys
+
+    def test_unknown_placeholder_is_processed(self):
+        """Test that placeholder-like text without a table is still processed."""
+        placeholder = "XXPROTECTEDMARKDOWNTABLEXX7XXPROTECTEDMARKDOWNTABLEXX"
+        content = f"{placeholder} cites @key"
+        protected = {"XXPROTECTEDMARKDOWNTABLEXX0XXPROTECTEDMARKDOWNTABLEXX": ""}
+        result = process_citations_outside_tables(content, protected)
+        assert result == f"{placeholder} cites \\cite{{key}}"
+
+    def test_extract_citations_unique_and_ordered(self):
+        """Test that extracted keys are unique and bracketed ones come first."""
+        text = "@z then [@a;@b] and [@a] and @z again, see @eq:one"
+        assert extract_citations_from_text(text) == ["a", "b", "z"]
+
 
 class TestFigureConversion:
     """Test figure conversion functionality."""
@@ -146,6 +192,39 @@ class TestFigureConversion:
         result = convert_figure_references_to_latex(text)
         assert result == expected
 
+    def test_supplementary_environment_names(self):
+        """Test that floats are emitted with the supplementary names."""
+        markdown = (
+            "![Caption](FIGURES/a.png)\n\n"
+            "| A | B |\n|---|---|\n| 1 | 2 |\n\n"
+            "{#stable:t} **Table.**\n\n"
+            "| A | B | C | D | E |\n|---|---|---|---|---|\n| 1 | 2 | 3 | 4 | 5 |\n\n"
+            "{#stable:wide} **Wide table.**\n"
+        )
+        result = convert_markdown_to_latex(
+            markdown,
+            is_supplementary=True,
+            environment_names=SUPPLEMENTARY_ENVIRONMENT_NAMES,
+        )
+
+        assert result.count("\\begin{sfigure}") == 1
+        assert result.count("\\end{sfigure}") == 1
+        assert result.count("\\begin{stable}") == 1
+        assert result.count("\\end{stable}") == 1
+        assert result.count("\\begin{stable*}") == 1
+        assert result.count("\\end{stable*}") == 1
+        assert not re.search(r"\\(begin|end)\{(figure|table)\*?\}", result)
+
+    def test_default_environment_names(self):
+        """Test that floats keep their names without a naming context."""
+        markdown = "![Caption](FIGURES/a.png)\n\n| A |\n|---|\n| 1 |\n"
+        result = convert_markdown_to_latex(markdown, is_supplementary=True)
+
+        assert "\\begin{figure}" in result
+        assert "\\begin{table}" in result
+        assert "sfigure" not in result
+        assert "stable" not in result
+
 
 class TestTableReferenceConversion:
     """Test table reference conversion functionality."""
@@ -485,6 +564,50 @@ class TestTableFormattingConversion:
         assert "\\textit{italic}" in result
         assert "regular" in result
 
+    def test_protected_backticks_restored_in_cells(self):
+        """Test that backtick placeholders in cells are resolved per table."""
+        protected = {
+            "XXPROTECTEDBACKTICKXX0XXPROTECTEDBACKTICKXX": "`first_code`",
+            "XXPROTECTEDBACKTICKXX1XXPROTECTEDBACKTICKXX": "`second`",
+        }
+        markdown_input = """| Name | Code |
+|------|------|
+| a | XXPROTECTEDBACKTICKXX0XXPROTECTEDBACKTICKXX |
+| b | XXPROTECTEDBACKTICKXX1XXPROTECTEDBACKTICKXX |
+"""
+
+        result = convert_tables_to_latex(markdown_input, protected)
+
+        assert "XXPROTECTEDBACKTICKXX" not in result
+        assert "a & \\texttt{first_code} \\\\" in result
+        assert "b & \\texttt{second} \\\\" in result
+
+    def test_code_spans_in_pipe_lines_stay_protected(self):
+        """Test that code spans on lines that are not tables stay protected."""
+        result = convert_markdown_to_latex("| `a``*b* @c`` |")
+
+        assert "\\cite" not in result
+        assert "\\texttt{*b* @c}" in result
+
+    def test_every_data_row_followed_by_hline(self):
+        """Test the tabular body layout of a batch-formatted table."""
+        rows = "\n".join(f"| r{i} | v{i} |" for i in range(3))
+        result = convert_tables_to_latex(f"| A | B |\n|---|---|\n{rows}\n")
+
+        body = result.split("\\begin{tabular}{|l|l|}\n")[1].split("\\end{tabular}")[0]
+        assert body.split("\n") == [
+            "\\hline",
+            "A & B \\\\",
+            "\\hline",
+            "r0 & v0 \\\\",
+            "\\hline",
+            "r1 & v1 \\\\",
+            "\\hline",
+            "r2 & v2 \\\\",
+            "\\hline",
+            "",
+        ]
+
 
 class TestNoAutomaticNewpage:
     """Test that automatic newpage insertion has been removed."""
@@ -0,0 +1,171 @@
+"""Unit tests for the size analysis of the built PDF."""
+
+import json
+
+import pytest
+
+from src.py.commands import pdf_report
+from src.py.processors.pdf_analyzer import (
+    MB,
+    PDF_SIZE_REPORT_FILENAME,
+    analyze_pdf,
+    check_size_budget,
+    compact_pdf,
+    size_budget,
+)
+
+Image = pytest.importorskip("PIL.Image")
+pypdf = pytest.importorskip("pypdf")
+
+
+def write_pdf(path, copies=2):
+    """Write a PDF including a raster figure on every page and a PDF figure."""
+    from pypdf.generic import (
+        DecodedStreamObject,
+        DictionaryObject,
+        NameObject,
+        NumberObject,
+        TextStringObject,
+    )
+
+    writer = pypdf.PdfWriter()
+
+    def xobject(entries, data):
+        stream = DecodedStreamObject()
+        stream.set_data(data)
+        stream.update({NameObject(key): value for key, value in entries.items()})
+        return writer._add_object(stream)
+
+    def image():
+        return xobject(
+            {
+                "/Type": NameObject("/XObject"),
+                "/Subtype": NameObject("/Image"),
+                "/Width": NumberObject(40),
+                "/Height": NumberObject(20),
+                "/ColorSpace": NameObject("/DeviceGray"),
+                "/BitsPerComponent": NumberObject(8),
+            },
+            bytes(range(200)) * 4,
+        )
+
+    # pdflatex includes a figure once per \includegraphics of a distinct copy
+    images = [image() for _ in range(copies)]
+    form = xobject(
+        {
+            "/Type": NameObject("/XObject"),
+            "/Subtype": NameObject("/Form"),
+            "/BBox": pypdf.generic.ArrayObject([NumberObject(0)] * 4),
+            "/PTEX.FileName": TextStringObject("./Figures/Figure_2/Figure_2.pdf"),
+        },
+        b"0 0 m 10 10 l S\n" * 10,
+    )
+
+    for number, raster in enumerate(images):
+        page = writer.add_blank_page(200, 200)
+        xobjects = {NameObject("/Im1"): raster}
+        if number == 0:
+            xobjects[NameObject("/Fm1")] = form
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/XObject"): DictionaryObject(xobjects)}
+        )
+        content = DecodedStreamObject()
+        content.set_data(b"q 40 0 0 20 0 0 cm /Im1 Do Q\n" * 20)
+        page[NameObject("/Contents")] = writer._add_object(content)
+    writer.add_metadata({"/Title": "Manuscript"})
+    path.parent.mkdir(parents=True, exist_ok=True)
+    writer.write(path)
+    return path
+
+
+@pytest.fixture
+def built_pdf(temp_dir):
+    """Built PDF next to the Figures directory it includes."""
+    png = temp_dir / "Figures" / "Figure_1" / "Figure_1.png"
+    png.parent.mkdir(parents=True)
+    Image.new("L", (40, 20)).save(png)
+    return write_pdf(temp_dir / "paper.pdf")
+
+
+class TestAnalyzePdf:
+    """Test attributing the size of a PDF."""
+
+    def test_attributes_figures_and_pages(self, built_pdf):
+        report = analyze_pdf(built_pdf)
+
+        assert report.file_bytes == built_pdf.stat().st_size
+        assert [page.name for page in report.pages] == ["1", "2"]
+        assert report.pages[0].bytes > report.pages[1].bytes
+        names = [figure.name for figure in report.figures]
+        assert names.count("Figures/Figure_1/Figure_1.png") == 2
+        assert "Figures/Figure_2/Figure_2.pdf" in names
+        assert report.figures[0].bytes == 800
+
+    def test_size_budget(self, built_pdf):
+        report = analyze_pdf(built_pdf)
+        assert check_size_budget(report, max_pdf_mb=10, max_figure_mb=1) == []
+
+        violations = check_size_budget(report, max_pdf_mb=1 / MB, max_figure_mb=None)
+        assert violations == report.violations
+        assert violations[0].startswith("PDF is")
+
+        check_size_budget(report, max_figure_mb=500 / MB)
+        assert len(report.violations) == 2
+        assert all("Figure_1.png" in violation for violation in report.violations)
+
+    def test_budget_from_configuration(self):
+        assert size_budget({}) == {"max_pdf_mb": None, "max_figure_mb": None}
+        assert size_budget({"pdf_size_budget": {"max_figure_mb": 2}}) == {
+            "max_pdf_mb": None,
+            "max_figure_mb": 2,
+        }
+
+
+class TestCompactPdf:
+    """Test compacting the built PDF."""
+
+    def test_merges_duplicate_images(self, built_pdf):
+        size = built_pdf.stat().st_size
+
+        saved = compact_pdf(built_pdf)
+
+        assert saved == size - built_pdf.stat().st_size > 0
+        reader = pypdf.PdfReader(built_pdf)
+        assert reader.metadata["/Title"] == "Manuscript"
+        images = {
+            page["/Resources"]["/XObject"].raw_get("/Im1").idnum
+            for page in reader.pages
+        }
+        assert len(images) == 1
+        assert len(analyze_pdf(built_pdf).figures) == 2
+
+    def test_compact_pdf_is_kept(self, built_pdf):
+        compact_pdf(built_pdf)
+        compacted = built_pdf.read_bytes()
+        assert compact_pdf(built_pdf) == 0
+        assert built_pdf.read_bytes() == compacted
+
+
+class TestPdfReportCommand:
+    """Test the pdf-report command."""
+
+    def test_writes_report_with_configured_budget(
+        self, built_pdf, temp_dir, monkeypatch
+    ):
+        manuscript = temp_dir / "PAPER"
+        manuscript.mkdir()
+        (manuscript / "00_CONFIG.yml").write_text(
+            "pdf_size_budget:\n  max_figure_mb: 0.0005\n"
+        )
+        monkeypatch.setenv("MANUSCRIPT_PATH", str(manuscript))
+        monkeypatch.setattr(
+            "sys.argv",
+            ["pdf_report.py", "-o", str(temp_dir), "--pdf", str(built_pdf)],
+        )
+        assert pdf_report.main() == 0
+
+        report = json.loads((temp_dir / PDF_SIZE_REPORT_FILENAME).read_text())
+        assert len(report["violations"]) == 2
+
+        monkeypatch.setattr("sys.argv", [*pdf_report.sys.argv, "--strict"])
+        assert pdf_report.main() == 1
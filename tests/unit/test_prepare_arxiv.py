@@ -0,0 +1,319 @@
+"""Unit tests for dependency-driven arXiv packaging."""
+
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+import prepare_arxiv
+from prepare_arxiv import (
+    create_zip_package,
+    find_main_tex,
+    find_tex_dependencies,
+    prepare_arxiv_package,
+    seed_compilation_state,
+    sync_package,
+    verify_package,
+    write_reproducible_zip,
+)
+from prepare_arxiv import (
+    test_arxiv_compilation as compile_package,
+)
+
+MAIN_TEX = r"""\documentclass{rxiv_maker_style}
+\usepackage{graphicx}
+\begin{document}
+\includegraphics[width=\linewidth]{Figures/Figure_1/Figure_1.png}
+\includegraphics{Figures/Figure_2/Figure_2}
+% \includegraphics{Figures/Unused/Unused.png}
+50\% done
+\input{Supplementary.tex}
+\bibliography{03_REFERENCES}
+\end{document}
+"""
+
+SUPPLEMENTARY_TEX = r"""\includegraphics{Figures/SFigure_1/SFigure_1.pdf}
+\input{Figures/DATA_TABLES/values/part_0001.tex}
+"""
+
+
+@pytest.fixture
+def output_dir(temp_dir):
+    """Generated output directory with referenced and unreferenced files."""
+    output = temp_dir / "output"
+    files = {
+        "MANUSCRIPT.tex": MAIN_TEX,
+        "MANUSCRIPT.bbl": "bbl",
+        "MANUSCRIPT.log": "log",
+        "Supplementary.tex": SUPPLEMENTARY_TEX,
+        "03_REFERENCES.bib": "@article{a}",
+        "rxiv_maker_style.cls": "\\bibliographystyle{rxiv_maker_style}",
+        "rxiv_maker_style.bst": "bst",
+        "Figures/Figure_1/Figure_1.png": "png",
+        "Figures/Figure_1/Figure_1.pdf": "pdf",
+        "Figures/Figure_2/Figure_2.png": "png",
+        "Figures/Figure_2/Figure_2.pdf": "pdf",
+        "Figures/SFigure_1/SFigure_1.pdf": "pdf",
+        "Figures/Unused/Unused.png": "png",
+        "Figures/DATA/Figure_1/data.csv": "a,b",
+        "Figures/DATA_TABLES/values/part_0001.tex": "1 \\\\",
+    }
+    for name, content in files.items():
+        path = output / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+    return output
+
+
+EXPECTED_FILES = [
+    "03_REFERENCES.bib",
+    "Figures/DATA_TABLES/values/part_0001.tex",
+    "Figures/Figure_1/Figure_1.png",
+    "Figures/Figure_2/Figure_2.pdf",
+    "Figures/SFigure_1/SFigure_1.pdf",
+    "MANUSCRIPT.bbl",
+    "MANUSCRIPT.tex",
+    "Supplementary.tex",
+    "rxiv_maker_style.bst",
+    "rxiv_maker_style.cls",
+]
+
+
+def _package_files(arxiv_dir):
+    return sorted(
+        path.relative_to(arxiv_dir).as_posix()
+        for path in arxiv_dir.rglob("*")
+        if path.is_file()
+    )
+
+
+class TestDependencyScan:
+    """Test scanning generated LaTeX for the files it references."""
+
+    def test_find_main_tex(self, output_dir):
+        """Test that the file declaring a document class is the main file."""
+        (output_dir / "A_snippet.tex").write_text("text", encoding="utf-8")
+        assert find_main_tex(output_dir) == output_dir / "MANUSCRIPT.tex"
+
+    def test_only_referenced_files(self, output_dir):
+        """Test that inputs, graphics, bibliography and style are collected."""
+        dependencies, missing = find_tex_dependencies(output_dir / "MANUSCRIPT.tex")
+        assert sorted(dependencies) == EXPECTED_FILES
+        assert missing == []
+
+    def test_graphics_without_extension_prefer_pdf(self, output_dir):
+        """Test that one format is picked per figure, in pdflatex order."""
+        dependencies, _ = find_tex_dependencies(output_dir / "MANUSCRIPT.tex")
+        assert "Figures/Figure_2/Figure_2.pdf" in dependencies
+        assert "Figures/Figure_2/Figure_2.png" not in dependencies
+
+    def test_style_falls_back_to_style_directory(self, output_dir, temp_dir):
+        """Test that style files missing from the output are found elsewhere."""
+        style_dir = temp_dir / "style"
+        style_dir.mkdir()
+        (output_dir / "rxiv_maker_style.bst").rename(style_dir / "rxiv_maker_style.bst")
+        dependencies, _ = find_tex_dependencies(
+            output_dir / "MANUSCRIPT.tex", [output_dir, style_dir]
+        )
+        assert dependencies["rxiv_maker_style.bst"] == (
+            style_dir / "rxiv_maker_style.bst"
+        )
+
+    def test_missing_references_are_reported(self, output_dir):
+        """Test that unresolved references are listed, system packages are not."""
+        (output_dir / "Figures/SFigure_1/SFigure_1.pdf").unlink()
+        _, missing = find_tex_dependencies(output_dir / "MANUSCRIPT.tex")
+        assert missing == ["Figures/SFigure_1/SFigure_1.pdf"]
+
+
+class TestPackageSync:
+    """Test incremental synchronisation of the submission directory."""
+
+    def test_sync_copies_then_skips_unchanged(self, output_dir, temp_dir):
+        """Test that a second sync copies nothing."""
+        dependencies, _ = find_tex_dependencies(output_dir / "MANUSCRIPT.tex")
+        arxiv_dir = temp_dir / "arxiv"
+        stats = sync_package(dependencies, arxiv_dir)
+        assert sorted(stats["copied"]) == EXPECTED_FILES
+        assert _package_files(arxiv_dir) == EXPECTED_FILES
+
+        stats = sync_package(dependencies, arxiv_dir)
+        assert stats["copied"] == []
+        assert sorted(stats["unchanged"]) == EXPECTED_FILES
+
+    def test_sync_updates_changed_and_removes_stale(self, output_dir, temp_dir):
+        """Test that changed files are recopied and stale files removed."""
+        dependencies, _ = find_tex_dependencies(output_dir / "MANUSCRIPT.tex")
+        arxiv_dir = temp_dir / "arxiv"
+        sync_package(dependencies, arxiv_dir)
+        (arxiv_dir / "MANUSCRIPT.aux").write_text("aux", encoding="utf-8")
+        (arxiv_dir / "Figures" / "Old").mkdir()
+        (arxiv_dir / "Figures" / "Old" / "Old.png").write_text("x", encoding="utf-8")
+        source = output_dir / "Supplementary.tex"
+        source.write_text(SUPPLEMENTARY_TEX + "% edited\n", encoding="utf-8")
+
+        stats = sync_package(dependencies, arxiv_dir)
+        assert stats["copied"] == ["Supplementary.tex"]
+        assert sorted(stats["removed"]) == ["Figures/Old/Old.png", "MANUSCRIPT.aux"]
+        assert not (arxiv_dir / "Figures" / "Old").exists()
+        assert (arxiv_dir / "Supplementary.tex").read_text().endswith("% edited\n")
+
+
+class TestPrepareArxivPackage:
+    """Test the end-to-end packaging entry point."""
+
+    def test_prepare_and_verify(self, output_dir, monkeypatch):
+        """Test that the package holds exactly the referenced files."""
+        monkeypatch.setattr(prepare_arxiv, "test_arxiv_compilation", lambda *_: True)
+        arxiv_dir = output_dir / "arxiv_submission"
+        stale = arxiv_dir / "Figures" / "Unused" / "Unused.png"
+        stale.parent.mkdir(parents=True)
+        stale.write_text("png", encoding="utf-8")
+
+        arxiv_path = prepare_arxiv_package(str(output_dir))
+        assert arxiv_path == arxiv_dir
+        assert _package_files(arxiv_dir) == EXPECTED_FILES
+        assert prepare_arxiv_package.compilation_success
+        assert verify_package(arxiv_dir)
+
+    def test_verify_detects_missing_figure(self, output_dir, monkeypatch):
+        """Test that verification checks the package's own references."""
+        monkeypatch.setattr(prepare_arxiv, "test_arxiv_compilation", lambda *_: True)
+        arxiv_dir = prepare_arxiv_package(str(output_dir))
+        os.remove(arxiv_dir / "Figures" / "Figure_1" / "Figure_1.png")
+        assert not verify_package(arxiv_dir)
+
+
+class TestZipPackage:
+    """Test the reproducible submission archive."""
+
+    @pytest.fixture
+    def package_dir(self, temp_dir):
+        """Submission directory with text, image and nested files."""
+        package = temp_dir / "package"
+        (package / "Figures" / "Figure_1").mkdir(parents=True)
+        (package / "main.tex").write_text("\\section{A}\n" * 200, encoding="utf-8")
+        (package / "Figures" / "Figure_1" / "Figure_1.png").write_bytes(
+            bytes(range(256)) * 40
+        )
+        (package / "Figures" / "Figure_1" / "données.csv").write_text(
+            "a,b\n1,2\n", encoding="utf-8"
+        )
+        return package
+
+    def test_archive_contents(self, package_dir, temp_dir):
+        """Test that entries are sorted, valid and stored or deflated by type."""
+        zip_path = temp_dir / "package.zip"
+        write_reproducible_zip(package_dir, zip_path)
+        with zipfile.ZipFile(zip_path) as zipf:
+            assert zipf.testzip() is None
+            infos = zipf.infolist()
+            assert [info.filename for info in infos] == [
+                "Figures/Figure_1/Figure_1.png",
+                "Figures/Figure_1/données.csv",
+                "main.tex",
+            ]
+            assert infos[0].compress_type == zipfile.ZIP_STORED
+            assert infos[2].compress_type == zipfile.ZIP_DEFLATED
+            assert infos[2].compress_size < infos[2].file_size
+            assert all(info.date_time == (1980, 1, 1, 0, 0, 0) for info in infos)
+            assert zipf.read("main.tex") == (package_dir / "main.tex").read_bytes()
+            assert zipf.read("Figures/Figure_1/Figure_1.png") == (
+                bytes(range(256)) * 40
+            )
+
+    def test_archive_is_reproducible(self, package_dir, temp_dir):
+        """Test that timestamps and worker count do not change the bytes."""
+        first = temp_dir / "first.zip"
+        second = temp_dir / "second.zip"
+        write_reproducible_zip(package_dir, first)
+        os.utime(package_dir / "main.tex", (0, 0))
+        write_reproducible_zip(package_dir, second, max_workers=1)
+        assert first.read_bytes() == second.read_bytes()
+
+    def test_archive_with_more_files_than_window(self, package_dir, temp_dir):
+        """Test that entries stay sorted when they exceed the worker window."""
+        for i in range(10):
+            (package_dir / f"section_{i}.tex").write_text(f"Section {i}\n" * 50)
+        zip_path = temp_dir / "package.zip"
+        returned = write_reproducible_zip(package_dir, zip_path, max_workers=1)
+        with zipfile.ZipFile(zip_path) as zipf:
+            assert zipf.testzip() is None
+            assert zipf.namelist() == returned == sorted(returned)
+            assert zipf.read("section_7.tex") == b"Section 7\n" * 50
+
+    def test_create_zip_package(self, package_dir, temp_dir):
+        """Test that the archive inside the package directory is skipped."""
+        zip_path = create_zip_package(package_dir, str(package_dir / "out.zip"))
+        with zipfile.ZipFile(zip_path) as zipf:
+            assert "out.zip" not in zipf.namelist()
+
+
+class TestSandboxedCompilation:
+    """Test that the compilation check leaves the package untouched."""
+
+    @pytest.fixture
+    def fake_latex(self, monkeypatch):
+        """Replace pdflatex and bibtex with a recorder that writes outputs."""
+        calls = []
+
+        def fake_run(command, cwd, **kwargs):
+            calls.append((command[0], Path(cwd)))
+            main_name = Path(command[-1]).stem
+            if command[0] == "pdflatex":
+                (Path(cwd) / f"{main_name}.pdf").write_bytes(b"%PDF")
+                (Path(cwd) / f"{main_name}.log").write_text("ok")
+                (Path(cwd) / f"{main_name}.aux").write_text("aux")
+            elif command[0] == "bibtex":
+                # bibtex rewrites the .bbl in place
+                (Path(cwd) / f"{main_name}.bbl").write_text("rewritten")
+
+        monkeypatch.setattr(prepare_arxiv.subprocess, "run", fake_run)
+        return calls
+
+    @pytest.fixture
+    def arxiv_dir(self, output_dir, monkeypatch):
+        """Synchronised submission directory of ``output_dir``."""
+        monkeypatch.setattr(prepare_arxiv, "test_arxiv_compilation", lambda *_: True)
+        return prepare_arxiv_package(str(output_dir))
+
+    def test_cold_compilation_runs_in_sandbox(self, arxiv_dir, fake_latex):
+        """Test the full sequence runs outside the package directory."""
+        before = _package_files(arxiv_dir)
+        assert compile_package(arxiv_dir)
+        assert [tool for tool, _ in fake_latex] == [
+            "pdflatex",
+            "bibtex",
+            "pdflatex",
+            "pdflatex",
+        ]
+        assert all(cwd != arxiv_dir and not cwd.exists() for _, cwd in fake_latex)
+        assert _package_files(arxiv_dir) == before
+
+    def test_written_files_are_copied(self, arxiv_dir, fake_latex):
+        """Test that rewriting the .bbl leaves the package .bbl untouched."""
+        bbl = arxiv_dir / "MANUSCRIPT.bbl"
+        mtime = bbl.stat().st_mtime_ns
+        assert compile_package(arxiv_dir)
+        assert bbl.read_text() == "bbl"
+        assert bbl.stat().st_mtime_ns == mtime
+
+    def test_warm_compilation_reuses_aux(self, output_dir, arxiv_dir, fake_latex):
+        """Test that an up-to-date main build allows a single pass."""
+        (output_dir / "MANUSCRIPT.aux").write_text("aux", encoding="utf-8")
+        assert compile_package(arxiv_dir, output_dir)
+        assert [tool for tool, _ in fake_latex] == ["pdflatex"]
+
+    def test_changed_sources_compile_cold(self, output_dir, arxiv_dir, fake_latex):
+        """Test that build state is not reused when sources differ."""
+        (output_dir / "MANUSCRIPT.aux").write_text("aux", encoding="utf-8")
+        (output_dir / "Supplementary.tex").write_text("changed", encoding="utf-8")
+        with tempfile.TemporaryDirectory() as sandbox:
+            assert (
+                seed_compilation_state(arxiv_dir, output_dir, sandbox, "MANUSCRIPT")
+                == []
+            )
+        assert compile_package(arxiv_dir, output_dir)
+        assert len(fake_latex) == 4
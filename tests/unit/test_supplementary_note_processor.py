@@ -1,7 +1,10 @@
 """Unit tests for the supplementary note processor module."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
+from src.py.converters.md2tex import convert_markdown_to_latex
 from src.py.converters.supplementary_note_processor import (
     extract_supplementary_note_info,
     process_supplementary_note_references,
@@ -341,5 +344,34 @@ This note describes the implementation approach."""
         assert "@snote:" not in final
 
 
+class TestConversionState:
+    """Test that note replacements are not shared between conversions."""
+
+    def test_interleaved_conversions(self):
+        """Test restoring one conversion after another one started."""
+        first_notes = {}
+        second_notes = {}
+        first = process_supplementary_notes("{#snote:a} **First.**", first_notes)
+        second = process_supplementary_notes("{#snote:b} **Second.**", second_notes)
+
+        assert "First." in restore_supplementary_note_placeholders(first, first_notes)
+        restored = restore_supplementary_note_placeholders(second, second_notes)
+        assert "\\suppnotesection{Second.}\\label{snote:b}" in restored
+
+    def test_concurrent_threads(self):
+        """Test converting supplementary documents in several threads."""
+
+        def convert(i):
+            content = f"{{#snote:n{i}}} **Note {i}.**\n\nText {i}."
+            return i, convert_markdown_to_latex(content, is_supplementary=True)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(convert, range(200)))
+
+        for i, latex in results:
+            assert f"\\suppnotesection{{Note {i}.}}\\label{{snote:n{i}}}" in latex
+            assert "XXSUBNOTEPROTECTEDXX" not in latex
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -2,11 +2,17 @@
 
 from pathlib import Path
 
+from src.py.processors import template_processor
 from src.py.processors.template_processor import (
+    SUPPLEMENTARY_CACHE_DIR,
+    convert_supplementary_parts,
     generate_bibliography,
     generate_keywords,
+    generate_supplementary_tex,
     get_template_path,
+    parse_template,
     process_template_replacements,
+    render_template,
 )
 
 
@@ -98,3 +104,137 @@ class TestTemplateProcessor:
         assert "Comprehensive Test" in result
         assert "Jane Doe" in result
         assert "comprehensive" in result
+
+
+class TestTemplateRendering:
+    """Test the single-pass template engine."""
+
+    def test_parse_template_segments(self):
+        """Test that literals and placeholder names alternate."""
+        segments = parse_template("a<PY-RPL:ONE>b<PY-RPL:TWO-2>")
+        assert segments == ("a", "ONE", "b", "TWO-2", "")
+        assert parse_template("a<PY-RPL:ONE>b<PY-RPL:TWO-2>") is segments
+
+    def test_render_template(self):
+        """Test that values are substituted and unknown placeholders kept."""
+        template = "\\title{<PY-RPL:TITLE>} <PY-RPL:TITLE> <PY-RPL:UNKNOWN>"
+        result = render_template(template, {"TITLE": "T"})
+        assert result == "\\title{T} T <PY-RPL:UNKNOWN>"
+
+    def test_values_are_not_expanded(self):
+        """Test that placeholders inside substituted content stay literal."""
+        result = render_template(
+            "<PY-RPL:MAIN-CONTENT><PY-RPL:METHODS>",
+            {"MAIN-CONTENT": "<PY-RPL:METHODS>", "METHODS": "m"},
+        )
+        assert result == "<PY-RPL:METHODS>m"
+
+    def test_template_has_no_unfilled_placeholders(self):
+        """Test that every placeholder of the real template gets a value."""
+        template = get_template_path().read_text(encoding="utf-8")
+        result = process_template_replacements(
+            template, {"title": "A Title"}, "# Title\n\n## Abstract\n\nText.\n"
+        )
+        assert "<PY-RPL:" not in result
+
+
+SUPPLEMENTARY_MARKDOWN = """## Supplementary Tables
+
+| A | B |
+|---|---|
+| 1 | 2 |
+
+{#stable:values} **Values.**
+
+## Supplementary Notes
+
+{#snote:method} **Method**
+
+See @stable:values.
+
+## Supplementary Figures
+
+![Overview](FIGURES/overview.png){#sfig:overview}
+"""
+
+
+class TestSupplementaryConversion:
+    """Test the per-part conversion of the supplementary information."""
+
+    def test_parts_assembled_in_order(self, temp_dir, monkeypatch):
+        """Test that concurrently converted parts keep the document order."""
+        (temp_dir / "02_SUPPLEMENTARY_INFO.md").write_text(SUPPLEMENTARY_MARKDOWN)
+        monkeypatch.setenv("MANUSCRIPT_PATH", str(temp_dir))
+        generate_supplementary_tex(temp_dir)
+
+        result = (temp_dir / "Supplementary.tex").read_text()
+        tables = result.index("% Supplementary Tables")
+        notes = result.index("% Supplementary Notes")
+        figures = result.index("% Supplementary Figures")
+        assert tables < result.index("\\begin{stable}") < notes
+        assert notes < result.index("\\suppnotesection{Method}") < figures
+        assert figures < result.index("\\begin{sfigure}")
+
+    def test_raw_latex_floats_renamed(self, temp_dir, monkeypatch):
+        """Test that floats typed as raw LaTeX use the supplementary names."""
+        (temp_dir / "02_SUPPLEMENTARY_INFO.md").write_text(
+            "## Supplementary Figures\n\n"
+            "\\begin{figure}\n\\caption{Raw.}\n\\end{figure}\n\n"
+            "\\begin{table*}\n\\caption{Wide.}\n\\end{table*}\n"
+        )
+        monkeypatch.setenv("MANUSCRIPT_PATH", str(temp_dir))
+        generate_supplementary_tex(temp_dir)
+
+        result = (temp_dir / "Supplementary.tex").read_text()
+        assert "\\begin{sfigure}\n\\caption{Raw.}\n\\end{sfigure}" in result
+        assert "\\begin{stable*}\n\\caption{Wide.}\n\\end{stable*}" in result
+        assert "{figure}" not in result
+
+    def test_parts_cached_separately(self, temp_dir):
+        """Test that only the edited part is converted again."""
+        parts = {"tables": "| A |\n|---|\n| 1 |\n", "notes": "Some *notes*."}
+        first = convert_supplementary_parts(parts, temp_dir)
+        assert list(first) == ["tables", "notes"]
+        assert first["notes"] == "Some \\textit{notes}."
+
+        # Tamper with the cached tables: a cache hit returns them unchanged
+        cache_dir = temp_dir / SUPPLEMENTARY_CACHE_DIR
+        (cached_tables,) = cache_dir.glob("tables-*.tex")
+        cached_tables.write_text("cached", encoding="utf-8")
+
+        parts["notes"] = "Edited *notes*."
+        second = convert_supplementary_parts(parts, temp_dir)
+        assert second["tables"] == "cached"
+        assert second["notes"] == "Edited \\textit{notes}."
+        assert len(list(cache_dir.glob("notes-*.tex"))) == 1
+
+    def test_converter_changes_invalidate_cache(self, temp_dir, monkeypatch):
+        """Test that cached parts are not reused after the converters change."""
+        parts = {"notes": "Some *notes*."}
+        convert_supplementary_parts(parts, temp_dir)
+        cache_dir = temp_dir / SUPPLEMENTARY_CACHE_DIR
+        (cached_notes,) = cache_dir.glob("notes-*.tex")
+        cached_notes.write_text("cached", encoding="utf-8")
+
+        converters_dir = temp_dir / "converters"
+        converters_dir.mkdir()
+        (converters_dir / "md2tex.py").write_text("# edited\n")
+        monkeypatch.setattr(template_processor, "CONVERTERS_DIR", converters_dir)
+        template_processor._converter_fingerprint.cache_clear()
+        try:
+            converted = convert_supplementary_parts(parts, temp_dir)
+        finally:
+            template_processor._converter_fingerprint.cache_clear()
+        assert converted["notes"] == "Some \\textit{notes}."
+
+    def test_serial_fallback(self, temp_dir, monkeypatch):
+        """Test that parts are converted in-process when no pool is available."""
+        monkeypatch.setattr(
+            template_processor,
+            "_convert_parts_in_pool",
+            lambda contents, manuscript_path=None: None,
+        )
+        converted = convert_supplementary_parts(
+            {"tables": "**a**", "figures": "**b**"}, temp_dir
+        )
+        assert converted == {"tables": "\\textbf{a}", "figures": "\\textbf{b}"}
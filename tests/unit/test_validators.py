@@ -165,6 +165,22 @@ This citation does not exist @nonexistent2023.
         error_messages = [error.message for error in result.errors]
         self.assertTrue(any("nonexistent2023" in msg for msg in error_messages))
 
+    def test_citation_keys_match_converter(self):
+        """Test that the validator checks the keys the converter cites."""
+        main_content = """
+Cited [@jones2022;@smith2023] and again @smith2023.
+
+See @fig:one and @table:values.
+"""
+        with open(os.path.join(self.manuscript_dir, "01_MAIN.md"), "w") as f:
+            f.write(main_content)
+
+        validator = CitationValidator(self.manuscript_dir)
+        result = validator.validate()
+
+        self.assertFalse(result.has_errors)
+        self.assertEqual(list(validator.citations_found), ["jones2022", "smith2023"])
+
 
 @pytest.mark.validation
 @unittest.skipUnless(VALIDATORS_AVAILABLE, "Validators not available")
@@ -342,6 +358,41 @@ See @fig:test for details.
         error_messages = [error.message for error in result.errors]
         self.assertTrue(any("missing.png" in msg for msg in error_messages))
 
+    def test_generated_outputs_from_manifest(self):
+        """Test that files recorded for a figure script are not reported unused."""
+        import json
+
+        os.makedirs(os.path.join(self.figures_dir, "Figure_1"))
+        os.makedirs(os.path.join(self.figures_dir, ".cache"))
+        for name in ("Figure_1.py", "Figure_1/Figure_1.png", "Figure_1/data.csv"):
+            with open(os.path.join(self.figures_dir, name), "w") as f:
+                f.write("content")
+        manifest = {
+            "version": 1,
+            "figures": {
+                "Figure_1.py": {
+                    "outputs": ["Figure_1/Figure_1.png", "Figure_1/data.csv"]
+                }
+            },
+        }
+        with open(
+            os.path.join(self.figures_dir, ".cache", "figure_outputs.json"), "w"
+        ) as f:
+            json.dump(manifest, f)
+        with open(os.path.join(self.manuscript_dir, "01_MAIN.md"), "w") as f:
+            f.write("![Generated](FIGURES/Figure_1.py){#fig:generated}\n")
+
+        validator = FigureValidator(self.manuscript_dir)
+        result = validator.validate()
+
+        self.assertFalse(result.has_errors)
+        unused = [
+            error.message
+            for error in result.errors
+            if error.error_code == "unused_figure_file"
+        ]
+        self.assertEqual(unused, [])
+
 
 @pytest.mark.validation
 @unittest.skipUnless(VALIDATORS_AVAILABLE, "Validators not available")
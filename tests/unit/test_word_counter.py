@@ -0,0 +1,138 @@
+"""Unit tests for word counting during section conversion."""
+
+import json
+
+from src.py.converters.md2tex import extract_content_sections
+from src.py.converters.section_processor import count_content_sections
+from src.py.converters.word_counter import (
+    WORD_COUNT_FILENAME,
+    MarkdownWordCount,
+    count_markdown_words,
+    count_words_in_text,
+    load_word_counts,
+    write_word_counts,
+)
+
+MANUSCRIPT = """---
+title: Test
+---
+
+Introductory text before any section.
+
+## Abstract
+
+A short abstract with **bold** words.
+
+## Methods
+
+We used \\texttt{tools} and @smith2020.
+
+## Empty
+"""
+
+
+class TestSectionWordCounts:
+    """Test word counts collected while sections are converted."""
+
+    def test_counts_collected_during_conversion(self):
+        """Test that every non-empty section is counted in document order."""
+        word_counts = {}
+        extract_content_sections(MANUSCRIPT, word_counts)
+        assert list(word_counts) == ["main", "abstract", "methods"]
+        assert word_counts["abstract"].words == 6
+        assert word_counts["methods"].words == 4
+        assert word_counts["methods"].citations == 1
+
+    def test_count_without_conversion(self):
+        """Test that counting alone gives the same counts as conversion."""
+        word_counts = {}
+        extract_content_sections(MANUSCRIPT, word_counts)
+        assert count_content_sections(MANUSCRIPT) == word_counts
+
+    def test_counting_is_optional(self):
+        """Test that conversion is unchanged when no counter is passed."""
+        assert extract_content_sections(MANUSCRIPT) == extract_content_sections(
+            MANUSCRIPT, {}
+        )
+
+    def test_count_words_ignores_latex_commands(self):
+        """Test that LaTeX commands and their arguments are not words."""
+        assert count_words_in_text("Two \\cite{a} words \\newline") == 2
+
+
+class TestMarkdownWordCount:
+    """Test the token-based markdown word counter."""
+
+    def test_prose_words(self):
+        """Test that emphasis and punctuation do not split or add words."""
+        count = count_markdown_words("A **bold**, *state-of-the-art* tool's 3.5 x.")
+        assert count.words == 6
+        assert count.characters == len("Aboldstate-of-the-arttool's3.5x")
+
+    def test_math_citations_and_code_are_not_words(self):
+        """Test that non-prose tokens are counted separately."""
+        count = count_markdown_words(
+            "Energy $E = mc^2$ and $$x + y$$ from [@a;@b] and @c with `x = 1`.\n\n"
+            "```python\nprint('not words')\n```\n"
+        )
+        assert count.words == 5
+        assert count.math == 2
+        assert count.citations == 3
+        assert count.code == 2
+
+    def test_references_urls_and_markup(self):
+        """Test cross-references, links, images, comments and HTML markers."""
+        count = count_markdown_words(
+            "See @fig:one and [the docs](https://example.org/a_b).\n"
+            "<!-- hidden words here -->\n<newpage>\n"
+            "$$a$${#eq:a} Done https://example.org."
+        )
+        assert count.references == 1
+        assert count.words == 6
+
+    def test_captions_headings_and_tables(self):
+        """Test that captions are counted per label, apart from prose."""
+        count = count_markdown_words(
+            "### Sub heading\n\n"
+            "Body text.\n\n"
+            "![](FIGURES/a.png)\n"
+            '{#fig:a width="0.5"} **Title.** Caption with @ref1.\n\n'
+            "| **A** | **B** |\n|---|---|\n| one | two |\n\n"
+            "{#stable:b rotate=90} **Table.** Legend.\n\n"
+            "Closing words."
+        )
+        assert count.words == 4
+        assert count.heading_words == 2
+        assert count.table_words == 4
+        assert count.captions == {"fig:a": 3, "stable:b": 2}
+        assert count.caption_words == 5
+        assert count.citations == 1
+        assert count.paragraphs == [2, 2]
+
+
+class TestWordCountPersistence:
+    """Test the word count JSON written to the output directory."""
+
+    def test_round_trip(self, temp_dir):
+        """Test that stored counts are returned in section order."""
+        source = temp_dir / "01_MAIN.md"
+        source.write_text(MANUSCRIPT, encoding="utf-8")
+        word_counts = {
+            "main": MarkdownWordCount(words=5, captions={"fig:a": 2}),
+            "abstract": MarkdownWordCount(words=3, paragraphs=[3]),
+        }
+        path = write_word_counts(str(temp_dir), word_counts, source)
+        assert path == temp_dir / WORD_COUNT_FILENAME
+        assert json.loads(path.read_text())["total"] == 8
+        loaded = load_word_counts(str(temp_dir), str(source))
+        assert loaded == word_counts
+        assert list(loaded) == ["main", "abstract"]
+
+    def test_stale_or_missing_counts(self, temp_dir):
+        """Test that counts of an edited manuscript are not reused."""
+        source = temp_dir / "01_MAIN.md"
+        assert load_word_counts(str(temp_dir)) is None
+        source.write_text(MANUSCRIPT, encoding="utf-8")
+        write_word_counts(str(temp_dir), {"main": MarkdownWordCount(5)}, str(source))
+        source.write_text(MANUSCRIPT + "More words.\n", encoding="utf-8")
+        assert load_word_counts(str(temp_dir), str(source)) is None